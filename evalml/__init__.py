@@ -1,25 +1,11 @@
 # flake8:noqa
 
+import importlib
 import warnings
 
-# hack to prevent warnings from skopt
-# must import sklearn first
-import sklearn
-
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore", FutureWarning)
-    warnings.simplefilter("ignore", DeprecationWarning)
-    import skopt
-
-import evalml.demos
 import evalml.model_family
-import evalml.objectives
-import evalml.pipelines
-import evalml.preprocessing
 import evalml.problem_types
 import evalml.utils
-import evalml.data_checks
-from evalml.automl import AutoMLSearch
 from evalml.utils import print_info
 
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -27,3 +13,20 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
 __version__ = '0.13.2'
+
+# Subpackages which pull in heavier dependencies are imported when they are first accessed, so that
+# loading a saved pipeline doesn't pay for importing skopt, the demo datasets or the automl search.
+_lazy_submodules = ['automl', 'data_checks', 'demos', 'model_understanding', 'objectives', 'pipelines', 'preprocessing', 'tuners']
+_lazy_attributes = {'AutoMLSearch': 'evalml.automl'}
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module(f'evalml.{name}')
+    if name in _lazy_attributes:
+        return getattr(importlib.import_module(_lazy_attributes[name]), name)
+    raise AttributeError(f"module 'evalml' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_submodules) | set(_lazy_attributes))
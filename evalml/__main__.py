@@ -13,7 +13,24 @@ def info():
     print_info()
 
 
+@click.command()
+@click.argument('pipeline_path', type=click.Path(exists=True))
+@click.option('--host', default='127.0.0.1', show_default=True, help="Host to listen on.")
+@click.option('--port', default=8000, show_default=True, help="Port to listen on.")
+@click.option('--max-batch-size', default=64, show_default=True, help="Rows at which a batch of requests is predicted.")
+@click.option('--max-wait-ms', default=2.0, show_default=True, help="Longest time to wait for more requests to batch, in milliseconds.")
+@click.option('--workers', default=1, show_default=True, help="Number of batches to predict concurrently.")
+def serve(pipeline_path, host, port, max_batch_size, max_wait_ms, workers):
+    """Serves the predictions of a pipeline saved with PipelineBase.save, as a pickle file or an artifact directory, as JSON over HTTP."""
+    # imported here so that other commands, such as info, don't import the pipelines
+    from evalml.pipelines import PipelineBase
+    from evalml.utils.serve_utils import serve_pipeline
+    serve_pipeline(PipelineBase.load(pipeline_path), host=host, port=port, max_batch_size=max_batch_size,
+                   max_wait=max_wait_ms / 1000, n_workers=workers)
+
+
 cli.add_command(info)
+cli.add_command(serve)
 
 
 if __name__ == '__main__':
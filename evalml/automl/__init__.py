@@ -1,3 +1,4 @@
 # flake8:noqas
 from .automl_search import AutoMLSearch
 from .data_splitters import TrainingValidationSplit
+from .search_journal import SearchJournal
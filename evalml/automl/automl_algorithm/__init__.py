@@ -1,3 +1,4 @@
 # flake8:noqas
 from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
 from .iterative_algorithm import IterativeAlgorithm
+from .successive_halving_algorithm import SuccessiveHalvingAlgorithm
@@ -1,5 +1,7 @@
+import inspect
 from abc import ABC, abstractmethod
 
+from evalml.pipelines.components.utils import handle_component_class
 from evalml.tuners import SKOptTuner
 from evalml.utils import get_random_state
 
@@ -16,7 +18,9 @@ class AutoMLAlgorithm(ABC):
                  allowed_pipelines=None,
                  max_iterations=None,
                  tuner_class=None,
-                 random_state=0):
+                 random_state=0,
+                 n_jobs=-1,
+                 number_features=None):
         """This class represents an automated machine learning (AutoML) algorithm. It encapsulates the decision-making logic behind an automl search, by both deciding which pipelines to evaluate next and by deciding what set of parameters to configure the pipeline with.
 
         To use this interface, you must define a next_batch method which returns the next group of pipelines to evaluate on the training data. That method may access state and results recorded from the previous batches, although that information is not tracked in a general way in this base class. Overriding add_result is a convenient way to record pipeline evaluation info if necessary.
@@ -26,8 +30,12 @@ class AutoMLAlgorithm(ABC):
             max_iterations (int): The maximum number of iterations to be evaluated.
             tuner_class (class): A subclass of Tuner, to be used to find parameters for each pipeline. The default of None indicates the SKOptTuner will be used.
             random_state (int, np.random.RandomState): The random seed/state. Defaults to 0.
+            n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
+            number_features (int): The number of columns in the input features.
         """
         self.random_state = get_random_state(random_state)
+        self.n_jobs = n_jobs
+        self.number_features = number_features
         self.allowed_pipelines = allowed_pipelines or []
         self.max_iterations = max_iterations
         self._tuner_class = tuner_class or SKOptTuner
@@ -54,6 +62,12 @@ class AutoMLAlgorithm(ABC):
         """
         self._tuners[pipeline.name].add(pipeline.parameters, score_to_minimize)
 
+    @property
+    def data_fraction(self):
+        """Returns the fraction of the training data which the pipelines of the most recent batch should be evaluated on.
+        Algorithms which evaluate every pipeline on all of the data always return 1.0."""
+        return 1.0
+
     @property
     def pipeline_number(self):
         """Returns the number of pipelines which have been recommended so far."""
@@ -63,3 +77,19 @@ class AutoMLAlgorithm(ABC):
     def batch_number(self):
         """Returns the number of batches which have been recommended so far."""
         return self._batch_number
+
+    def _transform_parameters(self, pipeline_class, proposed_parameters):
+        """Given a pipeline parameters dict, make sure n_jobs and number_features are set."""
+        parameters = {}
+        component_graph = [handle_component_class(c) for c in pipeline_class.component_graph]
+        for component_class in component_graph:
+            component_parameters = proposed_parameters.get(component_class.name, {})
+            init_params = inspect.signature(component_class.__init__).parameters
+
+            # Inspects each component and adds the following parameters when needed
+            if 'n_jobs' in init_params:
+                component_parameters['n_jobs'] = self.n_jobs
+            if 'number_features' in init_params:
+                component_parameters['number_features'] = self.number_features
+            parameters[component_class.name] = component_parameters
+        return parameters
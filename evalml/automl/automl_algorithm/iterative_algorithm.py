@@ -1,10 +1,7 @@
-import inspect
 from operator import itemgetter
 
 from .automl_algorithm import AutoMLAlgorithm, AutoMLAlgorithmException
 
-from evalml.pipelines.components.utils import handle_component_class
-
 
 class IterativeAlgorithm(AutoMLAlgorithm):
     """An automl algorithm which first fits a base round of pipelines with default parameters, then does a round of parameter tuning on each pipeline in order of performance."""
@@ -31,10 +28,10 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         super().__init__(allowed_pipelines=allowed_pipelines,
                          max_iterations=max_iterations,
                          tuner_class=tuner_class,
-                         random_state=random_state)
+                         random_state=random_state,
+                         n_jobs=n_jobs,
+                         number_features=number_features)
         self.pipelines_per_batch = pipelines_per_batch
-        self.n_jobs = n_jobs
-        self.number_features = number_features
         self._first_batch_results = []
 
     def next_batch(self):
@@ -72,19 +69,3 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         super().add_result(score_to_minimize, pipeline)
         if self.batch_number == 1:
             self._first_batch_results.append((score_to_minimize, pipeline.__class__))
-
-    def _transform_parameters(self, pipeline_class, proposed_parameters):
-        """Given a pipeline parameters dict, make sure n_jobs and number_features are set."""
-        parameters = {}
-        component_graph = [handle_component_class(c) for c in pipeline_class.component_graph]
-        for component_class in component_graph:
-            component_parameters = proposed_parameters.get(component_class.name, {})
-            init_params = inspect.signature(component_class.__init__).parameters
-
-            # Inspects each component and adds the following parameters when needed
-            if 'n_jobs' in init_params:
-                component_parameters['n_jobs'] = self.n_jobs
-            if 'number_features' in init_params:
-                component_parameters['number_features'] = self.number_features
-            parameters[component_class.name] = component_parameters
-        return parameters
@@ -0,0 +1,123 @@
+import numpy as np
+
+from .automl_algorithm import AutoMLAlgorithm
+
+
+class SuccessiveHalvingAlgorithm(AutoMLAlgorithm):
+    """An automl algorithm which evaluates many candidate pipelines on a small sample of the data, then repeatedly evaluates the best of them on larger samples until the most promising candidates are evaluated on all of the data."""
+
+    def __init__(self,
+                 allowed_pipelines=None,
+                 max_iterations=None,
+                 tuner_class=None,
+                 random_state=0,
+                 candidates_per_bracket=None,
+                 eta=3,
+                 min_data_fraction=0.1,
+                 n_jobs=-1,
+                 number_features=None):
+        """An automl algorithm which evaluates many candidate pipelines on a small sample of the data, then repeatedly evaluates the best of them on larger samples until the most promising candidates are evaluated on all of the data.
+
+        Candidates are evaluated in brackets. Each bracket starts with `candidates_per_bracket` pipelines evaluated on the smallest
+        fraction of the data. After each round (rung), only the best 1/eta of the pipelines are promoted to the next round, which uses
+        eta times more data. The last round uses all of the data. The first bracket contains every allowed pipeline with default
+        parameters. All other candidates are proposed by each pipeline's tuner, in turn. Tuners only learn from results on all of the data.
+
+        Arguments:
+            allowed_pipelines (list(class)): A list of PipelineBase subclasses indicating the pipelines allowed in the search. The default of None indicates all pipelines for this problem type are allowed.
+            max_iterations (int): The maximum number of iterations to be evaluated.
+            tuner_class (class): A subclass of Tuner, to be used to find parameters for each pipeline. The default of None indicates the SKOptTuner will be used.
+            random_state (int, np.random.RandomState): The random seed/state. Defaults to 0.
+            candidates_per_bracket (int): The number of pipelines to evaluate on the smallest fraction of the data in each bracket.
+                Defaults to the larger of the number of allowed pipelines and eta raised to the number of promotions in a bracket.
+            eta (int): The factor by which the number of pipelines decreases and the amount of data increases after each round. Must be at least 2. Defaults to 3.
+            min_data_fraction (float): The smallest fraction of the data to evaluate pipelines on, between 0 and 1. The fractions used are
+                the powers of 1/eta which are at least min_data_fraction. Defaults to 0.1.
+            n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
+            number_features (int): The number of columns in the input features.
+        """
+        super().__init__(allowed_pipelines=allowed_pipelines,
+                         max_iterations=max_iterations,
+                         tuner_class=tuner_class,
+                         random_state=random_state,
+                         n_jobs=n_jobs,
+                         number_features=number_features)
+        if eta < 2:
+            raise ValueError(f"eta must be at least 2. Received {eta}.")
+        if not 0 < min_data_fraction <= 1:
+            raise ValueError(f"min_data_fraction must be greater than 0 and at most 1. Received {min_data_fraction}.")
+        self.eta = eta
+        self.min_data_fraction = min_data_fraction
+        n_promotions = int(np.floor(np.log(1 / min_data_fraction) / np.log(eta) + 1e-9))
+        self.data_fractions = [float(eta) ** -(n_promotions - rung) for rung in range(n_promotions + 1)]
+        self.candidates_per_bracket = candidates_per_bracket or max(len(self.allowed_pipelines), eta ** n_promotions)
+        self._bracket_number = 0
+        self._rung = None
+        self._rung_results = []
+
+    @property
+    def data_fraction(self):
+        """Returns the fraction of the training data which the pipelines of the most recent batch should be evaluated on."""
+        if self._rung is None:
+            return 1.0
+        return self.data_fractions[self._rung]
+
+    @property
+    def rung_sizes(self):
+        """Returns the number of pipelines in each round of a bracket, if every pipeline of the previous round was evaluated."""
+        rung_sizes = [self.candidates_per_bracket]
+        for _ in self.data_fractions[1:]:
+            rung_sizes.append(int(np.ceil(rung_sizes[-1] / self.eta)))
+        return rung_sizes
+
+    @property
+    def bracket_number(self):
+        """Returns the number of brackets which have been started so far."""
+        return self._bracket_number
+
+    def next_batch(self):
+        """Get the next batch of pipelines to evaluate. Each batch is one round of a bracket.
+
+        Returns:
+            list(PipelineBase): a list of instances of PipelineBase subclasses, ready to be trained and evaluated.
+        """
+        if self._rung is not None and self._rung < len(self.data_fractions) - 1 and self._rung_results:
+            n_promoted = int(np.ceil(len(self._rung_results) / self.eta))
+            # nan scores are ranked last
+            ranked = sorted(self._rung_results, key=lambda result: (np.isnan(result[0]), result[0]))
+            next_batch = [pipeline.clone(random_state=self.random_state) for _, pipeline in ranked[:n_promoted]]
+            self._rung += 1
+        else:
+            next_batch = self._propose_bracket()
+            self._rung = 0
+        self._rung_results = []
+        self._pipeline_number += len(next_batch)
+        self._batch_number += 1
+        return next_batch
+
+    def add_result(self, score_to_minimize, pipeline):
+        """Register results from evaluating a pipeline
+
+        Arguments:
+            score_to_minimize (float): The score obtained by this pipeline on the primary objective, converted so that lower values indicate better pipelines.
+            pipeline (PipelineBase): The trained pipeline object which was used to compute the score.
+        """
+        self._rung_results.append((score_to_minimize, pipeline))
+        if self.data_fraction == 1.0:
+            super().add_result(score_to_minimize, pipeline)
+
+    def _propose_bracket(self):
+        """Returns the candidate pipelines for a new bracket."""
+        candidates = []
+        if self._bracket_number == 0:
+            candidates = [pipeline_class(parameters=self._transform_parameters(pipeline_class, {}), random_state=self.random_state)
+                          for pipeline_class in self.allowed_pipelines]
+        i = self._bracket_number
+        while len(candidates) < self.candidates_per_bracket:
+            pipeline_class = self.allowed_pipelines[i % len(self.allowed_pipelines)]
+            proposed_parameters = self._tuners[pipeline_class.name].propose()
+            candidates.append(pipeline_class(parameters=self._transform_parameters(pipeline_class, proposed_parameters),
+                                             random_state=self.random_state))
+            i += 1
+        self._bracket_number += 1
+        return candidates
@@ -2,10 +2,13 @@ import copy
 import time
 import warnings
 from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, wait
 
 import cloudpickle
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
 from sklearn.model_selection import (
     BaseCrossValidator,
     KFold,
@@ -14,10 +17,19 @@ from sklearn.model_selection import (
 )
 
 from .pipeline_search_plots import PipelineSearchPlots
+from .search_journal import SearchJournal
 
-from evalml.automl.automl_algorithm import IterativeAlgorithm
+from evalml.automl.automl_algorithm import (
+    IterativeAlgorithm,
+    SuccessiveHalvingAlgorithm
+)
 from evalml.automl.data_splitters import TrainingValidationSplit
-from evalml.data_checks import DataChecks, DefaultDataChecks, EmptyDataChecks
+from evalml.data_checks import (
+    DataChecks,
+    DataProfile,
+    DefaultDataChecks,
+    EmptyDataChecks
+)
 from evalml.data_checks.data_check_message_type import DataCheckMessageType
 from evalml.exceptions import (
     AutoMLSearchException,
@@ -48,10 +60,17 @@ from evalml.pipelines import (
     ModeBaselineMulticlassPipeline
 )
 from evalml.pipelines.components.utils import get_estimators
+from evalml.pipelines.transform_cache import TransformCache
 from evalml.pipelines.utils import make_pipeline
 from evalml.problem_types import ProblemTypes, handle_problem_types
 from evalml.tuners import SKOptTuner
-from evalml.utils import convert_to_seconds, get_random_state
+from evalml.utils import (
+    convert_to_seconds,
+    get_random_state,
+    is_artifact,
+    load_artifact,
+    save_artifact
+)
 from evalml.utils.gen_utils import classproperty
 from evalml.utils.logger import (
     get_logger,
@@ -76,6 +95,11 @@ class AutoMLSearch:
                            'multiclass': 'Log Loss Multiclass',
                            'regression': 'R2'}
 
+    _AUTOML_ALGORITHMS = {'iterative': IterativeAlgorithm,
+                          'successive_halving': SuccessiveHalvingAlgorithm}
+
+    _CV_PRUNING_RULES = [None, 'margin', 'median']
+
     def __init__(self,
                  problem_type=None,
                  objective='auto',
@@ -95,6 +119,13 @@ class AutoMLSearch:
                  tuner_class=None,
                  verbose=True,
                  optimize_thresholds=False,
+                 cv_n_jobs=None,
+                 batch_n_jobs=None,
+                 cache_transforms=False,
+                 automl_algorithm='iterative',
+                 cv_pruning=None,
+                 cv_pruning_margin=0.5,
+                 journal_path=None,
                  _max_batches=None):
         """Automated pipeline search
 
@@ -110,7 +141,8 @@ class AutoMLSearch:
                 max_time is not set, then max_pipelines will default to max_pipelines of 5.
 
             max_iterations (int): Maximum number of iterations to search. If max_iterations and
-                max_time is not set, then max_iterations will default to max_iterations of 5.
+                max_time is not set, then max_iterations will default to max_iterations of 5, or with successive halving, to
+                the baseline and one complete bracket.
 
             max_time (int, str): Maximum time to search for pipelines.
                 This will not start a new pipeline search after the duration
@@ -152,6 +184,40 @@ class AutoMLSearch:
 
             verbose (boolean): If True, turn verbosity on. Defaults to True
 
+            cv_n_jobs (int or None): Number of cross-validation folds to train and score in parallel, using a pool of worker processes.
+                None and 1 are equivalent and evaluate folds serially. If set to -1, all CPUs are used. Scores are identical to
+                those computed serially. Consider lowering n_jobs when using this, since each fold's estimator also uses n_jobs.
+                Defaults to None.
+
+            batch_n_jobs (int or None): Number of pipelines from each batch of the automl algorithm to evaluate in parallel, using a
+                pool of worker processes. None and 1 are equivalent and evaluate pipelines one at a time. If set to -1, all CPUs are used.
+                Results are passed to the automl algorithm and callbacks as pipelines finish, and the stopping criteria are checked
+                before each pipeline is started. Pipelines which are already running when patience is exceeded are still recorded.
+                The baseline pipeline is always evaluated on its own first. Defaults to None.
+
+            cache_transforms (boolean): If True, pipelines which start with the same preprocessing components reuse the fitted
+                components and transformed data of previously evaluated pipelines on each cross-validation fold, instead of
+                fitting them again. The cache is only used when pipelines and folds are evaluated serially, and it is cleared
+                when the search finishes. Defaults to False.
+
+            automl_algorithm (str): The algorithm used to choose which pipelines to evaluate. Either 'iterative', which evaluates every
+                pipeline on all of the data, or 'successive_halving', which first evaluates candidate pipelines on small samples of
+                the rows and only evaluates the best of them on all of the data. Results on samples count towards max_iterations but
+                are not included in the rankings. Defaults to 'iterative'.
+
+            cv_pruning (str, None): Rule used to stop cross-validating a pipeline once its mean score on the folds completed so far
+                shows it is clearly worse than previously evaluated pipelines. Either 'margin', which stops if the mean score is worse
+                than the best score so far by more than cv_pruning_margin times its magnitude, or 'median', which stops if the mean
+                score is worse than the median of the other pipelines' mean scores on the same folds. Pruned pipelines are recorded
+                in results with their partial scores and a pruned flag, and are left out of the rankings. Pruning is not applied when
+                cv_n_jobs trains the folds in parallel. Defaults to None, which disables pruning.
+
+            cv_pruning_margin (float): The relative margin used by the 'margin' pruning rule. Defaults to 0.5.
+
+            journal_path (str): Location of a file to which the search appends a record of each batch of pipelines proposed by the
+                automl algorithm and of each evaluated pipeline, as soon as they happen. A search which was interrupted can be
+                continued from the journal by calling search with resume=True. Defaults to None, which disables the journal.
+
             _max_batches (int): The maximum number of batches of pipelines to search. Parameters max_time, and
                 max_iterations have precedence over stopping the search.
         """
@@ -198,7 +264,8 @@ class AutoMLSearch:
             logger.warning("`max_pipelines` will be deprecated in the next release. Use `max_iterations` instead.")
 
         self.max_iterations = max_iterations
-        if not self.max_iterations and not self.max_time and not _max_batches:
+        self._default_max_iterations = not self.max_iterations and not self.max_time and not _max_batches
+        if self._default_max_iterations and automl_algorithm != 'successive_halving':
             self.max_iterations = 5
             logger.info("Using default limit of max_iterations=5.\n")
 
@@ -216,6 +283,22 @@ class AutoMLSearch:
         }
         self.random_state = get_random_state(random_state)
         self.n_jobs = n_jobs
+        self.cv_n_jobs = cv_n_jobs
+        self.batch_n_jobs = batch_n_jobs
+        self.cache_transforms = cache_transforms
+        if automl_algorithm not in self._AUTOML_ALGORITHMS:
+            raise ValueError(f"automl_algorithm must be one of {', '.join(self._AUTOML_ALGORITHMS)}. Received '{automl_algorithm}'.")
+        self.automl_algorithm = automl_algorithm
+        if cv_pruning not in self._CV_PRUNING_RULES:
+            raise ValueError(f"cv_pruning must be one of {', '.join(str(rule) for rule in self._CV_PRUNING_RULES)}. Received '{cv_pruning}'.")
+        if cv_pruning_margin < 0:
+            raise ValueError(f"cv_pruning_margin must be non-negative. Received {cv_pruning_margin}.")
+        self.cv_pruning = cv_pruning
+        self.cv_pruning_margin = cv_pruning_margin
+        self._transform_cache = TransformCache() if cache_transforms else None
+        self.journal_path = journal_path
+        self._journal = SearchJournal(journal_path) if journal_path else None
+        self._journal_batch_number = None
 
         self.plot = None
         try:
@@ -290,6 +373,12 @@ class AutoMLSearch:
             f"Additional Objectives: {_print_list(self.additional_objectives or [])}\n"
             f"Random State: {self.random_state}\n"
             f"n_jobs: {self.n_jobs}\n"
+            f"cv_n_jobs: {self.cv_n_jobs}\n"
+            f"batch_n_jobs: {self.batch_n_jobs}\n"
+            f"Cache Transforms: {self.cache_transforms}\n"
+            f"AutoML Algorithm: {self.automl_algorithm}\n"
+            f"CV Pruning: {self.cv_pruning}\n"
+            f"Journal Path: {self.journal_path}\n"
             f"Verbose: {self.verbose}\n"
             f"Optimize Thresholds: {self.optimize_thresholds}\n"
         )
@@ -340,22 +429,32 @@ class AutoMLSearch:
             list: Next pipelines to search in the batch. If the user decides to stop the search,
                 an empty list will be returned.
         """
+        if self._confirm_exit():
+            return []
+        return [pipeline] + current_batch_pipelines
+
+    def _confirm_exit(self):
+        """Presents a prompt to the user asking if they want to stop the search.
+
+        Returns:
+            bool: True if the user decides to stop the search.
+        """
         leading_char = "\n"
         start_of_loop = time.time()
         while True:
             choice = input(leading_char + "Do you really want to exit search (y/n)? ").strip().lower()
             if choice == "y":
                 logger.info("Exiting AutoMLSearch.")
-                return []
+                return True
             elif choice == "n":
                 # So that the time in this loop does not count towards the time budget (if set)
                 time_in_loop = time.time() - start_of_loop
                 self._start += time_in_loop
-                return [pipeline] + current_batch_pipelines
+                return False
             else:
                 leading_char = ""
 
-    def search(self, X, y, data_checks="auto", feature_types=None, show_iteration_plot=True):
+    def search(self, X, y, data_checks="auto", feature_types=None, show_iteration_plot=True, resume=False):
         """Find the best pipeline for the data set.
 
         Arguments:
@@ -374,9 +473,22 @@ class AutoMLSearch:
                 search begins. If "disabled" or None, no data checks will be done.
                 If set to "auto", DefaultDataChecks will be done. Default value is set to "auto".
 
+            resume (boolean): If True, continue the search recorded in the journal at journal_path instead of starting a new one.
+                The results in the journal are restored, the automl algorithm and its tuners are given the recorded results, and
+                only the pipelines which were not evaluated yet are searched. The search must be created with the same parameters
+                and given the same data as the search which wrote the journal. If the journal is empty or doesn't exist yet,
+                a new search is started. Defaults to False.
+
         Returns:
             self
         """
+        if resume and self._journal is None:
+            raise ValueError("journal_path must be set to resume a search.")
+        journal_records = self._journal.read() if self._journal is not None else []
+        if journal_records and not resume:
+            raise ValueError(f"The journal at {self.journal_path} already contains a search. Pass resume=True to continue it, "
+                             "or use a different journal_path.")
+
         # don't show iteration plot outside of a jupyter notebook
         if show_iteration_plot:
             try:
@@ -402,8 +514,12 @@ class AutoMLSearch:
 
         self.data_split = self.data_split or default_data_split
 
+        # the data is profiled at most once, for both the data checks and pipeline generation, and only if either of them needs it
+        profile = None
         data_checks = self._validate_data_checks(data_checks)
-        data_check_results = data_checks.validate(X, y)
+        if any(data_checks._supports_profile(data_check) for data_check in data_checks.data_checks):
+            profile = DataProfile(X, n_jobs=self.n_jobs)
+        data_check_results = data_checks.validate(X, y, profile=profile)
 
         if len(data_check_results) > 0:
             self._data_check_results = data_check_results
@@ -419,11 +535,13 @@ class AutoMLSearch:
             logger.info("Generating pipelines to search over...")
             allowed_estimators = get_estimators(self.problem_type, self.allowed_model_families)
             logger.debug(f"allowed_estimators set to {[estimator.name for estimator in allowed_estimators]}")
-            self.allowed_pipelines = [make_pipeline(X, y, estimator, self.problem_type) for estimator in allowed_estimators]
+            if profile is None:
+                profile = DataProfile(X, n_jobs=self.n_jobs)
+            self.allowed_pipelines = [make_pipeline(X, y, estimator, self.problem_type, profile=profile) for estimator in allowed_estimators]
 
         if self.allowed_pipelines == []:
             raise ValueError("No allowed pipelines to search")
-        if self._max_batches and self.max_iterations is None:
+        if self._max_batches and self.max_iterations is None and self.automl_algorithm == 'iterative':
             self.max_iterations = 1 + len(self.allowed_pipelines) + (self._pipelines_per_batch * (self._max_batches - 1))
 
         self.allowed_model_families = list(set([p.model_family for p in (self.allowed_pipelines)]))
@@ -431,15 +549,20 @@ class AutoMLSearch:
         logger.debug(f"allowed_pipelines set to {[pipeline.name for pipeline in self.allowed_pipelines]}")
         logger.debug(f"allowed_model_families set to {self.allowed_model_families}")
 
-        self._automl_algorithm = IterativeAlgorithm(
+        algorithm_parameters = {}
+        if self.automl_algorithm == 'iterative':
+            algorithm_parameters['pipelines_per_batch'] = self._pipelines_per_batch
+        self._automl_algorithm = self._AUTOML_ALGORITHMS[self.automl_algorithm](
             max_iterations=self.max_iterations,
             allowed_pipelines=self.allowed_pipelines,
             tuner_class=self.tuner_class,
             random_state=self.random_state,
             n_jobs=self.n_jobs,
             number_features=X.shape[1],
-            pipelines_per_batch=self._pipelines_per_batch
+            **algorithm_parameters
         )
+        if self.automl_algorithm == 'successive_halving':
+            self._limit_successive_halving()
 
         log_title(logger, "Beginning pipeline search")
         logger.info("Optimizing for %s. " % self.objective.name)
@@ -456,51 +579,65 @@ class AutoMLSearch:
 
         self._start = time.time()
 
-        should_terminate = self._add_baseline_pipelines(X, y)
-        if should_terminate:
-            return
-
         current_batch_pipelines = []
         current_batch_pipeline_scores = []
-        while self._check_stopping_condition(self._start):
-            try:
-                if len(current_batch_pipelines) == 0:
-                    try:
-                        if current_batch_pipeline_scores and np.isnan(np.array(current_batch_pipeline_scores, dtype=float)).all():
-                            raise AutoMLSearchException(f"All pipelines in the current AutoML batch produced a score of np.nan on the primary objective {self.objective}.")
-                        current_batch_pipelines = self._automl_algorithm.next_batch()
-                        current_batch_pipeline_scores = []
-                    except StopIteration:
-                        logger.info('AutoML Algorithm out of recommendations, ending')
-                        break
-                pipeline = current_batch_pipelines.pop(0)
-                parameters = pipeline.parameters
-                logger.debug('Evaluating pipeline {}'.format(pipeline.name))
-                logger.debug('Pipeline parameters: {}'.format(parameters))
-
-                if self.start_iteration_callback:
-                    self.start_iteration_callback(pipeline.__class__, parameters, self)
-                desc = f"{pipeline.name}"
-                if len(desc) > self._MAX_NAME_LEN:
-                    desc = desc[:self._MAX_NAME_LEN - 3] + "..."
-                desc = desc.ljust(self._MAX_NAME_LEN)
-
-                update_pipeline(logger, desc, len(self._results['pipeline_results']) + 1, self.max_iterations, self._start)
+        data_fraction = 1.0
+        if journal_records:
+            current_batch_pipelines, current_batch_pipeline_scores, data_fraction = self._resume_from_journal(journal_records, X, y)
+        elif self._journal is not None:
+            self._journal.append(self._make_journal_header(X, y))
 
-                evaluation_results = self._evaluate(pipeline, X, y)
-                score = evaluation_results['cv_score_mean']
-                score_to_minimize = -score if self.objective.greater_is_better else score
-                current_batch_pipeline_scores.append(score_to_minimize)
-                self._automl_algorithm.add_result(score_to_minimize, pipeline)
-
-                if search_iteration_plot:
-                    search_iteration_plot.update()
-
-            except KeyboardInterrupt:
-                current_batch_pipelines = self._handle_keyboard_interrupt(pipeline, current_batch_pipelines)
-                if not current_batch_pipelines:
+        try:
+            if not self._results['pipeline_results']:
+                should_terminate = self._add_baseline_pipelines(X, y)
+                if should_terminate:
                     return
 
+            X_batch, y_batch = self._sample_rows(X, y, data_fraction)
+            while self._check_stopping_condition(self._start):
+                pipeline = None
+                try:
+                    if len(current_batch_pipelines) == 0:
+                        try:
+                            if current_batch_pipeline_scores and np.isnan(np.array(current_batch_pipeline_scores, dtype=float)).all():
+                                raise AutoMLSearchException(f"All pipelines in the current AutoML batch produced a score of np.nan on the primary objective {self.objective}.")
+                            current_batch_pipelines = self._automl_algorithm.next_batch()
+                            current_batch_pipeline_scores = []
+                            data_fraction = self._automl_algorithm.data_fraction
+                            X_batch, y_batch = self._sample_rows(X, y, data_fraction)
+                            self._journal_batch(current_batch_pipelines, data_fraction)
+                        except StopIteration:
+                            logger.info('AutoML Algorithm out of recommendations, ending')
+                            break
+                    if self.batch_n_jobs not in (None, 1):
+                        batch_scores = self._evaluate_batch_in_parallel(current_batch_pipelines, X_batch, y_batch, search_iteration_plot,
+                                                                        data_fraction=data_fraction)
+                        if batch_scores is None:
+                            return
+                        current_batch_pipeline_scores.extend(batch_scores)
+                        continue
+                    pipeline = current_batch_pipelines.pop(0)
+                    self._start_pipeline_evaluation(pipeline, len(self._results['pipeline_results']) + 1)
+
+                    evaluation_results = self._evaluate(pipeline, X_batch, y_batch, data_fraction=data_fraction)
+                    score_to_minimize = self._register_evaluation_with_algorithm(pipeline, evaluation_results, search_iteration_plot)
+                    current_batch_pipeline_scores.append(score_to_minimize)
+
+                except KeyboardInterrupt:
+                    if pipeline is None:
+                        # the search was interrupted between evaluations, so there is no pipeline to evaluate again
+                        if self._confirm_exit():
+                            return
+                        continue
+                    current_batch_pipelines = self._handle_keyboard_interrupt(pipeline, current_batch_pipelines)
+                    if not current_batch_pipelines:
+                        return
+        finally:
+            self._journal_batch_number = None
+            if self._transform_cache is not None:
+                logger.debug(f"Transform cache: {self._transform_cache.hits} hits, {self._transform_cache.misses} misses")
+                self._transform_cache.clear()
+
         elapsed_time = time_elapsed(self._start)
         desc = f"\nSearch finished after {elapsed_time}"
         desc = desc.ljust(self._MAX_NAME_LEN)
@@ -511,9 +648,227 @@ class AutoMLSearch:
         logger.info(f"Best pipeline: {best_pipeline_name}")
         logger.info(f"Best pipeline {self.objective.name}: {best_pipeline['score']:3f}")
 
-    def _check_stopping_condition(self, start):
+    def _make_journal_header(self, X, y):
+        """Returns the first record of the journal, which identifies the search and the data it was run on."""
+        return {"type": "search",
+                "problem_type": self.problem_type.value,
+                "objective": self.objective.name,
+                "automl_algorithm": self.automl_algorithm,
+                "allowed_pipelines": [pipeline_class.name for pipeline_class in self.allowed_pipelines],
+                "data": TransformCache.fingerprint(X, y)}
+
+    def _journal_batch(self, pipelines, data_fraction):
+        """Records a batch of pipelines proposed by the automl algorithm in the journal."""
+        if self._journal is None:
+            return
+        self._journal_batch_number = 0 if self._journal_batch_number is None else self._journal_batch_number + 1
+        self._journal.append({"type": "batch",
+                              "batch": self._journal_batch_number,
+                              "data_fraction": data_fraction,
+                              "pipelines": [{"pipeline_name": pipeline.name, "parameters": pipeline.parameters} for pipeline in pipelines]})
+
+    def _resume_from_journal(self, records, X, y):
+        """Restores the results of a search from its journal and brings the automl algorithm and its tuners up to date with them.
+
+        The batches recorded in the journal are requested from the automl algorithm again, and the recorded results of each batch
+        are passed to the algorithm in the order they were evaluated. The recorded pipelines replace the ones the algorithm proposes,
+        so pipelines which were evaluated before the search was interrupted are not evaluated again.
+
+        Arguments:
+            records (list(dict)): the records read from the journal.
+            X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+            y (pd.Series): the target training data of length [n_samples]
+
+        Returns:
+            list(PipelineBase), list(float), float: the pipelines of the last recorded batch which were not evaluated yet, the
+                scores of the pipelines of that batch which were evaluated, and the fraction of the data the batch is evaluated on.
+        """
+        header = self._make_journal_header(X, y)
+        for field, value in header.items():
+            if records[0].get(field) != value:
+                raise ValueError(f"The journal at {self.journal_path} was written by a different search: the recorded {field} "
+                                 f"{records[0].get(field)} does not match {value}.")
+        pipeline_classes = {pipeline_class.name: pipeline_class for pipeline_class in self.allowed_pipelines}
+        for baseline_class in [ModeBaselineBinaryPipeline, ModeBaselineMulticlassPipeline, MeanBaselineRegressionPipeline]:
+            pipeline_classes[baseline_class.name] = baseline_class
+
+        self._results = {
+            'pipeline_results': {},
+            'search_order': []
+        }
+        batches = [record for record in records if record["type"] == "batch"]
+        batch_results = [[] for _ in batches]
+        search_time = 0
+        for record in records:
+            if record["type"] != "result":
+                continue
+            result = record["result"]
+            result["pipeline_class"] = pipeline_classes[result["pipeline_name"]]
+            for fold in result["cv_data"]:
+                fold["all_objective_scores"] = OrderedDict(fold["all_objective_scores"])
+            self._results['pipeline_results'][result["id"]] = result
+            self._results['search_order'].append(result["id"])
+            if record["batch"] is not None:
+                batch_results[record["batch"]].append(result)
+            search_time = record["search_time"]
+        if self._results['pipeline_results']:
+            self._baseline_cv_score = self._results['pipeline_results'][self._results['search_order'][0]]['score']
+
+        remaining_pipelines, scores, data_fraction = [], [], 1.0
+        for batch, results in zip(batches, batch_results):
+            self._automl_algorithm.next_batch()
+            remaining_pipelines = list(batch["pipelines"])
+            scores = []
+            for result in results:
+                pipeline = result["pipeline_class"](parameters=result["parameters"])
+                score_to_minimize = -result["score"] if self.objective.greater_is_better else result["score"]
+                self._automl_algorithm.add_result(score_to_minimize, pipeline)
+                scores.append(score_to_minimize)
+                evaluated = {"pipeline_name": result["pipeline_name"], "parameters": result["parameters"]}
+                if evaluated in remaining_pipelines:
+                    remaining_pipelines.remove(evaluated)
+            data_fraction = batch["data_fraction"]
+        self._journal_batch_number = len(batches) - 1 if batches else None
+        self._start -= search_time
+        logger.info(f"Resuming search from {self.journal_path} after {len(self._results['pipeline_results'])} pipelines")
+        remaining_pipelines = [pipeline_classes[pipeline["pipeline_name"]](parameters=pipeline["parameters"])
+                               for pipeline in remaining_pipelines]
+        return remaining_pipelines, scores, data_fraction
+
+    def _start_pipeline_evaluation(self, pipeline, iteration):
+        """Calls the start iteration callback and logs the progress of the search before a pipeline is evaluated."""
+        parameters = pipeline.parameters
+        logger.debug('Evaluating pipeline {}'.format(pipeline.name))
+        logger.debug('Pipeline parameters: {}'.format(parameters))
+
+        if self.start_iteration_callback:
+            self.start_iteration_callback(pipeline.__class__, parameters, self)
+        desc = f"{pipeline.name}"
+        if len(desc) > self._MAX_NAME_LEN:
+            desc = desc[:self._MAX_NAME_LEN - 3] + "..."
+        desc = desc.ljust(self._MAX_NAME_LEN)
+
+        update_pipeline(logger, desc, iteration, self.max_iterations, self._start)
+
+    def _register_evaluation_with_algorithm(self, pipeline, evaluation_results, search_iteration_plot):
+        """Passes the score of an evaluated pipeline to the automl algorithm and updates the search iteration plot.
+
+        Returns:
+            float: the score on the primary objective, converted so that lower values indicate better pipelines.
+        """
+        score = evaluation_results['cv_score_mean']
+        score_to_minimize = -score if self.objective.greater_is_better else score
+        self._automl_algorithm.add_result(score_to_minimize, pipeline)
+
+        if search_iteration_plot:
+            search_iteration_plot.update()
+        return score_to_minimize
+
+    def _evaluate_batch_in_parallel(self, pipelines, X, y, search_iteration_plot, data_fraction=1.0):
+        """Evaluates a batch of pipelines in a pool of batch_n_jobs worker processes.
+
+        Pipelines are submitted to the pool as workers become free, so the stopping conditions are checked before each
+        pipeline is started. Results are recorded and passed to the automl algorithm in the order the pipelines finish.
+        Evaluated pipelines are removed from `pipelines`.
+
+        Arguments:
+            pipelines (list(PipelineBase)): the pipelines of the current batch which have not been evaluated yet.
+            X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+            y (pd.Series): the target training data of length [n_samples]
+            search_iteration_plot (SearchIterationPlot, None): plot to update as results come in.
+            data_fraction (float): the fraction of the training data which X and y were sampled from.
+
+        Returns:
+            list(float): the primary objective scores of the evaluated pipelines, converted so that lower values indicate
+                better pipelines. None if the user stopped the search.
+        """
+        max_workers = effective_n_jobs(self.batch_n_jobs)
+        executor = get_reusable_executor(max_workers=max_workers)
+        objectives = [self.objective] + self.additional_objectives
+        scores = []
+        in_progress = {}
+        while pipelines or in_progress:
+            try:
+                while pipelines and len(in_progress) < max_workers and self._check_stopping_condition(self._start, num_in_progress=len(in_progress)):
+                    # the pipeline is only removed from the batch once it was submitted, so that it is started again if the
+                    # user continues the search after interrupting it while it was being started
+                    pipeline = pipelines[0]
+                    self._start_pipeline_evaluation(pipeline, len(self._results['pipeline_results']) + len(in_progress) + 1)
+                    folds = self._split_cv_folds(X, y)
+                    pruning_thresholds = self._get_pruning_thresholds(len(folds), data_fraction)
+                    future = executor.submit(_train_and_score_pipeline, pipeline, folds, objectives, self.optimize_thresholds,
+                                             pruning_thresholds=pruning_thresholds)
+                    in_progress[future] = (pipeline, folds, time.time())
+                    pipelines.pop(0)
+                if not in_progress:
+                    break
+                finished, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    pipeline, folds, start = in_progress.pop(future)
+                    try:
+                        fold_results = future.result()
+                    except Exception as e:
+                        # the worker failed outside of training and scoring, for example if the pipeline could not be pickled,
+                        # so every fold is recorded as failed, as if each of them had raised the error
+                        fold_results = [(None, None, e)] * len(folds)
+                    evaluation_results = self._process_cv_results(pipeline, folds, fold_results, time.time() - start)
+                    self._add_result(trained_pipeline=pipeline,
+                                     parameters=pipeline.parameters,
+                                     training_time=evaluation_results['training_time'],
+                                     cv_data=evaluation_results['cv_data'],
+                                     cv_scores=evaluation_results['cv_scores'],
+                                     data_fraction=data_fraction,
+                                     pruned=evaluation_results['pruned'])
+                    scores.append(self._register_evaluation_with_algorithm(pipeline, evaluation_results, search_iteration_plot))
+            except KeyboardInterrupt:
+                if not self._confirm_exit():
+                    continue
+                for future in in_progress:
+                    future.cancel()
+                pipelines.clear()
+                return None
+        return scores
+
+    def _sample_rows(self, X, y, data_fraction):
+        """Returns a random sample of the rows of the data, stratified by the target for classification problems.
+
+        Arguments:
+            X (pd.DataFrame): the input training data of shape [n_samples, n_features]
+            y (pd.Series): the target training data of length [n_samples]
+            data_fraction (float): the fraction of the rows to sample. If 1.0, all of the data is returned.
+
+        Returns:
+            pd.DataFrame, pd.Series: the sampled rows of X and y
+        """
+        if data_fraction >= 1.0:
+            return X, y
+        stratify = y if self.problem_type in [ProblemTypes.BINARY, ProblemTypes.MULTICLASS] else None
+        try:
+            X_sample, _, y_sample, _ = train_test_split(X, y, train_size=data_fraction, stratify=stratify, random_state=self.random_state)
+        except ValueError:
+            # stratifying fails if a class has too few rows
+            X_sample, _, y_sample, _ = train_test_split(X, y, train_size=data_fraction, random_state=self.random_state)
+        return X_sample, y_sample
+
+    def _limit_successive_halving(self):
+        """Sizes the default limits of a successive halving search to complete a bracket, and warns if max_iterations is too small
+        for any pipeline besides the baseline to be evaluated on all of the data."""
+        rung_sizes = self._automl_algorithm.rung_sizes
+        # the baseline is evaluated before the first bracket
+        min_iterations = 1 + sum(rung_sizes)
+        if self._max_batches and self.max_iterations is None:
+            self.max_iterations = 1 + sum(rung_sizes[batch % len(rung_sizes)] for batch in range(self._max_batches))
+        elif self._default_max_iterations:
+            self.max_iterations = min_iterations
+            logger.info(f"Using default limit of max_iterations={min_iterations}, which completes one successive halving bracket.\n")
+        self._automl_algorithm.max_iterations = self.max_iterations
+        if self.max_iterations is not None and self.max_iterations < min_iterations:
+            logger.warning(f"max_iterations={self.max_iterations} is too small for successive halving to evaluate any pipeline on all of "
+                           f"the data, so only the baseline will be ranked. Use max_iterations={min_iterations} or more to complete a bracket.")
+
+    def _check_stopping_condition(self, start, num_in_progress=0):
         should_continue = True
-        num_pipelines = len(self._results['pipeline_results'])
+        num_pipelines = len(self._results['pipeline_results']) + num_in_progress
 
         # check max_time and max_iterations
         elapsed = time.time() - start
@@ -526,10 +881,13 @@ class AutoMLSearch:
         if self.patience is None:
             return True
 
-        first_id = self._results['search_order'][0]
+        # only results on all of the data are comparable
+        search_order = [id for id in self._results['search_order']
+                        if self._results['pipeline_results'][id].get('data_fraction', 1.0) == 1.0]
+        first_id = search_order[0]
         best_score = self._results['pipeline_results'][first_id]['score']
         num_without_improvement = 0
-        for id in self._results['search_order'][1:]:
+        for id in search_order[1:]:
             curr_score = self._results['pipeline_results'][id]['score']
             significant_change = abs((curr_score - best_score) / best_score) > self.tolerance
             score_improved = curr_score > best_score if self.objective.greater_is_better else curr_score < best_score
@@ -603,78 +961,145 @@ class AutoMLSearch:
 
         return False
 
-    def _compute_cv_scores(self, pipeline, X, y):
+    def _compute_cv_scores(self, pipeline, X, y, data_fraction=1.0, prune=False):
         start = time.time()
-        cv_data = []
         logger.info("\tStarting cross validation")
-        for i, (train, test) in enumerate(self.data_split.split(X, y)):
-            logger.debug(f"\t\tTraining and scoring on fold {i}")
-            X_train, X_test = X.iloc[train], X.iloc[test]
-            y_train, y_test = y.iloc[train], y.iloc[test]
-            objectives_to_score = [self.objective] + self.additional_objectives
-            cv_pipeline = None
-            try:
-                X_threshold_tuning = None
-                y_threshold_tuning = None
-                if self.optimize_thresholds and self.objective.problem_type == ProblemTypes.BINARY and self.objective.can_optimize_threshold:
-                    X_train, X_threshold_tuning, y_train, y_threshold_tuning = train_test_split(X_train, y_train, test_size=0.2, random_state=self.random_state)
-                cv_pipeline = pipeline.clone()
-                logger.debug(f"\t\t\tFold {i}: starting training")
-                cv_pipeline.fit(X_train, y_train)
-                logger.debug(f"\t\t\tFold {i}: finished training")
-                if self.objective.problem_type == ProblemTypes.BINARY:
-                    cv_pipeline.threshold = 0.5
-                    if self.optimize_thresholds and self.objective.can_optimize_threshold:
-                        logger.debug(f"\t\t\tFold {i}: Optimizing threshold for {self.objective.name}")
-                        y_predict_proba = cv_pipeline.predict_proba(X_threshold_tuning)
-                        if isinstance(y_predict_proba, pd.DataFrame):
-                            y_predict_proba = y_predict_proba.iloc[:, 1]
-                        else:
-                            y_predict_proba = y_predict_proba[:, 1]
-                        cv_pipeline.threshold = self.objective.optimize_threshold(y_predict_proba, y_threshold_tuning, X=X_threshold_tuning)
-                        logger.debug(f"\t\t\tFold {i}: Optimal threshold found ({cv_pipeline.threshold:.3f})")
-                logger.debug(f"\t\t\tFold {i}: Scoring trained pipeline")
-                scores = cv_pipeline.score(X_test, y_test, objectives=objectives_to_score)
+        folds = self._split_cv_folds(X, y)
+        pruning_thresholds = self._get_pruning_thresholds(len(folds), data_fraction) if prune else None
+        fold_results = self._train_and_score_folds(pipeline, folds, pruning_thresholds)
+        return self._process_cv_results(pipeline, folds, fold_results, time.time() - start)
+
+    def _get_pruning_thresholds(self, n_folds, data_fraction=1.0):
+        """Computes the scores above which cross validation of a pipeline is stopped, for the cv_pruning rule.
+
+        Only previous pipelines which were evaluated on the same fraction of the data and were not pruned are compared against.
+
+        Arguments:
+            n_folds (int): the number of cross-validation folds.
+            data_fraction (float): the fraction of the training data the pipeline is evaluated on.
+
+        Returns:
+            list(float), None: for each fold but the last, the threshold which the mean primary objective score of the folds
+                completed so far is compared to, converted so that lower values indicate better pipelines. None if no pruning applies.
+        """
+        if self.cv_pruning is None or n_folds < 2:
+            return None
+        sign = -1 if self.objective.greater_is_better else 1
+        previous_fold_scores = [sign * np.array([fold['score'] for fold in result['cv_data']], dtype=float)
+                                for result in self._results['pipeline_results'].values()
+                                if result.get('data_fraction', 1.0) == data_fraction and not result.get('pruned', False)]
+        if not previous_fold_scores:
+            return None
+        thresholds = []
+        if self.cv_pruning == 'margin':
+            mean_scores = [np.mean(fold_scores) for fold_scores in previous_fold_scores]
+            mean_scores = [score for score in mean_scores if not np.isnan(score)]
+            if not mean_scores:
+                return None
+            best_score = min(mean_scores)
+            thresholds = [best_score + self.cv_pruning_margin * abs(best_score)] * (n_folds - 1)
+        elif self.cv_pruning == 'median':
+            for fold_num in range(n_folds - 1):
+                running_means = [np.mean(fold_scores[:fold_num + 1]) for fold_scores in previous_fold_scores if len(fold_scores) > fold_num]
+                running_means = [score for score in running_means if not np.isnan(score)]
+                thresholds.append(np.median(running_means) if running_means else None)
+        return thresholds
+
+    def _process_cv_results(self, pipeline, folds, fold_results, training_time):
+        """Logs the outcome of each fold and collects the fold scores into the cross-validation results of a pipeline.
+
+        Arguments:
+            pipeline (PipelineBase): the pipeline which was evaluated.
+            folds (list(dict)): the data of each fold, as returned by _split_cv_folds.
+            fold_results (list(tuple)): (scores, threshold, error) for each fold.
+            training_time (float): time taken to evaluate the pipeline, in seconds.
+
+        Returns:
+            dict: the cross-validation data, training time, fold scores and mean score, and whether cross validation was pruned.
+        """
+        pruned = len(fold_results) < len(folds)
+        cv_data = []
+        for i, (fold, (scores, threshold, e)) in enumerate(zip(folds, fold_results)):
+            if e is None:
                 logger.debug(f"\t\t\tFold {i}: {self.objective.name} score: {scores[self.objective.name]:.3f}")
                 score = scores[self.objective.name]
-            except Exception as e:
-                if isinstance(e, PipelineScoreError):
-                    logger.info(f"\t\t\tFold {i}: Encountered an error scoring the following objectives: {', '.join(e.exceptions)}.")
-                    logger.info(f"\t\t\tFold {i}: The scores for these objectives will be replaced with nan.")
-                    logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
-                    logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
-                    logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
-                    nan_scores = {objective: np.nan for objective in e.exceptions}
-                    scores = {**nan_scores, **e.scored_successfully}
-                    scores = OrderedDict({o.name: scores[o.name] for o in [self.objective] + self.additional_objectives})
-                    score = scores[self.objective.name]
-                else:
-                    logger.info(f"\t\t\tFold {i}: Encountered an error.")
-                    logger.info(f"\t\t\tFold {i}: All scores will be replaced with nan.")
-                    logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
-                    logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
-                    logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
-                    score = np.nan
-                    scores = OrderedDict(zip([n.name for n in self.additional_objectives], [np.nan] * len(self.additional_objectives)))
+            elif isinstance(e, PipelineScoreError):
+                logger.info(f"\t\t\tFold {i}: Encountered an error scoring the following objectives: {', '.join(e.exceptions)}.")
+                logger.info(f"\t\t\tFold {i}: The scores for these objectives will be replaced with nan.")
+                logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
+                logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
+                logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
+                nan_scores = {objective: np.nan for objective in e.exceptions}
+                scores = {**nan_scores, **e.scored_successfully}
+                scores = OrderedDict({o.name: scores[o.name] for o in [self.objective] + self.additional_objectives})
+                score = scores[self.objective.name]
+            else:
+                logger.info(f"\t\t\tFold {i}: Encountered an error.")
+                logger.info(f"\t\t\tFold {i}: All scores will be replaced with nan.")
+                logger.info(f"\t\t\tFold {i}: Please check {logger.handlers[1].baseFilename} for the current hyperparameters and stack trace.")
+                logger.debug(f"\t\t\tFold {i}: Hyperparameters:\n\t{pipeline.hyperparameters}")
+                logger.debug(f"\t\t\tFold {i}: Exception during automl search: {str(e)}")
+                score = np.nan
+                scores = OrderedDict(zip([n.name for n in self.additional_objectives], [np.nan] * len(self.additional_objectives)))
 
             ordered_scores = OrderedDict()
             ordered_scores.update({self.objective.name: score})
             ordered_scores.update(scores)
-            ordered_scores.update({"# Training": len(y_train)})
-            ordered_scores.update({"# Testing": len(y_test)})
+            ordered_scores.update({"# Training": len(fold["y_train"])})
+            ordered_scores.update({"# Testing": len(fold["y_test"])})
 
-            evaluation_entry = {"all_objective_scores": ordered_scores, "score": score, 'binary_classification_threshold': None}
-            if isinstance(cv_pipeline, BinaryClassificationPipeline) and cv_pipeline.threshold is not None:
-                evaluation_entry['binary_classification_threshold'] = cv_pipeline.threshold
+            evaluation_entry = {"all_objective_scores": ordered_scores, "score": score, 'binary_classification_threshold': threshold}
             cv_data.append(evaluation_entry)
 
-        training_time = time.time() - start
         cv_scores = pd.Series([fold['score'] for fold in cv_data])
         cv_score_mean = cv_scores.mean()
-        logger.info(f"\tFinished cross validation - mean {self.objective.name}: {cv_score_mean:.3f}")
-        return {'cv_data': cv_data, 'training_time': training_time, 'cv_scores': cv_scores, 'cv_score_mean': cv_score_mean}
+        if pruned:
+            logger.info(f"\tPruned cross validation after {len(cv_data)} of {len(folds)} folds - mean {self.objective.name}: {cv_score_mean:.3f}")
+        else:
+            logger.info(f"\tFinished cross validation - mean {self.objective.name}: {cv_score_mean:.3f}")
+        return {'cv_data': cv_data, 'training_time': training_time, 'cv_scores': cv_scores, 'cv_score_mean': cv_score_mean, 'pruned': pruned}
 
-    def _add_result(self, trained_pipeline, parameters, training_time, cv_data, cv_scores):
+    def _split_cv_folds(self, X, y):
+        """Splits the data into the training, testing and threshold tuning data for each cross-validation fold.
+
+        Splitting is done serially in fold order so that the random state is consumed in the same order
+        regardless of whether the folds are then trained serially or in parallel.
+
+        Returns:
+            list(dict): one dictionary of data per fold. If splitting off the threshold tuning data fails,
+                the exception is stored under "error" and the fold is not trained.
+        """
+        folds = []
+        for train, test in self.data_split.split(X, y):
+            fold = {"X_train": X.iloc[train], "y_train": y.iloc[train],
+                    "X_test": X.iloc[test], "y_test": y.iloc[test],
+                    "X_threshold_tuning": None, "y_threshold_tuning": None,
+                    "error": None}
+            if self.optimize_thresholds and self.objective.problem_type == ProblemTypes.BINARY and self.objective.can_optimize_threshold:
+                try:
+                    fold["X_train"], fold["X_threshold_tuning"], fold["y_train"], fold["y_threshold_tuning"] = train_test_split(fold["X_train"], fold["y_train"], test_size=0.2, random_state=self.random_state)
+                except Exception as e:
+                    fold["error"] = e
+            folds.append(fold)
+        return folds
+
+    def _train_and_score_folds(self, pipeline, folds, pruning_thresholds=None):
+        """Trains and scores the pipeline on each fold. Folds are evaluated in parallel if cv_n_jobs allows it.
+        Otherwise, the remaining folds are skipped once the mean score of the completed folds is above the fold's pruning threshold.
+
+        Returns:
+            list(tuple): (scores, threshold, error) for each fold which was evaluated, in fold order.
+        """
+        objectives = [self.objective] + self.additional_objectives
+        if self.cv_n_jobs in (None, 1):
+            return _train_and_score_pipeline(pipeline, folds, objectives, self.optimize_thresholds, self._transform_cache,
+                                             pruning_thresholds=pruning_thresholds)
+        tasks = [(i, pipeline, fold, objectives, self.optimize_thresholds)
+                 for i, fold in enumerate(folds) if fold["error"] is None]
+        results = iter(Parallel(n_jobs=self.cv_n_jobs)(delayed(_train_and_score_fold)(*task) for task in tasks))
+        return [next(results) if fold["error"] is None else (None, None, fold["error"]) for fold in folds]
+
+    def _add_result(self, trained_pipeline, parameters, training_time, cv_data, cv_scores, data_fraction=1.0, pruned=False):
         cv_score = cv_scores.mean()
         percent_better = self.objective.calculate_percent_difference(cv_score, self._baseline_cv_score)
         # calculate high_variance_cv
@@ -697,23 +1122,34 @@ class AutoMLSearch:
             "high_variance_cv": high_variance_cv,
             "training_time": training_time,
             "cv_data": cv_data,
-            "percent_better_than_baseline": percent_better
+            "percent_better_than_baseline": percent_better,
+            "data_fraction": data_fraction,
+            "pruned": pruned
         }
         self._results['search_order'].append(pipeline_id)
 
+        if self._journal is not None:
+            result = {key: value for key, value in self._results['pipeline_results'][pipeline_id].items() if key != "pipeline_class"}
+            self._journal.append({"type": "result",
+                                  "batch": self._journal_batch_number,
+                                  "search_time": time.time() - self._start,
+                                  "result": result})
+
         if self.add_result_callback:
             self.add_result_callback(self._results['pipeline_results'][pipeline_id], trained_pipeline, self)
 
-    def _evaluate(self, pipeline, X, y):
+    def _evaluate(self, pipeline, X, y, data_fraction=1.0, prune=True):
         parameters = pipeline.parameters
-        evaluation_results = self._compute_cv_scores(pipeline, X, y)
+        evaluation_results = self._compute_cv_scores(pipeline, X, y, data_fraction=data_fraction, prune=prune)
         logger.debug('Adding results for pipeline {}\nparameters {}\nevaluation_results {}'.format(pipeline.name, parameters, evaluation_results))
 
         self._add_result(trained_pipeline=pipeline,
                          parameters=parameters,
                          training_time=evaluation_results['training_time'],
                          cv_data=evaluation_results['cv_data'],
-                         cv_scores=evaluation_results['cv_scores'])
+                         cv_scores=evaluation_results['cv_scores'],
+                         data_fraction=data_fraction,
+                         pruned=evaluation_results['pruned'])
 
         logger.debug('Adding results complete')
         return evaluation_results
@@ -815,7 +1251,7 @@ class AutoMLSearch:
         for parameter in pipeline_rows['parameters']:
             if pipeline.parameters == parameter:
                 return
-        self._evaluate(pipeline, X, y)
+        self._evaluate(pipeline, X, y, prune=False)
 
     @property
     def results(self):
@@ -839,7 +1275,11 @@ class AutoMLSearch:
 
     @property
     def full_rankings(self):
-        """Returns a pandas.DataFrame with scoring results from all pipelines searched"""
+        """Returns a pandas.DataFrame with scoring results from all pipelines searched.
+
+        Pipelines which were evaluated on a sample of the data or whose cross-validation was pruned are left out, since their scores
+        are not comparable with scores on all of the folds of all of the data. They can still be found in results.
+        """
         ascending = True
         if self.objective.greater_is_better:
             ascending = False
@@ -849,8 +1289,9 @@ class AutoMLSearch:
         if not self.has_searched:
             return pd.DataFrame(columns=full_rankings_cols)
 
-        rankings_df = pd.DataFrame(self._results['pipeline_results'].values())
-        rankings_df = rankings_df[full_rankings_cols]
+        pipeline_results = [result for result in self._results['pipeline_results'].values()
+                            if result.get('data_fraction', 1.0) == 1.0 and not result.get('pruned', False)]
+        rankings_df = pd.DataFrame(pipeline_results, columns=full_rankings_cols)
         rankings_df.sort_values("score", ascending=ascending, inplace=True)
         rankings_df.reset_index(drop=True, inplace=True)
         return rankings_df
@@ -868,28 +1309,121 @@ class AutoMLSearch:
         best = self.rankings.iloc[0]
         return self.get_pipeline(best["id"])
 
-    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
+    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL, artifact=False):
         """Saves AutoML object at file path
 
         Arguments:
-            file_path (str): location to save file
+            file_path (str): location to save file, or the directory to save the artifact to if artifact is True
             pickle_protocol (int): the pickle data stream format.
+            artifact (bool): whether to save a versioned artifact directory, with a manifest, fitted numpy arrays which are
+                memory-mapped on load and estimator backends in their native formats, rather than a single pickle file.
+                See evalml.utils.save_artifact. Defaults to False.
 
         Returns:
             None
         """
+        if artifact:
+            metadata = {'problem_type': str(self.problem_type),
+                        'objective': self.objective.name,
+                        'pipelines_evaluated': len(self.results['pipeline_results'])}
+            save_artifact(self, file_path, pickle_protocol, metadata=metadata)
+            return
         with open(file_path, 'wb') as f:
             cloudpickle.dump(self, f, protocol=pickle_protocol)
 
     @staticmethod
-    def load(file_path):
+    def load(file_path, mmap_mode='r'):
         """Loads AutoML object at file path
 
         Arguments:
-            file_path (str): location to find file to load
+            file_path (str): location to find file to load, or an artifact directory
+            mmap_mode (str or None): how to memory-map the fitted numpy arrays of an artifact. See evalml.utils.load_artifact.
+                Defaults to 'r'.
 
         Returns:
             AutoSearchBase object
         """
+        if is_artifact(file_path):
+            return load_artifact(file_path, mmap_mode)
         with open(file_path, 'rb') as f:
             return cloudpickle.load(f)
+
+
+def _train_and_score_fold(fold_num, pipeline, fold, objectives, optimize_thresholds, transform_cache=None):
+    """Trains a clone of the pipeline on one cross-validation fold and scores it on the fold's test data.
+
+    Defined at the module level so that folds can be dispatched to worker processes.
+
+    Arguments:
+        fold_num (int): index of the fold, used for logging.
+        pipeline (PipelineBase): the pipeline to clone, train and score.
+        fold (dict): the fold's training, testing and threshold tuning data, as returned by AutoMLSearch._split_cv_folds.
+        objectives (list(ObjectiveBase)): objectives to score on. The first one is the primary objective.
+        optimize_thresholds (bool): whether to optimize the binary classification threshold for the primary objective.
+        transform_cache (TransformCache, None): cache of fitted preprocessing components to share with other pipelines.
+
+    Returns:
+        tuple: the dictionary of scores (None if an error was raised), the binary classification threshold of the
+            trained pipeline (None if not applicable) and the exception raised while training or scoring (None if successful).
+    """
+    logger.debug(f"\t\tTraining and scoring on fold {fold_num}")
+    objective = objectives[0]
+    cv_pipeline = None
+    scores = None
+    error = None
+    try:
+        cv_pipeline = pipeline.clone()
+        cv_pipeline._transform_cache = transform_cache
+        logger.debug(f"\t\t\tFold {fold_num}: starting training")
+        cv_pipeline.fit(fold["X_train"], fold["y_train"])
+        logger.debug(f"\t\t\tFold {fold_num}: finished training")
+        if objective.problem_type == ProblemTypes.BINARY:
+            cv_pipeline.threshold = 0.5
+            if optimize_thresholds and objective.can_optimize_threshold:
+                logger.debug(f"\t\t\tFold {fold_num}: Optimizing threshold for {objective.name}")
+                y_predict_proba = cv_pipeline.predict_proba(fold["X_threshold_tuning"])
+                if isinstance(y_predict_proba, pd.DataFrame):
+                    y_predict_proba = y_predict_proba.iloc[:, 1]
+                else:
+                    y_predict_proba = y_predict_proba[:, 1]
+                cv_pipeline.threshold = objective.optimize_threshold(y_predict_proba, cv_pipeline._encode_targets(fold["y_threshold_tuning"]),
+                                                                     X=fold["X_threshold_tuning"])
+                logger.debug(f"\t\t\tFold {fold_num}: Optimal threshold found ({cv_pipeline.threshold:.3f})")
+        logger.debug(f"\t\t\tFold {fold_num}: Scoring trained pipeline")
+        scores = cv_pipeline.score(fold["X_test"], fold["y_test"], objectives=objectives)
+    except Exception as e:
+        error = e
+    threshold = None
+    if isinstance(cv_pipeline, BinaryClassificationPipeline) and cv_pipeline.threshold is not None:
+        threshold = cv_pipeline.threshold
+    return scores, threshold, error
+
+
+def _train_and_score_pipeline(pipeline, folds, objectives, optimize_thresholds, transform_cache=None, pruning_thresholds=None):
+    """Trains and scores a pipeline on every cross-validation fold, one fold after another.
+
+    Defined at the module level so that whole pipeline evaluations can be dispatched to worker processes.
+
+    Arguments:
+        pruning_thresholds (list(float), None): for each fold but the last, the threshold above which the remaining folds are
+            skipped. Compared to the mean primary objective score of the folds completed so far, converted so that lower values
+            indicate better pipelines. None to evaluate every fold.
+
+    Returns:
+        list(tuple): (scores, threshold, error) for each fold which was evaluated, in fold order. Folds which failed to split are not trained.
+    """
+    objective = objectives[0]
+    sign = -1 if objective.greater_is_better else 1
+    fold_results = []
+    primary_scores = []
+    for i, fold in enumerate(folds):
+        if fold["error"] is None:
+            fold_results.append(_train_and_score_fold(i, pipeline, fold, objectives, optimize_thresholds, transform_cache))
+        else:
+            fold_results.append((None, None, fold["error"]))
+        scores, _, error = fold_results[-1]
+        primary_scores.append(sign * scores[objective.name] if error is None else np.nan)
+        if pruning_thresholds is not None and i < len(pruning_thresholds) and pruning_thresholds[i] is not None:
+            if np.mean(primary_scores) > pruning_thresholds[i]:
+                break
+    return fold_results
@@ -0,0 +1,93 @@
+import json
+import os
+
+import numpy as np
+
+# records tuples as objects with this single key, so that they are not read back as lists
+_TUPLE_KEY = "__tuple__"
+
+
+class SearchJournal:
+    """Append-only record of the progress of an automl search, stored as a file with one JSON object per line.
+
+    Each record is written and flushed to disk as soon as it is appended, so that a search which is interrupted by a crash
+    or a preempted machine can be resumed from the records written before it stopped.
+    """
+
+    def __init__(self, file_path):
+        """Create a SearchJournal
+
+        Arguments:
+            file_path (str): location of the journal file. The file is created when the first record is appended.
+        """
+        self.file_path = file_path
+
+    def append(self, record):
+        """Appends a record to the journal and flushes it to disk.
+
+        Arguments:
+            record (dict): the record to append. Numpy values are converted to the equivalent python values. Tuples are
+                recorded so that they are read back as tuples rather than lists.
+        """
+        line = json.dumps(_encode_tuples(record), default=_to_json)
+        with open(self.file_path, 'a') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read(self):
+        """Reads the records in the journal.
+
+        A final record which was only partially written, for example because the process was killed while writing it, is ignored.
+
+        Returns:
+            list(dict): the records in the order they were appended. Empty if the journal file does not exist.
+        """
+        if not os.path.exists(self.file_path):
+            return []
+        with open(self.file_path) as f:
+            lines = f.read().split('\n')
+        records = []
+        for line_number, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line, object_hook=_decode_tuples))
+            except ValueError:
+                if line_number == len(lines) - 1:
+                    break
+                raise ValueError(f"Line {line_number + 1} of the journal at {self.file_path} is not a valid record.")
+        return records
+
+    def clear(self):
+        """Removes all of the records from the journal."""
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+
+def _to_json(value):
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} cannot be written to the search journal")
+
+
+def _encode_tuples(value):
+    if isinstance(value, tuple):
+        return {_TUPLE_KEY: [_encode_tuples(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode_tuples(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode_tuples(item) for key, item in value.items()}
+    return value
+
+
+def _decode_tuples(obj):
+    if list(obj) == [_TUPLE_KEY]:
+        return tuple(obj[_TUPLE_KEY])
+    return obj
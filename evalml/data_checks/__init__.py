@@ -1,6 +1,8 @@
 # flake8:noqas
 from .data_check import DataCheck
 from .data_checks import DataChecks
+from .data_profile import DataProfile, StreamingDataProfile
+from .sketches import HyperLogLog
 from .data_check_message import DataCheckMessage, DataCheckWarning, DataCheckError
 from .data_check_message_type import DataCheckMessageType
 from .default_data_checks import DefaultDataChecks
@@ -7,6 +7,8 @@ from .data_check_message import DataCheckWarning
 class ClassImbalanceDataCheck(DataCheck):
     """Checks if any target labels are imbalanced beyond a threshold. Use for classification problems"""
 
+    _ignores_features = True
+
     def validate(self, X, y, threshold=0.10):
         """Checks if any target labels are imbalanced beyond a threshold for binary and multiclass problems
         Ignores nan values in target labels if they appear
@@ -6,6 +6,9 @@ from evalml.utils import classproperty
 class DataCheck(ABC):
     """Base class for all data checks. Data checks are a set of heuristics used to determine if there are problems with input data."""
 
+    # whether the data check only inspects the target, so that DataChecks.validate_chunks can run it without the features
+    _ignores_features = False
+
     @classproperty
     def name(cls):
         """Returns a name describing the data check."""
@@ -1,4 +1,12 @@
+import inspect
+
+import pandas as pd
+
 from .data_check import DataCheck
+from .data_profile import DataProfile, StreamingDataProfile
+from .label_leakage_data_check import LabelLeakageDataCheck
+
+from evalml.utils.gen_utils import _iter_chunks
 
 
 class DataChecks:
@@ -18,13 +26,19 @@ class DataChecks:
 
         self.data_checks = data_checks
 
-    def validate(self, X, y=None):
+    def _supports_profile(self, data_check):
+        return 'profile' in inspect.signature(data_check.validate).parameters
+
+    def validate(self, X, y=None, profile=None):
         """
         Inspects and validates the input data against data checks and returns a list of warnings and errors if applicable.
 
+        The profile of the input data is computed once and shared by all of the data checks whose validate method accepts a profile.
+
         Arguments:
             X (pd.DataFrame): The input data of shape [n_samples, n_features]
             y (pd.Series): The target data of length [n_samples]
+            profile (DataProfile): Profile of X. If None, the profile is computed from X when a data check needs it.
 
         Returns:
             list (DataCheckMessage): List containing DataCheckMessage objects
@@ -32,6 +46,56 @@ class DataChecks:
         """
         messages = []
         for data_check in self.data_checks:
-            messages_new = data_check.validate(X, y)
+            if self._supports_profile(data_check):
+                if profile is None:
+                    profile = DataProfile(X)
+                messages_new = data_check.validate(X, y, profile=profile)
+            else:
+                messages_new = data_check.validate(X, y)
+            messages.extend(messages_new)
+        return messages
+
+    def validate_chunks(self, X, target=None, chunksize=100000, precision=14):
+        """
+        Validates data which is read one chunk of rows at a time, without holding all of the features in memory.
+
+        The features are summarized by a StreamingDataProfile with approximate unique counts, which is passed to the data checks
+        whose validate method accepts a profile. The target column is kept in memory. Data checks which only inspect the target,
+        such as InvalidTargetDataCheck, are given features that have no rows. Other data checks which do not accept a profile need
+        every row of the features, such as OutliersDataCheck, and are not supported.
+
+        Arguments:
+            X (pd.DataFrame, str or iterable(pd.DataFrame)): a dataframe, the path of a CSV or Parquet file, or an iterable of chunks
+            target (str): the name of the target column in the chunks. If None, the data checks are given no target.
+            chunksize (int): the number of rows in each chunk read from a dataframe or file. Defaults to 100000.
+            precision (int): The precision of the HyperLogLog sketch of each column. Defaults to 14.
+
+        Returns:
+            list (DataCheckMessage): List containing DataCheckMessage objects
+        """
+        unsupported = [data_check.name for data_check in self.data_checks
+                       if not self._supports_profile(data_check) and not data_check._ignores_features]
+        if unsupported:
+            raise ValueError(f"Data checks {unsupported} need every row of the features and cannot validate data in chunks. "
+                             "Use validate instead.")
+        # only label leakage checks read the correlations of the features with the target
+        keep_correlations = any(isinstance(data_check, LabelLeakageDataCheck) for data_check in self.data_checks)
+        profile = StreamingDataProfile(precision=precision, keep_correlations=keep_correlations)
+        targets = []
+        for chunk in _iter_chunks(X, chunksize):
+            y_chunk = None
+            if target is not None:
+                y_chunk = chunk[target]
+                chunk = chunk.drop(columns=[target])
+                targets.append(y_chunk)
+            profile.update(chunk, y_chunk)
+        y = pd.concat(targets) if targets else None
+
+        messages = []
+        for data_check in self.data_checks:
+            if self._supports_profile(data_check):
+                messages_new = data_check.validate(profile._empty, y, profile=profile)
+            else:
+                messages_new = data_check.validate(profile._empty, y)
             messages.extend(messages_new)
         return messages
@@ -0,0 +1,175 @@
+import pandas as pd
+from joblib import Parallel, delayed
+
+from .sketches import CorrelationSketch, HyperLogLog
+
+from evalml.utils.gen_utils import _iter_chunks, numeric_and_boolean_dtypes
+
+
+class DataProfile:
+    """Summary statistics of the columns of a dataset, computed in a single pass over each column.
+
+    Data checks and pipeline generation read the statistics they need from a profile instead of scanning the data again.
+    """
+
+    def __init__(self, X, n_jobs=None):
+        """Computes the profile of the input data.
+
+        Arguments:
+            X (pd.DataFrame): the input data of shape [n_samples, n_features]
+            n_jobs (int or None): Number of columns to profile in parallel, using a pool of threads. None and 1 are equivalent and
+                profile one column at a time. If set to -1, all CPUs are used. Defaults to None.
+        """
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(X)
+        self.n_rows = len(X)
+        column_stats = Parallel(n_jobs=n_jobs, prefer='threads')(delayed(_profile_column)(X.iloc[:, i]) for i in range(X.shape[1]))
+        self.null_counts = pd.Series([null_count for null_count, _ in column_stats], index=X.columns, dtype='int64')
+        self.unique_counts = pd.Series([unique_count for _, unique_count in column_stats], index=X.columns, dtype='int64')
+        self.dtypes = X.dtypes
+        self._empty = X.iloc[:0]
+
+    @property
+    def percent_null(self):
+        """Returns the fraction of the values of each column which are null."""
+        return self.null_counts / self.n_rows
+
+    def select_columns(self, include=None, exclude=None):
+        """Returns the names of the columns whose dtypes are included and not excluded, with the same semantics as pd.DataFrame.select_dtypes.
+
+        Arguments:
+            include (list): dtypes or strings of dtypes to include.
+            exclude (list): dtypes or strings of dtypes to exclude.
+
+        Returns:
+            list: names of the selected columns
+        """
+        return self._empty.select_dtypes(include=include, exclude=exclude).columns.tolist()
+
+
+class StreamingDataProfile(DataProfile):
+    """Approximate profile of a dataset, updated one chunk of rows at a time with mergeable per-column sketches.
+
+    Null counts are exact. Unique counts are exact while a column has at most 2 ** precision unique values, and otherwise are
+    HyperLogLog estimates; an estimate within three standard errors of the number of non-null rows is reported as all of the rows
+    being unique. If chunks of a numeric or boolean target are given, the Pearson correlation of each numeric feature with the
+    target is also kept.
+    """
+
+    def __init__(self, precision=14, keep_correlations=True):
+        """Create an empty profile.
+
+        Arguments:
+            precision (int): The precision of the HyperLogLog sketch of each column. Defaults to 14.
+            keep_correlations (bool): If True, the correlations of the numeric features with a numeric or boolean target are kept.
+                Defaults to True.
+        """
+        self.precision = precision
+        self.keep_correlations = keep_correlations
+        self._target_is_numeric = True
+        self.n_rows = 0
+        self._null_counts = {}
+        self._unique_sketches = {}
+        self._correlation_sketch = None
+        self._empty = pd.DataFrame()
+
+    @classmethod
+    def from_chunks(cls, X, chunksize=100000, precision=14):
+        """Computes the profile of data which is read one chunk at a time.
+
+        Arguments:
+            X (pd.DataFrame, str or iterable(pd.DataFrame)): a dataframe, the path of a CSV or Parquet file, or an iterable of chunks
+            chunksize (int): the number of rows in each chunk read from a dataframe or file. Defaults to 100000.
+            precision (int): The precision of the HyperLogLog sketch of each column. Defaults to 14.
+
+        Returns:
+            StreamingDataProfile: the profile of all of the chunks
+        """
+        profile = cls(precision=precision)
+        for chunk in _iter_chunks(X, chunksize):
+            profile.update(chunk)
+        return profile
+
+    def update(self, X, y=None):
+        """Adds a chunk of rows to the profile.
+
+        Arguments:
+            X (pd.DataFrame): a chunk of the input data
+            y (pd.Series): the target of the rows in the chunk, aligned with X by position. If None, correlations with the target are not
+                updated. If any chunk of the target is not numeric or boolean, no correlations are kept.
+        """
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(X)
+        self.n_rows += len(X)
+        for col_name, column in X.iteritems():
+            self._null_counts[col_name] = self._null_counts.get(col_name, 0) + int(column.isnull().sum())
+            self._unique_sketches.setdefault(col_name, HyperLogLog(self.precision)).add(column)
+        self._empty = pd.concat([self._empty, X.iloc[:0]]) if len(self._empty.columns) else X.iloc[:0]
+        if y is not None and self.keep_correlations and self._target_is_numeric:
+            y = pd.Series(y)
+            if y.dtype not in numeric_and_boolean_dtypes:
+                self._target_is_numeric = False
+                self._correlation_sketch = None
+                return
+            if self._correlation_sketch is None:
+                self._correlation_sketch = CorrelationSketch()
+            self._correlation_sketch.update(X.select_dtypes(include=numeric_and_boolean_dtypes), y)
+
+    def merge(self, other):
+        """Adds all of the rows of another profile with the same precision to this profile.
+
+        Arguments:
+            other (StreamingDataProfile): the profile to merge into this one
+
+        Returns:
+            StreamingDataProfile: this profile
+        """
+        self.n_rows += other.n_rows
+        for col_name, null_count in other._null_counts.items():
+            self._null_counts[col_name] = self._null_counts.get(col_name, 0) + null_count
+        for col_name, sketch in other._unique_sketches.items():
+            self._unique_sketches.setdefault(col_name, HyperLogLog(self.precision)).merge(sketch)
+        self._empty = pd.concat([self._empty, other._empty]) if len(self._empty.columns) else other._empty
+        if not other._target_is_numeric:
+            self._target_is_numeric = False
+            self._correlation_sketch = None
+        elif other._correlation_sketch is not None and self._target_is_numeric:
+            if self._correlation_sketch is None:
+                self._correlation_sketch = CorrelationSketch()
+            self._correlation_sketch.merge(other._correlation_sketch)
+        return self
+
+    @property
+    def null_counts(self):
+        """Returns the number of null values in each column."""
+        return pd.Series(self._null_counts, index=self._empty.columns, dtype='int64')
+
+    @property
+    def unique_counts(self):
+        """Returns the exact or estimated number of unique non-null values in each column."""
+        unique_counts = {}
+        for col_name, sketch in self._unique_sketches.items():
+            n_non_null = self.n_rows - self._null_counts[col_name]
+            count = sketch.count()
+            if count >= n_non_null * (1 - 3 * sketch.relative_error):
+                count = n_non_null
+            unique_counts[col_name] = int(round(count))
+        return pd.Series(unique_counts, index=self._empty.columns, dtype='int64')
+
+    @property
+    def dtypes(self):
+        """Returns the dtype of each column, combined over all of the chunks."""
+        return self._empty.dtypes
+
+    @property
+    def target_correlations(self):
+        """Returns the Pearson correlation of each numeric feature with the target, or None if no numeric or boolean target was given."""
+        if self._correlation_sketch is None:
+            return None
+        return self._correlation_sketch.correlations()
+
+
+def _profile_column(column):
+    """Returns the number of null values and the number of unique non-null values in a column, with a single hashing pass over it."""
+    codes, uniques = pd.factorize(column)
+    return int((codes == -1).sum()), len(uniques)
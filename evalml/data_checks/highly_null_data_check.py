@@ -2,6 +2,7 @@ import pandas as pd
 
 from .data_check import DataCheck
 from .data_check_message import DataCheckWarning
+from .data_profile import DataProfile
 
 
 class HighlyNullDataCheck(DataCheck):
@@ -19,12 +20,13 @@ class HighlyNullDataCheck(DataCheck):
             raise ValueError("pct_null_threshold must be a float between 0 and 1, inclusive.")
         self.pct_null_threshold = pct_null_threshold
 
-    def validate(self, X, y=None):
+    def validate(self, X, y=None, profile=None):
         """Checks if there are any highly-null columns in the input.
 
         Arguments:
             X (pd.DataFrame, pd.Series, np.array, list): Features
             y: Ignored.
+            profile (DataProfile): Profile of X. If None, the profile is computed from X.
 
         Returns:
             list (DataCheckWarning): List with a DataCheckWarning if there are any highly-null columns.
@@ -37,9 +39,11 @@ class HighlyNullDataCheck(DataCheck):
             >>> null_check = HighlyNullDataCheck(pct_null_threshold=0.8)
             >>> assert null_check.validate(df) == [DataCheckWarning("Column 'lots_of_null' is 80.0% or more null", "HighlyNullDataCheck")]
         """
-        if not isinstance(X, pd.DataFrame):
-            X = pd.DataFrame(X)
-        percent_null = (X.isnull().mean()).to_dict()
+        if profile is None:
+            if not isinstance(X, pd.DataFrame):
+                X = pd.DataFrame(X)
+            profile = DataProfile(X)
+        percent_null = profile.percent_null.to_dict()
         if self.pct_null_threshold == 0.0:
             all_null_cols = {key: value for key, value in percent_null.items() if value > 0.0}
             warning_msg = "Column '{}' is more than 0% null"
@@ -2,6 +2,7 @@ import pandas as pd
 
 from .data_check import DataCheck
 from .data_check_message import DataCheckWarning
+from .data_profile import DataProfile
 
 
 class IDColumnsDataCheck(DataCheck):
@@ -17,7 +18,7 @@ class IDColumnsDataCheck(DataCheck):
             raise ValueError("id_threshold must be a float between 0 and 1, inclusive.")
         self.id_threshold = id_threshold
 
-    def validate(self, X, y=None):
+    def validate(self, X, y=None, profile=None):
         """Check if any of the features are likely to be ID columns. Currently performs these simple checks:
 
             - column name is "id"
@@ -26,7 +27,8 @@ class IDColumnsDataCheck(DataCheck):
 
         Arguments:
             X (pd.DataFrame): The input features to check
-            threshold (float): The probability threshold to be considered an ID column. Defaults to 1.0
+            y: Ignored.
+            profile (DataProfile): Profile of X. If None, the profile is computed from X.
 
         Returns:
             A dictionary of features with column name or index and their probability of being ID columns
@@ -43,13 +45,15 @@ class IDColumnsDataCheck(DataCheck):
 
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
+        if profile is None:
+            profile = DataProfile(X)
         col_names = [str(col) for col in X.columns.tolist()]
         cols_named_id = [col for col in col_names if (col.lower() == "id")]  # columns whose name is "id"
         id_cols = {col: 0.95 for col in cols_named_id}
 
         non_id_types = ['float16', 'float32', 'float64', 'bool']
-        X = X.select_dtypes(exclude=non_id_types)
-        check_all_unique = (X.nunique() == len(X))
+        id_type_cols = profile.select_columns(exclude=non_id_types)
+        check_all_unique = (profile.unique_counts[id_type_cols] == profile.n_rows)
         cols_with_all_unique = check_all_unique[check_all_unique].index.tolist()  # columns whose values are all unique
         id_cols.update([(str(col), 1.0) if col in id_cols else (str(col), 0.95) for col in cols_with_all_unique])
 
@@ -12,6 +12,8 @@ from evalml.utils.gen_utils import (
 class InvalidTargetDataCheck(DataCheck):
     """Checks if the target data contains missing or invalid values."""
 
+    _ignores_features = True
+
     def validate(self, X, y):
         """Checks if the target data contains missing or invalid values.
 
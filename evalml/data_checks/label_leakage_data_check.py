@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from .data_check import DataCheck
@@ -9,27 +10,44 @@ from evalml.utils.gen_utils import numeric_and_boolean_dtypes
 class LabelLeakageDataCheck(DataCheck):
     """Check if any of the features are highly correlated with the target."""
 
-    def __init__(self, pct_corr_threshold=0.95):
+    _METHODS = ['pearson', 'spearman', 'mutual_info']
+    _MUTUAL_INFO_BINS = 10
+
+    def __init__(self, pct_corr_threshold=0.95, method='pearson', chunk_size=1000):
         """Check if any of the features are highly correlated with the target.
 
-        Currently only supports binary and numeric targets and features.
+        Currently only supports numeric and boolean features.
 
         Arguments:
             pct_corr_threshold (float): The correlation threshold to be considered leakage. Defaults to 0.95.
-
+            method (str): How to measure the dependence between each feature and the target. Either 'pearson' for the absolute
+                Pearson correlation, 'spearman' for the absolute Spearman rank correlation, or 'mutual_info' for the mutual
+                information between the feature and the target divided by the entropy of the target. 'pearson' and 'spearman' only
+                support binary and numeric targets. 'mutual_info' treats each unique target value as a class, so it supports categorical
+                targets, and discretizes each feature into quantile bins. Defaults to 'pearson'.
+            chunk_size (int): The number of features whose dependence with the target is computed at once, which bounds the memory used.
+                Defaults to 1000.
         """
         if pct_corr_threshold < 0 or pct_corr_threshold > 1:
             raise ValueError("pct_corr_threshold must be a float between 0 and 1, inclusive.")
+        if method not in self._METHODS:
+            raise ValueError(f"method must be one of {', '.join(self._METHODS)}. Received '{method}'.")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer. Received {chunk_size}.")
         self.pct_corr_threshold = pct_corr_threshold
+        self.method = method
+        self.chunk_size = chunk_size
 
-    def validate(self, X, y):
+    def validate(self, X, y, profile=None):
         """Check if any of the features are highly correlated with the target.
 
-        Currently only supports binary and numeric targets and features.
+        Currently only supports numeric and boolean features.
 
         Arguments:
             X (pd.DataFrame): The input features to check
             y (pd.Series): The target data
+            profile (DataProfile): Profile of X. If it is a StreamingDataProfile which kept the correlations of the features with
+                the target, those correlations are used instead of X, which requires the 'pearson' method.
 
         Returns:
             list (DataCheckWarning): List with a DataCheckWarning if there is label leakage detected.
@@ -49,12 +67,105 @@ class LabelLeakageDataCheck(DataCheck):
         if not isinstance(y, pd.Series):
             y = pd.Series(y)
 
-        if y.dtype not in numeric_and_boolean_dtypes:
+        if self.method != 'mutual_info' and y.dtype not in numeric_and_boolean_dtypes:
             return []
         X = X.select_dtypes(include=numeric_and_boolean_dtypes)
         if len(X.columns) == 0:
             return []
 
-        highly_corr_cols = {label: abs(y.corr(col)) for label, col in X.iteritems() if abs(y.corr(col)) >= self.pct_corr_threshold}
+        if getattr(profile, 'target_correlations', None) is not None:
+            if self.method != 'pearson':
+                raise ValueError(f"Only the 'pearson' method can use the correlations kept by a streaming profile. Received '{self.method}'.")
+            scores = profile.target_correlations.reindex(X.columns).abs().to_numpy()
+        else:
+            if not X.index.equals(y.index):
+                X, y = X.align(y, join='inner', axis=0)
+            scores = np.concatenate([self._score_features(X.iloc[:, start:start + self.chunk_size], y)
+                                     for start in range(0, len(X.columns), self.chunk_size)])
+        highly_corr_cols = [col_name for col_name, score in zip(X.columns, scores) if score >= self.pct_corr_threshold]
         warning_msg = "Column '{}' is {}% or more correlated with the target"
         return [DataCheckWarning(warning_msg.format(col_name, self.pct_corr_threshold * 100), self.name) for col_name in highly_corr_cols]
+
+    def _score_features(self, X, y):
+        """Returns the dependence between each of the features and the target, using the check's method."""
+        if self.method == 'mutual_info':
+            return _normalized_mutual_info(X, y, self._MUTUAL_INFO_BINS)
+        if self.method == 'pearson':
+            return np.abs(_correlations(X.to_numpy(dtype='float64'), y.to_numpy(dtype='float64')))
+        scores = np.abs(_correlations(X.rank().to_numpy(), y.rank().to_numpy()))
+        # ranks depend on which rows are kept, so features with rows dropped for missing values are ranked separately
+        incomplete = np.flatnonzero((X.isna().to_numpy() | y.isna().to_numpy()[:, np.newaxis]).any(axis=0))
+        for i in incomplete:
+            complete = X.iloc[:, i].notna().to_numpy() & y.notna().to_numpy()
+            scores[i] = abs(_correlations(X.iloc[complete, [i]].rank().to_numpy(), y[complete].rank().to_numpy())[0])
+        return scores
+
+
+def _correlations(X, y):
+    """Computes the Pearson correlation of each column of X with y.
+
+    As with pd.Series.corr, rows where either the feature or the target is missing are ignored for that feature.
+
+    Arguments:
+        X (np.ndarray): features of shape [n_samples, n_features]
+        y (np.ndarray): target of length [n_samples]
+
+    Returns:
+        np.ndarray: correlation of each feature with the target. nan if either has no variance.
+    """
+    missing = np.isnan(X) | np.isnan(y)[:, np.newaxis]
+    incomplete = np.flatnonzero(missing.any(axis=0))
+    correlations = np.empty(X.shape[1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        complete = np.setdiff1d(np.arange(X.shape[1]), incomplete)
+        if len(complete):
+            X_centered = X[:, complete] - X[:, complete].mean(axis=0)
+            y_centered = y - y.mean()
+            correlations[complete] = (y_centered @ X_centered) / np.sqrt(np.einsum('ij,ij->j', X_centered, X_centered) * (y_centered @ y_centered))
+        if len(incomplete):
+            mask = ~missing[:, incomplete]
+            counts = mask.sum(axis=0)
+            X_masked = np.where(mask, X[:, incomplete], 0.0)
+            y_masked = np.where(mask, y[:, np.newaxis], 0.0)
+            X_centered = np.where(mask, X_masked - X_masked.sum(axis=0) / counts, 0.0)
+            y_centered = np.where(mask, y_masked - y_masked.sum(axis=0) / counts, 0.0)
+            correlations[incomplete] = np.einsum('ij,ij->j', X_centered, y_centered) / np.sqrt(np.einsum('ij,ij->j', X_centered, X_centered) *
+                                                                                               np.einsum('ij,ij->j', y_centered, y_centered))
+    return correlations
+
+
+def _normalized_mutual_info(X, y, n_bins):
+    """Computes the mutual information between each column of X and y, divided by the entropy of y.
+
+    Each feature is discretized into n_bins quantile bins, with missing values in a bin of their own. Rows where the target is
+    missing are ignored.
+
+    Arguments:
+        X (pd.DataFrame): features of shape [n_samples, n_features]
+        y (pd.Series): target of length [n_samples]. Each unique value is a class.
+        n_bins (int): number of bins to discretize each feature into
+
+    Returns:
+        np.ndarray: normalized mutual information of each feature with the target, between 0 and 1. nan if the target has a single class.
+    """
+    y_codes, classes = pd.factorize(y)
+    has_target = y_codes >= 0
+    y_codes = y_codes[has_target]
+    n_classes = len(classes)
+    n_features = X.shape[1]
+
+    percentiles = X[has_target].rank(pct=True).to_numpy()
+    bins = np.minimum(np.nan_to_num(percentiles, nan=1.0) * n_bins, n_bins - 1).astype(int)
+    bins[np.isnan(percentiles)] = n_bins
+
+    # one histogram of (feature bin, class) pairs per feature, counted in a single pass over the chunk
+    cells = (np.arange(n_features) * (n_bins + 1) + bins) * n_classes + y_codes[:, np.newaxis]
+    joint = np.bincount(cells.ravel(), minlength=n_features * (n_bins + 1) * n_classes).reshape(n_features, n_bins + 1, n_classes)
+    joint = joint / len(y_codes)
+    p_bins = joint.sum(axis=2, keepdims=True)
+    p_classes = joint.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mutual_info = np.nansum(joint * np.log(joint / (p_bins * p_classes)), axis=(1, 2))
+        p_target = np.bincount(y_codes, minlength=n_classes) / len(y_codes)
+        target_entropy = -np.sum(p_target[p_target > 0] * np.log(p_target[p_target > 0]))
+        return mutual_info / target_entropy
@@ -2,6 +2,7 @@ import pandas as pd
 
 from .data_check import DataCheck
 from .data_check_message import DataCheckError, DataCheckWarning
+from .data_profile import DataProfile
 
 from evalml.utils.logger import get_logger
 
@@ -42,24 +43,29 @@ class NoVarianceDataCheck(DataCheck):
                                     "Consider encoding the nulls for "
                                     "this column to be useful for machine learning.", self.name)
 
-    def validate(self, X, y):
+    def validate(self, X, y, profile=None):
         """Check if the target or any of the features have no variance (1 unique value).
 
         Arguments:
             X (pd.DataFrame): The input features.
             y (pd.Series): The target data.
+            profile (DataProfile): Profile of X. If None, the profile is computed from X.
 
         Returns:
             list (DataCheckWarning or DataCheckError): List of warnings/errors corresponding to features or target with no variance.
         """
-        if not isinstance(X, pd.DataFrame):
-            X = pd.DataFrame(X)
+        if profile is None:
+            if not isinstance(X, pd.DataFrame):
+                X = pd.DataFrame(X)
+            profile = DataProfile(X)
 
         if not isinstance(y, pd.Series):
             y = pd.Series(y)
 
-        unique_counts = X.nunique(dropna=self._dropnan).to_dict()
-        any_nulls = (X.isnull().any()).to_dict()
+        any_nulls = profile.null_counts > 0
+        unique_counts = profile.unique_counts if self._dropnan else profile.unique_counts + any_nulls
+        unique_counts = unique_counts.to_dict()
+        any_nulls = any_nulls.to_dict()
 
         messages = []
 
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.ensemble import IsolationForest
 
 from .data_check import DataCheck
@@ -12,13 +14,28 @@ class OutliersDataCheck(DataCheck):
     """Checks if there are any outliers in input data by using an Isolation Forest to obtain the anomaly score
         of each index and then using IQR to determine score anomalies. Indices with score anomalies are considered outliers."""
 
-    def __init__(self, random_state=0):
+    def __init__(self, random_state=0, max_samples='auto', max_fit_rows=100000, n_jobs=None, chunk_size=100000):
         """Checks if there are any outliers in the input data.
 
         Arguments:
             random_state (int, np.random.RandomState): The random seed/state. Defaults to 0.
+            max_samples (int, float or str): The number of rows drawn to fit each tree of the Isolation Forest, passed to
+                sklearn's IsolationForest. Defaults to 'auto'.
+            max_fit_rows (int or None): If the input data has more rows than this, the Isolation Forest is fit on a random sample of
+                this many rows. All rows are still scored. If None, the forest is fit on all rows. Defaults to 100000.
+            n_jobs (int or None): Number of jobs used to fit the Isolation Forest and to score chunks of rows in parallel.
+                None and 1 are equivalent. If set to -1, all CPUs are used. Defaults to None.
+            chunk_size (int): The number of rows scored at once. Defaults to 100000.
         """
+        if max_fit_rows is not None and max_fit_rows < 1:
+            raise ValueError(f"max_fit_rows must be a positive integer or None. Received {max_fit_rows}.")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer. Received {chunk_size}.")
         self.random_state = get_random_state(random_state)
+        self.max_samples = max_samples
+        self.max_fit_rows = max_fit_rows
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
 
     def validate(self, X, y=None):
         """Checks if there are any outliers in a dataframe by using an Isolation Forest to obtain the anomaly score
@@ -41,26 +58,50 @@ class OutliersDataCheck(DataCheck):
             >>> assert outliers_check.validate(df) == [DataCheckWarning("Row '3' is likely to have outlier data", "OutliersDataCheck")]
         """
 
+        warning_msg = "Row '{}' is likely to have outlier data"
+        return [DataCheckWarning(warning_msg.format(row_index), self.name) for row_index in self.get_outlier_indices(X)]
+
+    def get_outlier_indices(self, X):
+        """Returns the positions of the rows which are likely to have outlier data, as found by validate.
+
+        This is a compact alternative to validate for large datasets, which does not create a message per outlier.
+
+        Arguments:
+            X (pd.DataFrame): Features
+
+        Returns:
+            np.ndarray: the positions of the rows that may have outlier data, in increasing order.
+
+        Example:
+            >>> df = pd.DataFrame({
+            ...     'x': [1, 2, 3, 40, 5],
+            ...     'y': [6, 7, 8, 990, 10],
+            ...     'z': [-1, -2, -3, -1201, -4]
+            ... })
+            >>> outliers_check = OutliersDataCheck()
+            >>> assert outliers_check.get_outlier_indices(df).tolist() == [3]
+        """
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
         X = X.select_dtypes(include=numeric_dtypes)
 
         if len(X.columns) == 0:
-            return []
+            return np.array([], dtype='int64')
 
-        def get_IQR(df, k=2.0):
-            q1 = df.quantile(0.25)
-            q3 = df.quantile(0.75)
+        def get_IQR(scores, k=2.0):
+            q1, q3 = np.quantile(scores, [0.25, 0.75])
             iqr = q3 - q1
             lower_bound = q1 - (k * iqr)
             upper_bound = q3 + (k * iqr)
             return (lower_bound, upper_bound)
 
-        clf = IsolationForest(random_state=self.random_state)
-        clf.fit(X)
-        scores = pd.Series(clf.decision_function(X))
+        X_fit = X
+        if self.max_fit_rows is not None and len(X) > self.max_fit_rows:
+            X_fit = X.iloc[np.sort(self.random_state.choice(len(X), self.max_fit_rows, replace=False))]
+        clf = IsolationForest(max_samples=self.max_samples, n_jobs=self.n_jobs, random_state=self.random_state)
+        clf.fit(X_fit)
+
+        chunks = (X.iloc[start:start + self.chunk_size] for start in range(0, len(X), self.chunk_size))
+        scores = np.concatenate(Parallel(n_jobs=self.n_jobs, prefer='threads')(delayed(clf.decision_function)(chunk) for chunk in chunks))
         lower_bound, upper_bound = get_IQR(scores, k=2)
-        outliers = (scores < lower_bound) | (scores > upper_bound)
-        outliers_indices = outliers[outliers].index.values.tolist()
-        warning_msg = "Row '{}' is likely to have outlier data"
-        return [DataCheckWarning(warning_msg.format(row_index), self.name) for row_index in outliers_indices]
+        return np.flatnonzero((scores < lower_bound) | (scores > upper_bound))
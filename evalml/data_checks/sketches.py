@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+
+
+class HyperLogLog:
+    """Mergeable sketch which estimates the number of unique values in a stream of values.
+
+    Values are hashed to 64 bits. The unique hashes are kept exactly until there are more of them than the sketch has registers,
+    after which the sketch switches to a HyperLogLog estimate whose relative standard error is 1.04 / sqrt(2 ** precision).
+    """
+
+    def __init__(self, precision=14):
+        """Create an empty HyperLogLog sketch.
+
+        Arguments:
+            precision (int): The base 2 logarithm of the number of registers, between 11 and 18. Defaults to 14, which uses 16 KB per sketch
+                and has a relative standard error of about 0.8%.
+        """
+        if precision < 11 or precision > 18:
+            raise ValueError(f"precision must be an integer between 11 and 18, inclusive. Received {precision}.")
+        self.precision = precision
+        self._n_registers = 2 ** precision
+        self._hashes = np.array([], dtype='uint64')
+        self._registers = None
+
+    @property
+    def is_exact(self):
+        """Returns whether the sketch still counts the unique values exactly."""
+        return self._registers is None
+
+    @property
+    def relative_error(self):
+        """Returns the relative standard error of the estimate, or 0 if the sketch is exact."""
+        return 0.0 if self.is_exact else 1.04 / np.sqrt(self._n_registers)
+
+    def add(self, values):
+        """Adds values to the sketch. Missing values are ignored.
+
+        Arguments:
+            values (pd.Series, np.ndarray or list): the values to add
+        """
+        self._add_hashes(_hash_values(values))
+
+    def merge(self, other):
+        """Adds all of the values in another sketch with the same precision to this sketch.
+
+        Arguments:
+            other (HyperLogLog): the sketch to merge into this one
+
+        Returns:
+            HyperLogLog: this sketch
+        """
+        if other.precision != self.precision:
+            raise ValueError(f"Cannot merge a HyperLogLog sketch of precision {other.precision} into one of precision {self.precision}.")
+        if other.is_exact:
+            self._add_hashes(other._hashes)
+        else:
+            self._to_registers()
+            np.maximum(self._registers, other._registers, out=self._registers)
+        return self
+
+    def count(self):
+        """Returns the estimated number of unique values added to the sketch."""
+        if self.is_exact:
+            return len(self._hashes)
+        estimate = 0.7213 / (1 + 1.079 / self._n_registers) * self._n_registers ** 2 / np.sum(2.0 ** -self._registers.astype('float64'))
+        n_empty = np.count_nonzero(self._registers == 0)
+        if estimate <= 2.5 * self._n_registers and n_empty > 0:
+            estimate = self._n_registers * np.log(self._n_registers / n_empty)
+        return estimate
+
+    def _add_hashes(self, hashes):
+        if self.is_exact:
+            self._hashes = np.union1d(self._hashes, hashes)
+            if len(self._hashes) > self._n_registers:
+                self._to_registers()
+        else:
+            self._update_registers(hashes)
+
+    def _to_registers(self):
+        if self.is_exact:
+            hashes = self._hashes
+            self._registers = np.zeros(self._n_registers, dtype='uint8')
+            self._hashes = None
+            self._update_registers(hashes)
+
+    def _update_registers(self, hashes):
+        n_bits = 64 - self.precision
+        registers = (hashes >> np.uint64(n_bits)).astype('int64')
+        remainders = hashes & np.uint64(2 ** n_bits - 1)
+        # position of the leading one bit in the remaining bits. Remainders below 2 ** 53 convert to floats exactly.
+        leading_bits = np.floor(np.log2(np.maximum(remainders, 1).astype('float64'))).astype('int64')
+        ranks = np.where(remainders == 0, n_bits + 1, n_bits - leading_bits).astype('uint8')
+        np.maximum.at(self._registers, registers, ranks)
+
+
+class CorrelationSketch:
+    """Mergeable sketch of the Pearson correlation between each of a set of features and a target, computed over chunks of rows.
+
+    For each feature, the sketch keeps the count, the means and the sums of squared deviations and of cross deviations of the rows
+    where neither the feature nor the target is missing, and merges them with the pairwise update formulas of Chan et al.
+    """
+
+    _STATISTICS = ['count', 'mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy']
+
+    def __init__(self):
+        """Create an empty CorrelationSketch."""
+        self._moments = pd.DataFrame(columns=self._STATISTICS, dtype='float64')
+
+    def update(self, X, y):
+        """Adds a chunk of rows to the sketch.
+
+        Arguments:
+            X (pd.DataFrame): numeric or boolean features of shape [n_samples, n_features]
+            y (pd.Series): numeric or boolean target of length [n_samples], aligned with X by position
+        """
+        X_values = X.to_numpy(dtype='float64')
+        y_values = pd.Series(y).to_numpy(dtype='float64')
+        mask = ~np.isnan(X_values) & ~np.isnan(y_values)[:, np.newaxis]
+        counts = mask.sum(axis=0)
+        X_values = np.where(mask, X_values, 0.0)
+        y_values = np.where(mask, y_values[:, np.newaxis], 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_x = np.where(counts > 0, X_values.sum(axis=0) / counts, 0.0)
+            mean_y = np.where(counts > 0, y_values.sum(axis=0) / counts, 0.0)
+        X_centered = np.where(mask, X_values - mean_x, 0.0)
+        y_centered = np.where(mask, y_values - mean_y, 0.0)
+        moments = pd.DataFrame({'count': counts,
+                                'mean_x': mean_x,
+                                'mean_y': mean_y,
+                                'm2_x': np.einsum('ij,ij->j', X_centered, X_centered),
+                                'm2_y': np.einsum('ij,ij->j', y_centered, y_centered),
+                                'c_xy': np.einsum('ij,ij->j', X_centered, y_centered)}, index=X.columns, dtype='float64')
+        self._merge_moments(moments)
+
+    def merge(self, other):
+        """Adds all of the rows in another sketch to this sketch.
+
+        Arguments:
+            other (CorrelationSketch): the sketch to merge into this one
+
+        Returns:
+            CorrelationSketch: this sketch
+        """
+        self._merge_moments(other._moments)
+        return self
+
+    def correlations(self):
+        """Returns the Pearson correlation of each feature with the target, or nan if either has no variance.
+
+        Returns:
+            pd.Series: correlation of each feature with the target, indexed by feature name
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self._moments['c_xy'] / np.sqrt(self._moments['m2_x'] * self._moments['m2_y'])
+
+    def _merge_moments(self, moments):
+        a, b = self._moments.align(moments, join='outer', axis=0, fill_value=0.0)
+        count = a['count'] + b['count']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = (b['count'] / count).fillna(0.0)
+            cross_weight = (a['count'] * b['count'] / count).fillna(0.0)
+        delta_x = b['mean_x'] - a['mean_x']
+        delta_y = b['mean_y'] - a['mean_y']
+        self._moments = pd.DataFrame({'count': count,
+                                      'mean_x': a['mean_x'] + delta_x * weight,
+                                      'mean_y': a['mean_y'] + delta_y * weight,
+                                      'm2_x': a['m2_x'] + b['m2_x'] + delta_x ** 2 * cross_weight,
+                                      'm2_y': a['m2_y'] + b['m2_y'] + delta_y ** 2 * cross_weight,
+                                      'c_xy': a['c_xy'] + b['c_xy'] + delta_x * delta_y * cross_weight}, columns=self._STATISTICS)
+
+
+def _hash_values(values):
+    """Hashes the non-missing values to unsigned 64 bit integers. Numeric values are hashed as floats, so that chunks of a column
+    which are read with different numeric dtypes hash equal values the same way."""
+    values = pd.Series(values).dropna()
+    if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+        values = values.astype('float64')
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
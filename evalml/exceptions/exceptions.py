@@ -61,3 +61,7 @@ class PipelineScoreError(Exception):
 
         self.message = message
         super().__init__(message)
+
+    def __reduce__(self):
+        # Needed so the exception can be pickled, e.g. when returned from a worker process
+        return (self.__class__, (self.exceptions, self.scored_successfully))
@@ -0,0 +1,296 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from evalml.model_family import ModelFamily
+
+
+class _Tree:
+    """Binary tree stored as arrays indexed by node, in a common format for the tree ensembles of the supported libraries.
+
+    A row goes to the left child of a node if its value of the node's feature is less than the node's threshold (or less than or
+    equal to it, if the ensemble's splits are not strict). Missing values go to the left child if missing_left is True for the node.
+    """
+
+    def __init__(self, feature, threshold, left, right, missing_left, value, nan_as_zero=None, zero_as_missing=None):
+        """Create a tree from arrays indexed by node.
+
+        Arguments:
+            feature (np.ndarray): position of the feature each node splits on, or -1 for leaves
+            threshold (np.ndarray): threshold of each split
+            left (np.ndarray): index of the left child of each node
+            right (np.ndarray): index of the right child of each node
+            missing_left (np.ndarray): whether missing values go to the left child of each node
+            value (np.ndarray): value of each node, of shape [n_nodes, n_outputs]. Only the values of leaves are used.
+            nan_as_zero (np.ndarray): whether each node treats missing values as zero. Defaults to False for all nodes.
+            zero_as_missing (np.ndarray): whether each node treats zero as a missing value. Defaults to False for all nodes.
+        """
+        n_nodes = len(feature)
+        self.feature = np.asarray(feature, dtype='int64')
+        self.threshold = np.asarray(threshold, dtype='float64')
+        self.left = np.asarray(left, dtype='int64')
+        self.right = np.asarray(right, dtype='int64')
+        self.missing_left = np.asarray(missing_left, dtype=bool)
+        self.value = np.asarray(value, dtype='float64').reshape(n_nodes, -1)
+        self.nan_as_zero = np.zeros(n_nodes, dtype=bool) if nan_as_zero is None else np.asarray(nan_as_zero, dtype=bool)
+        self.zero_as_missing = np.zeros(n_nodes, dtype=bool) if zero_as_missing is None else np.asarray(zero_as_missing, dtype=bool)
+
+    def goes_left(self, node, values, strict):
+        """Returns whether each of the values of the node's feature goes to the node's left child."""
+        if self.nan_as_zero[node]:
+            values = np.where(np.isnan(values), 0.0, values)
+        missing = np.isnan(values)
+        if self.zero_as_missing[node]:
+            missing |= np.abs(values) <= 1e-35
+        with np.errstate(invalid='ignore'):
+            left = values < self.threshold[node] if strict else values <= self.threshold[node]
+        return np.where(missing, self.missing_left[node], left)
+
+
+class _TreeEnsemble:
+    """Tree ensemble whose raw output for a row is base plus the sum over its trees of the value of the leaf the row reaches,
+    transformed by its link function."""
+
+    def __init__(self, trees, base, link=None, dtype='float64', strict=False, supports_missing=True):
+        """Create a tree ensemble.
+
+        Arguments:
+            trees (list(_Tree)): the trees of the ensemble
+            base (np.ndarray): raw output of the ensemble before the trees are added, of length [n_outputs]
+            link (str or None): None to output the raw output, 'sigmoid' to output the probabilities of two classes from a single raw
+                output, or 'softmax' to output the probabilities of each class from one raw output per class
+            dtype (str): the dtype the library casts features to before comparing them with the thresholds
+            strict (bool): whether rows go to the left child when their value is strictly less than the threshold, rather than less
+                than or equal to it
+            supports_missing (bool): whether the library supports missing values
+        """
+        self.trees = trees
+        self.base = np.asarray(base, dtype='float64')
+        self.link = link
+        self.dtype = dtype
+        self.strict = strict
+        self.supports_missing = supports_missing
+
+    def _apply_link(self, raw):
+        if self.link == 'sigmoid':
+            proba = 1 / (1 + np.exp(-raw[..., 0]))
+            return np.stack([1 - proba, proba], axis=-1)
+        if self.link == 'softmax':
+            exp = np.exp(raw - raw.max(axis=-1, keepdims=True))
+            return exp / exp.sum(axis=-1, keepdims=True)
+        return raw
+
+    def _leaves(self, tree, X, grid, target_positions):
+        """Yields the rows, the mask of grid points and the value of each leaf which the rows reach when the target features are
+        set to those grid points. Each row reaches exactly one leaf for each grid point."""
+        stack = [(0, np.arange(X.shape[0]), np.ones(grid.shape[0], dtype=bool))]
+        while stack:
+            node, rows, grid_mask = stack.pop()
+            feature = tree.feature[node]
+            if feature < 0:
+                yield rows, grid_mask, tree.value[node]
+                continue
+            if feature in target_positions:
+                goes_left = tree.goes_left(node, grid[:, target_positions[feature]], self.strict)
+                children = [(tree.left[node], rows, grid_mask & goes_left), (tree.right[node], rows, grid_mask & ~goes_left)]
+            else:
+                goes_left = tree.goes_left(node, X[rows, feature], self.strict)
+                children = [(tree.left[node], rows[goes_left], grid_mask), (tree.right[node], rows[~goes_left], grid_mask)]
+            stack.extend(child for child in children if len(child[1]) and child[2].any())
+
+    def partial_dependence(self, X, grid, target_features, chunksize):
+        """Computes the average output of the ensemble over the rows of X, with the target features set to each point of the grid.
+
+        Arguments:
+            X (np.ndarray): features of shape [n_samples, n_features]
+            grid (np.ndarray): values of the target features at each grid point, of shape [n_points, n_target_features]
+            target_features (list(int)): positions of the target features in X
+            chunksize (int): the maximum number of pairs of a row and a grid point whose output is held in memory at once, when the
+                ensemble has a link function
+
+        Returns:
+            np.ndarray: average output at each grid point, of shape [n_points, n_outputs]
+        """
+        X = np.asfortranarray(np.asarray(X, dtype=self.dtype), dtype='float64')
+        grid = np.asarray(np.asarray(grid, dtype=self.dtype), dtype='float64')
+        target_positions = {feature: i for i, feature in enumerate(target_features)}
+        n_rows, n_points = X.shape[0], grid.shape[0]
+        if self.link is None:
+            # the output is linear in the leaf values, so only the number of rows reaching each leaf is needed
+            totals = np.zeros((n_points, len(self.base)))
+            for tree in self.trees:
+                for rows, grid_mask, value in self._leaves(tree, X, grid, target_positions):
+                    totals[grid_mask] += len(rows) * value
+            return self.base + totals / n_rows
+
+        totals = 0
+        rows_per_chunk = max(1, chunksize // n_points)
+        for start in range(0, n_rows, rows_per_chunk):
+            X_chunk = X[start:start + rows_per_chunk]
+            raw = np.tile(self.base, (X_chunk.shape[0], n_points, 1))
+            for tree in self.trees:
+                for rows, grid_mask, value in self._leaves(tree, X_chunk, grid, target_positions):
+                    raw[np.ix_(rows, np.flatnonzero(grid_mask))] += value
+            totals += self._apply_link(raw).sum(axis=0)
+        return totals / n_rows
+
+
+def _get_tree_ensemble(estimator):
+    """Returns the trees of a fitted estimator as a _TreeEnsemble whose output is the same as the estimator's predictions for
+    regression and probability estimates for classification, or None if the estimator is not a supported tree ensemble.
+
+    Supports scikit-learn's random forests and extra trees, XGBoost's and LightGBM's gradient boosted trees with numeric splits, and
+    CatBoost's oblivious trees without categorical features.
+    """
+    model = estimator._component_obj
+    if estimator.model_family in [ModelFamily.RANDOM_FOREST, ModelFamily.EXTRA_TREES]:
+        return _sklearn_forest_ensemble(model)
+    if estimator.model_family == ModelFamily.XGBOOST:
+        return _xgboost_ensemble(model)
+    if estimator.model_family == ModelFamily.LIGHTGBM:
+        return _lightgbm_ensemble(model)
+    if estimator.model_family == ModelFamily.CATBOOST:
+        return _catboost_ensemble(model)
+    return None
+
+
+def _sklearn_forest_ensemble(model):
+    trees = []
+    for tree_estimator in model.estimators_:
+        tree = tree_estimator.tree_
+        value = tree.value[:, 0, :]
+        if hasattr(model, 'classes_'):
+            value = value / value.sum(axis=1, keepdims=True)
+        trees.append(_Tree(tree.feature, tree.threshold, tree.children_left, tree.children_right,
+                           np.zeros(tree.node_count, dtype=bool), value / len(model.estimators_)))
+    # scikit-learn trees compare the features as float32
+    return _TreeEnsemble(trees, np.zeros(trees[0].value.shape[1]), dtype='float32', supports_missing=False)
+
+
+def _xgboost_ensemble(model):
+    booster = model.get_booster()
+    config = json.loads(booster.save_config())
+    learner = config['learner']
+    objective = learner['objective']['name']
+    if learner['gradient_booster']['name'] != 'gbtree':
+        return None
+    base_score = float(learner['learner_model_param']['base_score'])
+    n_classes = int(learner['learner_model_param']['num_class'])
+    if objective == 'binary:logistic':
+        base, link, n_outputs = [np.log(base_score / (1 - base_score))], 'sigmoid', 1
+    elif objective == 'multi:softprob':
+        base, link, n_outputs = [base_score] * n_classes, 'softmax', n_classes
+    elif objective == 'reg:squarederror':
+        base, link, n_outputs = [base_score], None, 1
+    else:
+        return None
+
+    feature_names = booster.feature_names or []
+    feature_positions = {name: i for i, name in enumerate(feature_names)}
+    nodes = booster.trees_to_dataframe()
+    trees = []
+    for tree_index, tree_nodes in nodes.groupby('Tree', sort=True):
+        tree_nodes = tree_nodes.sort_values('Node')
+        node_index = {node_id: i for i, node_id in enumerate(tree_nodes['ID'])}
+        is_leaf = (tree_nodes['Feature'] == 'Leaf').to_numpy()
+        feature = [-1 if leaf else feature_positions.get(name, None) for leaf, name in zip(is_leaf, tree_nodes['Feature'])]
+        if any(position is None for position in feature):
+            feature = [-1 if leaf else int(name[1:]) for leaf, name in zip(is_leaf, tree_nodes['Feature'])]
+        left = [0 if leaf else node_index[node_id] for leaf, node_id in zip(is_leaf, tree_nodes['Yes'])]
+        right = [0 if leaf else node_index[node_id] for leaf, node_id in zip(is_leaf, tree_nodes['No'])]
+        missing_left = (tree_nodes['Missing'] == tree_nodes['Yes']).to_numpy()
+        value = np.zeros((len(tree_nodes), n_outputs))
+        value[:, tree_index % n_outputs] = np.where(is_leaf, tree_nodes['Gain'].to_numpy(), 0.0)
+        # XGBoost compares float32 features with float32 split values
+        threshold = np.where(is_leaf, 0.0, tree_nodes['Split'].to_numpy(dtype='float64')).astype('float32')
+        trees.append(_Tree(feature, threshold, left, right, missing_left, value))
+    return _TreeEnsemble(trees, base, link=link, dtype='float32', strict=True)
+
+
+def _lightgbm_ensemble(model):
+    dump = model.booster_.dump_model()
+    objective = dump['objective'].split(' ')[0]
+    n_outputs = dump['num_tree_per_iteration']
+    if objective == 'binary':
+        link = 'sigmoid'
+    elif objective == 'multiclass':
+        link = 'softmax'
+    elif objective == 'regression':
+        link = None
+    else:
+        return None
+    trees = []
+    for tree_index, tree_info in enumerate(dump['tree_info']):
+        nodes = []
+        stack = [tree_info['tree_structure']]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            if 'split_feature' in node:
+                if node['decision_type'] != '<=':
+                    return None
+                stack.extend([node['left_child'], node['right_child']])
+        node_index = {id(node): i for i, node in enumerate(nodes)}
+        is_split = ['split_feature' in node for node in nodes]
+        value = np.zeros((len(nodes), n_outputs))
+        value[:, tree_index % n_outputs] = [0.0 if split else node['leaf_value'] for split, node in zip(is_split, nodes)]
+        if dump.get('average_output'):
+            value /= len(dump['tree_info']) // n_outputs
+        trees.append(_Tree(feature=[node['split_feature'] if split else -1 for split, node in zip(is_split, nodes)],
+                           threshold=[node['threshold'] if split else 0.0 for split, node in zip(is_split, nodes)],
+                           left=[node_index[id(node['left_child'])] if split else 0 for split, node in zip(is_split, nodes)],
+                           right=[node_index[id(node['right_child'])] if split else 0 for split, node in zip(is_split, nodes)],
+                           missing_left=[split and node['default_left'] for split, node in zip(is_split, nodes)],
+                           value=value,
+                           nan_as_zero=[split and node['missing_type'] == 'None' for split, node in zip(is_split, nodes)],
+                           zero_as_missing=[split and node['missing_type'] == 'Zero' for split, node in zip(is_split, nodes)]))
+    return _TreeEnsemble(trees, np.zeros(n_outputs), link=link)
+
+
+def _catboost_ensemble(model):
+    if len(model.get_cat_feature_indices()) > 0:
+        return None
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'model.json')
+        model.save_model(path, format='json')
+        with open(path) as f:
+            dump = json.load(f)
+    loss_function = dump['model_info']['params']['loss_function']['type']
+    if loss_function == 'Logloss':
+        link = 'sigmoid'
+    elif loss_function == 'MultiClass':
+        link = 'softmax'
+    elif loss_function == 'RMSE':
+        link = None
+    else:
+        return None
+    float_features = {feature['feature_index']: feature for feature in dump['features_info']['float_features']}
+    scale, bias = dump.get('scale_and_bias', [1.0, [0.0]])
+    bias = np.atleast_1d(bias).astype('float64')
+    n_outputs = len(bias)
+
+    trees = []
+    for oblivious_tree in dump['oblivious_trees']:
+        splits = oblivious_tree.get('splits', [])
+        depth = len(splits)
+        leaf_values = np.reshape(oblivious_tree['leaf_values'], (2 ** depth, n_outputs)) * scale
+        # expand the oblivious tree into a binary tree. Each split sets one bit of the leaf index, the first split setting the lowest.
+        # Rows go right when their value is greater than the border, and missing values are treated as the minimum or maximum value.
+        n_internal = 2 ** depth - 1
+        feature, threshold, left, right, missing_left = [], [], [], [], []
+        for node in range(n_internal):
+            level = int(np.log2(node + 1))
+            split = splits[depth - 1 - level]
+            float_feature = float_features[split['float_feature_index']]
+            feature.append(float_feature['flat_feature_index'])
+            threshold.append(split['border'])
+            left.append(2 * node + 1)
+            right.append(2 * node + 2)
+            missing_left.append(float_feature.get('nan_value_treatment', 'AsIs') != 'AsTrue')
+        # the root splits on the highest bit, so the leaves of the expanded tree are in the order of the leaf indices
+        value = np.concatenate([np.zeros((n_internal, n_outputs)), leaf_values])
+        trees.append(_Tree(feature + [-1] * 2 ** depth, np.asarray(threshold + [0.0] * 2 ** depth, dtype='float32'),
+                           left + [0] * 2 ** depth, right + [0] * 2 ** depth, missing_left + [False] * 2 ** depth, value))
+    return _TreeEnsemble(trees, bias, link=link, dtype='float32')
@@ -1,10 +1,10 @@
 
-import copy
 import warnings
 
 import numpy as np
 import pandas as pd
-from sklearn.inspection import partial_dependence as sk_partial_dependence
+from joblib import Parallel, delayed
+from scipy.stats.mstats import mquantiles
 from sklearn.inspection import \
     permutation_importance as sk_permutation_importance
 from sklearn.metrics import auc as sklearn_auc
@@ -17,9 +17,14 @@ from sklearn.utils.multiclass import unique_labels
 
 import evalml
 from evalml.model_family import ModelFamily
+from evalml.model_understanding._tree_ensembles import _get_tree_ensemble
+from evalml.objectives.binary_classification_objective import (
+    _boolean_targets,
+    _confusion_counts
+)
 from evalml.objectives.utils import get_objective
 from evalml.problem_types import ProblemTypes
-from evalml.utils import import_or_raise, jupyter_check
+from evalml.utils import get_random_state, import_or_raise, jupyter_check
 
 
 def confusion_matrix(y_true, y_predicted, normalize_method='true'):
@@ -267,13 +272,18 @@ def graph_confusion_matrix(y_true, y_pred, normalize_method='true', title_additi
 def calculate_permutation_importance(pipeline, X, y, objective, n_repeats=5, n_jobs=None, random_state=0):
     """Calculates permutation importance for features.
 
+    If all of the pipeline's transformers are column-wise, as evalml's transformers are, X is transformed once. Each permutation of
+    an input column then only permutes the columns derived from it in the transformed data, and the pipeline's estimator makes
+    predictions for all of the repeats of a feature at once. Otherwise, the whole pipeline is evaluated on each permutation.
+    Both compute the same permutations, in the same way as scikit-learn's permutation_importance.
+
     Arguments:
         pipeline (PipelineBase or subclass): Fitted pipeline
         X (pd.DataFrame): The input data used to score and compute permutation importance
         y (pd.Series): The target data
         objective (str, ObjectiveBase): Objective to score on
         n_repeats (int): Number of times to permute a feature. Defaults to 5.
-        n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
+        n_jobs (int or None): Non-negative integer describing level of parallelism used to score the permutations of different features.
             None and 1 are equivalent. If set to -1, all CPUs are used. For n_jobs below -1, (n_cpus + 1 + n_jobs) are used.
         random_state (int, np.random.RandomState): The random seed/state. Defaults to 0.
 
@@ -283,20 +293,82 @@ def calculate_permutation_importance(pipeline, X, y, objective, n_repeats=5, n_j
     objective = get_objective(objective, return_instance=True)
     if objective.problem_type != pipeline.problem_type:
         raise ValueError(f"Given objective '{objective.name}' cannot be used with '{pipeline.name}'")
-
-    def scorer(pipeline, X, y):
-        scores = pipeline.score(X, y, objectives=[objective])
-        return scores[objective.name] if objective.greater_is_better else -scores[objective.name]
-    perm_importance = sk_permutation_importance(pipeline, X, y, n_repeats=n_repeats, scoring=scorer, n_jobs=n_jobs, random_state=random_state)
-    mean_perm_importance = perm_importance["importances_mean"]
     if not isinstance(X, pd.DataFrame):
         X = pd.DataFrame(X)
+    if not isinstance(y, pd.Series):
+        y = pd.Series(y)
+
+    provenance = pipeline._get_feature_provenance()
+    if provenance is not None and set(provenance) == set(X.columns):
+        mean_perm_importance = _fast_permutation_importance(pipeline, X, y, objective, provenance, n_repeats, n_jobs, random_state)
+    else:
+        def scorer(pipeline, X, y):
+            scores = pipeline.score(X, y, objectives=[objective])
+            return scores[objective.name] if objective.greater_is_better else -scores[objective.name]
+        perm_importance = sk_permutation_importance(pipeline, X, y, n_repeats=n_repeats, scoring=scorer, n_jobs=n_jobs, random_state=random_state)
+        mean_perm_importance = perm_importance["importances_mean"]
     feature_names = list(X.columns)
     mean_perm_importance = list(zip(feature_names, mean_perm_importance))
     mean_perm_importance.sort(key=lambda x: x[1], reverse=True)
     return pd.DataFrame(mean_perm_importance, columns=["feature", "importance"])
 
 
+def _fast_permutation_importance(pipeline, X, y, objective, provenance, n_repeats, n_jobs, random_state):
+    """Computes the mean permutation importance of each column of X from the data transformed once by the pipeline, using the
+    pipeline's feature provenance to permute the transformed columns derived from each column."""
+    X_t = pipeline._transform(X)
+    if pipeline.problem_type != ProblemTypes.REGRESSION:
+        y = pipeline._encode_targets(y)
+    # as in scikit-learn, every feature is permuted with a random state seeded with the same seed
+    random_seed = get_random_state(random_state).randint(np.iinfo(np.int32).max + 1)
+    y_predicted, y_predicted_proba = pipeline._compute_predictions(X, [objective], X_t=X_t)
+    baseline_score = _permutation_score(pipeline, X, y, y_predicted, y_predicted_proba, objective)
+    scores = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_permuted_scores)(pipeline, X, X_t, y, objective, col_idx, provenance[col], n_repeats, random_seed)
+        for col_idx, col in enumerate(X.columns))
+    return np.mean(baseline_score - np.array(scores), axis=1)
+
+
+def _permuted_scores(pipeline, X, X_t, y, objective, col_idx, derived_features, n_repeats, random_seed):
+    """Scores the pipeline on n_repeats permutations of the column of X at position col_idx, given X transformed by the pipeline
+    and the names of the transformed columns derived from the permuted column."""
+    random_state = np.random.RandomState(random_seed)
+    n_rows = len(X)
+    shuffling_idx = np.arange(n_rows)
+    permutation = np.arange(n_rows)
+    permutations = []
+    for _ in range(n_repeats):
+        random_state.shuffle(shuffling_idx)
+        # scikit-learn shuffles the already permuted column in each repeat, so the shuffles compose
+        permutation = permutation[shuffling_idx]
+        permutations.append(permutation)
+
+    X_t_permuted = pd.concat([X_t] * n_repeats, ignore_index=True)
+    for feature in derived_features:
+        X_t_permuted[feature] = pd.concat([X_t[feature].iloc[permutation] for permutation in permutations], ignore_index=True)
+    # scoring does not make predictions with an objective, which is the only use of the untransformed data in making predictions
+    y_predicted, y_predicted_proba = pipeline._compute_predictions(None, [objective], X_t=X_t_permuted)
+
+    X_permuted = X.copy()
+    scores = np.zeros(n_repeats)
+    for i, permutation in enumerate(permutations):
+        col = X.iloc[permutation, col_idx]
+        col.index = X_permuted.index
+        X_permuted.iloc[:, col_idx] = col
+        rows = slice(i * n_rows, (i + 1) * n_rows)
+        scores[i] = _permutation_score(pipeline, X_permuted, y,
+                                       None if y_predicted is None else y_predicted.iloc[rows].reset_index(drop=True),
+                                       None if y_predicted_proba is None else y_predicted_proba.iloc[rows].reset_index(drop=True),
+                                       objective)
+    return scores
+
+
+def _permutation_score(pipeline, X, y, y_predicted, y_predicted_proba, objective):
+    """Scores predictions on the objective, negating the score if lower scores are better."""
+    score = pipeline._score_all_objectives(X, y, y_predicted, y_predicted_proba, [objective])[objective.name]
+    return score if objective.greater_is_better else -score
+
+
 def graph_permutation_importance(pipeline, X, y, objective, importance_threshold=0):
     """Generate a bar graph of the pipeline's permutation importance.
 
@@ -347,16 +419,21 @@ def graph_permutation_importance(pipeline, X, y, objective, importance_threshold
     return fig
 
 
-def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
+def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100, y_pred_proba=None):
     """Computes objective score as a function of potential binary classification
         decision thresholds for a fitted binary classification pipeline.
 
+    The predicted probabilities are computed once. Objectives which implement objective_function_from_counts are then scored at all
+    of the thresholds at once.
+
     Arguments:
         pipeline (BinaryClassificationPipeline obj): Fitted binary classification pipeline
         X (pd.DataFrame): The input data used to compute objective score
         y (pd.Series): The target labels
         objective (ObjectiveBase obj, str): Objective used to score
         steps (int): Number of intervals to divide and calculate objective score at
+        y_pred_proba (pd.DataFrame, pd.Series or np.ndarray): The pipeline's predicted probabilities for X, either of both classes
+            or of the positive class. If None, they are computed with the pipeline. Defaults to None.
 
     Returns:
         pd.DataFrame: DataFrame with thresholds and the corresponding objective score calculated at each threshold
@@ -368,18 +445,32 @@ def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
     if objective.score_needs_proba:
         raise ValueError("Objective `score_needs_proba` must be False")
 
-    pipeline_tmp = copy.copy(pipeline)
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(X)
+    if not isinstance(y, pd.Series):
+        y = pd.Series(y)
+    if y_pred_proba is None:
+        y_pred_proba = pipeline.predict_proba(X)
+    if isinstance(y_pred_proba, (pd.Series, pd.DataFrame)):
+        y_pred_proba = y_pred_proba.to_numpy()
+    if y_pred_proba.ndim > 1:
+        y_pred_proba = y_pred_proba[:, 1]
+    y_pred_proba = pd.Series(y_pred_proba)
+    y = pipeline._encode_targets(y)
+
     thresholds = np.linspace(0, 1, steps + 1)
-    costs = []
-    for threshold in thresholds:
-        pipeline_tmp.threshold = threshold
-        scores = pipeline_tmp.score(X, y, [objective])
-        costs.append(scores[objective.name])
+    if objective._can_score_counts():
+        objective.validate_inputs(y.to_numpy(), (y_pred_proba > 0.5).to_numpy())
+        _, weights = objective._decision_scores_and_weights(y_pred_proba, X)
+        counts = _confusion_counts(y_pred_proba.to_numpy(dtype='float64'), _boolean_targets(y), weights, thresholds)
+        costs = objective.objective_function_from_counts(*counts)
+    else:
+        costs = [objective.score(y, y_pred_proba > threshold, X) for threshold in thresholds]
     df = pd.DataFrame({"threshold": thresholds, "score": costs})
     return df
 
 
-def graph_binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
+def graph_binary_objective_vs_threshold(pipeline, X, y, objective, steps=100, y_pred_proba=None):
     """Generates a plot graphing objective score vs. decision thresholds for a fitted binary classification pipeline.
 
     Arguments:
@@ -388,6 +479,8 @@ def graph_binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
         y (pd.Series): The target labels
         objective (ObjectiveBase obj, str): Objective used to score, shown on the y-axis of the graph
         steps (int): Number of intervals to divide and calculate objective score at
+        y_pred_proba (pd.DataFrame, pd.Series or np.ndarray): The pipeline's predicted probabilities for X, either of both classes
+            or of the positive class. If None, they are computed with the pipeline. Defaults to None.
 
     Returns:
         plotly.Figure representing the objective score vs. threshold graph generated
@@ -398,7 +491,7 @@ def graph_binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
         import_or_raise("ipywidgets", warning=True)
 
     objective = get_objective(objective, return_instance=True)
-    df = binary_objective_vs_threshold(pipeline, X, y, objective, steps)
+    df = binary_objective_vs_threshold(pipeline, X, y, objective, steps, y_pred_proba=y_pred_proba)
     title = f'{objective.name} Scores vs. Thresholds'
     layout = _go.Layout(title={'text': title},
                         xaxis={'title': 'Threshold', 'range': _calculate_axis_range(df['threshold'])},
@@ -410,20 +503,34 @@ def graph_binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
     return _go.Figure(layout=layout, data=data)
 
 
-def partial_dependence(pipeline, X, feature, grid_resolution=100):
+def partial_dependence(pipeline, X, feature, grid_resolution=100, method='auto', chunksize=100000):
     """Calculates partial dependence.
 
+    The partial dependence at each point of the grid is the pipeline's prediction averaged over the rows of X, with the target
+    features set to the point's values. If all of the pipeline's transformers are column-wise, as evalml's transformers are, X and
+    the grid are each transformed once, and the pipeline's estimator makes predictions for as many grid points at once as fit in
+    chunksize rows. Otherwise, the whole pipeline makes predictions for as many grid points at once. For random forest, extra trees,
+    XGBoost, LightGBM and CatBoost estimators on numeric features, the partial dependence can instead be computed exactly by
+    traversing each tree once for all of the grid points, without making predictions.
+
     Arguments:
         pipeline (PipelineBase or subclass): Fitted pipeline
         X (pd.DataFrame, np.array): The input data used to generate a grid of values
             for feature where partial dependence will be calculated at
-        feature (int, string): The target features for which to create the partial dependence plot for.
+        feature (int, string, list): The target features for which to create the partial dependence plot for.
             If feature is an int, it must be the index of the feature to use.
             If feature is a string, it must be a valid column name in X.
+            If feature is a list of ints or strings, the partial dependence is calculated for every combination of the grid values
+            of those features.
+        grid_resolution (int): Number of samples of each feature to include in the grid. Defaults to 100.
+        method (str): 'brute' to average the predictions of the pipeline, 'tree' to traverse the trees of a tree ensemble estimator,
+            or 'auto' to use 'tree' when the pipeline supports it and 'brute' otherwise. Defaults to 'auto'.
+        chunksize (int): The maximum number of rows to make predictions for at once, which bounds the memory used. Defaults to 100000.
 
     Returns:
         pd.DataFrame: DataFrame with averaged predictions for all points in the grid averaged
-            over all samples of X and the values used to calculate those predictions.
+            over all samples of X and the values used to calculate those predictions. For a single feature, the values are in the
+            "feature_values" column. For a list of features, each feature has a column of values named after it.
 
     """
     if not isinstance(X, pd.DataFrame):
@@ -432,41 +539,136 @@ def partial_dependence(pipeline, X, feature, grid_resolution=100):
         raise ValueError("Pipeline to calculate partial dependence for must be fitted")
     if pipeline.model_family == ModelFamily.BASELINE:
         raise ValueError("Partial dependence plots are not supported for Baseline pipelines")
-    if isinstance(pipeline, evalml.pipelines.ClassificationPipeline):
-        pipeline._estimator_type = "classifier"
-    elif isinstance(pipeline, evalml.pipelines.RegressionPipeline):
-        pipeline._estimator_type = "regressor"
-    pipeline.feature_importances_ = pipeline.feature_importance
-    avg_pred, values = sk_partial_dependence(pipeline, X=X, features=[feature], grid_resolution=grid_resolution)
-
-    # Delete scikit-learn attributes that were temporarily set
-    del pipeline._estimator_type
-    del pipeline.feature_importances_
-    return pd.DataFrame({"feature_values": values[0],
-                         "partial_dependence": avg_pred[0]})
+    if method not in ['auto', 'brute', 'tree']:
+        raise ValueError(f"method must be one of 'auto', 'brute' or 'tree'. Received '{method}'.")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer. Received {chunksize}.")
+
+    features = list(feature) if isinstance(feature, (list, tuple)) else [feature]
+    columns = [X.columns[f] if isinstance(f, (int, np.integer)) else f for f in features]
+    for col in columns:
+        if col not in X.columns:
+            raise ValueError(f"Feature '{col}' is not a column of X")
+    values = [_grid_values(X[col], grid_resolution) for col in columns]
+    # every combination of the grid values, with the first feature's values changing slowest
+    grid_indices = np.meshgrid(*[np.arange(len(col_values)) for col_values in values], indexing='ij')
+    X_grid = X.iloc[np.zeros(grid_indices[0].size, dtype=int)].reset_index(drop=True)
+    for col, col_values, indices in zip(columns, values, grid_indices):
+        X_grid[col] = col_values[indices.ravel()]
+
+    is_classification = isinstance(pipeline, evalml.pipelines.ClassificationPipeline)
+    provenance = pipeline._get_feature_provenance()
+    ensemble = None
+    if provenance is not None and set(provenance) == set(X.columns):
+        X_t = pipeline._transform(X)
+        derived_features = [derived for col in columns for derived in provenance[col]]
+        grid_t = pipeline._transform(X_grid)[derived_features]
+        if method != 'brute':
+            ensemble = _get_numeric_tree_ensemble(pipeline.estimator, X_t, grid_t)
+        if ensemble is not None:
+            avg_pred = ensemble.partial_dependence(X_t.to_numpy(dtype='float64'), grid_t.to_numpy(dtype='float64'),
+                                                   [X_t.columns.get_loc(derived) for derived in derived_features],
+                                                   chunksize * X_t.shape[1])
+        else:
+            predict = pipeline.estimator.predict_proba if is_classification else pipeline.estimator.predict
+            avg_pred = _brute_partial_dependence(predict, X_t, grid_t, chunksize)
+    else:
+        predict = pipeline.predict_proba if is_classification else pipeline.predict
+        avg_pred = _brute_partial_dependence(predict, X, X_grid[columns], chunksize)
+    if method == 'tree' and ensemble is None:
+        raise ValueError("The 'tree' method requires a pipeline with column-wise transformers and a random forest, extra trees, "
+                         "XGBoost, LightGBM or CatBoost estimator whose features are numeric")
+
+    # as in scikit-learn, the partial dependence of the positive class for binary classification and of the first class for multiclass
+    avg_pred = avg_pred[:, 1] if is_classification and avg_pred.shape[1] == 2 else avg_pred[:, 0]
+    if len(features) == 1:
+        return pd.DataFrame({"feature_values": values[0],
+                             "partial_dependence": avg_pred})
+    part_dep = X_grid[columns].copy()
+    part_dep["partial_dependence"] = avg_pred
+    return part_dep
+
+
+def _grid_values(values, grid_resolution):
+    """Returns the grid values of a feature: its unique values if there are fewer than grid_resolution of them, and otherwise
+    grid_resolution equally spaced values between its 5th and 95th percentiles, as in scikit-learn."""
+    if grid_resolution <= 1:
+        raise ValueError("'grid_resolution' must be strictly greater than 1.")
+    uniques = np.unique(values)
+    if len(uniques) < grid_resolution:
+        return uniques
+    percentiles = mquantiles(values, prob=(0.05, 0.95), axis=0)
+    if np.allclose(percentiles[0], percentiles[1]):
+        raise ValueError("percentiles are too close to each other, unable to build the grid. Please choose percentiles that are further apart.")
+    return np.linspace(percentiles[0], percentiles[1], num=grid_resolution, endpoint=True)
+
+
+def _get_numeric_tree_ensemble(estimator, X_t, grid_t):
+    """Returns the trees of the estimator if it is a supported tree ensemble and the data passed to it is numeric, or None."""
+    if not all(pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype) for dtype in X_t.dtypes):
+        return None
+    ensemble = _get_tree_ensemble(estimator)
+    if ensemble is not None and not ensemble.supports_missing and (X_t.isnull().any(axis=None) or grid_t.isnull().any(axis=None)):
+        return None
+    return ensemble
+
+
+def _brute_partial_dependence(predict, X, grid, chunksize):
+    """Averages the predictions over the rows of X with the columns of the grid set to the values of each of its points.
+
+    The rows of X are repeated for as many grid points at once as fit in chunksize rows, so that predict is called once per batch of
+    grid points. Returns an array of the average predictions of shape [n_points, n_outputs]."""
+    X = X.reset_index(drop=True)
+    n_rows = len(X)
+    points_per_batch = max(1, chunksize // n_rows)
+    avg_pred = []
+    for start in range(0, len(grid), points_per_batch):
+        batch = grid.iloc[start:start + points_per_batch]
+        X_batch = pd.concat([X] * len(batch), ignore_index=True)
+        for col in batch.columns:
+            X_batch[col] = batch[col].iloc[np.repeat(np.arange(len(batch)), n_rows)].reset_index(drop=True)
+        predictions = np.asarray(predict(X_batch), dtype='float64')
+        avg_pred.append(predictions.reshape(len(batch), n_rows, -1).mean(axis=1))
+    return np.concatenate(avg_pred)
 
 
 def graph_partial_dependence(pipeline, X, feature, grid_resolution=100):
-    """Create an one-way partial dependence plot.
+    """Create an one-way partial dependence plot, or a two-way partial dependence contour plot.
 
     Arguments:
         pipeline (PipelineBase or subclass): Fitted pipeline
         X (pd.DataFrame, np.array): The input data used to generate a grid of values
             for feature where partial dependence will be calculated at
-        feature (int, string): The target feature for which to create the partial dependence plot for.
+        feature (int, string, list): The target feature for which to create the partial dependence plot for.
             If feature is an int, it must be the index of the feature to use.
             If feature is a string, it must be a valid column name in X.
+            If feature is a list of two ints or strings, a contour plot of the partial dependence on both features is created.
+        grid_resolution (int): Number of samples of each feature to include in the grid. Defaults to 100.
 
     Returns:
-        pd.DataFrame: pd.DataFrame with averaged predictions for all points in the grid averaged
-            over all samples of X and the values used to calculate those predictions.
+        plotly.Figure: figure object containing the partial dependence data for plotting
 
     """
     _go = import_or_raise("plotly.graph_objects", error_msg="Cannot find dependency plotly.graph_objects")
     if jupyter_check():
         import_or_raise("ipywidgets", warning=True)
 
+    if isinstance(feature, (list, tuple)) and len(feature) != 2:
+        raise ValueError(f"Partial dependence can only be plotted for one or two features. Received {len(feature)} features.")
     part_dep = partial_dependence(pipeline, X, feature=feature, grid_resolution=grid_resolution)
+    if isinstance(feature, (list, tuple)):
+        x_name, y_name = [str(name) for name in part_dep.columns[:2]]
+        x_values = part_dep.iloc[:, 0].unique()
+        y_values = part_dep.iloc[:, 1].unique()
+        title = f"Partial Dependence of '{x_name}' vs. '{y_name}'"
+        layout = _go.Layout(title={'text': title},
+                            xaxis={'title': x_name},
+                            yaxis={'title': y_name})
+        # the grid's second feature changes fastest, so each row of z is one value of the first feature
+        z = part_dep['partial_dependence'].to_numpy().reshape(len(x_values), len(y_values)).T
+        data = [_go.Contour(x=x_values, y=y_values, z=z, name='Partial Dependence', colorbar={'title': 'Partial Dependence'})]
+        return _go.Figure(layout=layout, data=data)
+
     feature_name = str(feature)
     title = f"Partial Dependence of '{feature_name}'"
     layout = _go.Layout(title={'text': title},
@@ -1,7 +1,6 @@
 import warnings
 
 import numpy as np
-import shap
 from sklearn.utils import check_array
 
 from evalml.model_family.model_family import ModelFamily
@@ -43,6 +42,9 @@ def _compute_shap_values(pipeline, features, training_data=None):
         dict or list(dict): For regression problems, a dictionary mapping a feature name to a list of SHAP values.
             For classification problems, returns a list of dictionaries. One for each class.
     """
+    # shap imports matplotlib and IPython, so it is only imported when SHAP values are computed
+    import shap
+
     estimator = pipeline.estimator
     if estimator.model_family == ModelFamily.BASELINE:
         raise ValueError("You passed in a baseline pipeline. These are simple enough that SHAP values are not needed.")
@@ -132,7 +134,9 @@ def _normalize_values_dict(values):
     if not all_values.any():
         return values
 
-    scaled_values = all_values / np.abs(all_values).sum(axis=1)[:, np.newaxis]
+    sums = np.abs(all_values).sum(axis=1)[:, np.newaxis]
+    # rows whose values are all zero stay zero
+    scaled_values = all_values / np.where(sums == 0, 1, sums)
 
     return {feature_name: scaled_values[:, i].tolist() for i, feature_name in enumerate(sorted_feature_names)}
 
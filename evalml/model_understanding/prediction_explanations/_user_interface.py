@@ -194,6 +194,39 @@ class _MultiClassSHAPTable(_TableMaker):
         return {"explanations": json_output}
 
 
+def _compute_shap_values_for_rows(pipeline, input_features, training_data=None):
+    """Transforms the input features and computes the SHAP values of all of the rows with a single explainer.
+
+    Arguments:
+        pipeline (PipelineBase): Fitted pipeline whose predictions we want to explain with SHAP.
+        input_features (pd.DataFrame): Dataframe of features - needs to correspond to data the pipeline was fit on.
+        training_data (pd.DataFrame): Training data the pipeline was fit on.
+            This is required for non-tree estimators because we need a sample of training data for the KernelSHAP algorithm.
+
+    Returns:
+        tuple: the transformed features, their SHAP values and their normalized SHAP values.
+    """
+    pipeline_features = pipeline._transform(input_features)
+    shap_values = _compute_shap_values(pipeline, pipeline_features, training_data)
+    return pipeline_features, shap_values, _normalize_shap_values(shap_values)
+
+
+def _select_row(values, row):
+    """Selects the SHAP values of a single row from SHAP values computed for many rows.
+
+    Arguments:
+        values (dict or list(dict)): Dictionary mapping feature name to list of values,
+            or a list of dictionaries (each mapping a feature name to a list of values).
+        row (int): Position of the row to select.
+
+    Returns:
+        dict or list(dict): The values in the same format, with one value per feature.
+    """
+    if isinstance(values, list):
+        return [_select_row(class_values, row) for class_values in values]
+    return {feature_name: [feature_values[row]] for feature_name, feature_values in values.items()}
+
+
 def _make_single_prediction_shap_table(pipeline, input_features, top_k=3, training_data=None,
                                        include_shap_values=False, output_format="text"):
     """Creates table summarizing the top_k positive and top_k negative contributing features to the prediction of a single datapoint.
@@ -212,11 +245,29 @@ def _make_single_prediction_shap_table(pipeline, input_features, top_k=3, traini
     """
     if not (isinstance(input_features, pd.DataFrame) and input_features.shape[0] == 1):
         raise ValueError("features must be stored in a dataframe of one row.")
-    pipeline_features = pipeline._transform(input_features)
+    pipeline_features, shap_values, normalized_shap_values = _compute_shap_values_for_rows(pipeline, input_features,
+                                                                                           training_data)
+    return _make_shap_table(pipeline, pipeline_features, shap_values, normalized_shap_values, top_k,
+                            include_shap_values, output_format)
 
-    shap_values = _compute_shap_values(pipeline, pipeline_features, training_data)
-    normalized_shap_values = _normalize_shap_values(shap_values)
 
+def _make_shap_table(pipeline, pipeline_features, shap_values, normalized_shap_values, top_k=3,
+                     include_shap_values=False, output_format="text"):
+    """Creates table summarizing the top_k positive and top_k negative contributing features to the prediction of a single datapoint, given its SHAP values.
+
+    Arguments:
+        pipeline (PipelineBase): Fitted pipeline whose predictions we want to explain with SHAP.
+        pipeline_features (pd.DataFrame): The transformed features of the datapoint, as a dataframe of one row.
+        shap_values (dict or list(dict)): The SHAP values of the datapoint.
+        normalized_shap_values (dict or list(dict)): The normalized SHAP values of the datapoint.
+        top_k (int): How many of the highest/lowest features to include in the table.
+        include_shap_values (bool): Whether the SHAP values should be included in an extra column in the output.
+            Default is False.
+        output_format (str): Either "text" or "dict". Default is "text".
+
+    Returns:
+        str or dict: Table
+    """
     class_names = None
     if hasattr(pipeline, "classes_"):
         class_names = pipeline.classes_
@@ -331,28 +382,44 @@ class _SHAPTable(_SectionMaker):
         self.include_shap_values = include_shap_values
         self.training_data = training_data
 
-    def make_text(self, index, pipeline, input_features):
+    def compute_shap_values(self, pipeline, input_features, index_list):
+        """Computes the SHAP values of all of the rows in the report at once.
+
+        The rows are transformed by the pipeline and explained by a single SHAP explainer, rather than one per row.
+
+        Arguments:
+            pipeline (PipelineBase): Fitted pipeline whose predictions we want to explain with SHAP.
+            input_features (pd.DataFrame): Dataframe of input data to evaluate the pipeline on.
+            index_list (list(int)): Positions of the rows of input_features included in the report.
+
+        Returns:
+            dict: Maps each position in index_list to the transformed features, SHAP values and normalized SHAP values of that row.
+        """
+        index_list = list(index_list)
+        pipeline_features, shap_values, normalized_shap_values = _compute_shap_values_for_rows(pipeline, input_features.iloc[index_list],
+                                                                                               self.training_data)
+        return {index: (pipeline_features.iloc[row:(row + 1)], _select_row(shap_values, row), _select_row(normalized_shap_values, row))
+                for row, index in enumerate(index_list)}
+
+    def make_text(self, index, pipeline, shap_values_by_index):
         """Makes the SHAP table section for reports formatted as text.
 
         The table is the same whether the user requests a best/worst report or they manually specified the
         subset of the input features.
 
         Handling the differences in how the table is formatted between regression and classification problems
-        is delegated to the _make_single_prediction_shap_table
+        is delegated to the _make_shap_table
         """
-        table = _make_single_prediction_shap_table(pipeline, input_features.iloc[index:(index + 1)],
-                                                   training_data=self.training_data, top_k=self.top_k_features,
-                                                   include_shap_values=self.include_shap_values, output_format="text")
+        table = _make_shap_table(pipeline, *shap_values_by_index[index], top_k=self.top_k_features,
+                                 include_shap_values=self.include_shap_values, output_format="text")
         table = table.splitlines()
         # Indent the rows of the table to match the indentation of the entire report.
         return ["\t\t" + line + "\n" for line in table] + ["\n\n"]
 
-    def make_dict(self, index, pipeline, input_features):
+    def make_dict(self, index, pipeline, shap_values_by_index):
         """Makes the SHAP table section formatted as a dictionary."""
-        json_output = _make_single_prediction_shap_table(pipeline, input_features.iloc[index:(index + 1)],
-                                                         training_data=self.training_data, top_k=self.top_k_features,
-                                                         include_shap_values=self.include_shap_values,
-                                                         output_format="dict")
+        json_output = _make_shap_table(pipeline, *shap_values_by_index[index], top_k=self.top_k_features,
+                                       include_shap_values=self.include_shap_values, output_format="dict")
         return json_output
 
 
@@ -387,13 +454,14 @@ class _ReportMaker:
              str
         """
         report = [data.pipeline.name + "\n\n", str(data.pipeline.parameters) + "\n\n"]
+        shap_values_by_index = self.table_maker.compute_shap_values(data.pipeline, data.input_features, data.index_list)
         for rank, index in enumerate(data.index_list):
             report.extend(self.heading_maker.make_text(rank))
             if self.make_predicted_values_maker:
                 report.extend(self.make_predicted_values_maker.make_text(index, data.y_pred, data.y_true, data.errors))
             else:
                 report.extend([""])
-            report.extend(self.table_maker.make_text(index, data.pipeline, data.input_features))
+            report.extend(self.table_maker.make_text(index, data.pipeline, shap_values_by_index))
         return "".join(report)
 
     def make_dict(self, data):
@@ -406,6 +474,7 @@ class _ReportMaker:
              dict
         """
         report = []
+        shap_values_by_index = self.table_maker.compute_shap_values(data.pipeline, data.input_features, data.index_list)
         for rank, index in enumerate(data.index_list):
             section = {}
             # We want to omit heading and predicted values sections for "explain_predictions"-style reports
@@ -415,6 +484,6 @@ class _ReportMaker:
                 section["predicted_values"] = self.make_predicted_values_maker.make_dict(index, data.y_pred,
                                                                                          data.y_true, data.errors)
             section["explanations"] = self.table_maker.make_dict(index, data.pipeline,
-                                                                 data.input_features)["explanations"]
+                                                                 shap_values_by_index)["explanations"]
             report.append(section)
         return {"explanations": report}
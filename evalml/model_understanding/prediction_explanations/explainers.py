@@ -155,8 +155,8 @@ def explain_predictions_best_worst(pipeline, input_features, y_true, num_to_expl
             y_pred_values = None
             errors = metric(y_true, y_pred)
         else:
-            y_pred = pipeline.predict_proba(input_features)
-            y_pred_values = pipeline.predict(input_features)
+            y_pred_values, y_pred = pipeline._predict_with_proba(input_features)
+            y_pred_values = pd.Series(pipeline._decode_targets(y_pred_values))
             errors = metric(pipeline._encode_targets(y_true), y_pred)
     except Exception as e:
         tb = traceback.format_tb(sys.exc_info()[2])
@@ -25,9 +25,13 @@ class BinaryClassificationObjective(ObjectiveBase):
     def optimize_threshold(self, ypred_proba, y_true, X=None):
         """Learn a binary classification threshold which optimizes the current objective.
 
+        Objectives which implement objective_function_from_counts are optimized exactly, by scoring every threshold which changes
+        the predictions in a single vectorized pass over the sorted predictions. Other objectives are optimized with golden section search.
+
         Arguments:
             ypred_proba (list): The classifier's predicted probabilities
-            y_true (list): The ground truth for the predictions.
+            y_true (list): The ground truth for the predictions, as booleans or 0 and 1 for the positive class, like the targets
+                encoded by a pipeline.
             X (pd.DataFrame, optional): Any extra columns that are needed from training data.
 
         Returns:
@@ -36,6 +40,13 @@ class BinaryClassificationObjective(ObjectiveBase):
         if not self.can_optimize_threshold:
             raise RuntimeError("Trying to optimize objective that can't be optimized!")
 
+        if self._can_score_counts():
+            decision_scores, _ = self._decision_scores_and_weights(ypred_proba, X)
+            thresholds = _candidate_thresholds(decision_scores)
+            objective_values = self._score_thresholds(ypred_proba, y_true, thresholds, X=X)
+            best = np.nanargmax(objective_values) if self.greater_is_better else np.nanargmin(objective_values)
+            return thresholds[best]
+
         def cost(threshold):
             y_predicted = self.decision_function(ypred_proba=ypred_proba, threshold=threshold, X=X)
             cost = self.objective_function(y_true, y_predicted, X=X)
@@ -59,9 +70,89 @@ class BinaryClassificationObjective(ObjectiveBase):
             ypred_proba = pd.Series(ypred_proba)
         return ypred_proba > threshold
 
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        """Computes the objective from the counts of the confusion matrix, for many confusion matrices at once.
+
+        Objectives whose value only depends on the confusion matrix can implement this to be optimized exactly and quickly by optimize_threshold.
+        The counts are weighted for objectives which weight rows, like FraudCost.
+
+        Arguments:
+            true_positives (np.ndarray): Number of true positives of each confusion matrix
+            false_positives (np.ndarray): Number of false positives of each confusion matrix
+            true_negatives (np.ndarray): Number of true negatives of each confusion matrix
+            false_negatives (np.ndarray): Number of false negatives of each confusion matrix
+
+        Returns:
+            np.ndarray: the objective value of each confusion matrix
+        """
+        raise NotImplementedError(f"{self.name} cannot be computed from the counts of a confusion matrix.")
+
+    def _can_score_counts(self):
+        return type(self).objective_function_from_counts is not BinaryClassificationObjective.objective_function_from_counts
+
+    def _decision_scores_and_weights(self, ypred_proba, X=None):
+        """Returns the values which decision_function compares to the threshold, and the weight of each row in the confusion matrix."""
+        decision_scores = np.asarray(ypred_proba, dtype='float64')
+        return decision_scores, np.ones(len(decision_scores))
+
+    def _score_thresholds(self, ypred_proba, y_true, thresholds, X=None):
+        """Computes the objective at many thresholds at once with objective_function_from_counts.
+
+        Arguments:
+            ypred_proba (list): The classifier's predicted probabilities
+            y_true (list): The ground truth for the predictions.
+            thresholds (np.ndarray): The thresholds to score
+            X (pd.DataFrame, optional): Any extra columns that are needed from training data.
+
+        Returns:
+            np.ndarray: the objective value at each threshold
+        """
+        decision_scores, weights = self._decision_scores_and_weights(ypred_proba, X)
+        counts = _confusion_counts(decision_scores, _boolean_targets(y_true), weights, np.asarray(thresholds, dtype='float64'))
+        return self.objective_function_from_counts(*counts)
+
     def validate_inputs(self, y_true, y_predicted):
         super().validate_inputs(y_true, y_predicted)
         if len(np.unique(y_true)) > 2:
             raise ValueError("y_true contains more than two unique values")
         if len(np.unique(y_predicted)) > 2 and not self.score_needs_proba:
             raise ValueError("y_predicted contains more than two unique values")
+
+
+def _boolean_targets(y_true):
+    """Converts binary targets which are booleans or 0 and 1 to booleans, and raises a ValueError for any other targets."""
+    y_true = np.asarray(y_true)
+    if y_true.dtype != bool:
+        if not np.isin(y_true, [0, 1]).all():
+            raise ValueError(f"y_true must be booleans or 0 and 1 for the positive class, like the targets encoded by a pipeline. "
+                             f"Received values {pd.unique(y_true.ravel()).tolist()[:10]}.")
+        y_true = y_true.astype(bool)
+    return y_true
+
+
+def _candidate_thresholds(decision_scores):
+    """Returns one threshold for each distinct set of predictions: a threshold below every score, one between each pair
+    of consecutive distinct scores, and the highest score."""
+    unique_scores = np.unique(decision_scores)
+    midpoints = (unique_scores[:-1] + unique_scores[1:]) / 2
+    # the midpoint of two adjacent floats can round up to the higher one, which would predict it as negative
+    midpoints = np.where(midpoints < unique_scores[1:], midpoints, unique_scores[:-1])
+    return np.concatenate([[np.nextafter(unique_scores[0], -np.inf)], midpoints, unique_scores[-1:]])
+
+
+def _confusion_counts(decision_scores, y_true, weights, thresholds):
+    """Computes the weighted confusion matrix counts at each threshold, predicting rows whose score is above the threshold as positive.
+
+    The rows are sorted once, after which the counts at all of the thresholds are looked up from cumulative sums in O(log n) each.
+
+    Returns:
+        tuple(np.ndarray): the true positives, false positives, true negatives and false negatives at each threshold
+    """
+    order = np.argsort(decision_scores, kind='mergesort')
+    sorted_scores = decision_scores[order]
+    positive_weights = np.concatenate([[0.0], np.cumsum(np.where(y_true[order], weights[order], 0.0))])
+    negative_weights = np.concatenate([[0.0], np.cumsum(np.where(y_true[order], 0.0, weights[order]))])
+    n_predicted_negative = np.searchsorted(sorted_scores, thresholds, side='right')
+    false_negatives = positive_weights[n_predicted_negative]
+    true_negatives = negative_weights[n_predicted_negative]
+    return positive_weights[-1] - false_negatives, negative_weights[-1] - true_negatives, true_negatives, false_negatives
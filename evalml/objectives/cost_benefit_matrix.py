@@ -3,8 +3,6 @@ import numpy as np
 
 from .binary_classification_objective import BinaryClassificationObjective
 
-from evalml.model_understanding.graphs import confusion_matrix
-
 
 class CostBenefitMatrix(BinaryClassificationObjective):
     """Score using a cost-benefit matrix. Scores quantify the benefits of a given value, so greater numeric
@@ -43,9 +41,16 @@ class CostBenefitMatrix(BinaryClassificationObjective):
         Returns:
             float: Cost-benefit matrix score
         """
+        # imported here since evalml.model_understanding.graphs imports the objectives
+        from evalml.model_understanding.graphs import confusion_matrix
         conf_matrix = confusion_matrix(y_true, y_predicted, normalize_method='all')
         cost_matrix = np.array([[self.true_negative, self.false_positive],
                                 [self.false_negative, self.true_positive]])
 
         total_cost = np.multiply(conf_matrix.values, cost_matrix).sum()
         return total_cost
+
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        total = true_positives + false_positives + true_negatives + false_negatives
+        return (true_positives * self.true_positive + false_positives * self.false_positive +
+                true_negatives * self.true_negative + false_negatives * self.false_negative) / total
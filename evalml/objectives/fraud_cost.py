@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from .binary_classification_objective import BinaryClassificationObjective
@@ -94,3 +95,28 @@ class FraudCost(BinaryClassificationObjective):
         loss_per_total_processed = loss / transaction_amount.sum()
 
         return loss_per_total_processed
+
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        """Calculate amount lost to fraud per transaction from the total transaction amounts of each cell of confusion matrices.
+
+        Arguments:
+            true_positives (np.ndarray): Transaction amount of the true positives of each confusion matrix
+            false_positives (np.ndarray): Transaction amount of the false positives of each confusion matrix
+            true_negatives (np.ndarray): Transaction amount of the true negatives of each confusion matrix
+            false_negatives (np.ndarray): Transaction amount of the false negatives of each confusion matrix
+
+        Returns:
+            np.ndarray: Amount lost to fraud per transaction of each confusion matrix
+        """
+        loss = false_negatives * self.fraud_payout_percentage
+        loss = loss + false_positives * (1 - self.retry_percentage) * self.interchange_fee
+        return loss / (true_positives + false_positives + true_negatives + false_negatives)
+
+    def _decision_scores_and_weights(self, ypred_proba, X=None):
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(X)
+        try:
+            transaction_amount = X[self.amount_col].to_numpy(dtype='float64')
+        except KeyError:
+            raise ValueError("`{}` is not a valid column in X.".format(self.amount_col))
+        return np.asarray(ypred_proba, dtype='float64') * transaction_amount, transaction_amount
@@ -48,3 +48,7 @@ class LeadScoring(BinaryClassificationObjective):
         profit_per_lead = profit / len(y_true)
 
         return profit_per_lead
+
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        total = true_positives + false_positives + true_negatives + false_negatives
+        return (self.true_positives * true_positives + self.false_positives * false_positives) / total
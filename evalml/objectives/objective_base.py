@@ -3,10 +3,16 @@ from abc import ABC, abstractmethod
 import numpy as np
 import pandas as pd
 
+from evalml.utils.gen_utils import _track_subclass
+
 
 class ObjectiveBase(ABC):
     """Base class for all objectives."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _track_subclass(cls)
+
     @property
     @classmethod
     @abstractmethod
@@ -21,6 +21,9 @@ class AccuracyBinary(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.accuracy_score(y_true, y_predicted)
 
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        return (true_positives + true_negatives) / (true_positives + false_positives + true_negatives + false_negatives)
+
 
 class AccuracyMulticlass(MulticlassClassificationObjective):
     """Accuracy score for multiclass classification."""
@@ -43,6 +46,14 @@ class BalancedAccuracyBinary(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.balanced_accuracy_score(y_true, y_predicted)
 
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # classes which are missing from y_true are not averaged over, as in sklearn
+            recalls = np.stack([true_positives / (true_positives + false_negatives), true_negatives / (true_negatives + false_positives)])
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmean(recalls, axis=0)
+
 
 class BalancedAccuracyMulticlass(MulticlassClassificationObjective):
     """Balanced accuracy score for multiclass classification."""
@@ -65,6 +76,9 @@ class F1(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.f1_score(y_true, y_predicted, zero_division=0.0)
 
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        return _divide_or_zero(2 * true_positives, 2 * true_positives + false_positives + false_negatives)
+
 
 class F1Micro(MulticlassClassificationObjective):
     """F1 score for multiclass classification using micro averaging."""
@@ -109,6 +123,9 @@ class Precision(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.precision_score(y_true, y_predicted, zero_division=0.0)
 
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        return _divide_or_zero(true_positives, true_positives + false_positives)
+
 
 class PrecisionMicro(MulticlassClassificationObjective):
     """Precision score for multiclass classification using micro averaging."""
@@ -153,6 +170,9 @@ class Recall(BinaryClassificationObjective):
     def objective_function(self, y_true, y_predicted, X=None):
         return metrics.recall_score(y_true, y_predicted, zero_division=0.0)
 
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        return _divide_or_zero(true_positives, true_positives + false_negatives)
+
 
 class RecallMicro(MulticlassClassificationObjective):
     """Recall score for multiclass classification using micro averaging."""
@@ -269,6 +289,11 @@ class MCCBinary(BinaryClassificationObjective):
             warnings.simplefilter('ignore', RuntimeWarning)
             return metrics.matthews_corrcoef(y_true, y_predicted)
 
+    def objective_function_from_counts(self, true_positives, false_positives, true_negatives, false_negatives):
+        denominator = np.sqrt((true_positives + false_positives) * (true_positives + false_negatives) *
+                              (true_negatives + false_positives) * (true_negatives + false_negatives))
+        return _divide_or_zero(true_positives * true_negatives - false_positives * false_negatives, denominator)
+
 
 class MCCMulticlass(MulticlassClassificationObjective):
     """Matthews correlation coefficient for multiclass classification."""
@@ -395,3 +420,9 @@ def _handle_predictions(y_true, y_pred):
         y_true = label_binarize(y_true, classes=classes)
 
     return y_true, y_pred
+
+
+def _divide_or_zero(numerator, denominator):
+    """Divides arrays elementwise, with a result of 0 where the denominator is 0."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator == 0, 0.0, numerator / denominator)
@@ -4,17 +4,27 @@ from .objective_base import ObjectiveBase
 
 from evalml.exceptions import ObjectiveNotFoundError
 from evalml.problem_types import handle_problem_types
-from evalml.utils.gen_utils import _get_subclasses
+from evalml.utils.gen_utils import _get_subclasses, _get_subclasses_version
+
+_objectives_by_name = (None, {})
+
+
+def _get_objectives_by_name():
+    """Returns the dictionary of objective classes keyed by lowercase name, rebuilt only when ObjectiveBase subclasses change."""
+    global _objectives_by_name
+    version, objectives_dict = _objectives_by_name
+    if version != _get_subclasses_version():
+        objectives_dict = {}
+        for objective in _get_subclasses(ObjectiveBase):
+            if 'evalml.objectives' not in objective.__module__:
+                continue
+            objectives_dict[objective.name.lower()] = objective
+        _objectives_by_name = (_get_subclasses_version(), objectives_dict)
+    return objectives_dict
 
 
 def _all_objectives_dict():
-    all_objectives = _get_subclasses(ObjectiveBase)
-    objectives_dict = {}
-    for objective in all_objectives:
-        if 'evalml.objectives' not in objective.__module__:
-            continue
-        objectives_dict[objective.name.lower()] = objective
-    return objectives_dict
+    return dict(_get_objectives_by_name())
 
 
 def _print_objectives_in_table(names):
@@ -64,9 +74,9 @@ def get_objective(objective, return_instance=False, **kwargs):
         raise TypeError("Objective parameter cannot be NoneType")
     if isinstance(objective, ObjectiveBase):
         return objective
-    all_objectives_dict = _all_objectives_dict()
     if not isinstance(objective, str):
         raise TypeError("If parameter objective is not a string, it must be an instance of ObjectiveBase!")
+    all_objectives_dict = _get_objectives_by_name()
     if objective.lower() not in all_objectives_dict:
         raise ObjectiveNotFoundError(f"{objective} is not a valid Objective! "
                                      "Use evalml.objectives.print_all_objective_names(allowed_in_automl=False)"
@@ -93,6 +103,6 @@ def get_objectives(problem_type):
         List of Objectives
     """
     problem_type = handle_problem_types(problem_type)
-    all_objectives_dict = _all_objectives_dict()
+    all_objectives_dict = _get_objectives_by_name()
     objectives = [obj for obj in all_objectives_dict.values() if obj.problem_type == problem_type]
     return objectives
@@ -29,6 +29,8 @@ from .classification_pipeline import ClassificationPipeline
 from .binary_classification_pipeline import BinaryClassificationPipeline
 from .multiclass_classification_pipeline import MulticlassClassificationPipeline
 from .regression_pipeline import RegressionPipeline
+from .transform_cache import TransformCache
+from .compiled_pipeline import CompiledPipeline
 
 from .classification import (
     BaselineBinaryPipeline,
@@ -1,5 +1,3 @@
-import pandas as pd
-
 from evalml.objectives import get_objective
 from evalml.pipelines.classification_pipeline import ClassificationPipeline
 from evalml.problem_types import ProblemTypes
@@ -19,20 +17,10 @@ class BinaryClassificationPipeline(ClassificationPipeline):
     def threshold(self, value):
         self._threshold = value
 
-    def _predict(self, X, objective=None):
-        """Make predictions using selected features.
-
-        Arguments:
-            X (pd.DataFrame or np.array): Data of shape [n_samples, n_features]
-            objective (Object or string): The objective to use to make predictions
-
-        Returns:
-            pd.Series: Estimated labels
-        """
-        if not isinstance(X, pd.DataFrame):
-            X = pd.DataFrame(X)
-        X_t = self._transform(X)
+    def _labels_need_proba(self):
+        return self.threshold is not None
 
+    def _predict_labels(self, X, X_t, ypred_proba, objective=None):
         if objective is not None:
             objective = get_objective(objective, return_instance=True)
             if objective.problem_type != self.problem_type:
@@ -40,7 +28,6 @@ class BinaryClassificationPipeline(ClassificationPipeline):
 
         if self.threshold is None:
             return self.estimator.predict(X_t)
-        ypred_proba = self.predict_proba(X)
         ypred_proba = ypred_proba.iloc[:, 1]
         if objective is None:
             return ypred_proba > self.threshold
@@ -76,9 +76,40 @@ class ClassificationPipeline(PipelineBase):
         Returns:
             pd.Series: Estimated labels
         """
+        y_predicted, _ = self._predict_with_proba(X, objective=objective, include_proba=False)
+        return y_predicted
+
+    def _predict_with_proba(self, X, objective=None, include_labels=True, include_proba=True, X_t=None):
+        """Make predictions and probability estimates from a single pass of the data through the pipeline's components.
+
+        Arguments:
+            X (pd.DataFrame or np.array): Data of shape [n_samples, n_features]
+            objective (Object or string): The objective to use to make predictions
+            include_labels (bool): Whether to make predictions. Defaults to True.
+            include_proba (bool): Whether to make probability estimates. Defaults to True.
+            X_t (pd.DataFrame): X already transformed by the pipeline's components. If provided, X is not transformed again and is
+                only passed to the objective. Defaults to None.
+
+        Returns:
+            (pd.Series, pd.DataFrame): Encoded estimated labels and probability estimates, each None if it is not included.
+        """
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
-        X_t = self._transform(X)
+        if X_t is None:
+            X_t = self._transform(X)
+        ypred_proba = None
+        if include_proba or (include_labels and self._labels_need_proba()):
+            ypred_proba = self.estimator.predict_proba(X_t)
+            ypred_proba.columns = self._encoder.classes_
+        y_predicted = self._predict_labels(X, X_t, ypred_proba, objective) if include_labels else None
+        return y_predicted, ypred_proba if include_proba else None
+
+    def _labels_need_proba(self):
+        """Returns whether the estimated labels are derived from the probability estimates."""
+        return False
+
+    def _predict_labels(self, X, X_t, ypred_proba, objective=None):
+        """Derives the estimated labels from the transformed data, or from the probability estimates if _labels_need_proba is True."""
         return self.estimator.predict(X_t)
 
     def predict(self, X, objective=None):
@@ -103,14 +134,25 @@ class ClassificationPipeline(PipelineBase):
         Returns:
             pd.DataFrame: Probability estimates
         """
-        if not isinstance(X, pd.DataFrame):
-            X = pd.DataFrame(X)
-
-        X = self._transform(X)
-        proba = self.estimator.predict_proba(X)
-        proba.columns = self._encoder.classes_
+        _, proba = self._predict_with_proba(X, include_labels=False)
         return proba
 
+    def predict_proba_batches(self, X, chunksize=100000, n_jobs=None, prefer='threads'):
+        """Make probability estimates for labels on data in chunks of rows, so that only the intermediate results of a few chunks are in memory at once.
+
+        Arguments:
+            X (pd.DataFrame, str or iterable(pd.DataFrame)): Data to make probability estimates on. Either a dataframe, the path of a CSV or
+                Parquet file, or an iterable (such as a generator) which yields chunks of data of shape [n_samples, n_features].
+            chunksize (int): The number of rows in each chunk when X is a dataframe or a file. Defaults to 100000.
+            n_jobs (int or None): The number of chunks to make probability estimates on concurrently. None and 1 are equivalent and
+                use one chunk at a time. If set to -1, all CPUs are used. Defaults to None.
+            prefer (str): Either 'threads' or 'processes'. See predict_batches. Defaults to 'threads'.
+
+        Returns:
+            generator(pd.DataFrame): Probability estimates of each chunk, in the order of the chunks.
+        """
+        return self._map_chunks('predict_proba', X, chunksize, n_jobs, prefer)
+
     def score(self, X, y, objectives):
         """Evaluate model performance on objectives
 
@@ -133,13 +175,10 @@ class ClassificationPipeline(PipelineBase):
 
         return self._score_all_objectives(X, y, y_predicted, y_predicted_proba, objectives)
 
-    def _compute_predictions(self, X, objectives):
-        """Scan through the objectives list and precompute"""
-        y_predicted = None
-        y_predicted_proba = None
-        for objective in objectives:
-            if objective.score_needs_proba and y_predicted_proba is None:
-                y_predicted_proba = self.predict_proba(X)
-            if not objective.score_needs_proba and y_predicted is None:
-                y_predicted = self._predict(X)
-        return y_predicted, y_predicted_proba
+    def _compute_predictions(self, X, objectives, X_t=None):
+        """Scan through the objectives list and precompute the predictions and probability estimates they need, transforming X once."""
+        needs_proba = any(objective.score_needs_proba for objective in objectives)
+        needs_labels = any(not objective.score_needs_proba for objective in objectives)
+        if not (needs_proba or needs_labels):
+            return None, None
+        return self._predict_with_proba(X, include_labels=needs_labels, include_proba=needs_proba, X_t=X_t)
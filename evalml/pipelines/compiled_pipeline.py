@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+from evalml.pipelines.components.compiled_steps import ColumnLayout
+from evalml.problem_types import ProblemTypes
+
+
+class CompiledPipeline:
+    """A fitted pipeline frozen into a flat plan of numpy steps, which makes predictions for single rows and arrays without the
+    overhead of constructing dataframes for each component.
+
+    The data is held as a float array of its numeric columns and an object array of its other columns. Each of the pipeline's
+    transformers is compiled into a step on those arrays, with the column positions, fill values and one-hot lookup tables it needs
+    computed once, and the estimator is called directly on a float array of its features. If a transformer cannot be compiled, it
+    and the components after it are applied to a dataframe of the data, as they are by the pipeline. The estimator is also applied
+    to a dataframe if it cannot make predictions from a float array, such as CatBoost with categorical features.
+
+    The compiled pipeline uses the fitted components and the threshold of the pipeline at the time it was compiled.
+    """
+
+    def __init__(self, pipeline):
+        """Compile a fitted pipeline. Use PipelineBase.compile rather than calling this directly.
+
+        Arguments:
+            pipeline (PipelineBase): the fitted pipeline to compile
+        """
+        self.problem_type = pipeline.problem_type
+        self.feature_names = list(pipeline.input_feature_names[pipeline.component_graph[0].name])
+        self._input_dtypes = getattr(pipeline, '_input_dtypes', None) or {}
+        numeric = [name for name in self.feature_names if self._is_numeric(name)]
+        objects = [name for name in self.feature_names if not self._is_numeric(name)]
+        self._input_layout = ColumnLayout(numeric, objects)
+        positions = {name: i for i, name in enumerate(self.feature_names)}
+        self._numeric_indices = np.array([positions[name] for name in numeric], dtype=int)
+        self._object_indices = np.array([positions[name] for name in objects], dtype=int)
+
+        layout = self._input_layout
+        self._steps = []
+        self._components = []
+        for i, component in enumerate(pipeline.component_graph[:-1]):
+            compiled = component._compile(layout, pipeline.input_feature_names[component.name])
+            if compiled is None:
+                self._components = pipeline.component_graph[i:-1]
+                break
+            step, layout = compiled
+            self._steps.append(step)
+        self._layout = layout
+
+        self._estimator = pipeline.estimator
+        estimator_features = pipeline.input_feature_names[self._estimator.name]
+        compiled_estimator = None
+        if not self._components and all(name in layout.numeric_positions for name in estimator_features):
+            compiled_estimator = self._estimator._compile()
+        if compiled_estimator is not None:
+            self._predict, self._predict_proba = compiled_estimator
+            self._estimator_indices = np.array([layout.numeric_positions[name] for name in estimator_features], dtype=int)
+            self._frame_columns = None
+        else:
+            self._predict, self._predict_proba = self._estimator.predict, self._estimator.predict_proba
+            self._frame_columns = list(pipeline.input_feature_names[self._components[0].name] if self._components else estimator_features)
+
+        self._classes = None if self.problem_type == ProblemTypes.REGRESSION else np.asarray(pipeline.classes_)
+        self._threshold = pipeline.threshold if self.problem_type == ProblemTypes.BINARY else None
+
+    @property
+    def classes_(self):
+        """Gets the class names for the problem, in the order of the columns of the probability estimates."""
+        if self._classes is None:
+            raise AttributeError("Regression pipelines do not have classes.")
+        return self._classes
+
+    def predict_one(self, row):
+        """Make a prediction for a single row.
+
+        Arguments:
+            row (dict): The value of each of the features, by name. None and nan are missing values.
+
+        Returns:
+            The predicted value, or the estimated label for classification.
+        """
+        labels, _ = self._estimate(*self._from_row(row), include_proba=False)
+        return labels.tolist()[0]
+
+    def predict_array(self, X):
+        """Make predictions for the rows of an array.
+
+        Arguments:
+            X (np.ndarray): Data of shape [n_samples, n_features], with the features in the order of feature_names. Arrays with
+                non-numeric features must have the object dtype.
+
+        Returns:
+            np.ndarray: Predicted values, or estimated labels for classification.
+        """
+        labels, _ = self._estimate(*self._from_array(X), include_proba=False)
+        return labels
+
+    def predict_proba_one(self, row):
+        """Make probability estimates for a single row.
+
+        Arguments:
+            row (dict): The value of each of the features, by name. None and nan are missing values.
+
+        Returns:
+            np.ndarray: Probability estimate of each class, in the order of classes_.
+        """
+        _, proba = self._estimate(*self._from_row(row), include_labels=False)
+        return proba[0]
+
+    def predict_proba_array(self, X):
+        """Make probability estimates for the rows of an array.
+
+        Arguments:
+            X (np.ndarray): Data of shape [n_samples, n_features], with the features in the order of feature_names. Arrays with
+                non-numeric features must have the object dtype.
+
+        Returns:
+            np.ndarray: Probability estimates of shape [n_samples, n_classes], with the classes in the order of classes_.
+        """
+        _, proba = self._estimate(*self._from_array(X), include_labels=False)
+        return proba
+
+    def _is_numeric(self, name):
+        dtype = self._input_dtypes.get(name)
+        # boolean columns are imputed and encoded as categories, so they are held in the object array
+        return dtype is not None and pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+    def _from_row(self, row):
+        try:
+            numeric_values = np.array([[row[name] for name in self._input_layout.numeric]], dtype='float64')
+            object_values = np.empty((1, len(self._input_layout.objects)), dtype=object)
+            object_values[0] = [row[name] for name in self._input_layout.objects]
+        except KeyError:
+            missing = [name for name in self.feature_names if name not in row]
+            raise ValueError(f"Row is missing features {missing}")
+        return numeric_values, object_values
+
+    def _from_array(self, X):
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_names):
+            raise ValueError(f"X must be an array of shape [n_samples, {len(self.feature_names)}]. Received an array of shape {X.shape}.")
+        return X[:, self._numeric_indices].astype('float64'), X[:, self._object_indices].astype(object)
+
+    def _transform(self, numeric_values, object_values):
+        for step in self._steps:
+            numeric_values, object_values = step(numeric_values, object_values)
+        if self._frame_columns is None:
+            return numeric_values[:, self._estimator_indices]
+        X_t = pd.DataFrame({**{name: numeric_values[:, i] for i, name in enumerate(self._layout.numeric)},
+                            **{name: self._restore_dtype(name, object_values[:, i]) for i, name in enumerate(self._layout.objects)}},
+                           columns=self._frame_columns)
+        for component in self._components:
+            X_t = component.transform(X_t)
+        return X_t
+
+    def _restore_dtype(self, name, values):
+        dtype = self._input_dtypes.get(name)
+        if dtype is not None and pd.api.types.is_datetime64_any_dtype(dtype):
+            return pd.Series(values).astype(dtype)
+        return values
+
+    def _estimate(self, numeric_values, object_values, include_labels=True, include_proba=True):
+        if include_proba and self._classes is None:
+            raise ValueError("Probability estimates are only available for classification pipelines.")
+        X_t = self._transform(numeric_values, object_values)
+        proba = None
+        if include_proba or (include_labels and self._threshold is not None):
+            proba = np.asarray(self._predict_proba(X_t), dtype='float64')
+        labels = None
+        if include_labels:
+            if self._threshold is not None:
+                labels = proba[:, 1] > self._threshold
+            else:
+                labels = np.asarray(self._predict(X_t)).ravel()
+            if self._classes is not None:
+                labels = self._classes[labels.astype(int)]
+        return labels, proba
@@ -0,0 +1,83 @@
+import numpy as np
+
+
+class ColumnLayout:
+    """Names of the columns in the numeric and object arrays of a compiled pipeline's data, in the order of the arrays' columns.
+
+    A compiled pipeline holds its data as a float array of the numeric columns and an object array of the other columns, and applies
+    each fitted component as a step, which is a function of those two arrays returning the two arrays of its output.
+    """
+
+    def __init__(self, numeric, objects):
+        """Create a column layout.
+
+        Arguments:
+            numeric (list): names of the columns of the float array
+            objects (list): names of the columns of the object array
+        """
+        self.numeric = list(numeric)
+        self.objects = list(objects)
+        self.numeric_positions = {name: i for i, name in enumerate(self.numeric)}
+        self.object_positions = {name: i for i, name in enumerate(self.objects)}
+
+    def select(self, names):
+        """Returns a step which keeps only the given columns, and the layout of its output."""
+        names = set(names)
+        numeric = [name for name in self.numeric if name in names]
+        objects = [name for name in self.objects if name in names]
+        numeric_indices = np.array([self.numeric_positions[name] for name in numeric], dtype=int)
+        object_indices = np.array([self.object_positions[name] for name in objects], dtype=int)
+
+        def step(numeric_values, object_values):
+            return numeric_values[:, numeric_indices], object_values[:, object_indices]
+        return step, ColumnLayout(numeric, objects)
+
+    def drop(self, names):
+        """Returns a step which drops the given columns, and the layout of its output."""
+        names = set(names or [])
+        return self.select([name for name in self.numeric + self.objects if name not in names])
+
+
+def is_missing(values):
+    """Returns whether each of the values of a float or object array is missing."""
+    if values.dtype.kind == 'f':
+        return np.isnan(values)
+    if values.dtype.kind == 'M':
+        return np.isnat(values)
+    if values.dtype.kind == 'O':
+        return (values != values) | np.equal(values, None).astype(bool)
+    return np.zeros(values.shape, dtype=bool)
+
+
+def fill_missing(layout, fill_values):
+    """Returns a step which replaces the missing values of each column named in fill_values with its fill value, or None if a fill
+    value of a numeric column is not a number."""
+    numeric = [name for name in fill_values if name in layout.numeric_positions]
+    objects = [name for name in fill_values if name in layout.object_positions]
+    numeric_indices = np.array([layout.numeric_positions[name] for name in numeric], dtype=int)
+    object_indices = np.array([layout.object_positions[name] for name in objects], dtype=int)
+    try:
+        numeric_fill = np.array([fill_values[name] for name in numeric], dtype='float64')
+    except (TypeError, ValueError):
+        return None
+    object_fill = np.empty(len(objects), dtype=object)
+    object_fill[:] = [fill_values[name] for name in objects]
+
+    def step(numeric_values, object_values):
+        if len(numeric_indices):
+            block = numeric_values[:, numeric_indices]
+            numeric_values[:, numeric_indices] = np.where(np.isnan(block), numeric_fill, block)
+        if len(object_indices):
+            block = object_values[:, object_indices]
+            object_values[:, object_indices] = np.where(is_missing(block), object_fill, block)
+        return numeric_values, object_values
+    return step
+
+
+def chain(steps):
+    """Returns a step which applies each of the steps in order."""
+    def step(numeric_values, object_values):
+        for each_step in steps:
+            numeric_values, object_values = each_step(numeric_values, object_values)
+        return numeric_values, object_values
+    return step
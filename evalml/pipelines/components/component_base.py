@@ -10,8 +10,12 @@ from evalml.utils import (
     classproperty,
     get_logger,
     get_random_state,
-    log_subtitle
+    is_artifact,
+    load_artifact,
+    log_subtitle,
+    save_artifact
 )
+from evalml.utils.gen_utils import _track_subclass
 
 logger = get_logger(__file__)
 
@@ -20,6 +24,10 @@ class ComponentBase(ABC, metaclass=ComponentBaseMeta):
     """Base class for all components."""
     _default_parameters = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _track_subclass(cls)
+
     def __init__(self, parameters=None, component_obj=None, random_state=0, **kwargs):
         self.random_state = get_random_state(random_state)
         self._component_obj = component_obj
@@ -114,29 +122,42 @@ class ComponentBase(ABC, metaclass=ComponentBaseMeta):
             component_dict.update({"parameters": self.parameters})
             return component_dict
 
-    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
+    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL, artifact=False):
         """Saves component at file path
 
         Arguments:
-            file_path (str): location to save file
+            file_path (str): location to save file, or the directory to save the artifact to if artifact is True
             pickle_protocol (int): the pickle data stream format.
+            artifact (bool): whether to save a versioned artifact directory, with a manifest, fitted numpy arrays which are
+                memory-mapped on load and estimator backends in their native formats, rather than a single pickle file.
+                See evalml.utils.save_artifact. Defaults to False.
 
         Returns:
             None
         """
+        if artifact:
+            metadata = {'name': self.name,
+                        'parameters': self.parameters,
+                        'is_fitted': self._is_fitted}
+            save_artifact(self, file_path, pickle_protocol, metadata=metadata)
+            return
         with open(file_path, 'wb') as f:
             cloudpickle.dump(self, f, protocol=pickle_protocol)
 
     @staticmethod
-    def load(file_path):
+    def load(file_path, mmap_mode='r'):
         """Loads component at file path
 
         Arguments:
-            file_path (str): location to load file
+            file_path (str): location to load file, or an artifact directory
+            mmap_mode (str or None): how to memory-map the fitted numpy arrays of an artifact. See evalml.utils.load_artifact.
+                Defaults to 'r'.
 
         Returns:
             ComponentBase object
         """
+        if is_artifact(file_path):
+            return load_artifact(file_path, mmap_mode)
         with open(file_path, 'rb') as f:
             return cloudpickle.load(f)
 
@@ -79,6 +79,17 @@ class CatBoostClassifier(Estimator):
             predictions = pd.Series(predictions)
         return predictions
 
+    def _compile(self):
+        if len(self._component_obj.get_cat_feature_indices()) > 0:
+            return None
+
+        def predict(X):
+            predictions = self._component_obj.predict(X).ravel()
+            if self._label_encoder:
+                predictions = self._label_encoder.inverse_transform(predictions.astype(np.int64))
+            return predictions
+        return predict, self._component_obj.predict_proba
+
     @property
     def feature_importance(self):
         return self._component_obj.get_feature_importance()
@@ -94,3 +94,8 @@ class LightGBMClassifier(Estimator):
     def predict_proba(self, X):
         X2 = self._encode_categories(X)
         return super().predict_proba(X2)
+
+    def _compile(self):
+        if self._ordinal_encoder is not None or self._label_encoder is not None:
+            return None
+        return super()._compile()
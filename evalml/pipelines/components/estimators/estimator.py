@@ -58,6 +58,18 @@ class Estimator(ComponentBase):
             pred_proba = pd.DataFrame(pred_proba)
         return pred_proba
 
+    def _compile(self):
+        """Returns functions which make predictions and probability estimates from a float array of the features passed to the fitted
+        estimator, in the order they were passed to fit.
+
+        Returns:
+            (callable, callable): the prediction and probability estimate functions, or None if the estimator cannot make predictions
+                from such an array. The probability estimate function is None if the estimator does not estimate probabilities.
+        """
+        if self._component_obj is None:
+            return None
+        return self._component_obj.predict, getattr(self._component_obj, 'predict_proba', None)
+
     @property
     def feature_importance(self):
         """Returns importance associated with each feature.
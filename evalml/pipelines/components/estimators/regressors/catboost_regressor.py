@@ -61,6 +61,11 @@ class CatBoostRegressor(Estimator):
         model = self._component_obj.fit(X, y, silent=True, cat_features=cat_cols)
         return model
 
+    def _compile(self):
+        if len(self._component_obj.get_cat_feature_indices()) > 0:
+            return None
+        return super()._compile()
+
     @property
     def feature_importance(self):
         return self._component_obj.get_feature_importance()
@@ -1,3 +1,5 @@
+from functools import partial
+
 import pandas as pd
 from skopt.space import Integer, Real
 
@@ -54,6 +56,10 @@ class XGBoostRegressor(Estimator):
         predictions = super().predict(X)
         return predictions
 
+    def _compile(self):
+        # XGBoost checks the feature names of the data against the renamed columns it was fitted on, and arrays have no names
+        return partial(self._component_obj.predict, validate_features=False), None
+
     @property
     def feature_importance(self):
         return self._component_obj.feature_importances_
@@ -7,6 +7,7 @@ from evalml.pipelines.components.transformers import Transformer
 
 
 class ColumnSelector(Transformer):
+    _is_column_wise = True
 
     def __init__(self, columns=None, random_state=0, **kwargs):
         """Initalizes an transformer that drops specified columns in input data.
@@ -90,6 +91,9 @@ class DropColumns(ColumnSelector):
     def _modify_columns(self, cols, X, y=None):
         return X.drop(columns=cols, axis=1)
 
+    def _compile(self, layout, input_feature_names):
+        return layout.drop(self.parameters.get("columns") or [])
+
     def transform(self, X, y=None):
         """Transforms data X by dropping columns.
 
@@ -112,6 +116,9 @@ class SelectColumns(ColumnSelector):
     def _modify_columns(self, cols, X, y=None):
         return X[cols]
 
+    def _compile(self, layout, input_feature_names):
+        return layout.select(self.parameters.get("columns") or [])
+
     def transform(self, X, y=None):
         """Transforms data X by selecting columns.
 
@@ -6,6 +6,7 @@ from sklearn.preprocessing import OneHotEncoder as SKOneHotEncoder
 from ..transformer import Transformer
 
 from evalml.pipelines.components import ComponentBaseMeta
+from evalml.pipelines.components.compiled_steps import ColumnLayout, is_missing
 
 
 class OneHotEncoderMeta(ComponentBaseMeta):
@@ -17,6 +18,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
     """One-hot encoder to encode non-numeric data."""
     name = 'One Hot Encoder'
     hyperparameter_ranges = {}
+    _is_column_wise = True
 
     def __init__(self,
                  top_n=10,
@@ -24,6 +26,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
                  drop=None,
                  handle_unknown="ignore",
                  handle_missing="error",
+                 sparse=False,
                  random_state=0,
                  **kwargs):
         """Initalizes an transformer that encodes categorical features in a one-hot numeric array."
@@ -42,12 +45,15 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
                 `fit` or `transform`. If this is set to "as_category" and NaN values are within the `n` most frequent,
                 "nan" values will be encoded as their own column. If this is set to "error", any missing
                 values encountered will raise an error. Defaults to "error".
+            sparse (bool): If True, the encoded columns are returned as pandas sparse columns, which use much less memory when
+                there are many categories. The components after the encoder must support sparse columns. Defaults to False.
         """
         parameters = {"top_n": top_n,
                       "categories": categories,
                       "drop": drop,
                       "handle_unknown": handle_unknown,
-                      "handle_missing": handle_missing}
+                      "handle_missing": handle_missing,
+                      "sparse": sparse}
         parameters.update(kwargs)
 
         # Check correct inputs
@@ -79,11 +85,11 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
         top_n = self.parameters['top_n']
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
-        X_t = X
-        self._cols_to_encode = self._get_cat_cols(X_t)
+        self._cols_to_encode = self._get_cat_cols(X)
+        X_t = X[self._cols_to_encode]
 
         if self.parameters['handle_missing'] == "as_category":
-            X_t[self._cols_to_encode] = X_t[self._cols_to_encode].replace(np.nan, "nan")
+            X_t = X_t.replace(np.nan, "nan")
         elif self.parameters['handle_missing'] == "error" and X.isnull().any().any():
             raise ValueError("Input contains NaN")
 
@@ -97,7 +103,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
 
         else:
             categories = []
-            for col in X_t[self._cols_to_encode]:
+            for col in X_t:
                 value_counts = X_t[col].value_counts(dropna=False).to_frame()
                 if top_n is None or len(value_counts) <= top_n:
                     unique_values = value_counts.index.tolist()
@@ -111,8 +117,9 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
         # Create an encoder to pass off the rest of the computation to
         self._encoder = SKOneHotEncoder(categories=categories,
                                         drop=self.parameters['drop'],
-                                        handle_unknown=self.parameters['handle_unknown'])
-        self._encoder.fit(X_t[self._cols_to_encode])
+                                        handle_unknown=self.parameters['handle_unknown'],
+                                        sparse=self.parameters['sparse'])
+        self._encoder.fit(X_t)
         return self
 
     def transform(self, X, y=None):
@@ -129,27 +136,25 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
         cat_cols = self._get_cat_cols(X)
+        X_cat = X[cat_cols]
 
         if self.parameters['handle_missing'] == "as_category":
-            X[cat_cols] = X[cat_cols].replace(np.nan, "nan")
+            X_cat = X_cat.replace(np.nan, "nan")
         if self.parameters['handle_missing'] == "error" and X.isnull().any().any():
             raise ValueError("Input contains NaN")
 
-        X_t = pd.DataFrame()
-        # Add the non-categorical columns, untouched
-        for col in X.columns:
-            if col not in cat_cols:
-                X_t = pd.concat([X_t, X[col]], axis=1)
-        # The call to pd.concat above changes the type of the index so we will manually keep it the same.
-        if not X_t.empty:
-            X_t.index = X.index
+        # Keep the non-categorical columns untouched
+        X_t = X.drop(columns=cat_cols)
 
         # Call sklearn's transform on the categorical columns
         if len(cat_cols) > 0:
-            X_cat = pd.DataFrame(self._encoder.transform(X[cat_cols]).toarray(), index=X.index)
-            cat_cols_str = [str(c) for c in cat_cols]
-            X_cat.columns = self._encoder.get_feature_names(input_features=cat_cols_str)
-            X_t = pd.concat([X_t, X_cat], axis=1)
+            encoded = self._encoder.transform(X_cat)
+            feature_names = self._encoder.get_feature_names(input_features=[str(c) for c in cat_cols])
+            if self.parameters['sparse']:
+                X_encoded = pd.DataFrame.sparse.from_spmatrix(encoded, index=X.index, columns=feature_names)
+            else:
+                X_encoded = pd.DataFrame(encoded, index=X.index, columns=feature_names)
+            X_t = pd.concat([X_t, X_encoded], axis=1)
 
         return X_t
 
@@ -174,3 +179,54 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
             np.array: The feature names after encoding, provided in the same order as input_features.
         """
         return self._encoder.get_feature_names(self._cols_to_encode)
+
+    def _get_feature_provenance(self):
+        if self._encoder is None or len(self._cols_to_encode) == 0:
+            return {}
+        feature_names = list(self._encoder.get_feature_names(input_features=[str(c) for c in self._cols_to_encode]))
+        provenance = {}
+        for i, col in enumerate(self._cols_to_encode):
+            n_features = len(self._encoder.categories_[i])
+            if self._encoder.drop_idx_ is not None and self._encoder.drop_idx_[i] is not None:
+                n_features -= 1
+            provenance[col], feature_names = feature_names[:n_features], feature_names[n_features:]
+        return provenance
+
+    def _compile(self, layout, input_feature_names):
+        if any(col not in layout.object_positions for col in self._cols_to_encode):
+            return None
+        handle_missing = self.parameters['handle_missing']
+        handle_unknown = self.parameters['handle_unknown']
+        provenance = self._get_feature_provenance()
+        feature_names = [name for col in self._cols_to_encode for name in provenance[col]]
+        # one lookup table per encoded column, from each category to the position of its encoded column in the output
+        lookups = []
+        for i, col in enumerate(self._cols_to_encode):
+            categories = list(self._encoder.categories_[i])
+            if self._encoder.drop_idx_ is not None and self._encoder.drop_idx_[i] is not None:
+                del categories[self._encoder.drop_idx_[i]]
+            offset = feature_names.index(provenance[col][0]) if provenance[col] else 0
+            lookups.append({category: offset + j for j, category in enumerate(categories)})
+        known_categories = [set(categories) for categories in self._encoder.categories_]
+        encoded_indices = [layout.object_positions[col] for col in self._cols_to_encode]
+        _, output_layout = layout.drop(self._cols_to_encode)
+        keep_indices = [layout.object_positions[col] for col in output_layout.objects]
+        output_layout = ColumnLayout(output_layout.numeric + feature_names, output_layout.objects)
+
+        def step(numeric_values, object_values):
+            if handle_missing == "error" and (np.isnan(numeric_values).any() or is_missing(object_values).any()):
+                raise ValueError("Input contains NaN")
+            values = object_values[:, encoded_indices]
+            if handle_missing == "as_category":
+                values = np.where(is_missing(values), "nan", values)
+            encoded = np.zeros((len(values), len(feature_names)))
+            for i, lookup in enumerate(lookups):
+                if handle_unknown == "error":
+                    unknown = [value for value in values[:, i] if value not in known_categories[i]]
+                    if unknown:
+                        raise ValueError(f"Found unknown categories {unknown} in column {i} during transform")
+                positions = np.array([lookup.get(value, -1) for value in values[:, i]], dtype=int)
+                rows = np.flatnonzero(positions >= 0)
+                encoded[rows, positions[rows]] = 1
+            return np.hstack([numeric_values, encoded]), object_values[:, keep_indices]
+        return step, output_layout
@@ -5,6 +5,7 @@ from evalml.pipelines.components.transformers import Transformer
 
 class FeatureSelector(Transformer):
     """Selects top features based on importance weights"""
+    _is_column_wise = True
 
     def get_names(self):
         """Get names of selected features.
@@ -68,3 +69,7 @@ class FeatureSelector(Transformer):
             return pd.DataFrame(X_t, columns=selected_col_names, index=X.index).astype(col_types)
         else:
             return pd.DataFrame(X_t)
+
+    def _compile(self, layout, input_feature_names):
+        selected_masks = self._component_obj.get_support()
+        return layout.select([feature_name for (selected, feature_name) in zip(selected_masks, input_feature_names) if selected])
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from evalml.pipelines.components.compiled_steps import chain
 from evalml.pipelines.components.transformers import Transformer
 from evalml.pipelines.components.transformers.imputers import SimpleImputer
 from evalml.utils.gen_utils import boolean, categorical_dtypes, numeric_dtypes
@@ -14,6 +15,7 @@ class Imputer(Transformer):
     }
     _valid_categorical_impute_strategies = set(["most_frequent", "constant"])
     _valid_numeric_impute_strategies = set(["mean", "median", "most_frequent", "constant"])
+    _is_column_wise = True
 
     def __init__(self, categorical_impute_strategy="most_frequent",
                  categorical_fill_value=None,
@@ -108,3 +110,15 @@ class Imputer(Transformer):
             X_null_dropped[X_categorical.columns] = self._categorical_imputer.transform(X_categorical)
 
         return X_null_dropped
+
+    def _compile(self, layout, input_feature_names):
+        step, layout = layout.drop(self._all_null_cols)
+        steps = [step]
+        for imputer, cols in [(self._numeric_imputer, self._numeric_cols), (self._categorical_imputer, self._categorical_cols)]:
+            if cols is not None and len(cols) > 0:
+                compiled = imputer._compile(layout, list(cols))
+                if compiled is None:
+                    return None
+                step, layout = compiled
+                steps.append(step)
+        return chain(steps), layout
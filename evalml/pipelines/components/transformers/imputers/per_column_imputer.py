@@ -1,5 +1,6 @@
 import pandas as pd
 
+from evalml.pipelines.components.compiled_steps import chain
 from evalml.pipelines.components.transformers import Transformer
 from evalml.pipelines.components.transformers.imputers.simple_imputer import (
     SimpleImputer
@@ -10,6 +11,7 @@ class PerColumnImputer(Transformer):
     """Imputes missing data according to a specified imputation strategy per column"""
     name = 'Per Column Imputer'
     hyperparameter_ranges = {}
+    _is_column_wise = True
 
     def __init__(self, impute_strategies=None, default_impute_strategy="most_frequent", random_state=0, **kwargs):
         """Initializes a transformer that imputes missing data according to the specified imputation strategy per column."
@@ -99,3 +101,13 @@ class PerColumnImputer(Transformer):
 
         self.fit(X, y)
         return self.transform(X, y)
+
+    def _compile(self, layout, input_feature_names):
+        steps = []
+        for column, imputer in self.imputers.items():
+            compiled = imputer._compile(layout, [column])
+            if compiled is None:
+                return None
+            step, layout = compiled
+            steps.append(step)
+        return chain(steps), layout
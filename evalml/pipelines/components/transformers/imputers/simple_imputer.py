@@ -2,6 +2,11 @@ import numpy as np
 import pandas as pd
 from sklearn.impute import SimpleImputer as SkImputer
 
+from evalml.pipelines.components.compiled_steps import (
+    ColumnLayout,
+    chain,
+    fill_missing
+)
 from evalml.pipelines.components.transformers import Transformer
 
 
@@ -9,6 +14,7 @@ class SimpleImputer(Transformer):
     """Imputes missing data according to a specified imputation strategy."""
     name = 'Simple Imputer'
     hyperparameter_ranges = {"impute_strategy": ["mean", "median", "most_frequent"]}
+    _is_column_wise = True
 
     def __init__(self, impute_strategy="most_frequent", fill_value=None, random_state=0, **kwargs):
         """Initalizes an transformer that imputes missing data according to the specified imputation strategy."
@@ -88,3 +94,22 @@ class SimpleImputer(Transformer):
             pd.DataFrame: Transformed X
         """
         return self.fit(X, y).transform(X, y)
+
+    def _compile(self, layout, input_feature_names):
+        drop_step, layout = layout.drop(self._all_null_cols)
+        fill_step = fill_missing(layout, {name: value for name, value in zip(input_feature_names, self._component_obj.statistics_)
+                                          if name not in self._all_null_cols})
+        if fill_step is None:
+            return None
+        inputs = set(input_feature_names) - self._all_null_cols
+        moved = [name for name in layout.numeric if name in inputs]
+        if not moved or len(moved) == len(inputs):
+            return chain([drop_step, fill_step]), layout
+        # imputing numeric and non-numeric columns together makes every column an object column
+        kept = [name for name in layout.numeric if name not in inputs]
+        moved_indices = np.array([layout.numeric_positions[name] for name in moved], dtype=int)
+        kept_indices = np.array([layout.numeric_positions[name] for name in kept], dtype=int)
+
+        def to_objects(numeric_values, object_values):
+            return numeric_values[:, kept_indices], np.hstack([object_values, numeric_values[:, moved_indices].astype(object)])
+        return chain([drop_step, fill_step, to_objects]), ColumnLayout(kept, layout.objects + moved)
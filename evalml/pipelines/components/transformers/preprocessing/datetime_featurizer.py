@@ -1,5 +1,9 @@
+import calendar
+
+import numpy as np
 import pandas as pd
 
+from evalml.pipelines.components.compiled_steps import ColumnLayout, is_missing
 from evalml.pipelines.components.transformers import Transformer
 from evalml.utils.gen_utils import datetime_dtypes
 
@@ -28,6 +32,7 @@ class DateTimeFeaturizer(Transformer):
                           "month": _extract_month,
                           "day_of_week": _extract_day_of_week,
                           "hour": _extract_hour}
+    _is_column_wise = True
 
     def __init__(self, features_to_extract=None, random_state=0, **kwargs):
         """Extracts features from DateTime columns
@@ -77,3 +82,45 @@ class DateTimeFeaturizer(Transformer):
             for feature in features_to_extract:
                 X_t[f"{col_name}_{feature}"] = self._function_mappings[feature](X_t[col_name])
         return X_t.drop(self._date_time_col_names, axis=1)
+
+    def _get_feature_provenance(self):
+        features_to_extract = self.parameters["features_to_extract"]
+        if self._date_time_col_names is None or len(features_to_extract) == 0:
+            return {}
+        return {col_name: [f"{col_name}_{feature}" for feature in features_to_extract] for col_name in self._date_time_col_names}
+
+    def _compile(self, layout, input_feature_names):
+        features_to_extract = self.parameters["features_to_extract"]
+        cols = list(self._date_time_col_names)
+        if len(features_to_extract) == 0 or len(cols) == 0:
+            return layout.select(layout.numeric + layout.objects)
+        if any(col not in layout.object_positions for col in cols):
+            return None
+        indices = [layout.object_positions[col] for col in cols]
+        numeric_features = [feature for feature in features_to_extract if feature in ["year", "hour"]]
+        object_features = [feature for feature in features_to_extract if feature in ["month", "day_of_week"]]
+        _, output_layout = layout.drop(cols)
+        keep_indices = [layout.object_positions[col] for col in output_layout.objects]
+        output_layout = ColumnLayout(output_layout.numeric + [f"{col}_{feature}" for feature in numeric_features for col in cols],
+                                     output_layout.objects + [f"{col}_{feature}" for feature in object_features for col in cols])
+
+        def step(numeric_values, object_values):
+            dates = object_values[:, indices]
+            dates = np.where(is_missing(dates), None, dates).astype('datetime64[ns]')
+            missing = np.isnat(dates)
+            extracted = {}
+            for feature in features_to_extract:
+                values = _compiled_extractors[feature](dates)
+                extracted[feature] = np.where(missing, np.nan if values.dtype.kind == 'f' else None, values)
+            return (np.hstack([numeric_values] + [extracted[feature] for feature in numeric_features]),
+                    np.hstack([object_values[:, keep_indices]] + [extracted[feature] for feature in object_features]))
+        return step, output_layout
+
+
+_MONTH_NAMES = np.array(list(calendar.month_name)[1:], dtype=object)
+_DAY_NAMES = np.array(list(calendar.day_name), dtype=object)
+# the compiled counterparts of the extraction functions, on arrays of datetime64 values. 1970-01-01 was a Thursday.
+_compiled_extractors = {"year": lambda dates: dates.astype('datetime64[Y]').astype('int64').astype('float64') + 1970,
+                        "month": lambda dates: _MONTH_NAMES[dates.astype('datetime64[M]').astype('int64') % 12],
+                        "day_of_week": lambda dates: _DAY_NAMES[(dates.astype('datetime64[D]').astype('int64') + 3) % 7],
+                        "hour": lambda dates: (dates.astype('datetime64[h]').astype('int64') % 24).astype('float64')}
@@ -7,6 +7,7 @@ class DropNullColumns(Transformer):
     """Transformer to drop features whose percentage of NaN values exceeds a specified threshold"""
     name = "Drop Null Columns Transformer"
     hyperparameter_ranges = {}
+    _is_column_wise = True
 
     def __init__(self, pct_null_threshold=1.0, random_state=0, **kwargs):
         """Initalizes an transformer to drop features whose percentage of NaN values exceeds a specified threshold.
@@ -52,3 +53,6 @@ class DropNullColumns(Transformer):
         if not isinstance(X, pd.DataFrame):
             X = pd.DataFrame(X)
         return X.drop(columns=self._cols_to_drop, axis=1)
+
+    def _compile(self, layout, input_feature_names):
+        return layout.drop(self._cols_to_drop)
@@ -62,3 +62,6 @@ class LSA(TextTransformer):
             X_t['LSA({})[1]'.format(col)] = pd.Series(transformed[:, 1])
         X_t = X_t.drop(columns=text_columns)
         return X_t
+
+    def _get_feature_provenance(self):
+        return {col: ['LSA({})[0]'.format(col), 'LSA({})[1]'.format(col)] for col in self._all_text_columns}
@@ -108,3 +108,13 @@ class TextFeaturizer(TextTransformer):
         X_lsa = self._lsa.transform(X[text_columns])
 
         return pd.concat([X.drop(text_columns, axis=1), X_nlp_primitives, X_lsa], axis=1)
+
+    def _get_feature_provenance(self):
+        if self._features is None or len(self._features) == 0:
+            return {}
+        provenance = self._lsa._get_feature_provenance()
+        for col in self._all_text_columns:
+            # featuretools names each feature after the str-type name of the text column it is computed from
+            nlp_features = [feature for feature in self._features if [base.get_name() for base in feature.base_features] == [str(col)]]
+            provenance[col] = [name for feature in nlp_features for name in feature.get_feature_names()] + provenance[col]
+        return provenance
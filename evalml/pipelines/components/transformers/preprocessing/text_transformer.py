@@ -6,6 +6,7 @@ logger = get_logger(__file__)
 
 class TextTransformer(Transformer):
     """Base class for all transformers working with text features"""
+    _is_column_wise = True
 
     def __init__(self, text_columns=None, component_obj=None, random_state=0, **kwargs):
         """Creates a transformer to perform TF-IDF transformation and Singular Value Decomposition for text columns.
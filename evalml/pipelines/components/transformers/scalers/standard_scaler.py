@@ -1,3 +1,4 @@
+import numpy as np
 from sklearn.preprocessing import StandardScaler as SkScaler
 
 from evalml.pipelines.components.transformers import Transformer
@@ -7,6 +8,7 @@ class StandardScaler(Transformer):
     """Standardize features: removes mean and scales to unit variance."""
     name = "Standard Scaler"
     hyperparameter_ranges = {}
+    _is_column_wise = True
 
     def __init__(self, random_state=0, **kwargs):
         parameters = {}
@@ -16,3 +18,16 @@ class StandardScaler(Transformer):
         super().__init__(parameters=parameters,
                          component_obj=scaler,
                          random_state=random_state)
+
+    def _compile(self, layout, input_feature_names):
+        if any(name not in layout.numeric_positions for name in input_feature_names):
+            return None
+        scaler = self._component_obj
+        indices = np.array([layout.numeric_positions[name] for name in input_feature_names], dtype=int)
+        mean = scaler.mean_ if scaler.with_mean else np.zeros(len(indices))
+        scale = scaler.scale_ if scaler.with_std else np.ones(len(indices))
+
+        def step(numeric_values, object_values):
+            numeric_values[:, indices] = (numeric_values[:, indices] - mean) / scale
+            return numeric_values, object_values
+        return step, layout
@@ -19,6 +19,9 @@ class Transformer(ComponentBase):
     """
 
     model_family = ModelFamily.NONE
+    # Whether each output column is computed row by row from a single input column, using only state set during fit and the values
+    # of that input column. If so, permuting the rows of an input column permutes the rows of the columns derived from it in the same way.
+    _is_column_wise = False
 
     def transform(self, X, y=None):
         """Transforms data X
@@ -58,3 +61,20 @@ class Transformer(ComponentBase):
         if not isinstance(X_t, pd.DataFrame) and isinstance(X, pd.DataFrame):
             return pd.DataFrame(X_t, columns=X.columns, index=X.index)
         return pd.DataFrame(X_t)
+
+    def _get_feature_provenance(self):
+        """Returns a dictionary mapping input columns to the list of output columns derived from them. Input columns which are
+        passed through under the same name or dropped do not need to be listed."""
+        return {}
+
+    def _compile(self, layout, input_feature_names):
+        """Returns a step which applies the fitted transformer to the arrays of a compiled pipeline's data, and the layout of its output.
+
+        Arguments:
+            layout (ColumnLayout): the layout of the transformer's input
+            input_feature_names (list): the names of the columns passed to the transformer during fit, in order
+
+        Returns:
+            (callable, ColumnLayout): the step and the layout of its output, or None if the transformer cannot be compiled
+        """
+        return None
@@ -27,6 +27,18 @@ def all_components():
     return _all_estimators() + _all_transformers()
 
 
+_components_by_name = ((), {})
+
+
+def _get_components_by_name():
+    """Returns a dictionary of all components keyed by name, rebuilt only when the list of components changes."""
+    global _components_by_name
+    components = tuple(all_components())
+    if components != _components_by_name[0]:
+        _components_by_name = (components, {component.name: component for component in components})
+    return _components_by_name[1]
+
+
 def allowed_model_families(problem_type):
     """List the model types allowed for a particular problem type.
 
@@ -98,7 +110,7 @@ def handle_component_class(component_class):
     if not isinstance(component_class, str):
         raise ValueError(("component_graph may only contain str or ComponentBase subclasses, not '{}'")
                          .format(type(component_class)))
-    component_classes = {component.name: component for component in all_components()}
+    component_classes = _get_components_by_name()
     if component_class not in component_classes:
         raise MissingComponentError('Component "{}" was not found'.format(component_class))
     component_class = component_classes[component_class]
@@ -5,10 +5,13 @@ import re
 import sys
 import traceback
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 import cloudpickle
 import pandas as pd
+from joblib import effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
 
 from .components import Estimator
 from .components.utils import handle_component_class
@@ -16,8 +19,10 @@ from .components.utils import handle_component_class
 from evalml.exceptions import (
     IllFormattedClassNameError,
     MissingComponentError,
+    PipelineNotYetFittedError,
     PipelineScoreError
 )
+from evalml.pipelines.compiled_pipeline import CompiledPipeline
 from evalml.pipelines.pipeline_base_meta import PipelineBaseMeta
 from evalml.utils import (
     check_random_state_equality,
@@ -25,10 +30,14 @@ from evalml.utils import (
     get_logger,
     get_random_state,
     import_or_raise,
+    is_artifact,
     jupyter_check,
+    load_artifact,
     log_subtitle,
-    log_title
+    log_title,
+    save_artifact
 )
+from evalml.utils.gen_utils import _iter_chunks, _track_subclass
 
 logger = get_logger(__file__)
 
@@ -36,6 +45,10 @@ logger = get_logger(__file__)
 class PipelineBase(ABC, metaclass=PipelineBaseMeta):
     """Base class for all pipelines."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _track_subclass(cls)
+
     @property
     @classmethod
     @abstractmethod
@@ -70,6 +83,9 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
 
         self._validate_estimator_problem_type()
         self._is_fitted = False
+        self._transform_cache = None
+        self._component_cache_keys = None
+        self._input_dtypes = None
 
     @classproperty
     def name(cls):
@@ -184,16 +200,81 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             pd.DataFrame - New dataframe.
         """
         X_t = X
-        for component in self.component_graph[:-1]:
+        cache = self._transform_cache
+        if cache is None or self._component_cache_keys is None:
+            for component in self.component_graph[:-1]:
+                X_t = component.transform(X_t)
+            return X_t
+
+        fingerprint = cache.fingerprint(X)
+        X_t_is_cached = False
+        for component, component_key in zip(self.component_graph[:-1], self._component_cache_keys):
+            key = ('transform', component_key, fingerprint)
+            entry = cache.get(key)
+            if entry is not None:
+                X_t, = entry
+                X_t_is_cached = True
+                continue
+            if X_t_is_cached:
+                X_t = X_t.copy()
+                X_t_is_cached = False
             X_t = component.transform(X_t)
-        return X_t
+            cache.put(key, X_t)
+        return X_t.copy() if X_t_is_cached else X_t
+
+    def _get_feature_provenance(self):
+        """Returns a dictionary mapping each input column of the fitted pipeline to the list of columns derived from it which are
+        passed to the estimator.
+
+        Returns None if any transformer is not column-wise, or if a column passed to the estimator is not derived from exactly one
+        input column. Otherwise, permuting the rows of an input column permutes the rows of the columns derived from it in the same way.
+        """
+        provenance = {col: [col] for col in self.input_feature_names[self.component_graph[0].name]}
+        for component, next_component in zip(self.component_graph[:-1], self.component_graph[1:]):
+            if not component._is_column_wise:
+                return None
+            component_provenance = component._get_feature_provenance()
+            output_columns = set(self.input_feature_names[next_component.name])
+            for col, derived in provenance.items():
+                provenance[col] = [output for feature in derived for output in component_provenance.get(feature, [feature])
+                                   if output in output_columns]
+        derived = [feature for features in provenance.values() for feature in features]
+        if len(derived) != len(set(derived)) or set(derived) != set(self.input_feature_names[self.estimator.name]):
+            return None
+        return provenance
 
     def _fit(self, X, y):
+        self._input_dtypes = X.dtypes.to_dict()
         X_t = X
         y_t = y
-        for component in self.component_graph[:-1]:
+        cache = self._transform_cache
+        component_key = cache.fingerprint(X, y) if cache is not None else None
+        component_cache_keys = []
+        X_t_is_cached = False
+        for i, component in enumerate(self.component_graph[:-1]):
+            if cache is not None:
+                component_key = cache.component_key(component_key, component, self.random_state)
+                component_cache_keys.append(component_key)
+                entry = cache.get(component_key)
+                if entry is not None:
+                    # Reuse the component fitted by another pipeline with the same preprocessing on the same data
+                    component, input_feature_names, X_t, random_state = entry
+                    self.component_graph[i] = component
+                    self.input_feature_names.update({component.name: input_feature_names})
+                    self.random_state.set_state(random_state)
+                    X_t_is_cached = True
+                    continue
+            if X_t_is_cached:
+                X_t = X_t.copy()
+                X_t_is_cached = False
             self.input_feature_names.update({component.name: list(pd.DataFrame(X_t))})
             X_t = component.fit_transform(X_t, y_t)
+            if cache is not None:
+                cache.put(component_key, component, self.input_feature_names[component.name], X_t, self.random_state.get_state())
+        if X_t_is_cached:
+            X_t = X_t.copy()
+        if cache is not None:
+            self._component_cache_keys = component_cache_keys
 
         self.input_feature_names.update({self.estimator.name: list(pd.DataFrame(X_t))})
         self.estimator.fit(X_t, y_t)
@@ -228,6 +309,66 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         X_t = self._transform(X)
         return self.estimator.predict(X_t)
 
+    def compile(self):
+        """Freezes the fitted pipeline into a CompiledPipeline, which makes predictions for single rows and numpy arrays with a
+        precomputed plan of numpy operations rather than by passing dataframes through each component. Use it to serve predictions
+        with low latency.
+
+        Returns:
+            CompiledPipeline: The compiled pipeline
+        """
+        return CompiledPipeline(self)
+
+    def predict_batches(self, X, objective=None, chunksize=100000, n_jobs=None, prefer='threads'):
+        """Make predictions on data in chunks of rows, so that only the intermediate results of a few chunks are in memory at once.
+
+        Arguments:
+            X (pd.DataFrame, str or iterable(pd.DataFrame)): Data to make predictions on. Either a dataframe, the path of a CSV or
+                Parquet file, or an iterable (such as a generator) which yields chunks of data of shape [n_samples, n_features].
+            objective (Object or string): The objective to use to make predictions
+            chunksize (int): The number of rows in each chunk when X is a dataframe or a file. Defaults to 100000.
+            n_jobs (int or None): The number of chunks to make predictions on concurrently. At most twice as many chunks are read ahead
+                of the predictions yielded so far. None and 1 are equivalent and predict one chunk at a time. If set to -1, all CPUs are used.
+                Defaults to None.
+            prefer (str): Either 'threads', to predict in a pool of threads, or 'processes', to predict in a pool of worker processes,
+                which the pipeline is copied to for each chunk. Only used if n_jobs is not None or 1. Defaults to 'threads'.
+
+        Returns:
+            generator(pd.Series): Predicted values of each chunk, in the order of the chunks.
+        """
+        return self._map_chunks('predict', X, chunksize, n_jobs, prefer, objective)
+
+    def _map_chunks(self, method_name, X, chunksize, n_jobs, prefer, *args):
+        """Validates the arguments of a batch prediction method and returns a generator which calls the method on each chunk of X."""
+        if not self._is_fitted:
+            klass = type(self).__name__
+            raise PipelineNotYetFittedError(f'This {klass} is not fitted yet. You must fit {klass} before calling {method_name}_batches.')
+        if prefer not in ['threads', 'processes']:
+            raise ValueError(f"prefer must be either 'threads' or 'processes'. Received '{prefer}'.")
+        chunks = _iter_chunks(X, chunksize)
+        if n_jobs in (None, 1):
+            return (getattr(self, method_name)(chunk, *args) for chunk in chunks)
+        return self._map_chunks_in_parallel(method_name, chunks, effective_n_jobs(n_jobs), prefer, args)
+
+    def _map_chunks_in_parallel(self, method_name, chunks, max_workers, prefer, args):
+        if prefer == 'threads':
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            executor = get_reusable_executor(max_workers=max_workers)
+        in_progress = deque()
+        try:
+            for chunk in chunks:
+                in_progress.append(executor.submit(_predict_chunk, self, method_name, chunk, args))
+                if len(in_progress) >= 2 * max_workers:
+                    yield in_progress.popleft().result()
+            while in_progress:
+                yield in_progress.popleft().result()
+        finally:
+            for future in in_progress:
+                future.cancel()
+            if prefer == 'threads':
+                executor.shutdown(wait=False)
+
     @abstractmethod
     def score(self, X, y, objectives):
         """Evaluate model performance on current and additional objectives
@@ -241,6 +382,12 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             dict: Ordered dictionary of objective scores
         """
 
+    def _compute_predictions(self, X, objectives, X_t=None):
+        """Computes the predictions needed to score the objectives, and None in place of the probability estimates."""
+        if X_t is None:
+            X_t = self._transform(X)
+        return self.estimator.predict(X_t), None
+
     @staticmethod
     def _score(X, y, predictions, objective):
         return objective.score(y, predictions, X)
@@ -439,29 +586,43 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         fig = go.Figure(data=data, layout=layout)
         return fig
 
-    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
+    def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL, artifact=False):
         """Saves pipeline at file path
 
         Arguments:
-            file_path (str): location to save file
+            file_path (str): location to save file, or the directory to save the artifact to if artifact is True
             pickle_protocol (int): the pickle data stream format.
+            artifact (bool): whether to save a versioned artifact directory, with a manifest, fitted numpy arrays which are
+                memory-mapped on load and estimator backends in their native formats, rather than a single pickle file.
+                See evalml.utils.save_artifact. Defaults to False.
 
         Returns:
             None
         """
+        if artifact:
+            metadata = {'problem_type': str(self.problem_type),
+                        'component_graph': [{'name': component.name, 'class': type(component).__name__} for component in self.component_graph],
+                        'parameters': self.parameters,
+                        'is_fitted': self._is_fitted}
+            save_artifact(self, file_path, pickle_protocol, metadata=metadata)
+            return
         with open(file_path, 'wb') as f:
             cloudpickle.dump(self, f, protocol=pickle_protocol)
 
     @staticmethod
-    def load(file_path):
+    def load(file_path, mmap_mode='r'):
         """Loads pipeline at file path
 
         Arguments:
-            file_path (str): location to load file
+            file_path (str): location to load file, or an artifact directory
+            mmap_mode (str or None): how to memory-map the fitted numpy arrays of an artifact. See evalml.utils.load_artifact.
+                Defaults to 'r'.
 
         Returns:
             PipelineBase object
         """
+        if is_artifact(file_path):
+            return load_artifact(file_path, mmap_mode)
         with open(file_path, 'rb') as f:
             return cloudpickle.load(f)
 
@@ -487,3 +648,11 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
             if getattr(self, attribute) != getattr(other, attribute):
                 return False
         return True
+
+
+def _predict_chunk(pipeline, method_name, X, args):
+    """Calls a prediction method of the pipeline on one chunk of data.
+
+    Defined at the module level so that chunks can be dispatched to worker processes.
+    """
+    return getattr(pipeline, method_name)(X, *args)
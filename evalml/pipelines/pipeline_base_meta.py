@@ -9,6 +9,8 @@ from evalml.utils.base_meta import BaseMeta
 class PipelineBaseMeta(BaseMeta):
     """Metaclass that overrides creating a new pipeline by wrapping methods with validators and setters"""
 
+    METHODS_TO_CHECK = BaseMeta.METHODS_TO_CHECK + ['compile']
+
     @classmethod
     def check_for_fit(cls, method):
         """`check_for_fit` wraps a method that validates if `self._is_fitted` is `True`.
@@ -0,0 +1,100 @@
+import copy
+import hashlib
+from collections import OrderedDict
+
+import pandas as pd
+
+from evalml.pipelines.components import ComponentBase
+
+
+class TransformCache:
+    """Cache of fitted pipeline components and their outputs, shared between pipelines which start with the same components.
+
+    Entries are keyed by the classes and parameters of all components up to and including the cached one, the state of
+    the pipeline's random state before fitting them, and a fingerprint of the data they were fit on. This lets a pipeline
+    reuse the fitted preprocessing components of another pipeline which was trained on the same cross-validation fold,
+    along with the transformed training and test data.
+
+    AutoMLSearch creates a new cache for every search.
+    """
+
+    def __init__(self, max_entries=64):
+        """Create a TransformCache
+
+        Arguments:
+            max_entries (int): maximum number of fitted components and transformed datasets to keep. When the cache is full,
+                the least recently used entry is evicted. Defaults to 64.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be a positive integer. Received {max_entries}.")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        self._entries.clear()
+
+    @staticmethod
+    def fingerprint(X, y=None):
+        """Computes a fingerprint identifying the index, columns and values of the input data.
+
+        Arguments:
+            X (pd.DataFrame): input data
+            y (pd.Series, optional): target data
+
+        Returns:
+            str: fingerprint of the data
+        """
+        fingerprint = hashlib.sha1()
+        fingerprint.update(pd.util.hash_pandas_object(X, index=True).values.tobytes())
+        fingerprint.update(repr(list(X.columns)).encode())
+        if y is not None:
+            fingerprint.update(pd.util.hash_pandas_object(pd.Series(y), index=False).values.tobytes())
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def component_key(previous_key, component, random_state):
+        """Computes the key of a component which is fit after the components identified by previous_key.
+
+        Arguments:
+            previous_key (tuple or str): key of the previous component, or the fingerprint of the training data for the first component.
+            component (ComponentBase): the component to compute the key for.
+            random_state (np.random.RandomState): the random state of the pipeline, before fitting the component.
+
+        Returns:
+            tuple: key of the fitted component
+        """
+        state_fingerprint = hashlib.sha1()
+        for value in random_state.get_state():
+            state_fingerprint.update(repr(value).encode() if not hasattr(value, 'tobytes') else value.tobytes())
+        return (previous_key, type(component), repr(sorted(component.parameters.items())), state_fingerprint.hexdigest())
+
+    def get(self, key):
+        """Returns the entry stored under key, or None if there is no such entry.
+
+        Dataframes in entries are shared, so callers must copy any dataframe they get from the cache before modifying it.
+        Components are copied, so that each pipeline which reuses a fitted component has its own.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return tuple(copy.deepcopy(value) if isinstance(value, ComponentBase) else value for value in entry)
+
+    def put(self, key, *entry):
+        """Stores an entry under key, evicting the least recently used entry if the cache is full.
+
+        Dataframes and components in the entry are copied, so callers may keep modifying them.
+        """
+        self._entries[key] = tuple(value.copy() if isinstance(value, pd.DataFrame) else
+                                   copy.deepcopy(value) if isinstance(value, ComponentBase) else value for value in entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -6,6 +6,7 @@ from .multiclass_classification_pipeline import (
 )
 from .regression_pipeline import RegressionPipeline
 
+from evalml.data_checks.data_profile import DataProfile
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components import (
     CatBoostClassifier,
@@ -25,7 +26,7 @@ from evalml.utils.gen_utils import categorical_dtypes, datetime_dtypes
 logger = get_logger(__file__)
 
 
-def _get_preprocessing_components(X, y, problem_type, estimator_class):
+def _get_preprocessing_components(X, y, problem_type, estimator_class, profile=None):
     """Given input data, target data and an estimator class, construct a recommended preprocessing chain to be combined with the estimator and trained on the provided data.
 
     Arguments:
@@ -33,27 +34,27 @@ def _get_preprocessing_components(X, y, problem_type, estimator_class):
         y (pd.Series): The target data of length [n_samples]
         problem_type (ProblemTypes or str): Problem type
         estimator_class (class): A class which subclasses Estimator estimator for pipeline
+        profile (DataProfile): Profile of X. If None, the profile is computed from X.
 
     Returns:
         list[Transformer]: A list of applicable preprocessing components to use with the estimator
     """
-    if not isinstance(X, pd.DataFrame):
-        X = pd.DataFrame(X)
+    if profile is None:
+        profile = DataProfile(X)
     pp_components = []
-    all_null_cols = X.columns[X.isnull().all()]
-    if len(all_null_cols) > 0:
+    if (profile.null_counts == profile.n_rows).any():
         pp_components.append(DropNullColumns)
 
     pp_components.append(Imputer)
 
-    datetime_cols = X.select_dtypes(include=datetime_dtypes)
-    add_datetime_featurizer = len(datetime_cols.columns) > 0
+    datetime_cols = profile.select_columns(include=datetime_dtypes)
+    add_datetime_featurizer = len(datetime_cols) > 0
     if add_datetime_featurizer:
         pp_components.append(DateTimeFeaturizer)
 
     # DateTimeFeaturizer can create categorical columns
-    categorical_cols = X.select_dtypes(include=categorical_dtypes)
-    if (add_datetime_featurizer or len(categorical_cols.columns) > 0) and estimator_class not in {CatBoostClassifier, CatBoostRegressor}:
+    categorical_cols = profile.select_columns(include=categorical_dtypes)
+    if (add_datetime_featurizer or len(categorical_cols) > 0) and estimator_class not in {CatBoostClassifier, CatBoostRegressor}:
         pp_components.append(OneHotEncoder)
 
     if estimator_class.model_family == ModelFamily.LINEAR_MODEL:
@@ -71,7 +72,7 @@ def _get_pipeline_base_class(problem_type):
         return RegressionPipeline
 
 
-def make_pipeline(X, y, estimator, problem_type):
+def make_pipeline(X, y, estimator, problem_type, profile=None):
     """Given input data, target data, an estimator class and the problem type,
         generates a pipeline class with a preprocessing chain which was recommended based on the inputs.
         The pipeline will be a subclass of the appropriate pipeline base class for the specified problem_type.
@@ -81,6 +82,8 @@ def make_pipeline(X, y, estimator, problem_type):
         y (pd.Series): The target data of length [n_samples]
         estimator (Estimator): Estimator for pipeline
         problem_type (ProblemTypes or str): Problem type for pipeline to generate
+        profile (DataProfile): Profile of X. Pass the same profile when generating pipelines for many estimators, so that the data is only profiled once.
+            If None, the profile is computed from X.
 
     Returns:
         class: PipelineBase subclass with dynamically generated preprocessing components and specified estimator
@@ -89,7 +92,7 @@ def make_pipeline(X, y, estimator, problem_type):
     problem_type = handle_problem_types(problem_type)
     if estimator not in get_estimators(problem_type):
         raise ValueError(f"{estimator.name} is not a valid estimator for problem type")
-    preprocessing_components = _get_preprocessing_components(X, y, problem_type, estimator)
+    preprocessing_components = _get_preprocessing_components(X, y, problem_type, estimator, profile)
     complete_component_graph = preprocessing_components + [estimator]
 
     hyperparameters = None
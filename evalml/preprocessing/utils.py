@@ -1,27 +1,49 @@
+import os
+
 import pandas as pd
 from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
 
+from evalml.utils import import_or_raise
+
 
-def load_data(path, index, target, n_rows=None, drop=None, verbose=True, **kwargs):
+def load_data(path, index, target, n_rows=None, drop=None, verbose=True, columns=None, chunksize=None, compact=False, **kwargs):
     """Load features and target from file.
 
     Arguments:
-        path (str): Path to file or a http/ftp/s3 URL
+        path (str, os.PathLike or file-like object): Path to file, a http/ftp/s3 URL or an open file. Files with the .parquet or .pq
+            extension are read as Parquet files, files with the .feather extension are read as Feather files, and all other files,
+            including open files, are read as CSV files.
         index (str): Column for index
         target (str): Column for target
         n_rows (int): Number of rows to return
         drop (list): List of columns to drop
         verbose (bool): If True, prints information about features and target
+        columns (list): Feature columns to load. Other columns are not read from the file. Defaults to None, which loads all columns.
+        chunksize (int): If set, CSV and Parquet files are read this many rows at a time, and reading stops once n_rows rows are read.
+            Combined with compact, this limits memory usage to a single chunk with the default dtypes. Defaults to None, which reads the file at once.
+        compact (bool): If True, the dtypes of the features are compacted with compact_dtypes. Numeric features are compacted
+            as each chunk is read. Defaults to False.
+        **kwargs: Additional arguments passed to pd.read_csv for CSV files.
 
     Returns:
         pd.DataFrame, pd.Series: features and target
     """
-
-    feature_matrix = pd.read_csv(path, index_col=index, nrows=n_rows, **kwargs)
-
-    targets = [target] + (drop or [])
+    usecols = None
+    if columns is not None:
+        usecols = [column for column in [index, target] if column is not None] + [column for column in columns if column not in [index, target]]
+
+    chunks = []
+    for chunk in _read_chunks(path, index, usecols, n_rows, chunksize, **kwargs):
+        if compact:
+            chunk = _compact_numeric_dtypes(chunk, exclude=[target])
+        chunks.append(chunk)
+    feature_matrix = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+
+    targets = [target] + [column for column in drop or [] if column in feature_matrix.columns or columns is None]
     y = feature_matrix[target]
     X = feature_matrix.drop(columns=targets)
+    if compact:
+        X = compact_dtypes(X)
 
     if verbose:
         # number of features
@@ -37,6 +59,81 @@ def load_data(path, index, target, n_rows=None, drop=None, verbose=True, **kwarg
     return X, y
 
 
+def _read_chunks(path, index, usecols, n_rows, chunksize, **kwargs):
+    """Reads a CSV, Parquet or Feather file, in chunks of chunksize rows if chunksize is set.
+
+    Returns:
+        iterable(pd.DataFrame): the chunks of the first n_rows rows of the file.
+    """
+    file_format = None
+    if isinstance(path, (str, os.PathLike)):
+        file_format = os.fspath(path).lower().rsplit('.', 1)[-1]
+    if file_format not in ['parquet', 'pq', 'feather']:
+        reader = pd.read_csv(path, index_col=index, nrows=n_rows, usecols=usecols, chunksize=chunksize, **kwargs)
+        return reader if chunksize else [reader]
+
+    if file_format == 'feather':
+        chunks = [pd.read_feather(path, columns=usecols)]
+    elif chunksize:
+        parquet = import_or_raise("pyarrow.parquet", error_msg="pyarrow is needed to read Parquet files in chunks.")
+        chunks = (batch.to_pandas() for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunksize, columns=usecols))
+    else:
+        chunks = [pd.read_parquet(path, columns=usecols)]
+    return _limit_rows((chunk.set_index(index) if index is not None else chunk for chunk in chunks), n_rows)
+
+
+def _limit_rows(chunks, n_rows):
+    """Yields chunks of data until n_rows rows have been yielded, without reading further chunks."""
+    n_remaining = n_rows
+    for chunk in chunks:
+        if n_remaining is not None:
+            chunk = chunk.iloc[:n_remaining]
+            n_remaining -= len(chunk)
+        yield chunk
+        if n_remaining == 0:
+            return
+
+
+def compact_dtypes(X, category_threshold=0.5):
+    """Converts the columns of a dataframe to the most compact dtypes which represent their values exactly.
+
+    Integer columns are downcast to the smallest integer dtype which holds their values, float columns are converted to float32
+    if no value changes, and object columns whose number of unique values is at most category_threshold times the number of rows
+    are converted to category.
+
+    Arguments:
+        X (pd.DataFrame): Data to compact
+        category_threshold (float): The largest ratio of unique values to rows for which an object column is converted to category.
+            Defaults to 0.5.
+
+    Returns:
+        pd.DataFrame: The data with compacted dtypes.
+    """
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(X)
+    X_t = _compact_numeric_dtypes(X)
+    for column in X_t.select_dtypes(include=['object']).columns:
+        if X_t[column].nunique() <= category_threshold * len(X_t):
+            X_t[column] = X_t[column].astype('category')
+    return X_t
+
+
+def _compact_numeric_dtypes(X, exclude=None):
+    """Downcasts the integer and float columns of a dataframe to the smallest dtypes which represent their values exactly."""
+    X_t = X.copy()
+    for column in X_t.select_dtypes(include=['integer', 'floating']).columns:
+        if column in (exclude or []):
+            continue
+        values = X_t[column]
+        if pd.api.types.is_integer_dtype(values):
+            X_t[column] = pd.to_numeric(values, downcast='integer')
+        elif values.dtype == 'float64':
+            values_float32 = values.astype('float32')
+            if ((values_float32.values == values.values) | values.isna().values).all():
+                X_t[column] = values_float32
+    return X_t
+
+
 def split_data(X, y, regression=False, test_size=.2, random_state=None):
     """Splits data into train and test sets.
 
@@ -84,10 +181,14 @@ def number_of_features(dtypes):
     """
     dtype_to_vtype = {
         'bool': 'Boolean',
+        'int8': 'Numeric',
+        'int16': 'Numeric',
         'int32': 'Numeric',
         'int64': 'Numeric',
+        'float32': 'Numeric',
         'float64': 'Numeric',
         'object': 'Categorical',
+        'category': 'Categorical',
         'datetime64[ns]': 'Datetime',
     }
 
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import Future
 from itertools import product
 from unittest.mock import MagicMock, patch
 
@@ -10,11 +11,17 @@ from sklearn.model_selection import StratifiedKFold
 
 from evalml import AutoMLSearch
 from evalml.automl import TrainingValidationSplit
+from evalml.automl.automl_algorithm import (
+    IterativeAlgorithm,
+    SuccessiveHalvingAlgorithm
+)
 from evalml.data_checks import (
     DataCheck,
     DataCheckError,
     DataChecks,
-    DataCheckWarning
+    DataCheckWarning,
+    DataProfile,
+    InvalidTargetDataCheck
 )
 from evalml.demos import load_breast_cancer, load_wine
 from evalml.exceptions import AutoMLSearchException, PipelineNotFoundError
@@ -26,6 +33,7 @@ from evalml.pipelines import (
     MulticlassClassificationPipeline,
     RegressionPipeline
 )
+from evalml.pipelines.components import Estimator
 from evalml.pipelines.components.utils import get_estimators
 from evalml.pipelines.utils import make_pipeline
 from evalml.problem_types import ProblemTypes
@@ -56,7 +64,7 @@ def test_search_results(X_y_regression, X_y_binary, X_y_multi, automl_type):
     assert len(automl.results['pipeline_results']) == 2
     for pipeline_id, results in automl.results['pipeline_results'].items():
         assert results.keys() == {'id', 'pipeline_name', 'pipeline_class', 'pipeline_summary', 'parameters', 'score', 'high_variance_cv', 'training_time',
-                                  'cv_data', 'percent_better_than_baseline'}
+                                  'cv_data', 'percent_better_than_baseline', 'data_fraction', 'pruned'}
         assert results['id'] == pipeline_id
         assert isinstance(results['pipeline_name'], str)
         assert issubclass(results['pipeline_class'], expected_pipeline_class)
@@ -221,11 +229,12 @@ def test_rankings(X_y_binary, X_y_regression):
     assert len(automl.rankings) == 2
 
 
+@patch('evalml.pipelines.BinaryClassificationPipeline._encode_targets', side_effect=lambda y: y)
 @patch('evalml.objectives.BinaryClassificationObjective.optimize_threshold')
 @patch('evalml.pipelines.BinaryClassificationPipeline.predict_proba')
 @patch('evalml.pipelines.BinaryClassificationPipeline.score')
 @patch('evalml.pipelines.BinaryClassificationPipeline.fit')
-def test_automl_str_search(mock_fit, mock_score, mock_predict_proba, mock_optimize_threshold, X_y_binary):
+def test_automl_str_search(mock_fit, mock_score, mock_predict_proba, mock_optimize_threshold, mock_encode_targets, X_y_binary):
     def _dummy_callback(param1, param2, param3):
         return None
 
@@ -244,6 +253,11 @@ def test_automl_str_search(mock_fit, mock_score, mock_predict_proba, mock_optimi
         'add_result_callback': None,
         'additional_objectives': ['Precision', 'AUC'],
         'n_jobs': 2,
+        'cv_n_jobs': 1,
+        'batch_n_jobs': 1,
+        'cache_transforms': True,
+        'automl_algorithm': 'successive_halving',
+        'cv_pruning': 'median',
         'optimize_thresholds': True
     }
 
@@ -261,6 +275,12 @@ def test_automl_str_search(mock_fit, mock_score, mock_predict_proba, mock_optimi
         'Additional Objectives': search_params['additional_objectives'],
         'Random State': 'RandomState(MT19937)',
         'n_jobs': search_params['n_jobs'],
+        'cv_n_jobs': search_params['cv_n_jobs'],
+        'batch_n_jobs': search_params['batch_n_jobs'],
+        'Cache Transforms': search_params['cache_transforms'],
+        'AutoML Algorithm': search_params['automl_algorithm'],
+        'CV Pruning': search_params['cv_pruning'],
+        'Journal Path': None,
         'Optimize Thresholds': search_params['optimize_thresholds']
     }
 
@@ -506,6 +526,20 @@ def test_automl_serialization(X_y_binary, tmpdir):
         pd.testing.assert_frame_equal(automl.rankings, loaded_automl.rankings)
 
 
+def test_automl_serialization_artifact(X_y_binary, tmpdir):
+    X, y = X_y_binary
+    path = os.path.join(str(tmpdir), 'automl')
+    automl = AutoMLSearch(problem_type='binary', max_iterations=2)
+    automl.search(X, y)
+    automl.save(path, artifact=True)
+    loaded_automl = AutoMLSearch.load(path)
+    for i in range(2):
+        assert automl.get_pipeline(i).__class__ == loaded_automl.get_pipeline(i).__class__
+        assert automl.get_pipeline(i).parameters == loaded_automl.get_pipeline(i).parameters
+    assert automl.results == loaded_automl.results
+    pd.testing.assert_frame_equal(automl.rankings, loaded_automl.rankings)
+
+
 @patch('cloudpickle.dump')
 def test_automl_serialization_protocol(mock_cloudpickle_dump, tmpdir):
     path = os.path.join(str(tmpdir), 'automl.pkl')
@@ -913,6 +947,32 @@ def test_catch_keyboard_interrupt(mock_fit, mock_score, mock_input,
     assert len(automl._results['pipeline_results']) == number_results
 
 
+@pytest.mark.parametrize("user_input,number_results", [(interrupt, 1), (dont_interrupt, 5)])
+@patch("builtins.input")
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"F1": 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_catch_keyboard_interrupt_between_pipelines(mock_fit, mock_score, mock_input, user_input, number_results, X_y_binary):
+    mock_input.side_effect = user_input
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type="binary", max_iterations=5, objective="f1", cache_transforms=True)
+    next_batch = IterativeAlgorithm.next_batch
+    interrupted = []
+
+    def interrupt_first_batch(algorithm):
+        if not interrupted:
+            interrupted.append(True)
+            raise KeyboardInterrupt
+        return next_batch(algorithm)
+
+    with patch.object(IterativeAlgorithm, 'next_batch', autospec=True, side_effect=interrupt_first_batch):
+        with patch.object(automl._transform_cache, 'clear') as mock_clear:
+            automl.search(X, y)
+    # no pipeline was being evaluated when the search was interrupted, so none is evaluated twice
+    assert len(automl._results['pipeline_results']) == number_results
+    assert len(set(result['pipeline_name'] for result in automl._results['pipeline_results'].values())) == number_results
+    mock_clear.assert_called_once()
+
+
 @patch('evalml.automl.automl_algorithm.IterativeAlgorithm.next_batch')
 @patch('evalml.automl.AutoMLSearch._evaluate')
 def test_pipelines_in_batch_return_nan(mock_evaluate, mock_next_batch, X_y_binary, dummy_binary_pipeline_class):
@@ -959,6 +1019,19 @@ def test_error_during_train_test_split(mock_fit, mock_score, mock_train_test_spl
         assert np.isnan(pipeline['score'])
 
 
+@patch('evalml.objectives.BinaryClassificationObjective.optimize_threshold')
+def test_optimize_threshold_encoded_targets(mock_optimize_threshold, X_y_binary):
+    X, y = X_y_binary
+    y = pd.Series(np.where(y, 'yes', 'no'))
+    mock_optimize_threshold.return_value = 0.4
+    automl = AutoMLSearch(problem_type='binary', objective='F1', max_iterations=1, optimize_thresholds=True)
+    automl.search(X, y)
+    y_threshold_tuning = mock_optimize_threshold.call_args[0][1]
+    assert set(y_threshold_tuning) == {0, 1}
+    assert not np.isnan(automl.results['pipeline_results'][0]['score'])
+    assert automl.results['pipeline_results'][0]['cv_data'][0]['binary_classification_threshold'] == 0.4
+
+
 @pytest.mark.parametrize("objective_tuple,pipeline_scores,baseline_score",
                          product(_all_objectives_dict().items(),
                                  [(0.3, 0.4), (np.nan, 0.4), (0.3, np.nan), (np.nan, np.nan)],
@@ -1080,3 +1153,396 @@ def test_max_batches_must_be_non_negative(max_batches):
 
 def test_can_print_out_automl_objective_names():
     AutoMLSearch.print_objective_names_allowed_in_automl()
+
+
+@pytest.mark.parametrize("optimize_thresholds", [False, True])
+def test_cv_n_jobs_matches_serial_scores(optimize_thresholds, logistic_regression_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    cv_data = []
+    for cv_n_jobs in [None, 2]:
+        automl = AutoMLSearch(problem_type='binary', objective='F1', max_iterations=2, cv_n_jobs=cv_n_jobs,
+                              optimize_thresholds=optimize_thresholds, allowed_pipelines=[logistic_regression_binary_pipeline_class])
+        automl.search(X, y, data_checks=None)
+        cv_data.append([result['cv_data'] for result in automl.results['pipeline_results'].values()])
+    assert cv_data[0] == cv_data[1]
+
+
+@patch('evalml.automl.automl_search.Parallel')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"Log Loss Binary": 0.8})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_cv_n_jobs_uses_parallel(mock_fit, mock_score, mock_parallel, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=1, cv_n_jobs=1)
+    automl.search(X, y, data_checks=None)
+    mock_parallel.assert_not_called()
+
+    mock_parallel.return_value = lambda tasks: [(mock_score.return_value, 0.5, None) for _ in tasks]
+    automl = AutoMLSearch(problem_type='binary', max_iterations=1, cv_n_jobs=-1)
+    automl.search(X, y, data_checks=None)
+    mock_parallel.assert_called_once_with(n_jobs=-1)
+    assert len(automl.results['pipeline_results'][0]['cv_data']) == 3
+    assert automl.results['pipeline_results'][0]['cv_data'][0]['binary_classification_threshold'] == 0.5
+
+
+def test_batch_n_jobs_matches_serial_scores(logistic_regression_binary_pipeline_class, dummy_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    results = []
+    for batch_n_jobs in [None, 2]:
+        automl = AutoMLSearch(problem_type='binary', max_iterations=3, batch_n_jobs=batch_n_jobs,
+                              allowed_pipelines=[logistic_regression_binary_pipeline_class, dummy_binary_pipeline_class])
+        automl.search(X, y, data_checks=None)
+        results.append({result['pipeline_name']: result['cv_data'] for result in automl.results['pipeline_results'].values()})
+    assert results[0] == results[1]
+
+
+class _SynchronousExecutor:
+    """Runs submitted functions immediately, in the current process."""
+
+    def __init__(self):
+        self.n_submitted = 0
+
+    def submit(self, function, *args, **kwargs):
+        self.n_submitted += 1
+        future = Future()
+        future.set_result(function(*args, **kwargs))
+        return future
+
+
+@pytest.mark.parametrize("when_to_interrupt,user_input,number_results",
+                         [(2, interrupt, 1),
+                          (2, dont_interrupt, 5),
+                          (4, interrupt, 3),
+                          (4, dont_interrupt_after_bad_message, 5)])
+@patch("builtins.input")
+@patch('evalml.automl.automl_search.get_reusable_executor')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"F1": 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_catch_keyboard_interrupt_batch_n_jobs(mock_fit, mock_score, mock_get_executor, mock_input,
+                                               when_to_interrupt, user_input, number_results, X_y_binary, tmpdir):
+    mock_get_executor.return_value = _SynchronousExecutor()
+    mock_input.side_effect = user_input
+    X, y = X_y_binary
+    # the callback is called while pipelines are being started, outside of waiting for the workers
+    callback = KeyboardInterruptOnKthPipeline(k=when_to_interrupt)
+    automl = AutoMLSearch(problem_type="binary", max_iterations=5, start_iteration_callback=callback, objective="f1", batch_n_jobs=2,
+                          cache_transforms=True, journal_path=os.path.join(str(tmpdir), 'journal.jsonl'))
+    with patch.object(automl._transform_cache, 'clear') as mock_clear:
+        automl.search(X, y)
+
+    assert len(automl._results['pipeline_results']) == number_results
+    mock_clear.assert_called_once()
+    assert automl._journal_batch_number is None
+
+
+@patch('evalml.automl.automl_search.get_reusable_executor')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"Log Loss Binary": 0.8})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_batch_n_jobs_honors_max_iterations_and_callbacks(mock_fit, mock_score, mock_get_executor, X_y_binary):
+    X, y = X_y_binary
+    executor = _SynchronousExecutor()
+    mock_get_executor.return_value = executor
+    start_iteration_callback = MagicMock()
+    add_result_callback = MagicMock()
+    automl = AutoMLSearch(problem_type='binary', max_iterations=8, batch_n_jobs=4,
+                          start_iteration_callback=start_iteration_callback, add_result_callback=add_result_callback)
+    automl.search(X, y, data_checks=None)
+    mock_get_executor.assert_called_with(max_workers=4)
+    assert len(automl.results['pipeline_results']) == 8
+    # the baseline pipeline is evaluated before the batches are dispatched
+    assert executor.n_submitted == 7
+    assert start_iteration_callback.call_count == 8
+    assert add_result_callback.call_count == 8
+    for result in automl.results['pipeline_results'].values():
+        assert result['score'] == pytest.approx(0.8)
+
+
+class _FailingExecutor(_SynchronousExecutor):
+    """Fails every submitted function, as if the worker process had died."""
+
+    def submit(self, function, *args, **kwargs):
+        self.n_submitted += 1
+        future = Future()
+        future.set_exception(RuntimeError("worker died"))
+        return future
+
+
+@patch('evalml.automl.automl_search.get_reusable_executor')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"Log Loss Binary": 0.8})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_batch_n_jobs_worker_error(mock_fit, mock_score, mock_get_executor, X_y_binary, caplog):
+    X, y = X_y_binary
+    mock_get_executor.return_value = _FailingExecutor()
+    add_result_callback = MagicMock()
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, batch_n_jobs=2, add_result_callback=add_result_callback)
+    automl.search(X, y, data_checks=None)
+    assert len(automl.results['pipeline_results']) == 3
+    assert add_result_callback.call_count == 3
+    for pipeline_id in automl.results['search_order'][1:]:
+        result = automl.results['pipeline_results'][pipeline_id]
+        assert np.isnan(result['score'])
+        assert len(result['cv_data']) == 3
+        assert all(np.isnan(fold['score']) for fold in result['cv_data'])
+    assert "All scores will be replaced with nan." in caplog.text
+
+
+@patch('evalml.automl.automl_search.get_reusable_executor')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={"Log Loss Binary": 0.8})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_batch_n_jobs_honors_max_time(mock_fit, mock_score, mock_get_executor, X_y_binary):
+    X, y = X_y_binary
+    mock_get_executor.return_value = _SynchronousExecutor()
+    automl = AutoMLSearch(problem_type='binary', max_time=1e-16, batch_n_jobs=4)
+    automl.search(X, y, data_checks=None)
+    # only the baseline pipeline is evaluated
+    assert len(automl.results['pipeline_results']) == 1
+
+
+def test_cache_transforms_matches_uncached_scores(X_y_categorical_classification):
+    X, y = X_y_categorical_classification
+    cv_data = []
+    for cache_transforms in [False, True]:
+        automl = AutoMLSearch(problem_type='binary', max_iterations=3, cache_transforms=cache_transforms,
+                              allowed_model_families=['linear_model', 'random_forest'])
+        automl.search(X, y, data_checks=None)
+        cv_data.append([result['cv_data'] for result in automl.results['pipeline_results'].values()])
+    assert cv_data[0] == cv_data[1]
+    assert automl._transform_cache.hits > 0
+    assert len(automl._transform_cache) == 0
+
+
+def test_automl_algorithm_invalid():
+    with pytest.raises(ValueError, match="automl_algorithm must be one of"):
+        AutoMLSearch(problem_type='binary', automl_algorithm='hyperband')
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_successive_halving(mock_fit, mock_score, X_y_binary):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 1.0}
+    automl = AutoMLSearch(problem_type='binary', max_iterations=14, automl_algorithm='successive_halving',
+                          allowed_model_families=['linear_model', 'random_forest'])
+    automl.search(X, y, data_checks=None)
+    assert isinstance(automl._automl_algorithm, SuccessiveHalvingAlgorithm)
+    assert automl._automl_algorithm.data_fractions == [1 / 9, 1 / 3, 1.0]
+
+    data_fractions = [result['data_fraction'] for result in automl.results['pipeline_results'].values()]
+    # baseline, then one bracket of 9 candidates, 3 promoted and 1 promoted
+    assert data_fractions == [1.0] + [1 / 9] * 9 + [1 / 3] * 3 + [1.0]
+    training_rows = [len(call[0][0]) for call in mock_fit.call_args_list]
+    assert sum(training_rows[:3]) == len(X) * 2
+    assert all(rows < len(X) / 9 for rows in training_rows[3:30])
+    assert len(automl.full_rankings) == 2
+    assert automl.best_pipeline.parameters == automl.full_rankings.iloc[0]['parameters']
+
+
+@pytest.mark.parametrize("max_iterations,_max_batches,expected_max_iterations", [(None, None, 14), (None, 2, 13), (None, 4, 23), (10, None, 10)])
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_automl_successive_halving_limits(mock_fit, mock_score, max_iterations, _max_batches, expected_max_iterations, X_y_binary, caplog):
+    X, y = X_y_binary
+    mock_score.return_value = {'Log Loss Binary': 1.0}
+    automl = AutoMLSearch(problem_type='binary', max_iterations=max_iterations, automl_algorithm='successive_halving',
+                          allowed_model_families=['linear_model', 'random_forest'], _max_batches=_max_batches)
+    automl.search(X, y, data_checks=None)
+    assert automl.max_iterations == expected_max_iterations
+    assert len(automl.results['pipeline_results']) == expected_max_iterations
+
+    # the baseline and one bracket of 9, 3 and 1 pipelines are needed for a pipeline to be evaluated on all of the data
+    too_small = expected_max_iterations < 14
+    assert ("is too small for successive halving" in caplog.text) == too_small
+    assert len(automl.full_rankings) == (1 if too_small else 2)
+
+
+def test_cv_pruning_invalid():
+    with pytest.raises(ValueError, match="cv_pruning must be one of"):
+        AutoMLSearch(problem_type='binary', cv_pruning='mean')
+    with pytest.raises(ValueError, match="cv_pruning_margin must be non-negative"):
+        AutoMLSearch(problem_type='binary', cv_pruning='margin', cv_pruning_margin=-1)
+
+
+@pytest.mark.parametrize("cv_pruning,fold_scores,pruned_id", [('margin', [1, 1, 1, 2, 1.2, 1.0, 1.1], 1),
+                                                              ('median', [1, 1, 1, 0.5, 0.5, 0.5, 0.9], 2)])
+@patch('evalml.tuners.SKOptTuner.add')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_cv_pruning(mock_fit, mock_score, mock_tuner_add, cv_pruning, fold_scores, pruned_id, X_y_binary):
+    X, y = X_y_binary
+    mock_score.side_effect = [{'Log Loss Binary': score} for score in fold_scores]
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, cv_pruning=cv_pruning,
+                          allowed_model_families=['linear_model'])
+    automl.search(X, y, data_checks=None)
+
+    assert mock_fit.call_count == 7
+    results = automl.results['pipeline_results']
+    for pipeline_id, result in results.items():
+        assert result['pruned'] == (pipeline_id == pruned_id)
+        assert len(result['cv_data']) == (1 if pipeline_id == pruned_id else 3)
+    assert results[pruned_id]['score'] == fold_scores[3 * pruned_id]
+    # pruned pipelines are still reported to the tuner, with their partial score
+    assert [call[0][1] for call in mock_tuner_add.call_args_list] == [results[1]['score'], results[2]['score']]
+    # pruned pipelines are left out of the rankings, since they were only scored on some of the folds
+    assert pruned_id not in automl.full_rankings['id'].tolist()
+    assert set(automl.full_rankings['id']) == set(results) - {pruned_id}
+
+
+@patch('evalml.automl.automl_search.get_reusable_executor')
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_cv_pruning_batch_n_jobs(mock_fit, mock_score, mock_get_executor, X_y_binary):
+    X, y = X_y_binary
+    mock_get_executor.return_value = _SynchronousExecutor()
+    mock_score.side_effect = [{'Log Loss Binary': score} for score in [1, 1, 1, 2, 1.2, 1.0, 1.1]]
+    automl = AutoMLSearch(problem_type='binary', max_iterations=3, cv_pruning='margin', batch_n_jobs=2,
+                          allowed_model_families=['linear_model'])
+    automl.search(X, y, data_checks=None)
+
+    assert mock_fit.call_count == 7
+    # both pipelines of the first batch are compared against the baseline, and only one of them is far worse than it
+    pruned = [result for result in automl.results['pipeline_results'].values() if result['pruned']]
+    assert len(pruned) == 1
+    assert [fold['score'] for fold in pruned[0]['cv_data']] == [2]
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_cv_pruning_disabled_for_add_to_rankings(mock_fit, mock_score, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    mock_score.side_effect = [{'Log Loss Binary': score} for score in [1, 1, 1, 2, 2, 2]]
+    automl = AutoMLSearch(problem_type='binary', max_iterations=1, cv_pruning='margin')
+    automl.search(X, y, data_checks=None)
+    automl.add_to_rankings(logistic_regression_binary_pipeline_class({}), X, y)
+    result = automl.results['pipeline_results'][1]
+    assert not result['pruned']
+    assert len(result['cv_data']) == 3
+
+
+def test_journal_resume_invalid(X_y_binary, tmpdir):
+    X, y = X_y_binary
+    with pytest.raises(ValueError, match="journal_path must be set to resume a search"):
+        AutoMLSearch(problem_type='binary').search(X, y, resume=True)
+
+    journal_path = os.path.join(str(tmpdir), 'journal.jsonl')
+    with patch('evalml.pipelines.BinaryClassificationPipeline.fit'), \
+            patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={'Log Loss Binary': 1.0}):
+        AutoMLSearch(problem_type='binary', max_iterations=1, journal_path=journal_path).search(X, y, data_checks=None)
+        with pytest.raises(ValueError, match="already contains a search. Pass resume=True to continue it"):
+            AutoMLSearch(problem_type='binary', max_iterations=1, journal_path=journal_path).search(X, y, data_checks=None)
+        with pytest.raises(ValueError, match="was written by a different search: the recorded data"):
+            AutoMLSearch(problem_type='binary', max_iterations=1, journal_path=journal_path).search(X[:-10], y[:-10], data_checks=None, resume=True)
+        with pytest.raises(ValueError, match="was written by a different search: the recorded objective"):
+            AutoMLSearch(problem_type='binary', objective='F1', max_iterations=1, journal_path=journal_path).search(X, y, data_checks=None, resume=True)
+
+
+@pytest.mark.parametrize("automl_algorithm", ['iterative', 'successive_halving'])
+@patch('evalml.pipelines.BinaryClassificationPipeline.score')
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_journal_resume(mock_fit, mock_score, automl_algorithm, X_y_binary, tmpdir):
+    X, y = X_y_binary
+    mock_score.side_effect = lambda X, y, objectives: {'Log Loss Binary': len(y) / 100}
+    journal_path = os.path.join(str(tmpdir), 'journal.jsonl')
+    search_params = {'problem_type': 'binary', 'max_iterations': 8, 'automl_algorithm': automl_algorithm,
+                     'allowed_model_families': ['linear_model', 'random_forest'], 'journal_path': journal_path}
+    automl = AutoMLSearch(**search_params)
+    automl.search(X, y, data_checks=None)
+
+    # interrupt the search after the first six pipelines, while the seventh result was being written
+    with open(journal_path) as f:
+        lines = f.readlines()
+    result_lines = [i for i, line in enumerate(lines) if line.startswith('{"type": "result"')]
+    assert len(result_lines) == 8
+    with open(journal_path, 'w') as f:
+        f.writelines(lines[:result_lines[5] + 1])
+        f.write(lines[result_lines[6]][:50])
+
+    mock_fit.reset_mock()
+    resumed = AutoMLSearch(**search_params)
+    with patch('evalml.tuners.SKOptTuner.add') as mock_tuner_add:
+        resumed.search(X, y, data_checks=None, resume=True)
+    # only the two pipelines without a complete record are evaluated again, on three folds each
+    assert mock_fit.call_count == 6
+    assert resumed._automl_algorithm.batch_number == automl._automl_algorithm.batch_number
+    # the tuners are given all of the results on all of the data, except for the baseline
+    n_full_data_results = len([result for result in automl.results['pipeline_results'].values() if result['data_fraction'] == 1.0])
+    assert mock_tuner_add.call_count == n_full_data_results - 1
+
+    original_results = automl.results['pipeline_results']
+    resumed_results = resumed.results['pipeline_results']
+    assert resumed.results['search_order'] == list(range(8))
+    for pipeline_id in range(8):
+        original_result = original_results[pipeline_id].copy()
+        resumed_result = resumed_results[pipeline_id].copy()
+        assert resumed_result.pop('pipeline_class').name == original_result.pop('pipeline_class').name
+        if pipeline_id < 6:
+            assert resumed_result == original_result
+        assert resumed_result['pipeline_name'] == original_result['pipeline_name']
+        assert resumed_result['data_fraction'] == original_result['data_fraction']
+    pd.testing.assert_frame_equal(resumed.full_rankings, automl.full_rankings)
+    assert resumed.best_pipeline.parameters == automl.best_pipeline.parameters
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={'Log Loss Binary': 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_journal_resume_tuple_parameters(mock_fit, mock_score, X_y_binary, tmpdir):
+    class TupleParameterEstimator(Estimator):
+        name = "Tuple Parameter Classifier"
+        model_family = ModelFamily.NONE
+        supported_problem_types = [ProblemTypes.BINARY]
+        hyperparameter_ranges = {'dummy_parameter': ['default', 'other']}
+
+        def __init__(self, layer_sizes=(10, 5), dummy_parameter='default', random_state=0):
+            super().__init__(parameters={'layer_sizes': layer_sizes, 'dummy_parameter': dummy_parameter},
+                             component_obj=None, random_state=random_state)
+
+    class TupleParameterPipeline(BinaryClassificationPipeline):
+        component_graph = [TupleParameterEstimator]
+
+    X, y = X_y_binary
+    journal_path = os.path.join(str(tmpdir), 'journal.jsonl')
+    search_params = {'problem_type': 'binary', 'max_iterations': 4, 'allowed_pipelines': [TupleParameterPipeline],
+                     'journal_path': journal_path}
+    automl = AutoMLSearch(**search_params)
+    automl.search(X, y, data_checks=None)
+
+    # interrupt the search after the first three pipelines
+    with open(journal_path) as f:
+        lines = f.readlines()
+    result_lines = [i for i, line in enumerate(lines) if line.startswith('{"type": "result"')]
+    with open(journal_path, 'w') as f:
+        f.writelines(lines[:result_lines[2] + 1])
+
+    resumed = AutoMLSearch(**search_params)
+    resumed.search(X, y, data_checks=None, resume=True)
+    for pipeline_id in range(1, 4):
+        parameters = resumed.results['pipeline_results'][pipeline_id]['parameters']
+        assert parameters == automl.results['pipeline_results'][pipeline_id]['parameters']
+        assert parameters['Tuple Parameter Classifier']['layer_sizes'] == (10, 5)
+    assert resumed.get_pipeline(1).parameters == automl.get_pipeline(1).parameters
+
+
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={'Log Loss Binary': 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_search_profiles_data_once(mock_fit, mock_score, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(problem_type='binary', max_iterations=2)
+    with patch('evalml.automl.automl_search.DataProfile', wraps=DataProfile) as mock_search_profile, \
+            patch('evalml.data_checks.data_checks.DataProfile') as mock_data_checks_profile, \
+            patch('evalml.pipelines.utils.DataProfile') as mock_make_pipeline_profile:
+        automl.search(X, y)
+    assert mock_search_profile.call_count == 1
+    mock_data_checks_profile.assert_not_called()
+    mock_make_pipeline_profile.assert_not_called()
+
+
+@pytest.mark.parametrize("data_checks", [None, 'disabled', [InvalidTargetDataCheck()]])
+@patch('evalml.pipelines.BinaryClassificationPipeline.score', return_value={'Log Loss Binary': 1.0})
+@patch('evalml.pipelines.BinaryClassificationPipeline.fit')
+def test_search_profiles_data_only_when_needed(mock_fit, mock_score, data_checks, logistic_regression_binary_pipeline_class, X_y_binary):
+    X, y = X_y_binary
+    with patch('evalml.automl.automl_search.DataProfile', wraps=DataProfile) as mock_profile:
+        AutoMLSearch(problem_type='binary', max_iterations=2,
+                     allowed_pipelines=[logistic_regression_binary_pipeline_class]).search(X, y, data_checks=data_checks)
+        mock_profile.assert_not_called()
+        # pipeline generation needs the profile even when the data checks don't
+        AutoMLSearch(problem_type='binary', max_iterations=2).search(X, y, data_checks=data_checks)
+        assert mock_profile.call_count == 1
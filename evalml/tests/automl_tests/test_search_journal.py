@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+import pytest
+
+from evalml.automl import SearchJournal
+
+
+def test_search_journal_append_and_read(tmpdir):
+    journal = SearchJournal(os.path.join(str(tmpdir), 'journal.jsonl'))
+    assert journal.read() == []
+    journal.append({"type": "search", "problem_type": "binary"})
+    journal.append({"type": "result", "score": np.float64(0.5), "id": np.int64(1), "pruned": np.bool_(False),
+                    "parameters": {"Estimator": {"values": np.array([1, 2])}}, "missing": np.nan})
+    records = journal.read()
+    assert records[0] == {"type": "search", "problem_type": "binary"}
+    assert np.isnan(records[1].pop("missing"))
+    assert records[1] == {"type": "result", "score": 0.5, "id": 1, "pruned": False, "parameters": {"Estimator": {"values": [1, 2]}}}
+
+    journal.clear()
+    assert journal.read() == []
+    journal.clear()
+
+
+def test_search_journal_tuples(tmpdir):
+    journal = SearchJournal(os.path.join(str(tmpdir), 'journal.jsonl'))
+    record = {"parameters": {"Estimator": {"sizes": (10, 5), "nested": [(1, (2, np.int64(3)))], "empty": (), "values": [1, 2]}}}
+    journal.append(record)
+    assert journal.read() == [{"parameters": {"Estimator": {"sizes": (10, 5), "nested": [(1, (2, 3))], "empty": (), "values": [1, 2]}}}]
+    assert isinstance(journal.read()[0]["parameters"]["Estimator"]["values"], list)
+
+
+def test_search_journal_incomplete_records(tmpdir):
+    file_path = os.path.join(str(tmpdir), 'journal.jsonl')
+    journal = SearchJournal(file_path)
+    journal.append({"id": 0})
+    journal.append({"id": 1})
+    with open(file_path, 'a') as f:
+        f.write('{"id": 2, "sc')
+    assert journal.read() == [{"id": 0}, {"id": 1}]
+
+    with open(file_path, 'a') as f:
+        f.write('\n{"id": 3}\n')
+    with pytest.raises(ValueError, match="Line 3 of the journal at .* is not a valid record"):
+        journal.read()
+
+
+def test_search_journal_unsupported_value(tmpdir):
+    journal = SearchJournal(os.path.join(str(tmpdir), 'journal.jsonl'))
+    with pytest.raises(TypeError, match="Object of type object cannot be written to the search journal"):
+        journal.append({"value": object()})
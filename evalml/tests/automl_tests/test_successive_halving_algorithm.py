@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from evalml.automl.automl_algorithm import SuccessiveHalvingAlgorithm
+from evalml.model_family import ModelFamily
+from evalml.pipelines import BinaryClassificationPipeline
+from evalml.pipelines.components import Estimator
+from evalml.problem_types import ProblemTypes
+
+
+@pytest.fixture
+def dummy_binary_pipeline_classes():
+    class MockEstimator(Estimator):
+        name = "Mock Classifier"
+        model_family = ModelFamily.NONE
+        supported_problem_types = [ProblemTypes.BINARY, ProblemTypes.MULTICLASS]
+        hyperparameter_ranges = {'dummy_parameter': ['default', 'other']}
+
+        def __init__(self, dummy_parameter='default', random_state=0):
+            super().__init__(parameters={'dummy_parameter': dummy_parameter}, component_obj=None, random_state=random_state)
+
+    class MockBinaryClassificationPipeline1(BinaryClassificationPipeline):
+        estimator = MockEstimator
+        component_graph = [MockEstimator]
+
+    class MockBinaryClassificationPipeline2(BinaryClassificationPipeline):
+        estimator = MockEstimator
+        component_graph = [MockEstimator]
+
+    return [MockBinaryClassificationPipeline1,
+            MockBinaryClassificationPipeline2]
+
+
+def test_successive_halving_algorithm_init(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes)
+    assert algo.pipeline_number == 0
+    assert algo.batch_number == 0
+    assert algo.bracket_number == 0
+    assert algo.data_fraction == 1.0
+    assert algo.data_fractions == [1 / 9, 1 / 3, 1.0]
+    assert algo.candidates_per_bracket == 9
+    assert algo.rung_sizes == [9, 3, 1]
+
+
+@pytest.mark.parametrize("eta,min_data_fraction,data_fractions", [(2, 0.25, [0.25, 0.5, 1.0]),
+                                                                  (2, 0.2, [0.25, 0.5, 1.0]),
+                                                                  (3, 1, [1.0]),
+                                                                  (4, 0.05, [1 / 16, 1 / 4, 1.0])])
+def test_successive_halving_algorithm_data_fractions(eta, min_data_fraction, data_fractions):
+    algo = SuccessiveHalvingAlgorithm(eta=eta, min_data_fraction=min_data_fraction)
+    assert algo.data_fractions == data_fractions
+
+
+@pytest.mark.parametrize("candidates_per_bracket,eta,rung_sizes", [(None, 2, [4, 2, 1]),
+                                                                   (10, 3, [10, 4]),
+                                                                   (5, 2, [5, 3, 2])])
+def test_successive_halving_algorithm_rung_sizes(candidates_per_bracket, eta, rung_sizes, dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes, candidates_per_bracket=candidates_per_bracket,
+                                      eta=eta, min_data_fraction=0.25)
+    assert algo.rung_sizes == rung_sizes
+
+
+def test_successive_halving_algorithm_invalid_parameters():
+    with pytest.raises(ValueError, match="eta must be at least 2"):
+        SuccessiveHalvingAlgorithm(eta=1)
+    with pytest.raises(ValueError, match="min_data_fraction must be greater than 0 and at most 1"):
+        SuccessiveHalvingAlgorithm(min_data_fraction=0)
+    with pytest.raises(ValueError, match="min_data_fraction must be greater than 0 and at most 1"):
+        SuccessiveHalvingAlgorithm(min_data_fraction=1.5)
+
+
+@patch('evalml.tuners.SKOptTuner.add')
+def test_successive_halving_algorithm_brackets(mock_tuner_add, dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes)
+
+    first_rung = algo.next_batch()
+    assert len(first_rung) == 9
+    assert algo.data_fraction == 1 / 9
+    assert algo.bracket_number == 1
+    assert [p.__class__ for p in first_rung[:2]] == dummy_binary_pipeline_classes
+    assert all(p.parameters['Mock Classifier']['dummy_parameter'] == 'default' for p in first_rung[:2])
+
+    scores = [0.5, 0.1, np.nan, 0.3, 0.9, 0.2, 0.8, 0.7, 0.6]
+    for score, pipeline in zip(scores, first_rung):
+        algo.add_result(score, pipeline)
+    # tuners only learn from results on all of the data
+    mock_tuner_add.assert_not_called()
+
+    second_rung = algo.next_batch()
+    assert algo.data_fraction == 1 / 3
+    assert algo.bracket_number == 1
+    assert [p.parameters for p in second_rung] == [first_rung[i].parameters for i in [1, 5, 3]]
+    assert all(p is not first_rung[i] for p, i in zip(second_rung, [1, 5, 3]))
+    # every rung's pipelines are seeded with the algorithm's random state
+    assert all(p.random_state is algo.random_state for p in first_rung)
+    assert all(p.random_state is algo.random_state for p in second_rung)
+    for score, pipeline in zip([0.4, 0.2, 0.3], second_rung):
+        algo.add_result(score, pipeline)
+
+    third_rung = algo.next_batch()
+    assert algo.data_fraction == 1.0
+    assert [p.parameters for p in third_rung] == [second_rung[1].parameters]
+    algo.add_result(0.2, third_rung[0])
+    mock_tuner_add.assert_called_once()
+
+    next_bracket = algo.next_batch()
+    assert len(next_bracket) == 9
+    assert algo.data_fraction == 1 / 9
+    assert algo.bracket_number == 2
+    assert algo.batch_number == 4
+    assert algo.pipeline_number == 9 + 3 + 1 + 9
+
+
+def test_successive_halving_algorithm_empty_rung(dummy_binary_pipeline_classes):
+    algo = SuccessiveHalvingAlgorithm(allowed_pipelines=dummy_binary_pipeline_classes)
+    algo.next_batch()
+    # no results were reported, so a new bracket is started
+    algo.next_batch()
+    assert algo.data_fraction == 1 / 9
+    assert algo.bracket_number == 2
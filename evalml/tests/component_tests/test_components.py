@@ -121,7 +121,8 @@ def test_describe_component():
                                                                                         'categories': None,
                                                                                         'drop': None,
                                                                                         'handle_unknown': 'ignore',
-                                                                                        'handle_missing': 'error'}}
+                                                                                        'handle_missing': 'error',
+                                                                                        'sparse': False}}
     drop_col_transformer = DropColumns(columns=['col_one', 'col_two'])
     assert imputer.describe(return_dict=True) == {'name': 'Simple Imputer', 'parameters': {'impute_strategy': 'mean', 'fill_value': None}}
     assert column_imputer.describe(return_dict=True) == {'name': 'Per Column Imputer', 'parameters': {'impute_strategies': {'a': 'mean', 'b': ('constant', 100)}, 'default_impute_strategy': 'most_frequent'}}
@@ -759,6 +760,25 @@ def test_serialization(X_y_binary, tmpdir):
                 assert (component.feature_importance == loaded_component.feature_importance).all()
 
 
+def test_serialization_artifact(X_y_binary, tmpdir):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+
+    for component_class in all_components():
+        path = os.path.join(str(tmpdir), component_class.name)
+        component = component_class()
+        component.fit(X, y)
+        component.save(path, artifact=True)
+        loaded_component = ComponentBase.load(path)
+        assert component.parameters == loaded_component.parameters
+        assert component.describe(return_dict=True) == loaded_component.describe(return_dict=True)
+        if issubclass(component_class, Estimator):
+            np.testing.assert_allclose(component.feature_importance, loaded_component.feature_importance)
+            np.testing.assert_allclose(component.predict(X), loaded_component.predict(X))
+        else:
+            pd.testing.assert_frame_equal(component.transform(X), loaded_component.transform(X))
+
+
 @patch('cloudpickle.dump')
 def test_serialization_protocol(mock_cloudpickle_dump, tmpdir):
     path = os.path.join(str(tmpdir), 'pipe.pkl')
@@ -80,3 +80,12 @@ def test_datetime_featurizer_numpy_array_input():
     X = np.array(['2007-02-03', '2016-06-07', '2020-05-19'], dtype='datetime64')
     datetime_transformer.fit(X)
     assert list(datetime_transformer.transform(X).columns) == ["0_year", "0_month", "0_day_of_week", "0_hour"]
+
+
+def test_datetime_featurizer_feature_provenance():
+    X = pd.DataFrame({"date col": pd.to_datetime(['2007-02-03', '2016-06-07', '2020-05-19']), "numerical": [0, 1, 0]})
+    datetime_transformer = DateTimeFeaturizer(features_to_extract=["year", "hour"])
+    assert datetime_transformer._get_feature_provenance() == {}
+    datetime_transformer.fit(X)
+    assert datetime_transformer._get_feature_provenance() == {"date col": ["date col_year", "date col_hour"]}
+    assert DateTimeFeaturizer(features_to_extract=[]).fit(X)._get_feature_provenance() == {}
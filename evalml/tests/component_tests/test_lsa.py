@@ -181,3 +181,15 @@ def test_lsa_output():
     cols = [col for col in X_t.columns if 'LSA' in col]
     features = X_t[cols]
     np.testing.assert_almost_equal(features, expected_features, decimal=3)
+
+
+def test_lsa_feature_provenance(text_df):
+    X = text_df
+    X['non_text'] = [1, 2, 3]
+    lsa = LSA(text_columns=['col_1', 'col_2'])
+    lsa.fit(X)
+    X_t = lsa.transform(X)
+    provenance = lsa._get_feature_provenance()
+    assert provenance == {'col_1': ['LSA(col_1)[0]', 'LSA(col_1)[1]'],
+                          'col_2': ['LSA(col_2)[0]', 'LSA(col_2)[1]']}
+    assert set(X_t.columns) == set(['non_text'] + provenance['col_1'] + provenance['col_2'])
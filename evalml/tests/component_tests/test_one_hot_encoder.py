@@ -12,7 +12,8 @@ def test_init():
                   "categories": None,
                   "drop": None,
                   "handle_unknown": "ignore",
-                  "handle_missing": "error"}
+                  "handle_missing": "error",
+                  "sparse": False}
     encoder = OneHotEncoder()
     assert encoder.parameters == parameters
 
@@ -24,7 +25,8 @@ def test_parameters():
         'categories': None,
         'drop': None,
         'handle_unknown': 'ignore',
-        'handle_missing': 'error'
+        'handle_missing': 'error',
+        'sparse': False
     }
     assert encoder.parameters == expected_parameters
 
@@ -381,3 +383,58 @@ def test_ohe_get_feature_names():
         ohe.get_feature_names()
     ohe.fit(X)
     np.testing.assert_array_equal(ohe.get_feature_names(), np.array(['col_1_a', 'col_2_a', 'col_2_b']))
+
+
+def test_ohe_column_order_and_dtypes():
+    X = pd.DataFrame({"num_1": [1, 2, 3],
+                      "cat_1": ["a", "b", "a"],
+                      "num_2": [0.5, 1.5, 2.5],
+                      "bool_1": [True, False, True],
+                      "cat_2": ["c", "c", "d"]})
+    encoder = OneHotEncoder()
+    X_t = encoder.fit_transform(X)
+    assert list(X_t.columns) == ["num_1", "num_2", "bool_1", "cat_1_a", "cat_1_b", "cat_2_c", "cat_2_d"]
+    assert list(X_t.dtypes) == [X["num_1"].dtype, X["num_2"].dtype, X["bool_1"].dtype] + [np.dtype('float64')] * 4
+
+
+def test_ohe_does_not_modify_input():
+    X = pd.DataFrame({"col_1": ["a", np.nan, "b"], "col_2": [1, 2, 3]})
+    X_expected = X.copy()
+    encoder = OneHotEncoder(handle_missing="as_category")
+    X_t = encoder.fit_transform(X)
+    pd.testing.assert_frame_equal(X, X_expected)
+    assert list(X_t.columns) == ["col_2", "col_1_a", "col_1_b", "col_1_nan"]
+
+
+def test_ohe_sparse():
+    X = pd.DataFrame({"col_1": ["a", "b", "c", "d", "a"],
+                      "col_2": ["a", "b", "a", "c", "b"],
+                      "col_3": [1, 2, 3, 4, 5]},
+                     index=[10, 11, 12, 13, 14])
+    X_dense = OneHotEncoder().fit_transform(X)
+    encoder = OneHotEncoder(sparse=True)
+    X_sparse = encoder.fit_transform(X)
+    assert encoder.parameters['sparse']
+    assert list(X_sparse.columns) == list(X_dense.columns)
+    assert X_sparse.index.equals(X.index)
+    assert X_sparse["col_3"].dtype == X["col_3"].dtype
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in X_sparse.dtypes[1:])
+    np.testing.assert_array_equal(np.asarray(X_sparse, dtype=float), X_dense.values)
+
+
+@pytest.mark.parametrize("drop", [None, "first"])
+def test_one_hot_encoder_feature_provenance(drop):
+    X = pd.DataFrame({0: ["a", "b", "c", "b"],
+                      'col_2': ["x", "y", "x", "x"],
+                      'numbers': [1, 2, 3, 4]})
+    encoder = OneHotEncoder(top_n=None, drop=drop, handle_unknown="error")
+    encoder.fit(X)
+    provenance = encoder._get_feature_provenance()
+    if drop is None:
+        assert provenance == {0: ["0_a", "0_b", "0_c"], 'col_2': ["col_2_x", "col_2_y"]}
+    else:
+        assert provenance == {0: ["0_b", "0_c"], 'col_2': ["col_2_y"]}
+    assert set(encoder.transform(X).columns) == set(['numbers'] + provenance[0] + provenance['col_2'])
+
+    encoder = OneHotEncoder().fit(X[['numbers']])
+    assert encoder._get_feature_provenance() == {}
@@ -282,3 +282,15 @@ def test_polarity_primitive_output():
     X_t = tf.transform(X)
     features = X_t['POLARITY_SCORE(polarity)']
     np.testing.assert_almost_equal(features, expected_features)
+
+
+def test_featurizer_feature_provenance(text_df):
+    X = text_df
+    tf = TextFeaturizer(text_columns=['col_1', 'col_2'])
+    tf.fit(X)
+    X_t = tf.transform(X)
+    provenance = tf._get_feature_provenance()
+    assert set(provenance) == {'col_1', 'col_2'}
+    for col in ['col_1', 'col_2']:
+        assert len(provenance[col]) == 20
+        assert set(provenance[col]) == set(name for name in X_t.columns if f'({col})' in name)
@@ -1,4 +1,5 @@
 import inspect
+from unittest.mock import patch
 
 import pytest
 
@@ -39,3 +40,13 @@ def test_handle_component_class_names():
         pass
     with pytest.raises(ValueError):
         handle_component_class(NonComponent())
+
+
+def test_handle_component_class_names_cached():
+    handle_component_class('Imputer')
+    with patch('evalml.pipelines.components.utils.get_importable_subclasses') as mock_get_subclasses:
+        mock_get_subclasses.side_effect = [[], [ComponentBase]]
+        # the index is rebuilt because the list of components changed
+        with pytest.raises(MissingComponentError, match='Component "Imputer" was not found'):
+            handle_component_class('Imputer')
+    assert handle_component_class('Imputer').name == 'Imputer'
@@ -0,0 +1,160 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.data_checks import (
+    DataChecks,
+    DataProfile,
+    DefaultDataChecks,
+    HighlyNullDataCheck,
+    IDColumnsDataCheck,
+    InvalidTargetDataCheck,
+    LabelLeakageDataCheck,
+    NoVarianceDataCheck,
+    OutliersDataCheck,
+    StreamingDataProfile
+)
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_data_profile(n_jobs):
+    X = pd.DataFrame({"numbers": [1, np.nan, 1, 2],
+                      "strings": ["a", None, "b", "c"],
+                      "all_null": [np.nan] * 4,
+                      "dates": pd.to_datetime(["2020-01-01", None, "2020-01-02", "2020-01-02"])})
+    profile = DataProfile(X, n_jobs=n_jobs)
+    assert profile.n_rows == 4
+    pd.testing.assert_series_equal(profile.null_counts, X.isnull().sum())
+    pd.testing.assert_series_equal(profile.unique_counts, X.nunique())
+    pd.testing.assert_series_equal(profile.percent_null, X.isnull().mean())
+    assert profile.select_columns(include=["object"]) == ["strings"]
+    assert profile.select_columns(exclude=["float64"]) == ["strings", "dates"]
+
+    profile = DataProfile(X.values[:, :2])
+    assert profile.null_counts.tolist() == [1, 1]
+
+
+def test_data_checks_share_profile(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    with patch("evalml.data_checks.data_checks.DataProfile", wraps=DataProfile) as mock_profile:
+        messages = DefaultDataChecks().validate(X, y)
+    assert mock_profile.call_count == 1
+
+    profile = DataProfile(X)
+    with patch("evalml.data_checks.data_checks.DataProfile") as mock_profile:
+        assert DefaultDataChecks().validate(X, y, profile=profile) == messages
+    mock_profile.assert_not_called()
+
+
+@pytest.mark.parametrize("data_check", [HighlyNullDataCheck(pct_null_threshold=0.0), IDColumnsDataCheck(),
+                                        NoVarianceDataCheck(), NoVarianceDataCheck(count_nan_as_value=True)])
+def test_data_checks_profile_matches_data(data_check):
+    X = pd.DataFrame({"id": range(5),
+                      "constant": [1] * 5,
+                      "constant_with_nulls": [1, 1, np.nan, 1, np.nan],
+                      "half_null": [1, 2, np.nan, np.nan, np.nan]})
+    y = pd.Series([1, 0, 1, 0, 1])
+    assert data_check.validate(X, y, profile=DataProfile(X)) == data_check.validate(X, y)
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_streaming_data_profile(chunksize):
+    X = pd.DataFrame({"numbers": [1, np.nan, 1, 2, 3],
+                      "strings": ["a", None, "b", "c", "c"],
+                      "all_null": [np.nan] * 5,
+                      "dates": pd.to_datetime(["2020-01-01", None, "2020-01-02", "2020-01-02", None])})
+    profile = StreamingDataProfile.from_chunks(X, chunksize=chunksize)
+    exact_profile = DataProfile(X)
+    assert profile.n_rows == 5
+    pd.testing.assert_series_equal(profile.null_counts, exact_profile.null_counts)
+    pd.testing.assert_series_equal(profile.unique_counts, exact_profile.unique_counts)
+    pd.testing.assert_series_equal(profile.percent_null, exact_profile.percent_null)
+    pd.testing.assert_series_equal(profile.dtypes, X.dtypes)
+    assert profile.select_columns(include=["object"]) == ["strings"]
+    assert profile.target_correlations is None
+
+    merged = StreamingDataProfile.from_chunks(X.iloc[:2]).merge(StreamingDataProfile.from_chunks(X.iloc[2:]))
+    pd.testing.assert_series_equal(merged.unique_counts, exact_profile.unique_counts)
+    pd.testing.assert_series_equal(merged.null_counts, exact_profile.null_counts)
+
+
+def test_streaming_data_profile_approximate_unique_counts(tmpdir):
+    n_rows = 20000
+    X = pd.DataFrame({"id": np.arange(n_rows),
+                      "mostly_unique": np.arange(n_rows) // 2,
+                      "few_values": np.arange(n_rows) % 3})
+    path = os.path.join(str(tmpdir), "data.csv")
+    X.to_csv(path, index=False)
+    profile = StreamingDataProfile.from_chunks(path, chunksize=3000, precision=11)
+    unique_counts = profile.unique_counts
+    assert unique_counts["id"] == n_rows
+    assert abs(unique_counts["mostly_unique"] - n_rows / 2) < 0.1 * n_rows / 2
+    assert unique_counts["few_values"] == 3
+
+    # dtypes which change between chunks are combined
+    profile = StreamingDataProfile()
+    profile.update(pd.DataFrame({"a": [1, 2]}))
+    profile.update(pd.DataFrame({"a": [2.0, np.nan]}))
+    assert profile.dtypes["a"] == "float64"
+    assert profile.unique_counts["a"] == 2
+
+
+def test_streaming_data_profile_target_correlations():
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0]})
+    profile = StreamingDataProfile()
+    profile.update(X, pd.Series([1, 2, 3, 4]))
+    assert profile.target_correlations["a"] == pytest.approx(1.0)
+    # correlations are only kept while every chunk of the target is numeric or boolean
+    profile.update(X, pd.Series(["a", "b", "a", "b"]))
+    assert profile.target_correlations is None
+    profile.update(X, pd.Series([1, 2, 3, 4]))
+    assert profile.target_correlations is None
+
+    merged = StreamingDataProfile()
+    merged.update(X, pd.Series([True, False, True, False]))
+    assert merged.merge(profile).target_correlations is None
+
+    profile = StreamingDataProfile(keep_correlations=False)
+    profile.update(X, pd.Series([1, 2, 3, 4]))
+    assert profile.target_correlations is None
+
+
+def test_data_checks_validate_chunks(tmpdir):
+    rs = np.random.RandomState(0)
+    n_rows = 1000
+    X = pd.DataFrame({"id": np.arange(n_rows),
+                      "leak": np.arange(n_rows) % 2 * 5.0,
+                      "mostly_null": np.where(rs.rand(n_rows) < 0.97, np.nan, 1.0),
+                      "constant": "a",
+                      "category": rs.choice(["a", "b", "c"], n_rows),
+                      "noise": rs.randn(n_rows),
+                      "target": np.arange(n_rows) % 2})
+    data_checks = DefaultDataChecks()
+    expected = data_checks.validate(X.drop(columns=["target"]), X["target"])
+    assert len(expected) == 5
+    assert data_checks.validate_chunks(X, target="target", chunksize=300) == expected
+    assert data_checks.validate_chunks(iter([X.iloc[:10], X.iloc[10:]]), target="target") == expected
+    path = os.path.join(str(tmpdir), "data.csv")
+    X.to_csv(path, index=False)
+    assert data_checks.validate_chunks(path, target="target", chunksize=300) == expected
+
+    with pytest.raises(ValueError, match="Only the 'pearson' method can use the correlations kept by a streaming profile"):
+        DataChecks([LabelLeakageDataCheck(method="spearman")]).validate_chunks(X, target="target")
+    with pytest.raises(ValueError, match=r"Data checks \['OutliersDataCheck'\] need every row of the features"):
+        DataChecks([OutliersDataCheck(), HighlyNullDataCheck()]).validate_chunks(X, target="target")
+
+    y_labels = pd.Series(np.where(X["target"], "yes", "no"))
+    X_labels = X.assign(target=y_labels)
+    for data_checks in [DataChecks([HighlyNullDataCheck(), IDColumnsDataCheck(), InvalidTargetDataCheck()]), DefaultDataChecks()]:
+        expected = data_checks.validate(X_labels.drop(columns=["target"]), y_labels)
+        assert expected
+        assert data_checks.validate_chunks(X_labels, target="target", chunksize=300) == expected
+
+    chunks = MagicMock()
+    with pytest.raises(ValueError, match="cannot validate data in chunks"):
+        DataChecks([OutliersDataCheck()]).validate_chunks(chunks, target="target")
+    chunks.__iter__.assert_not_called()
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -22,6 +23,10 @@ def test_label_leakage_data_check_init():
         LabelLeakageDataCheck(pct_corr_threshold=-0.1)
     with pytest.raises(ValueError, match="pct_corr_threshold must be a float between 0 and 1, inclusive."):
         LabelLeakageDataCheck(pct_corr_threshold=1.1)
+    with pytest.raises(ValueError, match="method must be one of pearson, spearman, mutual_info. Received 'kendall'."):
+        LabelLeakageDataCheck(method='kendall')
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer. Received 0."):
+        LabelLeakageDataCheck(chunk_size=0)
 
 
 def test_label_leakage_data_check_warnings():
@@ -69,3 +74,45 @@ def test_label_leakage_data_check_input_formats():
                                                              DataCheckWarning("Column '1' is 80.0% or more correlated with the target", "LabelLeakageDataCheck"),
                                                              DataCheckWarning("Column '2' is 80.0% or more correlated with the target", "LabelLeakageDataCheck"),
                                                              DataCheckWarning("Column '3' is 80.0% or more correlated with the target", "LabelLeakageDataCheck")]
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_label_leakage_data_check_matches_pandas(method, chunk_size):
+    rs = np.random.RandomState(0)
+    y = pd.Series(rs.randn(100))
+    X = pd.DataFrame(rs.randn(100, 7), columns=[f"col_{i}" for i in range(7)])
+    X["leak"] = y * 2 + rs.randn(100) * 0.1
+    X["leak_with_nans"] = X["leak"].mask(rs.rand(100) < 0.2)
+    X["constant"] = 1.0
+    X["object"] = "a"
+
+    label_leakage_check = LabelLeakageDataCheck(pct_corr_threshold=0.0, method=method, chunk_size=chunk_size)
+    numeric = X.drop(columns=["object"])
+    expected = numeric.drop(columns=["constant"]).apply(lambda col: abs(y.corr(col, method=method)))
+    scores = np.concatenate([label_leakage_check._score_features(numeric.iloc[:, start:start + chunk_size], y)
+                             for start in range(0, numeric.shape[1], chunk_size)])
+    np.testing.assert_allclose(scores[:-1], expected.values)
+    assert np.isnan(scores[-1])
+
+    label_leakage_check = LabelLeakageDataCheck(pct_corr_threshold=0.9, method=method, chunk_size=chunk_size)
+    assert label_leakage_check.validate(X, y) == [DataCheckWarning("Column 'leak' is 90.0% or more correlated with the target", "LabelLeakageDataCheck"),
+                                                  DataCheckWarning("Column 'leak_with_nans' is 90.0% or more correlated with the target", "LabelLeakageDataCheck")]
+
+
+def test_label_leakage_data_check_categorical_target():
+    rs = np.random.RandomState(0)
+    y = pd.Series(rs.choice(["cat", "dog", "fish"], 300))
+    X = pd.DataFrame({"leak": y.map({"cat": 0, "dog": 1, "fish": 2}) * 10 + rs.rand(300),
+                      "noise": rs.randn(300)})
+    X["leak_with_nans"] = X["leak"].mask(y == "fish")
+
+    assert LabelLeakageDataCheck(pct_corr_threshold=0.8).validate(X, y) == []
+    label_leakage_check = LabelLeakageDataCheck(pct_corr_threshold=0.8, method="mutual_info", chunk_size=2)
+    assert label_leakage_check.validate(X, y) == [DataCheckWarning("Column 'leak' is 80.0% or more correlated with the target", "LabelLeakageDataCheck"),
+                                                  DataCheckWarning("Column 'leak_with_nans' is 80.0% or more correlated with the target", "LabelLeakageDataCheck")]
+
+    scores = label_leakage_check._score_features(X, y.where(y != "fish"))
+    assert (scores[[0, 2]] > 0.95).all()
+    assert scores[1] < 0.1
+    assert np.isnan(label_leakage_check._score_features(X, pd.Series(["cat"] * 300))).all()
@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
+import pytest
+from sklearn.ensemble import IsolationForest
 
 from evalml.data_checks.data_check_message import DataCheckWarning
 from evalml.data_checks.outliers_data_check import OutliersDataCheck
@@ -13,6 +17,11 @@ def test_outliers_data_check_init():
     outliers_check = OutliersDataCheck(random_state=2)
     assert outliers_check.random_state.get_state()[0] == get_random_state(2).get_state()[0]
 
+    with pytest.raises(ValueError, match="max_fit_rows must be a positive integer or None. Received 0."):
+        OutliersDataCheck(max_fit_rows=0)
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer. Received 0."):
+        OutliersDataCheck(chunk_size=0)
+
 
 def test_outliers_data_check_warnings():
     a = np.arange(10) * 0.01
@@ -52,3 +61,44 @@ def test_outliers_data_check_input_formats():
                                                      DataCheckWarning("Row '25' is likely to have outlier data", "OutliersDataCheck"),
                                                      DataCheckWarning("Row '55' is likely to have outlier data", "OutliersDataCheck"),
                                                      DataCheckWarning("Row '72' is likely to have outlier data", "OutliersDataCheck")]
+
+
+@pytest.fixture
+def outliers_data():
+    rs = np.random.RandomState(0)
+    X = pd.DataFrame(rs.randn(1000, 5))
+    X.iloc[[10, 500, 900], :] = rs.randn(3, 5) * 1000
+    return X
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+@pytest.mark.parametrize("chunk_size", [300, 100000])
+def test_outliers_data_check_chunked_scoring(n_jobs, chunk_size, outliers_data):
+    expected = OutliersDataCheck(random_state=0).get_outlier_indices(outliers_data)
+    assert {10, 500, 900}.issubset(expected)
+
+    outliers_check = OutliersDataCheck(random_state=0, n_jobs=n_jobs, chunk_size=chunk_size)
+    with patch.object(IsolationForest, 'decision_function', autospec=True, side_effect=IsolationForest.decision_function) as mock_decision_function:
+        indices = outliers_check.get_outlier_indices(outliers_data)
+    np.testing.assert_array_equal(indices, expected)
+    assert isinstance(indices, np.ndarray)
+    assert mock_decision_function.call_count == int(np.ceil(len(outliers_data) / chunk_size))
+
+
+def test_outliers_data_check_max_fit_rows(outliers_data):
+    outliers_check = OutliersDataCheck(random_state=0, max_samples=64, max_fit_rows=200)
+    with patch.object(IsolationForest, 'fit', autospec=True, side_effect=IsolationForest.fit) as mock_fit:
+        indices = outliers_check.get_outlier_indices(outliers_data)
+    X_fit = mock_fit.call_args[0][1]
+    assert len(X_fit) == 200
+    assert X_fit.index.is_monotonic_increasing
+    assert mock_fit.call_args[0][0].max_samples == 64
+    assert {10, 500, 900}.issubset(indices)
+
+    outliers_check = OutliersDataCheck(random_state=0, max_fit_rows=200)
+    assert outliers_check.validate(outliers_data) == [DataCheckWarning(f"Row '{index}' is likely to have outlier data", "OutliersDataCheck")
+                                                      for index in OutliersDataCheck(random_state=0, max_fit_rows=200).get_outlier_indices(outliers_data)]
+
+
+def test_outliers_data_check_get_outlier_indices_empty():
+    assert OutliersDataCheck().get_outlier_indices(pd.DataFrame({"a": ["x", "y"]})).tolist() == []
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.data_checks import HyperLogLog
+from evalml.data_checks.sketches import CorrelationSketch
+
+
+def test_hyperloglog_precision():
+    with pytest.raises(ValueError, match="precision must be an integer between 11 and 18, inclusive. Received 10."):
+        HyperLogLog(precision=10)
+    with pytest.raises(ValueError, match="Cannot merge a HyperLogLog sketch of precision 12 into one of precision 14."):
+        HyperLogLog().merge(HyperLogLog(precision=12))
+
+
+def test_hyperloglog_exact():
+    sketch = HyperLogLog(precision=11)
+    sketch.add(pd.Series([1, 2, np.nan, 2]))
+    sketch.add(np.array([2.0, 3.0]))
+    sketch.add(["a", None, "a"])
+    assert sketch.is_exact
+    assert sketch.relative_error == 0
+    assert sketch.count() == 4
+
+    other = HyperLogLog(precision=11)
+    other.add(pd.Series([3, 3]))
+    other.add(pd.Series(["b"], dtype="category"))
+    assert sketch.merge(other) is sketch
+    assert sketch.count() == 5
+
+
+@pytest.mark.parametrize("n_unique", [5000, 100000])
+def test_hyperloglog_estimate(n_unique):
+    values = np.arange(n_unique)
+    sketch = HyperLogLog(precision=11)
+    other = HyperLogLog(precision=11)
+    for chunk in np.array_split(values, 10):
+        sketch.add(chunk)
+        other.add(chunk[::-1])
+    assert not sketch.is_exact
+    assert abs(sketch.count() - n_unique) < 3 * sketch.relative_error * n_unique
+
+    exact = HyperLogLog(precision=11)
+    exact.add(np.arange(n_unique, n_unique + 100))
+    expected = sketch.count()
+    assert sketch.merge(other).count() == expected
+    assert exact.merge(sketch).count() >= expected
+    assert not exact.is_exact
+
+
+def test_correlation_sketch():
+    rs = np.random.RandomState(0)
+    X = pd.DataFrame(rs.randn(500, 3), columns=["leak", "noise", "constant"])
+    X["constant"] = 1.0
+    X["with_nulls"] = X["noise"].mask(rs.rand(500) < 0.3)
+    y = pd.Series(X["leak"] * 2 + rs.randn(500) * 0.1).mask(rs.rand(500) < 0.1)
+
+    sketch = CorrelationSketch()
+    other = CorrelationSketch()
+    for start in range(0, 300, 60):
+        sketch.update(X.iloc[start:start + 60], y.iloc[start:start + 60])
+    other.update(X.iloc[300:], y.iloc[300:])
+    other.update(X.iloc[:0], y.iloc[:0])
+    correlations = sketch.merge(other).correlations()
+    assert correlations.index.tolist() == X.columns.tolist()
+    pd.testing.assert_series_equal(correlations.drop("constant"), X.drop(columns=["constant"]).apply(y.corr), check_names=False)
+    assert np.isnan(correlations["constant"])
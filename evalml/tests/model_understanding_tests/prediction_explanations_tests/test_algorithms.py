@@ -61,7 +61,7 @@ data_message = "You must pass in a value for parameter 'training_data' when the
                                                       (make_test_pipeline(XGBoostRegressor, RegressionPipeline), NotImplementedError, xg_boost_message),
                                                       (make_test_pipeline(RandomForestClassifier, BinaryClassificationPipeline), ValueError, datatype_message),
                                                       (make_test_pipeline(LinearRegressor, RegressionPipeline), ValueError, data_message)])
-@patch("evalml.model_understanding.prediction_explanations._algorithms.shap.TreeExplainer")
+@patch("shap.TreeExplainer")
 def test_value_errors_raised(mock_tree_explainer, pipeline, exception, match):
 
     if "xgboost" in pipeline.name.lower():
@@ -154,7 +154,8 @@ def test_normalize_values_exceptions():
                                            ([{"a": [0]}] * 10, [{"a": [0]}] * 10),
                                            ({"a": [5], "b": [20], "c": [-22]},
                                             {"a": [5 / 47], "b": [20 / 47], "c": [-22 / 47]}),
-                                           ({"a": [5], "b": [-5]}, {"a": [0.5], "b": [-0.5]})])
+                                           ({"a": [5], "b": [-5]}, {"a": [0.5], "b": [-0.5]}),
+                                           ({"a": [0, 1], "b": [0, -3]}, {"a": [0, 0.25], "b": [0, -0.75]})])
 def test_normalize_values(values, answer):
 
     def check_equal_dicts(normalized, answer):
@@ -198,7 +198,7 @@ def test_explain_predictions_raises_pipeline_score_error():
 
         pipeline = MagicMock()
         pipeline.problem_type = ProblemTypes.BINARY
-        pipeline.predict_proba.side_effect = raise_zero_division
+        pipeline._predict_with_proba.side_effect = raise_zero_division
         explain_predictions_best_worst(pipeline, pd.DataFrame({"a": range(15)}), pd.Series(range(15)))
 
 
@@ -393,6 +393,11 @@ multiclass_no_best_worst_answer = """Test Pipeline Name
 """.format(multiclass_table=multiclass_table)
 
 
+def _compute_shap_values_for_rows(pipeline, input_features, training_data=None):
+    shap_values = {"a": list(input_features["a"])}
+    return input_features, shap_values, shap_values
+
+
 @pytest.mark.parametrize("problem_type,output_format,answer,explain_predictions_answer",
                          [(ProblemTypes.REGRESSION, "text", regression_best_worst_answer, no_best_worst_answer),
                           (ProblemTypes.REGRESSION, "dict", regression_best_worst_answer_dict, no_best_worst_answer_dict),
@@ -401,8 +406,10 @@ multiclass_no_best_worst_answer = """Test Pipeline Name
                           (ProblemTypes.MULTICLASS, "text", multiclass_best_worst_answer, multiclass_no_best_worst_answer),
                           (ProblemTypes.MULTICLASS, "dict", multiclass_best_worst_answer_dict, no_best_worst_answer_dict)])
 @patch("evalml.model_understanding.prediction_explanations.explainers.DEFAULT_METRICS")
-@patch("evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_shap_table")
-def test_explain_predictions_best_worst_and_explain_predictions(mock_make_table, mock_default_metrics,
+@patch("evalml.model_understanding.prediction_explanations._user_interface._make_shap_table")
+@patch("evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_for_rows",
+       side_effect=_compute_shap_values_for_rows)
+def test_explain_predictions_best_worst_and_explain_predictions(mock_compute_shap_values, mock_make_table, mock_default_metrics,
                                                                 problem_type, output_format, answer,
                                                                 explain_predictions_answer):
 
@@ -426,6 +433,8 @@ def test_explain_predictions_best_worst_and_explain_predictions(mock_make_table,
         cross_entropy_mock.return_value = pd.Series([0.2, 0.78])
         pipeline.predict_proba.return_value = pd.DataFrame({"benign": [0.05, 0.1], "malignant": [0.95, 0.9]})
         pipeline.predict.return_value = pd.Series(["malignant"] * 2)
+        pipeline._predict_with_proba.return_value = (pd.Series([1, 1]), pipeline.predict_proba.return_value)
+        pipeline._decode_targets.return_value = pipeline.predict.return_value
         y_true = pd.Series(["malignant", "benign"])
     else:
         # Multiclass text output is formatted slightly different so need to account for that
@@ -438,6 +447,8 @@ def test_explain_predictions_best_worst_and_explain_predictions(mock_make_table,
         pipeline.predict_proba.return_value = pd.DataFrame({"setosa": [0.8, 0.2], "versicolor": [0.1, 0.75],
                                                             "virginica": [0.1, 0.05]})
         pipeline.predict.return_value = ["setosa", "versicolor"]
+        pipeline._predict_with_proba.return_value = (pd.Series([0, 1]), pipeline.predict_proba.return_value)
+        pipeline._decode_targets.return_value = pipeline.predict.return_value
         y_true = pd.Series(["setosa", "versicolor"])
 
     best_worst_report = explain_predictions_best_worst(pipeline, input_features, y_true=y_true,
@@ -461,8 +472,10 @@ def test_explain_predictions_best_worst_and_explain_predictions(mock_make_table,
                           (ProblemTypes.BINARY, "dict", no_best_worst_answer_dict),
                           (ProblemTypes.MULTICLASS, "text", multiclass_no_best_worst_answer),
                           (ProblemTypes.MULTICLASS, "dict", no_best_worst_answer_dict)])
-@patch("evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_shap_table")
-def test_explain_predictions_custom_index(mock_make_table, problem_type, output_format, answer):
+@patch("evalml.model_understanding.prediction_explanations._user_interface._make_shap_table")
+@patch("evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_for_rows",
+       side_effect=_compute_shap_values_for_rows)
+def test_explain_predictions_custom_index(mock_compute_shap_values, mock_make_table, problem_type, output_format, answer):
 
     mock_make_table.return_value = "table goes here" if output_format == "text" else {"explanations": ["explanation_dictionary_goes_here"]}
     pipeline = MagicMock()
@@ -533,8 +546,10 @@ regression_custom_metric_answer_dict = {
 @pytest.mark.parametrize("output_format,answer",
                          [("text", regression_custom_metric_answer),
                           ("dict", regression_custom_metric_answer_dict)])
-@patch("evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_shap_table")
-def test_explain_predictions_best_worst_custom_metric(mock_make_table, output_format, answer):
+@patch("evalml.model_understanding.prediction_explanations._user_interface._make_shap_table")
+@patch("evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_for_rows",
+       side_effect=_compute_shap_values_for_rows)
+def test_explain_predictions_best_worst_custom_metric(mock_compute_shap_values, mock_make_table, output_format, answer):
 
     mock_make_table.return_value = "table goes here" if output_format == "text" else {"explanations": ["explanation_dictionary_goes_here"]}
     pipeline = MagicMock()
@@ -586,3 +601,23 @@ def test_json_serialization(problem_type, X_y_regression, linear_regression_pipe
 
     report = explain_predictions(pipeline, pd.DataFrame(X[:1]), output_format="dict")
     assert json.loads(json.dumps(report)) == report
+
+
+@patch("evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values")
+def test_explain_predictions_computes_shap_values_once(mock_compute_shap_values, X_y_binary,
+                                                       logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+    pipeline = logistic_regression_binary_pipeline_class({})
+    pipeline.fit(X, y)
+    mock_compute_shap_values.side_effect = lambda pipeline, features, training_data: [{column: list(features[column]) for column in features}] * 2
+
+    explain_predictions(pipeline, X.iloc[:5], training_data=X)
+    assert mock_compute_shap_values.call_count == 1
+    assert mock_compute_shap_values.call_args[0][1].shape[0] == 5
+
+    mock_compute_shap_values.reset_mock()
+    explain_predictions_best_worst(pipeline, X, y, num_to_explain=2)
+    assert mock_compute_shap_values.call_count == 1
+    assert mock_compute_shap_values.call_args[0][1].shape[0] == 4
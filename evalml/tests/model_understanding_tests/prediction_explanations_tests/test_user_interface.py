@@ -1,6 +1,7 @@
 import copy
 import json
 from itertools import product
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
@@ -12,7 +13,8 @@ from evalml.model_understanding.prediction_explanations._user_interface import (
     _make_rows,
     _make_text_table,
     _MultiClassSHAPTable,
-    _RegressionSHAPTable
+    _RegressionSHAPTable,
+    _SHAPTable
 )
 
 make_rows_test_cases = [({"a": [0.2], "b": [0.1]}, 3, [["a", "1.20", "++"], ["b", "1.10", "+"]]),
@@ -336,3 +338,26 @@ def test_make_single_prediction_table(values, normalized_values, pipeline_featur
             assert row_table.strip().split() == row_answer.strip().split()
     else:
         assert table == answer
+
+
+@pytest.mark.parametrize("shap_values,row_answers",
+                         [({"a": [1, 2], "b": [3, 4]},
+                           [{"a": [1], "b": [3]}, {"a": [2], "b": [4]}]),
+                          ([{"a": [1, 2]}, {"a": [-1, -2]}],
+                           [[{"a": [1]}, {"a": [-1]}], [{"a": [2]}, {"a": [-2]}]])])
+@patch("evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values")
+def test_shap_table_computes_shap_values_once(mock_compute_shap_values, shap_values, row_answers):
+    mock_compute_shap_values.return_value = shap_values
+    pipeline = MagicMock()
+    pipeline._transform.side_effect = lambda features: features * 10
+    input_features = pd.DataFrame({"a": [1, 2, 3, 4], "b": [5, 6, 7, 8]})
+
+    shap_values_by_index = _SHAPTable(3, False, input_features).compute_shap_values(pipeline, input_features, [0, 2])
+
+    assert mock_compute_shap_values.call_count == 1
+    pd.testing.assert_frame_equal(pipeline._transform.call_args[0][0], input_features.iloc[[0, 2]])
+    assert list(shap_values_by_index) == [0, 2]
+    for index, row_answer in zip([0, 2], row_answers):
+        pipeline_features, row_shap_values, _ = shap_values_by_index[index]
+        pd.testing.assert_frame_equal(pipeline_features, input_features.iloc[[index]] * 10)
+        assert row_shap_values == row_answer
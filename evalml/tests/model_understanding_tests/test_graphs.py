@@ -5,6 +5,9 @@ import numpy as np
 import pandas as pd
 import pytest
 from sklearn.exceptions import UndefinedMetricWarning
+from sklearn.inspection import partial_dependence as sk_partial_dependence
+from sklearn.inspection import \
+    permutation_importance as sk_permutation_importance
 from sklearn.preprocessing import label_binarize
 from skopt.space import Real
 
@@ -25,11 +28,13 @@ from evalml.model_understanding.graphs import (
     precision_recall_curve,
     roc_curve
 )
-from evalml.objectives import CostBenefitMatrix
+from evalml.objectives import CostBenefitMatrix, FraudCost, get_objective
 from evalml.pipelines import (
     BinaryClassificationPipeline,
     MulticlassClassificationPipeline,
-    RegressionPipeline
+    PipelineBase,
+    RegressionPipeline,
+    Transformer
 )
 from evalml.problem_types import ProblemTypes
 
@@ -546,6 +551,97 @@ def test_get_permutation_importance_correlated_features(logistic_regression_bina
     assert correlated_importance_val > not_correlated_importance_val
 
 
+@pytest.fixture
+def X_y_mixed_types():
+    rs = np.random.RandomState(0)
+    n_rows = 300
+    X = pd.DataFrame({"numbers": rs.randn(n_rows),
+                      "categories": rs.choice(["a", "b", "c"], n_rows),
+                      "with_nulls": np.where(rs.rand(n_rows) < 0.2, np.nan, rs.randn(n_rows)),
+                      "dates": pd.Timestamp("2020-01-01") + pd.to_timedelta(rs.randint(0, 1000, n_rows), unit="D"),
+                      "all_null": np.nan})
+    y = X["numbers"] + (X["categories"] == "a") + rs.randn(n_rows) * 0.5
+    return X, y
+
+
+@pytest.mark.parametrize("problem_type,objective", [(ProblemTypes.BINARY, "Log Loss Binary"), (ProblemTypes.BINARY, "F1"),
+                                                    (ProblemTypes.MULTICLASS, "F1 Macro"), (ProblemTypes.REGRESSION, "R2")])
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_fast_permutation_importance_matches_sklearn(problem_type, objective, n_jobs, X_y_mixed_types):
+    X, y = X_y_mixed_types
+    graph = ["Imputer", "DateTime Featurization Component", "One Hot Encoder", "Standard Scaler"]
+    if problem_type == ProblemTypes.BINARY:
+        pipeline_class = BinaryClassificationPipeline
+        graph.append("Logistic Regression Classifier")
+        y = (y > 0.5).astype(int)
+    elif problem_type == ProblemTypes.MULTICLASS:
+        pipeline_class = MulticlassClassificationPipeline
+        graph.append("Logistic Regression Classifier")
+        y = pd.cut(y, 3, labels=["low", "medium", "high"]).astype(str)
+    else:
+        pipeline_class = RegressionPipeline
+        graph.append("Random Forest Regressor")
+
+    class MixedTypesPipeline(pipeline_class):
+        component_graph = graph
+    pipeline = MixedTypesPipeline({"Random Forest Regressor": {"n_estimators": 10}} if problem_type == ProblemTypes.REGRESSION else {})
+    pipeline.fit(X, y)
+    if problem_type == ProblemTypes.BINARY:
+        pipeline.threshold = 0.4
+
+    provenance = pipeline._get_feature_provenance()
+    assert provenance["numbers"] == ["numbers"]
+    assert provenance["categories"] == ["categories_a", "categories_b", "categories_c"]
+    assert "dates_year" in provenance["dates"]
+    assert provenance["all_null"] == []
+
+    objective_instance = get_objective(objective, return_instance=True)
+
+    def scorer(pipeline, X, y):
+        score = pipeline.score(X, y, objectives=[objective_instance])[objective_instance.name]
+        return score if objective_instance.greater_is_better else -score
+    expected = pd.Series(sk_permutation_importance(pipeline, X, y, scoring=scorer, n_repeats=5, random_state=0)["importances_mean"],
+                         index=X.columns)
+
+    with patch.object(PipelineBase, '_transform', autospec=True, side_effect=PipelineBase._transform) as mock_transform:
+        importance = calculate_permutation_importance(pipeline, X, y, objective, n_jobs=n_jobs, random_state=0)
+    assert mock_transform.call_count == 1
+    assert importance["importance"].is_monotonic_decreasing
+    pd.testing.assert_series_equal(importance.set_index("feature")["importance"].reindex(X.columns), expected,
+                                   check_names=False, check_exact=False)
+    assert importance.set_index("feature")["importance"]["all_null"] == 0
+
+
+class RowSumTransformer(Transformer):
+    name = "Row Sum Transformer"
+
+    def __init__(self, random_state=0):
+        super().__init__(parameters={}, component_obj=None, random_state=random_state)
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X, y=None):
+        X_t = pd.DataFrame(X).copy()
+        X_t["row_sum"] = X_t.sum(axis=1)
+        return X_t
+
+
+def test_permutation_importance_falls_back_for_transformers_which_are_not_column_wise(X_y_binary):
+    X, y = X_y_binary
+
+    class RowSumPipeline(BinaryClassificationPipeline):
+        component_graph = [RowSumTransformer, "Logistic Regression Classifier"]
+
+    pipeline = RowSumPipeline({})
+    pipeline.fit(X, y)
+    assert pipeline._get_feature_provenance() is None
+    with patch("evalml.model_understanding.graphs.sk_permutation_importance", wraps=sk_permutation_importance) as mock_permutation_importance:
+        importance = calculate_permutation_importance(pipeline, X, y, "Log Loss Binary")
+    mock_permutation_importance.assert_called_once()
+    assert len(importance) == X.shape[1]
+
+
 def test_graph_permutation_importance(X_y_binary, test_pipeline):
     go = pytest.importorskip('plotly.graph_objects', reason='Skipping plotting test because plotly not installed')
     X, y = X_y_binary
@@ -625,21 +721,64 @@ def test_binary_objective_vs_threshold(X_y_binary, logistic_regression_binary_pi
     assert not results_df.isnull().all().all()
 
 
-@patch('evalml.pipelines.BinaryClassificationPipeline.score')
-def test_binary_objective_vs_threshold_steps(mock_score,
+@patch('evalml.pipelines.BinaryClassificationPipeline.predict_proba')
+def test_binary_objective_vs_threshold_steps(mock_predict_proba,
                                              X_y_binary, logistic_regression_binary_pipeline_class):
     X, y = X_y_binary
     cbm = CostBenefitMatrix(true_positive=1, true_negative=-1,
                             false_positive=-7, false_negative=-2)
     pipeline = logistic_regression_binary_pipeline_class(parameters={})
     pipeline.fit(X, y)
-    mock_score.return_value = {"Cost Benefit Matrix": 0.2}
+    mock_predict_proba.return_value = pd.DataFrame({0: 1 - np.linspace(0, 1, len(y)), 1: np.linspace(0, 1, len(y))})
     cost_benefit_df = binary_objective_vs_threshold(pipeline, X, y, cbm, steps=234)
-    mock_score.assert_called()
+    mock_predict_proba.assert_called_once()
     assert list(cost_benefit_df.columns) == ['threshold', 'score']
     assert cost_benefit_df.shape == (235, 2)
 
 
+@pytest.mark.parametrize("objective", [CostBenefitMatrix(true_positive=1, true_negative=-1, false_positive=-7, false_negative=-2),
+                                       'f1', 'mcc binary', 'accuracy binary', 'balanced accuracy binary', 'lead scoring',
+                                       FraudCost(amount_col=0)])
+def test_binary_objective_vs_threshold_matches_score(objective, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X).abs()
+    y = pd.Series(y).map({0: 'no', 1: 'yes'})
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+    pipeline_copy = pipeline.clone()
+    pipeline_copy.fit(X, y)
+    objective = get_objective(objective, return_instance=True)
+    expected = []
+    for threshold in np.linspace(0, 1, 21):
+        pipeline_copy.threshold = threshold
+        expected.append(pipeline_copy.score(X, y, [objective])[objective.name])
+
+    results_df = binary_objective_vs_threshold(pipeline, X, y, objective, steps=20)
+    np.testing.assert_allclose(results_df['score'], expected)
+    y_pred_proba = pipeline.predict_proba(X)
+    with patch.object(pipeline, 'predict_proba') as mock_predict_proba:
+        pd.testing.assert_frame_equal(binary_objective_vs_threshold(pipeline, X, y, objective, steps=20, y_pred_proba=y_pred_proba), results_df)
+        pd.testing.assert_frame_equal(binary_objective_vs_threshold(pipeline, X, y, objective, steps=20, y_pred_proba=y_pred_proba.iloc[:, 1].values),
+                                      results_df)
+    mock_predict_proba.assert_not_called()
+
+
+@patch('evalml.objectives.FraudCost.objective_function_from_counts', side_effect=NotImplementedError)
+@patch('evalml.objectives.FraudCost._can_score_counts', return_value=False)
+def test_binary_objective_vs_threshold_without_counts(mock_can_score_counts, mock_from_counts, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X).abs()
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+    fraud_cost = FraudCost(amount_col=0)
+    with patch.object(pipeline, 'predict_proba', wraps=pipeline.predict_proba) as mock_predict_proba:
+        results_df = binary_objective_vs_threshold(pipeline, X, y, fraud_cost, steps=10)
+    mock_predict_proba.assert_called_once()
+    mock_from_counts.assert_not_called()
+    pipeline.threshold = 0.3
+    assert results_df['score'][3] == pytest.approx(pipeline.score(X, y, [fraud_cost])["Fraud Cost"])
+
+
 @patch('evalml.model_understanding.graphs.binary_objective_vs_threshold')
 def test_graph_binary_objective_vs_threshold(mock_cb_thresholds, X_y_binary, logistic_regression_binary_pipeline_class):
     go = pytest.importorskip('plotly.graph_objects', reason='Skipping plotting test because plotly not installed')
@@ -651,7 +790,8 @@ def test_graph_binary_objective_vs_threshold(mock_cb_thresholds, X_y_binary, log
     mock_cb_thresholds.return_value = pd.DataFrame({'threshold': [0, 0.5, 1.0],
                                                     'score': [100, -20, 5]})
 
-    figure = graph_binary_objective_vs_threshold(pipeline, X, y, cbm)
+    figure = graph_binary_objective_vs_threshold(pipeline, X, y, cbm, y_pred_proba=[0.2, 0.8])
+    mock_cb_thresholds.assert_called_once_with(pipeline, X, y, cbm, 100, y_pred_proba=[0.2, 0.8])
     assert isinstance(figure, go.Figure)
     data = figure.data[0]
     assert not np.any(np.isnan(data['x']))
@@ -801,6 +941,124 @@ def test_partial_dependence_not_fitted(X_y_binary, logistic_regression_binary_pi
         partial_dependence(pipeline, X, feature=0, grid_resolution=20)
 
 
+def _sklearn_partial_dependence(pipeline, X, features, grid_resolution):
+    pipeline._estimator_type = "regressor" if pipeline.problem_type == ProblemTypes.REGRESSION else "classifier"
+    pipeline.feature_importances_ = pipeline.feature_importance
+    features = features if isinstance(features, list) else [features]
+    avg_pred, values = sk_partial_dependence(pipeline, X, features=features, grid_resolution=grid_resolution)
+    del pipeline._estimator_type
+    del pipeline.feature_importances_
+    return avg_pred[0].ravel(), values
+
+
+@pytest.mark.parametrize("problem_type", [ProblemTypes.BINARY, ProblemTypes.MULTICLASS, ProblemTypes.REGRESSION])
+@pytest.mark.parametrize("estimator", ["Random Forest", "Extra Trees", "XGBoost", "LightGBM", "CatBoost", "Linear"])
+@pytest.mark.parametrize("method", ["tree", "brute"])
+def test_partial_dependence_matches_sklearn(problem_type, estimator, method, X_y_mixed_types, has_minimal_dependencies):
+    if has_minimal_dependencies and estimator in ["XGBoost", "LightGBM", "CatBoost"]:
+        pytest.skip(f"Skipping because {estimator} not installed for minimal dependencies")
+    if estimator == "LightGBM" and problem_type == ProblemTypes.REGRESSION:
+        pytest.skip("Skipping because there is no LightGBM regressor")
+    X, y = X_y_mixed_types
+    if problem_type == ProblemTypes.BINARY:
+        pipeline_class = BinaryClassificationPipeline
+        y = (y > 0.5).astype(int)
+    elif problem_type == ProblemTypes.MULTICLASS:
+        pipeline_class = MulticlassClassificationPipeline
+        y = pd.cut(y, 3, labels=["low", "medium", "high"]).astype(str)
+    else:
+        pipeline_class = RegressionPipeline
+    if estimator == "Linear":
+        estimator_name = "Linear Regressor" if problem_type == ProblemTypes.REGRESSION else "Logistic Regression Classifier"
+    else:
+        estimator_name = f"{estimator} {'Regressor' if problem_type == ProblemTypes.REGRESSION else 'Classifier'}"
+
+    class MixedTypesPipeline(pipeline_class):
+        component_graph = ["Imputer", "DateTime Featurization Component", "One Hot Encoder", estimator_name]
+    pipeline = MixedTypesPipeline({})
+    pipeline.fit(X, y)
+
+    if method == "tree" and estimator == "Linear":
+        with pytest.raises(ValueError, match="The 'tree' method requires"):
+            partial_dependence(pipeline, X, feature="numbers", grid_resolution=20, method=method)
+        return
+
+    for feature in ["numbers", "categories"]:
+        expected, values = _sklearn_partial_dependence(pipeline, X, feature, grid_resolution=20)
+        part_dep = partial_dependence(pipeline, X, feature=feature, grid_resolution=20, method=method, chunksize=len(X) * 3)
+        np.testing.assert_array_equal(part_dep["feature_values"], values[0])
+        # XGBoost sums the trees' outputs as float32
+        np.testing.assert_allclose(part_dep["partial_dependence"], expected, rtol=1e-5, atol=1e-6)
+
+    # scikit-learn cannot make a grid of numeric and categorical features, so the two-way grid is evaluated one point at a time
+    _, numbers = _sklearn_partial_dependence(pipeline, X, "numbers", grid_resolution=20)
+    _, categories = _sklearn_partial_dependence(pipeline, X, "categories", grid_resolution=20)
+    part_dep = partial_dependence(pipeline, X, feature=["numbers", "categories"], grid_resolution=20, method=method, chunksize=len(X) * 3)
+    assert list(part_dep.columns) == ["numbers", "categories", "partial_dependence"]
+    np.testing.assert_array_equal(part_dep["numbers"], np.repeat(numbers[0], len(categories[0])))
+    np.testing.assert_array_equal(part_dep["categories"], np.tile(categories[0], len(numbers[0])))
+    for _, point in part_dep.iloc[::7].iterrows():
+        X_point = X.assign(numbers=point["numbers"], categories=point["categories"])
+        if problem_type == ProblemTypes.REGRESSION:
+            expected = pipeline.predict(X_point).mean()
+        else:
+            expected = pipeline.predict_proba(X_point).iloc[:, 1 if problem_type == ProblemTypes.BINARY else 0].mean()
+        np.testing.assert_allclose(point["partial_dependence"], expected, rtol=1e-5, atol=1e-6)
+
+
+def test_partial_dependence_batches_predictions(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+    expected, _ = _sklearn_partial_dependence(pipeline, X, 0, grid_resolution=20)
+    with patch.object(PipelineBase, '_transform', autospec=True, side_effect=PipelineBase._transform) as mock_transform:
+        with patch.object(pipeline.estimator, 'predict_proba', wraps=pipeline.estimator.predict_proba) as mock_predict_proba:
+            part_dep = partial_dependence(pipeline, X, feature=0, grid_resolution=20, chunksize=len(X) * 6)
+    # X and the grid are each transformed once, and 6 grid points are predicted at once
+    assert mock_transform.call_count == 2
+    assert mock_predict_proba.call_count == 4
+    assert all(len(call[0][0]) <= len(X) * 6 for call in mock_predict_proba.call_args_list)
+    np.testing.assert_allclose(part_dep["partial_dependence"], expected)
+
+    with patch.object(pipeline.estimator, 'predict_proba', wraps=pipeline.estimator.predict_proba) as mock_predict_proba:
+        part_dep = partial_dependence(pipeline, X, feature=0, grid_resolution=20, chunksize=1)
+    assert mock_predict_proba.call_count == 20
+    np.testing.assert_allclose(part_dep["partial_dependence"], expected)
+
+
+def test_partial_dependence_falls_back_for_transformers_which_are_not_column_wise(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+
+    class RowSumPipeline(BinaryClassificationPipeline):
+        component_graph = [RowSumTransformer, "Random Forest Classifier"]
+
+    pipeline = RowSumPipeline({})
+    pipeline.fit(X, y)
+    expected, _ = _sklearn_partial_dependence(pipeline, X, [0, 1], grid_resolution=5)
+    with patch.object(pipeline, 'predict_proba', wraps=pipeline.predict_proba) as mock_predict_proba:
+        part_dep = partial_dependence(pipeline, X, feature=[0, 1], grid_resolution=5)
+    mock_predict_proba.assert_called_once()
+    np.testing.assert_allclose(part_dep["partial_dependence"], expected)
+    with pytest.raises(ValueError, match="The 'tree' method requires"):
+        partial_dependence(pipeline, X, feature=0, grid_resolution=5, method="tree")
+
+
+def test_partial_dependence_errors(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+    with pytest.raises(ValueError, match="method must be one of 'auto', 'brute' or 'tree'. Received 'recursion'."):
+        partial_dependence(pipeline, X, feature=0, method="recursion")
+    with pytest.raises(ValueError, match="chunksize must be a positive integer. Received 0."):
+        partial_dependence(pipeline, X, feature=0, chunksize=0)
+    with pytest.raises(ValueError, match="Feature 'not a column' is not a column of X"):
+        partial_dependence(pipeline, X, feature="not a column")
+    with pytest.raises(ValueError, match="'grid_resolution' must be strictly greater than 1."):
+        partial_dependence(pipeline, X, feature=0, grid_resolution=1)
+
+
 def test_graph_partial_dependence(test_pipeline):
     X, y = load_breast_cancer()
 
@@ -818,6 +1076,27 @@ def test_graph_partial_dependence(test_pipeline):
     assert np.array_equal(fig_dict['data'][0]['y'], part_dep_data['partial_dependence'].values)
 
 
+def test_graph_two_way_partial_dependence(test_pipeline):
+    X, y = load_breast_cancer()
+
+    go = pytest.importorskip('plotly.graph_objects', reason='Skipping plotting test because plotly not installed')
+    clf = test_pipeline
+    clf.fit(X, y)
+    fig = graph_partial_dependence(clf, X, feature=['mean radius', 'mean texture'], grid_resolution=5)
+    assert isinstance(fig, go.Figure)
+    fig_dict = fig.to_dict()
+    assert fig_dict['layout']['title']['text'] == "Partial Dependence of 'mean radius' vs. 'mean texture'"
+    assert len(fig_dict['data']) == 1
+
+    part_dep_data = partial_dependence(clf, X, feature=['mean radius', 'mean texture'], grid_resolution=5)
+    assert np.array_equal(fig_dict['data'][0]['x'], part_dep_data['mean radius'].unique())
+    assert np.array_equal(fig_dict['data'][0]['y'], part_dep_data['mean texture'].unique())
+    assert np.array_equal(fig_dict['data'][0]['z'][1], part_dep_data[part_dep_data['mean texture'] == part_dep_data['mean texture'].unique()[1]]['partial_dependence'])
+
+    with pytest.raises(ValueError, match="Partial dependence can only be plotted for one or two features. Received 3 features."):
+        graph_partial_dependence(clf, X, feature=['mean radius', 'mean texture', 'mean area'])
+
+
 @patch('evalml.model_understanding.graphs.jupyter_check')
 @patch('evalml.model_understanding.graphs.import_or_raise')
 def test_jupyter_graph_check(import_check, jupyter_check, X_y_binary, test_pipeline):
@@ -1,7 +1,23 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from evalml.objectives import (
+    AccuracyBinary,
+    BalancedAccuracyBinary,
+    BinaryClassificationObjective,
+    CostBenefitMatrix,
+    FraudCost,
+    LeadScoring,
+    MCCBinary,
+    Precision,
+    Recall
+)
+from evalml.objectives.binary_classification_objective import (
+    _candidate_thresholds
+)
 from evalml.objectives.standard_metrics import AUC, F1
 
 
@@ -48,3 +64,69 @@ def test_decision_function_neg():
     pd.testing.assert_series_equal(obj.decision_function(ypred_proba.tolist()), y_true)
     pd.testing.assert_series_equal(obj.decision_function(ypred_proba), y_true)
     pd.testing.assert_series_equal(obj.decision_function(pd.Series(ypred_proba, dtype=float)), y_true)
+
+
+@pytest.mark.parametrize("objective", [F1(), Precision(), Recall(), MCCBinary(), AccuracyBinary(), BalancedAccuracyBinary(),
+                                       CostBenefitMatrix(true_positive=10, true_negative=0, false_positive=-2, false_negative=-7),
+                                       LeadScoring(), FraudCost(amount_col="amount")])
+def test_optimize_threshold_exact(objective):
+    rs = np.random.RandomState(0)
+    ypred_proba = np.round(rs.rand(300), 2)
+    y_true = pd.Series(rs.rand(300) < ypred_proba)
+    X = pd.DataFrame({"amount": rs.rand(300) * 100})
+
+    thresholds = np.concatenate([np.linspace(-0.1, 1.1, 25), np.linspace(0, 100, 25)])
+    expected = [objective.objective_function(y_true, objective.decision_function(ypred_proba, threshold, X=X), X=X) for threshold in thresholds]
+    np.testing.assert_allclose(objective._score_thresholds(ypred_proba, y_true, thresholds, X=X), expected)
+
+    with patch("evalml.objectives.binary_classification_objective.minimize_scalar") as mock_minimize_scalar:
+        threshold = objective.optimize_threshold(ypred_proba, y_true, X=X)
+    mock_minimize_scalar.assert_not_called()
+    decision_scores, _ = objective._decision_scores_and_weights(ypred_proba, X)
+    all_scores = [objective.objective_function(y_true, objective.decision_function(ypred_proba, threshold, X=X), X=X)
+                  for threshold in _candidate_thresholds(decision_scores)]
+    optimal_score = max(all_scores) if objective.greater_is_better else min(all_scores)
+    assert objective.objective_function(y_true, objective.decision_function(ypred_proba, threshold, X=X), X=X) == pytest.approx(optimal_score)
+
+
+def test_optimize_threshold_exact_midpoint():
+    assert F1().optimize_threshold(np.array([0.2, 0.4]), np.array([0, 1])) == pytest.approx(0.3)
+    assert F1().optimize_threshold(np.array([0.2, 0.4]), np.array([1, 1])) < 0.2
+    assert Precision().optimize_threshold(np.array([0.2, 0.4]), np.array([0, 0])) == pytest.approx(0.2)
+
+    lower = 0.5
+    higher = np.nextafter(lower, 1)
+    thresholds = _candidate_thresholds(np.array([higher, lower]))
+    assert thresholds[0] < lower
+    assert lower <= thresholds[1] < higher
+    assert thresholds[2] == higher
+
+
+def test_optimize_threshold_targets():
+    ypred_proba = np.array([0.2, 0.4, 0.6])
+    threshold = F1().optimize_threshold(ypred_proba, np.array([0, 1, 1]))
+    assert F1().optimize_threshold(ypred_proba, pd.Series([False, True, True])) == threshold
+    assert F1().optimize_threshold(ypred_proba, np.array([0.0, 1.0, 1.0])) == threshold
+    with pytest.raises(ValueError, match="y_true must be booleans or 0 and 1 for the positive class"):
+        F1().optimize_threshold(ypred_proba, pd.Series(["no", "yes", "yes"]))
+    with pytest.raises(ValueError, match=r"Received values \[1, 2\]"):
+        F1().optimize_threshold(ypred_proba, np.array([1, 2, 2]))
+
+
+def test_optimize_threshold_without_counts():
+    class MockObjective(BinaryClassificationObjective):
+        name = "Mock Objective"
+        greater_is_better = True
+        score_needs_proba = False
+        perfect_score = 1.0
+
+        def objective_function(self, y_true, y_predicted, X=None):
+            return (y_true == y_predicted).mean()
+
+    objective = MockObjective()
+    with pytest.raises(NotImplementedError, match="Mock Objective cannot be computed from the counts of a confusion matrix."):
+        objective.objective_function_from_counts(1, 1, 1, 1)
+    with patch("evalml.objectives.binary_classification_objective.minimize_scalar") as mock_minimize_scalar:
+        mock_minimize_scalar.return_value.x = 0.25
+        assert objective.optimize_threshold(np.array([0.2, 0.4]), np.array([0, 1])) == 0.25
+    mock_minimize_scalar.assert_called_once()
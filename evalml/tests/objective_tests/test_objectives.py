@@ -1,3 +1,6 @@
+import gc
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -13,6 +16,7 @@ from evalml.objectives import (
     print_all_objective_names
 )
 from evalml.objectives.objective_base import ObjectiveBase
+from evalml.objectives.standard_metrics import F1
 from evalml.problem_types import ProblemTypes
 from evalml.utils.gen_utils import _get_subclasses
 
@@ -82,6 +86,30 @@ def test_can_print_all_objective_names():
     print_all_objective_names()
 
 
+@patch('evalml.objectives.utils._get_subclasses', wraps=_get_subclasses)
+def test_get_objective_cached(mock_get_subclasses):
+    get_objective("F1")
+    mock_get_subclasses.reset_mock()
+    assert get_objective("F1") == F1
+    assert get_objective("F1", return_instance=True).name == "F1"
+    assert get_objectives(ProblemTypes.BINARY)
+    mock_get_subclasses.assert_not_called()
+
+
+def test_get_objective_cache_invalidated():
+    assert get_objective("F1") == F1
+
+    class MockF1(F1):
+        pass
+
+    # F1 is no longer a leaf of the class hierarchy
+    with pytest.raises(ObjectiveNotFoundError):
+        get_objective("F1")
+    del MockF1
+    gc.collect()
+    assert get_objective("F1") == F1
+
+
 def test_get_objectives_types():
 
     assert len(get_objectives(ProblemTypes.MULTICLASS)) == 16
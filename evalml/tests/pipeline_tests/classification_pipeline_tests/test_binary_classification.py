@@ -1,8 +1,11 @@
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from evalml.pipelines import PipelineBase
+
 
 @patch('evalml.pipelines.ClassificationPipeline._decode_targets')
 @patch('evalml.objectives.BinaryClassificationObjective.decision_function')
@@ -67,3 +70,31 @@ def test_binary_predict_pipeline_objective_mismatch(mock_transform, X_y_binary,
     with pytest.raises(ValueError, match="You can only use a binary classification objective to make predictions for a binary classification pipeline."):
         binary_pipeline.predict(X, "precision micro")
     mock_transform.assert_called()
+
+
+@pytest.mark.parametrize("threshold", [None, 0.6])
+def test_binary_pipeline_score_transforms_once(threshold, X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    pipeline = logistic_regression_binary_pipeline_class(parameters={"Logistic Regression Classifier": {"n_jobs": 1}})
+    pipeline.fit(X, y)
+    pipeline.threshold = threshold
+    objectives = ["f1", "log loss binary", "auc"]
+    expected_scores = {}
+    for objective in objectives:
+        expected_scores.update(pipeline.score(X, y, [objective]))
+    with patch.object(PipelineBase, '_transform', autospec=True, side_effect=PipelineBase._transform) as mock_transform:
+        scores = pipeline.score(X, y, objectives)
+    assert mock_transform.call_count == 1
+    assert scores == pytest.approx(expected_scores)
+
+    with patch.object(PipelineBase, '_transform', autospec=True, side_effect=PipelineBase._transform) as mock_transform:
+        predictions = pipeline.predict(X)
+    assert mock_transform.call_count == 1
+    if threshold is not None:
+        np.testing.assert_array_equal(predictions, pipeline.predict_proba(X).iloc[:, 1] > threshold)
+
+    y_predicted, y_predicted_proba = pipeline._predict_with_proba(X)
+    pd.testing.assert_series_equal(pd.Series(pipeline._decode_targets(y_predicted)), predictions)
+    pd.testing.assert_frame_equal(y_predicted_proba, pipeline.predict_proba(X))
+    assert pipeline._predict_with_proba(X, include_proba=False)[1] is None
+    assert pipeline._predict_with_proba(X, include_labels=False)[0] is None
@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    CompiledPipeline,
+    MulticlassClassificationPipeline,
+    RegressionPipeline
+)
+from evalml.pipelines.components import Transformer
+from evalml.problem_types import ProblemTypes
+
+
+class RowSumTransformer(Transformer):
+    """Adds the sum of the numeric columns of each row, and cannot be compiled."""
+    name = "Row Sum Transformer"
+    hyperparameter_ranges = {}
+
+    def __init__(self, random_state=0):
+        super().__init__(parameters={}, component_obj=None, random_state=random_state)
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X, y=None):
+        X_t = X.copy()
+        X_t['row_sum'] = X.select_dtypes('number').sum(axis=1)
+        return X_t
+
+
+@pytest.fixture
+def X_mixed_types():
+    rng = np.random.RandomState(0)
+    n_rows = 200
+    X = pd.DataFrame({'numbers': rng.randn(n_rows),
+                      'integers': rng.randint(0, 5, n_rows),
+                      'letters': rng.choice(['a', 'b', 'c', None], n_rows),
+                      'dates': pd.date_range('2020-01-01', periods=n_rows, freq='11H'),
+                      'flags': rng.choice([True, False], n_rows),
+                      'empty': [np.nan] * n_rows})
+    X.loc[::7, 'numbers'] = np.nan
+    return X
+
+
+def make_y(problem_type, n_rows):
+    rng = np.random.RandomState(1)
+    if problem_type == ProblemTypes.BINARY:
+        return pd.Series(rng.choice(['no', 'yes'], n_rows))
+    if problem_type == ProblemTypes.MULTICLASS:
+        return pd.Series(rng.choice([3, 5, 9], n_rows))
+    return pd.Series(rng.randn(n_rows))
+
+
+def make_pipeline_class(problem_type, component_graph):
+    base_class = {ProblemTypes.BINARY: BinaryClassificationPipeline,
+                  ProblemTypes.MULTICLASS: MulticlassClassificationPipeline,
+                  ProblemTypes.REGRESSION: RegressionPipeline}[problem_type]
+    return type('CompiledTestPipeline', (base_class,), {'component_graph': component_graph})
+
+
+def assert_compiled_predictions_match(pipeline, X):
+    compiled = pipeline.compile()
+    X_array = X.values.astype(object)
+    predictions = pipeline.predict(X)
+    probabilities = None if pipeline.problem_type == ProblemTypes.REGRESSION else pipeline.predict_proba(X).values
+    if pipeline.problem_type == ProblemTypes.REGRESSION:
+        np.testing.assert_allclose(compiled.predict_array(X_array), predictions.values, rtol=1e-6)
+    else:
+        np.testing.assert_array_equal(compiled.predict_array(X_array), predictions.values)
+        np.testing.assert_allclose(compiled.predict_proba_array(X_array), probabilities, rtol=1e-6, atol=1e-9)
+        np.testing.assert_array_equal(compiled.classes_, pipeline.classes_)
+    for i in [0, 7, len(X) - 1]:
+        row = X.iloc[i].to_dict()
+        assert compiled.predict_one(row) == pytest.approx(predictions[i])
+        if pipeline.problem_type != ProblemTypes.REGRESSION:
+            np.testing.assert_allclose(compiled.predict_proba_one(row), probabilities[i], rtol=1e-6, atol=1e-9)
+    return compiled
+
+
+@pytest.mark.parametrize("problem_type", [ProblemTypes.BINARY, ProblemTypes.MULTICLASS, ProblemTypes.REGRESSION])
+@pytest.mark.parametrize("estimator", ["Random Forest", "Extra Trees", "XGBoost", "LightGBM", "CatBoost", "Linear"])
+def test_compiled_pipeline_matches_pipeline(estimator, problem_type, X_mixed_types, has_minimal_dependencies):
+    if has_minimal_dependencies and estimator in ["XGBoost", "LightGBM", "CatBoost"]:
+        pytest.skip(f"Skipping because {estimator} is not installed for minimal dependencies")
+    if problem_type == ProblemTypes.REGRESSION:
+        if estimator == "LightGBM":
+            pytest.skip("There is no LightGBM regressor")
+        estimator_name = "Elastic Net Regressor" if estimator == "Linear" else f"{estimator} Regressor"
+    else:
+        estimator_name = "Logistic Regression Classifier" if estimator == "Linear" else f"{estimator} Classifier"
+    component_graph = ['Imputer', 'DateTime Featurization Component', 'One Hot Encoder', 'Standard Scaler', estimator_name]
+    X = X_mixed_types
+    pipeline = make_pipeline_class(problem_type, component_graph)({}).fit(X, make_y(problem_type, len(X)))
+    compiled = assert_compiled_predictions_match(pipeline, X)
+    assert compiled.feature_names == list(X.columns)
+    assert compiled._frame_columns is None
+
+
+@pytest.mark.parametrize("component_graph", [['Per Column Imputer', 'Drop Null Columns Transformer', 'One Hot Encoder', 'Random Forest Classifier'],
+                                             ['Drop Columns Transformer', 'Simple Imputer', 'One Hot Encoder', 'RF Classifier Select From Model',
+                                              'Logistic Regression Classifier'],
+                                             ['Select Columns Transformer', 'Simple Imputer', 'Random Forest Classifier']])
+def test_compiled_pipeline_components(component_graph, X_mixed_types):
+    X = X_mixed_types.drop(columns=['dates', 'flags'])
+    parameters = {'Per Column Imputer': {'impute_strategies': {'numbers': {'impute_strategy': 'mean'},
+                                                               'letters': {'impute_strategy': 'most_frequent'}}},
+                  'Drop Columns Transformer': {'columns': ['empty']},
+                  'Select Columns Transformer': {'columns': ['numbers', 'integers']},
+                  'Simple Imputer': {'impute_strategy': 'most_frequent'}}
+    pipeline = make_pipeline_class(ProblemTypes.BINARY, component_graph)(parameters).fit(X, make_y(ProblemTypes.BINARY, len(X)))
+    compiled = assert_compiled_predictions_match(pipeline, X)
+    assert compiled._components == []
+    assert compiled._frame_columns is None
+
+
+@pytest.mark.parametrize("handle_missing", ["as_category", "error"])
+def test_compiled_pipeline_one_hot_encoder_missing_and_unknown(handle_missing, X_mixed_types):
+    X = X_mixed_types[['numbers', 'letters']].fillna({'numbers': 0})
+    if handle_missing == "error":
+        X = X.fillna({'letters': 'a'})
+    parameters = {'One Hot Encoder': {'handle_missing': handle_missing, 'handle_unknown': 'error'}}
+    pipeline = make_pipeline_class(ProblemTypes.BINARY, ['One Hot Encoder', 'Random Forest Classifier'])(parameters)
+    pipeline.fit(X, make_y(ProblemTypes.BINARY, len(X)))
+    compiled = assert_compiled_predictions_match(pipeline, X)
+    with pytest.raises(ValueError, match="Found unknown categories"):
+        compiled.predict_one({'numbers': 1.0, 'letters': 'z'})
+    if handle_missing == "error":
+        with pytest.raises(ValueError, match="Input contains NaN"):
+            compiled.predict_one({'numbers': 1.0, 'letters': None})
+
+
+def test_compiled_pipeline_binary_threshold(X_mixed_types):
+    X = X_mixed_types
+    pipeline = make_pipeline_class(ProblemTypes.BINARY, ['Imputer', 'DateTime Featurization Component', 'One Hot Encoder',
+                                                         'Logistic Regression Classifier'])({})
+    pipeline.fit(X, make_y(ProblemTypes.BINARY, len(X)))
+    pipeline.threshold = 0.45
+    compiled = assert_compiled_predictions_match(pipeline, X)
+    pipeline.threshold = 0.9
+    assert (compiled.predict_array(X.values.astype(object)) != pipeline.predict(X).values).any()
+    assert_compiled_predictions_match(pipeline, X)
+
+
+def test_compiled_pipeline_falls_back_to_components(X_mixed_types):
+    X = X_mixed_types
+    pipeline = make_pipeline_class(ProblemTypes.BINARY, ['Imputer', RowSumTransformer, 'DateTime Featurization Component', 'One Hot Encoder',
+                                                         'Random Forest Classifier'])({})
+    pipeline.fit(X, make_y(ProblemTypes.BINARY, len(X)))
+    compiled = assert_compiled_predictions_match(pipeline, X)
+    assert [component.name for component in compiled._components] == ['Row Sum Transformer', 'DateTime Featurization Component', 'One Hot Encoder']
+    assert len(compiled._steps) == 1
+
+    pipeline = make_pipeline_class(ProblemTypes.MULTICLASS, ['Imputer', 'One Hot Encoder', 'Baseline Classifier'])({})
+    pipeline.fit(X, make_y(ProblemTypes.MULTICLASS, len(X)))
+    compiled = assert_compiled_predictions_match(pipeline, X)
+    assert compiled._components == []
+    assert compiled._frame_columns is not None
+
+
+def test_compiled_pipeline_errors(X_mixed_types):
+    X = X_mixed_types
+    pipeline_class = make_pipeline_class(ProblemTypes.REGRESSION, ['Imputer', 'DateTime Featurization Component', 'One Hot Encoder',
+                                                                   'Linear Regressor'])
+    pipeline = pipeline_class({})
+    with pytest.raises(PipelineNotYetFittedError, match="You must fit"):
+        pipeline.compile()
+    pipeline.fit(X, make_y(ProblemTypes.REGRESSION, len(X)))
+    compiled = pipeline.compile()
+    assert isinstance(compiled, CompiledPipeline)
+    with pytest.raises(ValueError, match=r"Row is missing features \['letters', 'dates', 'flags', 'empty'\]"):
+        compiled.predict_one({'numbers': 1.0, 'integers': 2})
+    with pytest.raises(ValueError, match=r"X must be an array of shape \[n_samples, 6\]"):
+        compiled.predict_array(X.values[:, :3])
+    with pytest.raises(ValueError, match="only available for classification pipelines"):
+        compiled.predict_proba_array(X.values)
+    with pytest.raises(AttributeError, match="do not have classes"):
+        compiled.classes_
@@ -1,5 +1,6 @@
+import json
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import cloudpickle
 import numpy as np
@@ -7,6 +8,7 @@ import pandas as pd
 import pytest
 from skopt.space import Integer, Real
 
+from evalml.data_checks import DataProfile
 from evalml.demos import load_breast_cancer, load_wine
 from evalml.exceptions import (
     IllFormattedClassNameError,
@@ -299,6 +301,34 @@ def test_serialization(X_y_binary, tmpdir, logistic_regression_binary_pipeline_c
     assert pipeline.score(X, y, ['precision']) == PipelineBase.load(path).score(X, y, ['precision'])
 
 
+@pytest.mark.parametrize("estimator,library,extension", [("Random Forest Classifier", None, None),
+                                                         ("XGBoost Classifier", "xgboost", "json"),
+                                                         ("LightGBM Classifier", "lightgbm", "txt"),
+                                                         ("CatBoost Classifier", "catboost", "cbm")])
+def test_serialization_artifact(estimator, library, extension, X_y_categorical_classification, tmpdir, has_minimal_dependencies):
+    if has_minimal_dependencies and library is not None:
+        pytest.skip(f"Skipping because {library} is not installed for minimal dependencies")
+
+    class ArtifactPipeline(BinaryClassificationPipeline):
+        component_graph = ['Imputer', 'One Hot Encoder', estimator]
+
+    X, y = X_y_categorical_classification
+    path = os.path.join(str(tmpdir), 'pipeline')
+    pipeline = ArtifactPipeline(parameters={})
+    pipeline.fit(X, y)
+    pipeline.save(path, artifact=True)
+    with open(os.path.join(path, 'manifest.json')) as f:
+        manifest = json.load(f)
+    assert manifest['metadata']['parameters'] == pipeline.parameters
+    assert [component['name'] for component in manifest['metadata']['component_graph']] == ['Imputer', 'One Hot Encoder', estimator]
+    assert manifest['models'] == ([] if library is None else [{'file': f'models/0.{extension}', 'library': library}])
+    for mmap_mode in ['r', None]:
+        loaded = PipelineBase.load(path, mmap_mode=mmap_mode)
+        assert loaded == pipeline
+        pd.testing.assert_frame_equal(loaded.predict_proba(X), pipeline.predict_proba(X))
+        pd.testing.assert_series_equal(loaded.predict(X), pipeline.predict(X))
+
+
 @patch('cloudpickle.dump')
 def test_serialization_protocol(mock_cloudpickle_dump, tmpdir, logistic_regression_binary_pipeline_class):
     path = os.path.join(str(tmpdir), 'pipe.pkl')
@@ -440,7 +470,8 @@ def test_parameters(logistic_regression_binary_pipeline_class):
             'categories': None,
             'drop': None,
             'handle_unknown': 'ignore',
-            'handle_missing': 'error'
+            'handle_missing': 'error',
+            'sparse': False
         },
         'Logistic Regression Classifier': {
             'penalty': 'l2',
@@ -1062,7 +1093,8 @@ def test_get_default_parameters(logistic_regression_binary_pipeline_class):
             'categories': None,
             'drop': None,
             'handle_unknown': 'ignore',
-            'handle_missing': 'error'
+            'handle_missing': 'error',
+            'sparse': False
         },
         'Logistic Regression Classifier': {
             'penalty': 'l2',
@@ -1270,3 +1302,79 @@ def test_pipeline_equality_different_fitted_data(problem_type, X_y_binary, X_y_m
     pipeline_diff_data.fit(X, y)
 
     assert pipeline != pipeline_diff_data
+
+
+def test_pipeline_score_error_can_be_pickled():
+    exceptions = {"F1": (ValueError("bad input"), ["traceback line"])}
+    error = PipelineScoreError(exceptions, {"AUC": 0.5})
+    unpickled = cloudpickle.loads(cloudpickle.dumps(error))
+    assert unpickled.scored_successfully == {"AUC": 0.5}
+    assert list(unpickled.exceptions) == ["F1"]
+    assert unpickled.message == error.message
+
+
+@pytest.mark.parametrize("n_jobs,prefer", [(None, 'threads'), (2, 'threads'), (2, 'processes')])
+def test_predict_batches(n_jobs, prefer, X_y_binary, logistic_regression_binary_pipeline_class, tmpdir):
+    X, y = X_y_binary
+    X = pd.DataFrame(X).add_prefix('feature_')
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+    predictions = pipeline.predict(X)
+    proba = pipeline.predict_proba(X)
+
+    path = os.path.join(str(tmpdir), 'X.csv')
+    X.to_csv(path, index=False)
+    chunks = (X.iloc[start:start + 7] for start in range(0, len(X), 7))
+    for data, chunksize, n_chunks in [(X, 9, 12), (path, 11, 10), (chunks, 100000, 15)]:
+        predicted_chunks = list(pipeline.predict_batches(data, chunksize=chunksize, n_jobs=n_jobs, prefer=prefer))
+        assert len(predicted_chunks) == n_chunks
+        np.testing.assert_array_equal(pd.concat(predicted_chunks).values, predictions.values)
+
+    proba_chunks = list(pipeline.predict_proba_batches(X, chunksize=30, n_jobs=n_jobs, prefer=prefer))
+    assert [len(chunk) for chunk in proba_chunks] == [30, 30, 30, 10]
+    np.testing.assert_allclose(pd.concat(proba_chunks).values, proba.values)
+
+
+def test_predict_batches_invalid(X_y_binary, logistic_regression_binary_pipeline_class):
+    X, y = X_y_binary
+    pipeline = logistic_regression_binary_pipeline_class(parameters={})
+    with pytest.raises(PipelineNotYetFittedError, match="You must fit .* before calling predict_batches"):
+        pipeline.predict_batches(pd.DataFrame(X))
+    pipeline.fit(X, y)
+    with pytest.raises(ValueError, match="prefer must be either 'threads' or 'processes'"):
+        pipeline.predict_batches(pd.DataFrame(X), prefer='gpu')
+    with pytest.raises(ValueError, match="chunksize must be a positive integer"):
+        pipeline.predict_proba_batches(pd.DataFrame(X), chunksize=0)
+
+
+@patch('evalml.utils.gen_utils.import_or_raise')
+def test_predict_batches_parquet(mock_import_or_raise, X_y_regression, linear_regression_pipeline_class):
+    X, y = X_y_regression
+    X = pd.DataFrame(X)
+    pipeline = linear_regression_pipeline_class(parameters={})
+    pipeline.fit(X, y)
+
+    batches = []
+    for start in range(0, len(X), 40):
+        batch = MagicMock()
+        batch.to_pandas.return_value = X.iloc[start:start + 40]
+        batches.append(batch)
+    mock_import_or_raise.return_value.ParquetFile.return_value.iter_batches.return_value = batches
+
+    predicted_chunks = list(pipeline.predict_batches('data.parquet', chunksize=40))
+    mock_import_or_raise.return_value.ParquetFile.assert_called_once_with('data.parquet')
+    mock_import_or_raise.return_value.ParquetFile.return_value.iter_batches.assert_called_once_with(batch_size=40)
+    assert len(predicted_chunks) == 3
+    np.testing.assert_allclose(pd.concat(predicted_chunks).values, pipeline.predict(X).values)
+
+
+def test_make_pipeline_with_profile(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    X["categorical"] = ["a", "b"] * (len(X) // 2)
+    profile = DataProfile(X)
+    with patch("evalml.pipelines.utils.DataProfile") as mock_profile:
+        pipeline = make_pipeline(X, y, LogisticRegressionClassifier, ProblemTypes.BINARY, profile=profile)
+    mock_profile.assert_not_called()
+    assert pipeline.component_graph == make_pipeline(X, y, LogisticRegressionClassifier, ProblemTypes.BINARY).component_graph
+    assert OneHotEncoder in pipeline.component_graph
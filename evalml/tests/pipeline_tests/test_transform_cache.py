@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.pipelines import BinaryClassificationPipeline, TransformCache
+
+
+class LogisticRegressionPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Standard Scaler', 'Logistic Regression Classifier']
+
+
+class RandomForestPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Random Forest Classifier']
+
+
+@pytest.fixture
+def X_y_categorical():
+    X = pd.DataFrame({'numbers': [1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.0, 8.0] * 5,
+                      'letters': ['a', 'b', 'a', None, 'c', 'b', 'a', 'c'] * 5})
+    y = pd.Series([0, 1, 0, 1, 1, 0, 1, 0] * 5)
+    return X, y
+
+
+def test_transform_cache_invalid_max_entries():
+    with pytest.raises(ValueError, match="max_entries must be a positive integer"):
+        TransformCache(max_entries=0)
+
+
+def test_transform_cache_fingerprint(X_y_categorical):
+    X, y = X_y_categorical
+    assert TransformCache.fingerprint(X, y) == TransformCache.fingerprint(X.copy(), y.copy())
+    assert TransformCache.fingerprint(X) != TransformCache.fingerprint(X, y)
+    assert TransformCache.fingerprint(X.iloc[:20]) != TransformCache.fingerprint(X.iloc[20:])
+    assert TransformCache.fingerprint(X[['numbers']]) != TransformCache.fingerprint(X)
+    X_changed = X.copy()
+    X_changed.loc[0, 'numbers'] = 100.0
+    assert TransformCache.fingerprint(X_changed) != TransformCache.fingerprint(X)
+
+
+def test_transform_cache_evicts_least_recently_used():
+    cache = TransformCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == (1,)
+    cache.put('c', 3)
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == (1,)
+    assert cache.get('c') == (3,)
+    assert cache.hits == 3
+    assert cache.misses == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_pipelines_share_fitted_components(X_y_categorical):
+    X, y = X_y_categorical
+    cache = TransformCache()
+
+    uncached = RandomForestPipeline({}).fit(X, y)
+
+    first = LogisticRegressionPipeline({})
+    first._transform_cache = cache
+    first.fit(X, y)
+    assert cache.hits == 0
+
+    second = RandomForestPipeline({})
+    second._transform_cache = cache
+    second.fit(X, y)
+    assert cache.hits == 2
+    # each pipeline has its own copy of the shared fitted components
+    assert second['Imputer'] is not first['Imputer']
+    assert second['Imputer'] == first['Imputer']
+    assert second['One Hot Encoder'] is not first['One Hot Encoder']
+    assert second['One Hot Encoder'] == first['One Hot Encoder']
+    assert second.input_feature_names == uncached.input_feature_names
+    pd.testing.assert_frame_equal(second.predict_proba(X), uncached.predict_proba(X))
+
+    hits = cache.hits
+    pd.testing.assert_frame_equal(second.predict_proba(X), uncached.predict_proba(X))
+    assert cache.hits == hits + 2
+
+
+def test_transform_cache_keys_on_data_and_parameters(X_y_categorical):
+    X, y = X_y_categorical
+    cache = TransformCache()
+    for pipeline in [LogisticRegressionPipeline({}),
+                     LogisticRegressionPipeline({'Imputer': {'numeric_impute_strategy': 'median'}})]:
+        pipeline._transform_cache = cache
+        pipeline.fit(X, y)
+    assert cache.hits == 0
+
+    pipeline = LogisticRegressionPipeline({})
+    pipeline._transform_cache = cache
+    pipeline.fit(X.iloc[:20], y.iloc[:20])
+    assert cache.hits == 0
+
+
+def test_transform_cache_components_are_not_shared(X_y_categorical):
+    X, y = X_y_categorical
+    cache = TransformCache()
+    first = RandomForestPipeline({})
+    first._transform_cache = cache
+    first.fit(X, y)
+    second = RandomForestPipeline({})
+    second._transform_cache = cache
+    second.fit(X, y)
+    assert cache.hits == 2
+
+    # refitting a pipeline's components changes neither the cache nor the other pipeline
+    first['One Hot Encoder'].fit(pd.DataFrame({'numbers': [1.0], 'letters': ['z']}))
+    third = RandomForestPipeline({})
+    third._transform_cache = cache
+    third.fit(X, y)
+    assert cache.hits == 4
+    # data which hasn't been transformed yet, so that the components transform it instead of the cache
+    X_new = X.assign(numbers=X['numbers'] + 0.5)
+    expected = RandomForestPipeline({}).fit(X, y).predict_proba(X_new)
+    pd.testing.assert_frame_equal(second.predict_proba(X_new), expected)
+    pd.testing.assert_frame_equal(third.predict_proba(X_new), expected)
+
+
+def test_transform_cache_keys_on_values(X_y_categorical):
+    X, y = X_y_categorical
+    pipeline = RandomForestPipeline({})
+    pipeline._transform_cache = TransformCache()
+    pipeline.fit(X, y)
+    pipeline.predict_proba(X)
+
+    # the same index and columns with different values must not be served the cached transformed data
+    X_changed = X.copy()
+    X_changed['numbers'] = X_changed['numbers'] * 10
+    X_changed['letters'] = X_changed['letters'].map({'a': 'b', 'b': 'c', 'c': 'a'})
+    uncached = RandomForestPipeline({}).fit(X, y)
+    pd.testing.assert_frame_equal(pipeline.predict_proba(X_changed), uncached.predict_proba(X_changed))
+
+
+def test_transform_cache_does_not_change_input(X_y_categorical):
+    X, y = X_y_categorical
+    X_expected = X.copy()
+    cache = TransformCache()
+    for _ in range(2):
+        pipeline = RandomForestPipeline({})
+        pipeline._transform_cache = cache
+        pipeline.fit(X, y)
+        pipeline.predict(X)
+    pd.testing.assert_frame_equal(X, X_expected)
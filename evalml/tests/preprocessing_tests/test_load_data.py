@@ -0,0 +1,124 @@
+import os
+import pathlib
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.data_checks import LabelLeakageDataCheck, OutliersDataCheck
+from evalml.pipelines.components import Imputer
+from evalml.preprocessing import compact_dtypes, load_data
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"id": range(10),
+                         "small_int": range(10),
+                         "large_int": [2 ** 40] * 10,
+                         "exact_float": [0.5, 1.25, np.nan, 3.0, 4.5] * 2,
+                         "float": [0.1] * 10,
+                         "category": ["a", "b"] * 5,
+                         "text": [f"row {i}" for i in range(10)],
+                         "target": [0.1, 0.2] * 5})
+
+
+@pytest.mark.parametrize("chunksize", [None, 3])
+def test_load_data_csv(chunksize, data, tmpdir):
+    path = os.path.join(str(tmpdir), "data.csv")
+    data.to_csv(path, index=False)
+    X, y = load_data(path, index="id", target="target", chunksize=chunksize, drop=["text"], verbose=False)
+    pd.testing.assert_frame_equal(X, data.set_index("id").drop(columns=["target", "text"]))
+    pd.testing.assert_series_equal(y, data.set_index("id")["target"])
+
+    X, y = load_data(path, index="id", target="target", n_rows=4, chunksize=chunksize, columns=["small_int", "category"], verbose=False)
+    pd.testing.assert_frame_equal(X, data.set_index("id")[["small_int", "category"]].iloc[:4])
+    pd.testing.assert_series_equal(y, data.set_index("id")["target"].iloc[:4])
+
+
+def test_load_data_compact(data, tmpdir):
+    path = os.path.join(str(tmpdir), "data.csv")
+    data.to_csv(path, index=False)
+    X, y = load_data(path, index="id", target="target", chunksize=4, compact=True, verbose=False)
+    assert dict(X.dtypes.astype(str)) == {"small_int": "int8", "large_int": "int64", "exact_float": "float32", "float": "float64",
+                                          "category": "category", "text": "object"}
+    assert y.dtype == "float64"
+    pd.testing.assert_frame_equal(X, data.set_index("id").drop(columns=["target"]), check_dtype=False, check_categorical=False)
+
+
+def test_load_data_path_and_file(data, tmpdir):
+    path = os.path.join(str(tmpdir), "data.csv")
+    data.to_csv(path, index=False)
+    X, y = load_data(pathlib.Path(path), index="id", target="target", chunksize=4, verbose=False)
+    pd.testing.assert_frame_equal(X, data.set_index("id").drop(columns=["target"]))
+    with open(path) as f:
+        X, y = load_data(f, index="id", target="target", verbose=False)
+    pd.testing.assert_frame_equal(X, data.set_index("id").drop(columns=["target"]))
+
+
+@patch("pandas.read_parquet")
+def test_load_data_parquet_path(mock_read_parquet, data):
+    mock_read_parquet.return_value = data
+    load_data(pathlib.Path("data.parquet"), index=None, target="target", verbose=False)
+    mock_read_parquet.assert_called_once_with(pathlib.Path("data.parquet"), columns=None)
+
+
+def test_data_checks_on_compacted_data():
+    X = pd.DataFrame({"x": [1, 2, 3, 40, 5] * 4,
+                      "y": [6, 7, 8, 99, 10] * 4,
+                      "z": [-1, -2, -3, -120, -4] * 4,
+                      "missing": [0.5, np.nan, 1.5, 2.5, 3.5] * 4})
+    y = pd.Series([1, 2, 3, 40, 5] * 4)
+    X_compact = compact_dtypes(X)
+    assert dict(X_compact.dtypes.astype(str)) == {"x": "int8", "y": "int8", "z": "int8", "missing": "float32"}
+
+    leakage_check = LabelLeakageDataCheck(pct_corr_threshold=0.8)
+    assert leakage_check.validate(X_compact, compact_dtypes(y.to_frame())[0]) == leakage_check.validate(X, y) != []
+    outliers_check = OutliersDataCheck(random_state=0)
+    X_complete, X_compact_complete = X.drop(columns=["missing"]), X_compact.drop(columns=["missing"])
+    assert outliers_check.get_outlier_indices(X_compact_complete).tolist() == outliers_check.get_outlier_indices(X_complete).tolist() != []
+    X_t = Imputer().fit_transform(X_compact)
+    pd.testing.assert_frame_equal(X_t, Imputer().fit_transform(X), check_dtype=False)
+    assert X_t["missing"].notna().all()
+
+
+def test_compact_dtypes(data):
+    X = compact_dtypes(data, category_threshold=1.0)
+    assert X["text"].dtype == "category"
+    assert X["target"].dtype == "float64"
+    assert data["small_int"].dtype == "int64"
+    assert compact_dtypes(data[["category"]].values)[0].dtype == "category"
+
+
+@patch("pandas.read_feather")
+def test_load_data_feather(mock_read_feather, data):
+    mock_read_feather.return_value = data[["id", "target", "small_int"]]
+    X, y = load_data("data.feather", index="id", target="target", n_rows=3, columns=["small_int"], verbose=False)
+    mock_read_feather.assert_called_once_with("data.feather", columns=["id", "target", "small_int"])
+    pd.testing.assert_frame_equal(X, data.set_index("id")[["small_int"]].iloc[:3])
+    pd.testing.assert_series_equal(y, data.set_index("id")["target"].iloc[:3])
+
+
+@patch("pandas.read_parquet")
+def test_load_data_parquet(mock_read_parquet, data):
+    mock_read_parquet.return_value = data
+    X, y = load_data("data.parquet", index=None, target="target", verbose=False)
+    mock_read_parquet.assert_called_once_with("data.parquet", columns=None)
+    pd.testing.assert_frame_equal(X, data.drop(columns=["target"]))
+
+
+@patch("evalml.preprocessing.utils.import_or_raise")
+def test_load_data_parquet_chunks(mock_import_or_raise, data):
+    batches = []
+    for start in range(0, len(data), 4):
+        batch = MagicMock()
+        batch.to_pandas.return_value = data.iloc[start:start + 4]
+        batches.append(batch)
+    mock_import_or_raise.return_value.ParquetFile.return_value.iter_batches.return_value = iter(batches)
+
+    X, y = load_data("data.pq", index="id", target="target", n_rows=6, chunksize=4, verbose=False)
+    mock_import_or_raise.return_value.ParquetFile.return_value.iter_batches.assert_called_once_with(batch_size=4, columns=None)
+    pd.testing.assert_frame_equal(X, data.set_index("id").drop(columns=["target"]).iloc[:6])
+    # reading stops once enough rows are read
+    batches[1].to_pandas.assert_called_once()
+    batches[2].to_pandas.assert_not_called()
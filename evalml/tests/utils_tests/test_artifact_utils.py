@@ -0,0 +1,74 @@
+import json
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import evalml
+from evalml.utils import is_artifact, load_artifact, save_artifact
+
+
+class FittedState:
+    def __init__(self):
+        self.weights = np.arange(1000, dtype='float64')
+        self.nodes = np.zeros(500, dtype=[('left', 'int64'), ('threshold', 'float64')])
+        self.small = np.arange(3)
+        self.labels = np.array(['a', 'b'] * 600, dtype=object)
+        self.shared = self.weights
+
+
+def test_save_and_load_artifact(tmpdir):
+    path = str(tmpdir.join('artifact'))
+    state = FittedState()
+    save_artifact(state, path, metadata={'parameters': {'alpha': np.float64(0.5)}})
+    assert is_artifact(path)
+    assert not is_artifact(str(tmpdir))
+
+    with open(os.path.join(path, 'manifest.json')) as f:
+        manifest = json.load(f)
+    assert manifest['format_version'] == 1
+    assert manifest['class'].endswith('FittedState')
+    assert manifest['library_versions']['evalml'] == evalml.__version__
+    assert manifest['metadata'] == {'parameters': {'alpha': 0.5}}
+    assert manifest['arrays'] == [{'file': 'arrays/0.npy', 'dtype': 'float64', 'shape': [1000]},
+                                  {'file': 'arrays/1.npy', 'dtype': str(state.nodes.dtype), 'shape': [500]}]
+    assert manifest['models'] == []
+
+    loaded = load_artifact(path)
+    assert isinstance(loaded.weights, np.memmap)
+    assert not loaded.weights.flags.writeable
+    assert loaded.shared is loaded.weights
+    np.testing.assert_array_equal(loaded.weights, state.weights)
+    np.testing.assert_array_equal(loaded.nodes, state.nodes)
+    np.testing.assert_array_equal(loaded.small, state.small)
+    np.testing.assert_array_equal(loaded.labels, state.labels)
+
+    loaded = load_artifact(path, mmap_mode=None)
+    assert not isinstance(loaded.weights, np.memmap)
+    assert loaded.weights.flags.writeable
+
+
+def test_load_artifact_versions(tmpdir):
+    path = str(tmpdir.join('artifact'))
+    save_artifact(FittedState(), path)
+    with open(os.path.join(path, 'manifest.json')) as f:
+        manifest = json.load(f)
+
+    manifest['library_versions']['evalml'] = '0.0.1'
+    with open(os.path.join(path, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f)
+    with pytest.warns(UserWarning, match="Artifact was saved with evalml 0.0.1"):
+        load_artifact(path)
+
+    manifest['format_version'] = 2
+    with open(os.path.join(path, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f)
+    with pytest.raises(ValueError, match="Artifact format version 2 is newer"):
+        load_artifact(path)
+
+
+@patch('evalml.utils.artifact_utils._ArtifactPickler')
+def test_save_artifact_protocol(mock_pickler, tmpdir):
+    save_artifact(FittedState(), str(tmpdir.join('artifact')), pickle_protocol=2)
+    assert mock_pickler.call_args[1]['protocol'] == 2
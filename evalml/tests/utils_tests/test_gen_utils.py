@@ -1,3 +1,4 @@
+import gc
 import inspect
 from unittest.mock import patch
 
@@ -175,6 +176,35 @@ def test_get_importable_subclasses_wont_get_custom_classes():
     assert ChildClass not in get_importable_subclasses(ComponentBase)
 
 
+def test_get_importable_subclasses_cached():
+    from evalml.pipelines.components import StandardScaler
+    subclasses = get_importable_subclasses(ComponentBase)
+    with patch.object(StandardScaler, '__init__', side_effect=TypeError) as mock_init:
+        assert get_importable_subclasses(ComponentBase) == subclasses
+
+        # defining or collecting an unrelated subclass rebuilds the list without instantiating the classes again
+        class ChildClass(ComponentBase):
+            pass
+        del ChildClass
+        gc.collect()
+        assert get_importable_subclasses(ComponentBase) == subclasses
+        mock_init.assert_not_called()
+
+
+def test_get_importable_subclasses_cache_invalidated():
+    from evalml.pipelines.components import StandardScaler
+    assert StandardScaler in get_importable_subclasses(ComponentBase)
+
+    class ChildScaler(StandardScaler):
+        pass
+
+    # StandardScaler is no longer a leaf of the class hierarchy
+    assert StandardScaler not in get_importable_subclasses(ComponentBase)
+    del ChildScaler
+    gc.collect()
+    assert StandardScaler in get_importable_subclasses(ComponentBase)
+
+
 @patch('importlib.import_module')
 def test_import_or_warn_errors(dummy_importlib):
     def _mock_import_function(library_str):
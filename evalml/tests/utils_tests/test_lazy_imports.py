@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import evalml
+
+
+def _run_python(code):
+    result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    return result.stdout.decode().strip().splitlines()[-1]
+
+
+def test_import_evalml_does_not_import_heavy_dependencies():
+    heavy_modules = ['shap', 'plotly', 'matplotlib', 'IPython', 'xgboost', 'catboost', 'lightgbm', 'featuretools', 'skopt',
+                     'evalml.automl', 'evalml.demos', 'evalml.model_understanding', 'evalml.pipelines']
+    imported = _run_python(f"import sys; import evalml; print([m for m in {heavy_modules} if m in sys.modules])")
+    assert imported == '[]'
+
+
+def test_import_pipelines_does_not_import_optional_dependencies():
+    optional_modules = ['shap', 'plotly', 'matplotlib', 'xgboost', 'catboost', 'lightgbm']
+    imported = _run_python("import sys; import evalml.pipelines, evalml.model_understanding; "
+                           f"print([m for m in {optional_modules} if m in sys.modules])")
+    assert imported == '[]'
+
+
+@pytest.mark.parametrize('module', ['evalml.automl', 'evalml.data_checks', 'evalml.demos', 'evalml.model_understanding',
+                                    'evalml.model_understanding.graphs', 'evalml.model_understanding.prediction_explanations',
+                                    'evalml.objectives', 'evalml.pipelines', 'evalml.preprocessing', 'evalml.tuners'])
+def test_import_subpackage_first(module):
+    # each subpackage is imported on its own in a fresh interpreter, so that no other import hides a circular import
+    assert _run_python(f"import {module}; print('imported')") == 'imported'
+
+
+def test_import_evalml_time():
+    # sklearn and pandas are always needed, so only the time spent importing evalml itself is measured
+    import_time = _run_python("import time; import sklearn, pandas; start = time.perf_counter(); import evalml; "
+                              "print(time.perf_counter() - start)")
+    assert float(import_time) < 0.5
+
+
+def test_lazy_attributes():
+    from evalml import AutoMLSearch
+    from evalml.automl import AutoMLSearch as AutoMLSearchFromSubpackage
+    assert AutoMLSearch is AutoMLSearchFromSubpackage
+    assert evalml.demos.load_breast_cancer is not None
+    assert 'pipelines' in dir(evalml)
+    assert 'AutoMLSearch' in dir(evalml)
+    with pytest.raises(AttributeError, match="module 'evalml' has no attribute 'not_a_module'"):
+        evalml.not_a_module
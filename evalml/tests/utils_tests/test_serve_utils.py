@@ -0,0 +1,195 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from evalml.__main__ import cli
+from evalml.pipelines import BinaryClassificationPipeline, RegressionPipeline
+from evalml.utils.serve_utils import PredictionServer
+
+
+class LogisticRegressionPipeline(BinaryClassificationPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Logistic Regression Classifier']
+
+
+class LinearRegressionPipeline(RegressionPipeline):
+    component_graph = ['Imputer', 'One Hot Encoder', 'Linear Regressor']
+
+
+@pytest.fixture
+def X_y_categorical():
+    X = pd.DataFrame({'numbers': [1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.0, 8.0] * 5,
+                      'letters': ['a', 'b', 'a', None, 'c', 'b', 'a', 'c'] * 5})
+    y = pd.Series(['no', 'yes', 'no', 'yes', 'yes', 'no', 'yes', 'no'] * 5)
+    return X, y
+
+
+async def request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    content = b'' if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode('utf-8'))
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(content)}\r\nConnection: close\r\n\r\n".encode('latin-1') + content)
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(body)
+
+
+def run_with_server(pipeline, test, **kwargs):
+    loop = asyncio.new_event_loop()
+    server = PredictionServer(pipeline, **kwargs)
+
+    async def run():
+        http_server = await server.start(port=0)
+        try:
+            return await test(server, http_server.sockets[0].getsockname()[1])
+        finally:
+            http_server.close()
+            await http_server.wait_closed()
+            await server.close()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def test_prediction_server_invalid_parameters(X_y_categorical):
+    X, y = X_y_categorical
+    pipeline = LogisticRegressionPipeline({}).fit(X, y)
+    with pytest.raises(ValueError, match="max_batch_size must be a positive integer"):
+        PredictionServer(pipeline, max_batch_size=0)
+    with pytest.raises(ValueError, match="max_wait must be non-negative"):
+        PredictionServer(pipeline, max_wait=-1)
+    with pytest.raises(ValueError, match="n_workers must be a positive integer"):
+        PredictionServer(pipeline, n_workers=0)
+
+
+def test_prediction_server_predict(X_y_categorical):
+    X, y = X_y_categorical
+    pipeline = LogisticRegressionPipeline({}).fit(X, y)
+    rows = [{'numbers': number, 'letters': letter} for number, letter in zip(X['numbers'].fillna(-1), X['letters'])]
+    rows[2]['numbers'] = None
+
+    async def test(server, port):
+        status, one = await request(port, 'POST', '/predict', rows[0])
+        assert status == 200
+        many = await asyncio.gather(*[request(port, 'POST', '/predict', rows[i:i + 4]) for i in range(0, len(rows), 4)])
+        assert all(status == 200 for status, _ in many)
+        return one, [response for _, response in many], server.metrics.to_dict()
+
+    one, many, metrics = run_with_server(pipeline, test, max_batch_size=16, max_wait=0.05, n_workers=2)
+    X_expected = pd.DataFrame(rows)
+    assert one['predictions'] == [pipeline.predict(X_expected.iloc[[0]])[0]]
+    assert one['classes'] == ['no', 'yes']
+    assert [label for response in many for label in response['predictions']] == pipeline.predict(X_expected).tolist()
+    np.testing.assert_allclose([p for response in many for p in response['probabilities']], pipeline.predict_proba(X_expected).values)
+    assert metrics['requests'] == 11
+    assert metrics['rows'] == 41
+    assert metrics['errors'] == 0
+    assert metrics['batches'] < 11
+    assert metrics['mean_batch_rows'] > 4
+    assert set(metrics['latency_ms']) == {'p50', 'p95', 'p99', 'max'}
+
+
+def test_prediction_server_regression(X_y_categorical):
+    X, _ = X_y_categorical
+    pipeline = LinearRegressionPipeline({}).fit(X, pd.Series(np.arange(len(X), dtype=float)))
+
+    async def test(server, port):
+        return await request(port, 'POST', '/predict', [{'numbers': 3.0, 'letters': 'b'}])
+
+    status, response = run_with_server(pipeline, test)
+    assert status == 200
+    assert set(response) == {'predictions'}
+    assert response['predictions'] == pytest.approx(pipeline.predict(pd.DataFrame({'numbers': [3.0], 'letters': ['b']})).tolist())
+
+
+def test_prediction_server_errors(X_y_categorical):
+    X, y = X_y_categorical
+    pipeline = LogisticRegressionPipeline({'One Hot Encoder': {'handle_unknown': 'error'}}).fit(X, y)
+
+    async def test(server, port):
+        responses = await asyncio.gather(request(port, 'POST', '/predict', {'numbers': 1.0}),
+                                         request(port, 'POST', '/predict', b'{not json'),
+                                         request(port, 'POST', '/predict', []),
+                                         request(port, 'POST', '/predict', {'numbers': 1.0, 'letters': 'z'}),
+                                         request(port, 'POST', '/predict', {'numbers': 1.0, 'letters': 'a'}),
+                                         request(port, 'GET', '/predict'),
+                                         request(port, 'GET', '/unknown'),
+                                         request(port, 'GET', '/health'))
+        return responses, server.metrics.to_dict()
+
+    responses, metrics = run_with_server(pipeline, test, max_wait=0.05)
+    missing, not_json, empty, unknown, valid, wrong_method, not_found, health = responses
+    assert missing == (400, {'error': "Row 0 is missing features ['letters']"})
+    assert not_json[0] == 400
+    assert empty == (400, {'error': "Rows must be a JSON object of feature values, or a non-empty list of them."})
+    assert unknown[0] == 400
+    assert "Found unknown categories ['z']" in unknown[1]['error']
+    assert valid[0] == 200
+    assert wrong_method == (405, {'error': "GET is not allowed for /predict"})
+    assert not_found == (404, {'error': "/unknown was not found"})
+    assert health == (200, {'status': 'ok'})
+    assert metrics['requests'] == 5
+    assert metrics['errors'] == 4
+
+
+async def raw_request(port, data):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(data)
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_prediction_server_malformed_requests(X_y_categorical):
+    X, y = X_y_categorical
+    pipeline = LogisticRegressionPipeline({}).fit(X, y)
+
+    async def test(server, port):
+        return await asyncio.gather(raw_request(port, b'GET /health\r\n\r\n'),
+                                    raw_request(port, b'POST /predict HTTP/1.1\r\nContent-Length: ten\r\n\r\n{}'),
+                                    raw_request(port, b'POST /predict HTTP/1.1\r\nContent-Length: -1\r\n\r\n{}'))
+
+    request_line, not_integer, negative = run_with_server(pipeline, test)
+    assert request_line == (400, {'error': "Malformed request line"})
+    assert not_integer == (400, {'error': "Malformed Content-Length header 'ten'"})
+    assert negative == (400, {'error': "Malformed Content-Length header '-1'"})
+
+
+def test_prediction_server_nan_predictions(X_y_categorical):
+    X, _ = X_y_categorical
+    pipeline = LinearRegressionPipeline({}).fit(X, pd.Series(np.arange(len(X), dtype=float)))
+
+    async def test(server, port):
+        with patch.object(PredictionServer, '_predict', return_value=(np.array([np.nan, 1.5, np.inf]), None)):
+            return await request(port, 'POST', '/predict', [{'numbers': 3.0, 'letters': 'b'}] * 3)
+
+    assert run_with_server(pipeline, test) == (200, {'predictions': [None, 1.5, None]})
+
+
+def test_serve_cli(X_y_categorical, tmpdir):
+    X, y = X_y_categorical
+    path = str(tmpdir.join('pipeline.pkl'))
+    LogisticRegressionPipeline({}).fit(X, y).save(path)
+    runner = CliRunner()
+    with patch('evalml.utils.serve_utils.serve_pipeline') as mock_serve:
+        result = runner.invoke(cli, ['serve', path, '--port', '9000', '--max-batch-size', '32', '--max-wait-ms', '5', '--workers', '4'])
+    assert result.exit_code == 0
+    pipeline = mock_serve.call_args[0][0]
+    assert isinstance(pipeline, LogisticRegressionPipeline)
+    assert mock_serve.call_args[1] == {'host': '127.0.0.1', 'port': 9000, 'max_batch_size': 32, 'max_wait': 0.005, 'n_workers': 4}
+
+    artifact_path = str(tmpdir.join('artifact'))
+    LogisticRegressionPipeline({}).fit(X, y).save(artifact_path, artifact=True)
+    with patch('evalml.utils.serve_utils.serve_pipeline') as mock_serve:
+        result = runner.invoke(cli, ['serve', artifact_path])
+    assert result.exit_code == 0
+    assert isinstance(mock_serve.call_args[0][0], LogisticRegressionPipeline)
+
+    result = runner.invoke(cli, ['serve', str(tmpdir.join('missing.pkl'))])
+    assert result.exit_code != 0
@@ -2,3 +2,4 @@
 from .logger import get_logger, log_subtitle, log_title
 from .gen_utils import classproperty, import_or_raise, convert_to_seconds, get_random_state, check_random_state_equality, get_random_seed, SEED_BOUNDS, jupyter_check
 from .cli_utils import print_info, get_evalml_root, get_installed_packages, get_sys_info, print_sys_info, print_deps
+from .artifact_utils import save_artifact, load_artifact, is_artifact
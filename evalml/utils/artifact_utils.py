@@ -0,0 +1,188 @@
+import json
+import os
+import pickle
+import sys
+import warnings
+
+import cloudpickle
+import numpy as np
+
+import evalml
+
+ARTIFACT_FORMAT_VERSION = 1
+_MIN_ARRAY_BYTES = 1024
+_LIBRARIES = ['numpy', 'pandas', 'sklearn', 'xgboost', 'lightgbm', 'catboost']
+
+
+def is_artifact(path):
+    """Returns whether path is an artifact directory written by save_artifact."""
+    return os.path.isfile(os.path.join(path, 'manifest.json'))
+
+
+def save_artifact(obj, directory, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL, metadata=None):
+    """Saves an object, such as a pipeline, to an artifact directory, which can be loaded with load_artifact.
+
+    The directory has a manifest.json file describing the object and its contents, numeric numpy arrays of the object's fitted state
+    as .npy files in arrays/, XGBoost, LightGBM and CatBoost models in their native formats in models/, and the rest of the object
+    pickled in object.pkl.
+
+    Arguments:
+        obj (object): the object to save
+        directory (str): the directory to save the artifact to. Created if it does not exist.
+        pickle_protocol (int): the pickle data stream format of object.pkl.
+        metadata (dict): a description of the object to record in the manifest, such as its parameters. Defaults to None.
+
+    Returns:
+        None
+    """
+    os.makedirs(os.path.join(directory, 'arrays'), exist_ok=True)
+    os.makedirs(os.path.join(directory, 'models'), exist_ok=True)
+    with open(os.path.join(directory, 'object.pkl'), 'wb') as f:
+        pickler = _ArtifactPickler(f, directory, protocol=pickle_protocol)
+        pickler.dump(obj)
+    manifest = {'format_version': ARTIFACT_FORMAT_VERSION,
+                'class': f"{type(obj).__module__}.{type(obj).__qualname__}",
+                'library_versions': _library_versions(),
+                'metadata': metadata or {},
+                'object': 'object.pkl',
+                'arrays': pickler.arrays,
+                'models': pickler.models}
+    with open(os.path.join(directory, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, default=_to_json)
+
+
+def load_artifact(directory, mmap_mode='r'):
+    """Loads an object from an artifact directory written by save_artifact.
+
+    Arguments:
+        directory (str): the artifact directory
+        mmap_mode (str or None): how to memory-map the arrays of the object's fitted state, as in numpy.load. The default of 'r'
+            maps them read-only, so that processes which load the same artifact share their memory. If None, the arrays are read
+            into memory.
+
+    Returns:
+        The loaded object
+    """
+    with open(os.path.join(directory, 'manifest.json'), 'r') as f:
+        manifest = json.load(f)
+    if manifest['format_version'] > ARTIFACT_FORMAT_VERSION:
+        raise ValueError(f"Artifact format version {manifest['format_version']} is newer than the latest version this version of "
+                         f"evalml can load, {ARTIFACT_FORMAT_VERSION}. Please upgrade evalml to load it.")
+    saved_version = manifest['library_versions'].get('evalml')
+    if saved_version != evalml.__version__:
+        warnings.warn(f"Artifact was saved with evalml {saved_version} and is being loaded with evalml {evalml.__version__}.")
+    with open(os.path.join(directory, manifest['object']), 'rb') as f:
+        return _ArtifactUnpickler(f, directory, manifest, mmap_mode).load()
+
+
+def _library_versions():
+    versions = {'evalml': evalml.__version__, 'python': '.'.join(str(v) for v in sys.version_info[:3])}
+    for library in _LIBRARIES:
+        if library in sys.modules:
+            versions[library] = getattr(sys.modules[library], '__version__', None)
+    return versions
+
+
+def _to_json(obj):
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    return str(obj)
+
+
+class _ArtifactPickler(cloudpickle.CloudPickler):
+    """Pickles an object, saving its numeric numpy arrays and estimator backends to files of an artifact directory instead."""
+
+    def __init__(self, file, directory, protocol):
+        super().__init__(file, protocol=protocol)
+        self.directory = directory
+        self.arrays = []
+        self.models = []
+        # ids of the objects saved to files, and the objects, which are kept so that their ids are not reused
+        self._saved = {}
+
+    def persistent_id(self, obj):
+        if id(obj) in self._saved:
+            return self._saved[id(obj)][0]
+        if type(obj) in (np.ndarray, np.memmap) and not obj.dtype.hasobject and obj.nbytes >= _MIN_ARRAY_BYTES:
+            pid = self._save_array(obj)
+        else:
+            pid = self._save_model(obj)
+        if pid is not None:
+            self._saved[id(obj)] = (pid, obj)
+        return pid
+
+    def _save_array(self, array):
+        file_name = f"arrays/{len(self.arrays)}.npy"
+        np.save(os.path.join(self.directory, file_name), array, allow_pickle=False)
+        self.arrays.append({'file': file_name, 'dtype': str(array.dtype), 'shape': list(array.shape)})
+        return ('array', len(self.arrays) - 1)
+
+    def _save_model(self, obj):
+        library = type(obj).__module__.split('.')[0]
+        if library not in ('xgboost', 'lightgbm', 'catboost') or library not in sys.modules:
+            return None
+        module = sys.modules[library]
+        if library == 'xgboost' and isinstance(obj, module.Booster):
+            file_name = self._model_file_name('json')
+            obj.save_model(os.path.join(self.directory, file_name))
+            attributes = {'feature_names': obj.feature_names, 'feature_types': obj.feature_types}
+        elif library == 'lightgbm' and isinstance(obj, module.Booster):
+            file_name = self._model_file_name('txt')
+            obj.save_model(os.path.join(self.directory, file_name), num_iteration=-1)
+            attributes = {'best_iteration': obj.best_iteration}
+        elif library == 'catboost' and isinstance(obj, module.CatBoost) and obj.is_fitted():
+            file_name = self._model_file_name('cbm')
+            obj.save_model(os.path.join(self.directory, file_name))
+            attributes = {'class': type(obj)}
+        else:
+            return None
+        self.models.append({'file': file_name, 'library': library})
+        return ('model', len(self.models) - 1, attributes)
+
+    def _model_file_name(self, extension):
+        return f"models/{len(self.models)}.{extension}"
+
+
+class _ArtifactUnpickler(pickle.Unpickler):
+    """Unpickles an object pickled by _ArtifactPickler, loading its arrays and estimator backends from the artifact's files."""
+
+    def __init__(self, file, directory, manifest, mmap_mode):
+        super().__init__(file)
+        self.directory = directory
+        self.manifest = manifest
+        self.mmap_mode = mmap_mode
+        # objects referenced more than once are loaded once, as pickle would for objects in the pickle file
+        self._loaded = {}
+
+    def persistent_load(self, pid):
+        key = pid[:2]
+        if key not in self._loaded:
+            self._loaded[key] = self._load(pid)
+        return self._loaded[key]
+
+    def _load(self, pid):
+        if pid[0] == 'array':
+            file_name = self.manifest['arrays'][pid[1]]['file']
+            return np.load(os.path.join(self.directory, file_name), mmap_mode=self.mmap_mode, allow_pickle=False)
+        if pid[0] == 'model':
+            model = self.manifest['models'][pid[1]]
+            return self._load_model(model['library'], os.path.join(self.directory, model['file']), pid[2])
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid}")
+
+    @staticmethod
+    def _load_model(library, file_path, attributes):
+        if library == 'xgboost':
+            import xgboost
+            booster = xgboost.Booster(model_file=file_path)
+            booster.feature_names = attributes['feature_names']
+            booster.feature_types = attributes['feature_types']
+            return booster
+        if library == 'lightgbm':
+            import lightgbm
+            booster = lightgbm.Booster(model_file=file_path)
+            booster.best_iteration = attributes['best_iteration']
+            return booster
+        # the model's parameters are loaded from its file
+        model = attributes['class']()
+        model.load_model(file_path)
+        return model
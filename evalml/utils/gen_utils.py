@@ -1,8 +1,10 @@
 import importlib
 import warnings
+import weakref
 from collections import namedtuple
 
 import numpy as np
+import pandas as pd
 from sklearn.utils import check_random_state
 
 from evalml.exceptions import MissingComponentError
@@ -11,7 +13,7 @@ from evalml.utils import get_logger
 logger = get_logger(__file__)
 
 
-numeric_dtypes = ['int16', 'int32', 'int64', 'float16', 'float32', 'float64']
+numeric_dtypes = ['int8', 'int16', 'int32', 'int64', 'uint8', 'uint16', 'uint32', 'uint64', 'float16', 'float32', 'float64']
 boolean = ['bool']
 numeric_and_boolean_dtypes = numeric_dtypes + boolean
 categorical_dtypes = ['object', 'category']
@@ -170,6 +172,32 @@ _not_used_in_automl = {'BaselineClassifier', 'BaselineRegressor',
                        'BaselineRegressionPipeline', 'ModeBaselineMulticlassPipeline', 'BaselineMulticlassPipeline'}
 
 
+# incremented whenever a subclass of ComponentBase, PipelineBase or ObjectiveBase is defined or garbage collected,
+# to invalidate cached lists of subclasses
+_subclasses_version = 0
+
+
+def _subclasses_changed():
+    global _subclasses_version
+    _subclasses_version += 1
+
+
+def _track_subclass(cls):
+    """Invalidates cached lists of subclasses when cls is defined, and again when it is garbage collected."""
+    _subclasses_changed()
+    weakref.finalize(cls, _subclasses_changed).atexit = False
+
+
+def _get_subclasses_version():
+    """Returns a number which changes whenever a subclass of ComponentBase, PipelineBase or ObjectiveBase is defined or garbage collected."""
+    return _subclasses_version
+
+
+_importable_subclasses_cache = {}
+# whether each class could be instantiated, which doesn't change when other classes are defined or garbage collected
+_is_importable = weakref.WeakKeyDictionary()
+
+
 def get_importable_subclasses(base_class, used_in_automl=True):
     """Get importable subclasses of a base class. Used to list all of our
     estimators, transformers, components and pipelines dynamically.
@@ -182,25 +210,37 @@ def get_importable_subclasses(base_class, used_in_automl=True):
             only include those subclasses that are used in the search. This would mean excluding classes related to
             ExtraTrees, ElasticNet, and Baseline estimators.
 
+    Results are cached, and recomputed when a subclass of ComponentBase, PipelineBase or ObjectiveBase is defined or
+    garbage collected. Each class is only instantiated the first time it is checked.
+
     Returns:
         List of subclasses.
     """
-    all_classes = _get_subclasses(base_class)
+    cache_key = (base_class, used_in_automl)
+    cached = _importable_subclasses_cache.get(cache_key)
+    if cached is not None and cached[0] == _subclasses_version:
+        return list(cached[1])
 
+    version = _subclasses_version
     classes = []
-    for cls in all_classes:
+    for cls in _get_subclasses(base_class):
         if 'evalml.pipelines' not in cls.__module__:
             continue
-        try:
-            cls()
+        if cls not in _is_importable:
+            try:
+                cls()
+                _is_importable[cls] = True
+            except (ImportError, MissingComponentError, TypeError):
+                logger.debug(f'Could not import class {cls.__name__} in get_importable_subclasses')
+                _is_importable[cls] = False
+        if _is_importable[cls]:
             classes.append(cls)
-        except (ImportError, MissingComponentError, TypeError):
-            logger.debug(f'Could not import class {cls.__name__} in get_importable_subclasses')
 
     if used_in_automl:
         classes = [cls for cls in classes if cls.__name__ not in _not_used_in_automl]
 
-    return classes
+    _importable_subclasses_cache[cache_key] = (version, classes)
+    return list(classes)
 
 
 def _rename_column_names_to_numeric(X):
@@ -218,6 +258,29 @@ def _rename_column_names_to_numeric(X):
     return X.rename(columns=name_to_col_num, inplace=False)
 
 
+def _iter_chunks(X, chunksize):
+    """Iterates over data in chunks of rows.
+
+    Arguments:
+        X (pd.DataFrame, str or iterable(pd.DataFrame)): a dataframe to split into chunks, the path of a CSV or Parquet file to read
+            in chunks, or an iterable which already yields chunks of data. Parquet files are recognized by the .parquet or .pq extension.
+        chunksize (int): the number of rows in each chunk read from a dataframe or file.
+
+    Returns:
+        iterable(pd.DataFrame): the chunks of data
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer. Received {chunksize}.")
+    if isinstance(X, pd.DataFrame):
+        return (X.iloc[start:start + chunksize] for start in range(0, len(X), chunksize))
+    if isinstance(X, str):
+        if X.lower().endswith(('.parquet', '.pq')):
+            parquet = import_or_raise("pyarrow.parquet", error_msg="pyarrow is needed to read Parquet files in chunks.")
+            return (batch.to_pandas() for batch in parquet.ParquetFile(X).iter_batches(batch_size=chunksize))
+        return pd.read_csv(X, chunksize=chunksize)
+    return (chunk if isinstance(chunk, pd.DataFrame) else pd.DataFrame(chunk) for chunk in X)
+
+
 def jupyter_check():
     """Get whether or not the code is being run in a Ipython environment (such as Jupyter Notebook or Jupyter Lab)
 
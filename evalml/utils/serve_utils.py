@@ -0,0 +1,321 @@
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import numpy as np
+
+from evalml.problem_types import ProblemTypes
+from evalml.utils.logger import get_logger
+
+logger = get_logger(__file__)
+
+
+class _ServerMetrics:
+    """Counters of the requests, rows and batches a prediction server has served, and the latencies of its recent requests."""
+
+    def __init__(self, max_latencies=10000):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.batch_rows = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=max_latencies)
+
+    def to_dict(self):
+        uptime = time.monotonic() - self.started
+        latencies = {}
+        if self.latencies:
+            p50, p95, p99 = np.percentile(np.array(self.latencies) * 1000, [50, 95, 99])
+            latencies = {'p50': p50, 'p95': p95, 'p99': p99, 'max': max(self.latencies) * 1000}
+        return {'uptime_seconds': uptime,
+                'requests': self.requests,
+                'rows': self.rows,
+                'errors': self.errors,
+                'batches': self.batches,
+                'mean_batch_rows': self.batch_rows / self.batches if self.batches else 0,
+                'requests_per_second': self.requests / uptime,
+                'rows_per_second': self.rows / uptime,
+                'latency_ms': latencies}
+
+
+class PredictionServer:
+    """Serves the predictions of a fitted pipeline as JSON over HTTP.
+
+    The rows of requests which arrive together are queued and predicted in batches, with one vectorized call to the compiled
+    pipeline (see PipelineBase.compile) per batch, in a pool of worker threads. The server has the following endpoints:
+
+    - ``POST /predict``: predicts a JSON object of feature values, or a list of them. Responds with ``predictions``, and for
+      classification pipelines also ``classes`` and ``probabilities``, the probability estimates of each class for each row.
+    - ``GET /metrics``: responds with counters of the requests, rows and batches served, throughput and recent latencies.
+    - ``GET /health``: responds with ``{"status": "ok"}``.
+    """
+
+    def __init__(self, pipeline, max_batch_size=64, max_wait=0.002, n_workers=1):
+        """Create a prediction server.
+
+        Arguments:
+            pipeline (PipelineBase): The fitted pipeline to serve.
+            max_batch_size (int): A batch is predicted once it has at least this many rows. Requests are never split across batches,
+                so a batch can have more rows. Defaults to 64.
+            max_wait (float): The longest time, in seconds, to wait for more requests after the first request of a batch arrives.
+                Defaults to 0.002.
+            n_workers (int): The number of batches to predict concurrently. Defaults to 1.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer. Received {max_batch_size}.")
+        if max_wait < 0:
+            raise ValueError(f"max_wait must be non-negative. Received {max_wait}.")
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be a positive integer. Received {n_workers}.")
+        self.pipeline = pipeline
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.n_workers = n_workers
+        self.metrics = _ServerMetrics()
+        self._compiled = pipeline.compile()
+        self._classes = None if pipeline.problem_type == ProblemTypes.REGRESSION else self._compiled.classes_.tolist()
+        self._queue = None
+        self._workers = None
+        self._executor = None
+        self._batcher = None
+
+    async def start(self, host='127.0.0.1', port=8000):
+        """Starts serving predictions.
+
+        Arguments:
+            host (str): The host to listen on. Defaults to '127.0.0.1'.
+            port (int): The port to listen on. If 0, a free port is chosen. Defaults to 8000.
+
+        Returns:
+            asyncio.AbstractServer: The HTTP server
+        """
+        loop = asyncio.get_event_loop()
+        self._queue = asyncio.Queue()
+        self._workers = asyncio.Semaphore(self.n_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        self._batcher = loop.create_task(self._batch_requests())
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def close(self):
+        """Stops predicting batches. Close the HTTP server returned by start first."""
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self._executor.shutdown(wait=True)
+
+    async def predict(self, rows):
+        """Queues rows to be predicted in the next batch, and returns their predictions once made.
+
+        Arguments:
+            rows (dict or list(dict)): The value of each of the pipeline's features by name, for one row or a list of rows.
+
+        Returns:
+            dict: The predictions of the rows, and for classification pipelines the classes and probability estimates of the rows.
+        """
+        X = self._to_array(rows)
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((X, future))
+        predictions, probabilities = await future
+        if self._classes is None:
+            return {'predictions': predictions.tolist()}
+        return {'predictions': predictions.tolist(), 'classes': self._classes, 'probabilities': probabilities.tolist()}
+
+    def _to_array(self, rows):
+        if isinstance(rows, dict):
+            rows = [rows]
+        if not isinstance(rows, list) or not rows or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("Rows must be a JSON object of feature values, or a non-empty list of them.")
+        feature_names = self._compiled.feature_names
+        X = np.empty((len(rows), len(feature_names)), dtype=object)
+        for i, row in enumerate(rows):
+            try:
+                X[i] = [row[name] for name in feature_names]
+            except KeyError:
+                missing = [name for name in feature_names if name not in row]
+                raise ValueError(f"Row {i} is missing features {missing}")
+        return X
+
+    async def _batch_requests(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self._queue.get()]
+            n_rows = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+            while n_rows < self.max_batch_size:
+                try:
+                    request = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        request = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                batch.append(request)
+                n_rows += len(request[0])
+            await self._workers.acquire()
+            loop.create_task(self._predict_batch(batch, n_rows))
+
+    async def _predict_batch(self, batch, n_rows):
+        try:
+            results = await asyncio.get_event_loop().run_in_executor(self._executor, self._predict_arrays, [X for X, _ in batch])
+        finally:
+            self._workers.release()
+        self.metrics.batches += 1
+        self.metrics.batch_rows += n_rows
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _predict_arrays(self, arrays):
+        """Predicts the arrays of a batch at once, or each on its own if that fails, so that a request which cannot be predicted
+        only fails itself. Returns the predictions and probability estimates of each array, or the exception it raised."""
+        try:
+            predictions, probabilities = self._predict(np.concatenate(arrays) if len(arrays) > 1 else arrays[0])
+        except Exception as e:
+            if len(arrays) == 1:
+                return [e]
+            return [result for X in arrays for result in self._predict_arrays([X])]
+        results = []
+        start = 0
+        for X in arrays:
+            end = start + len(X)
+            results.append((predictions[start:end], None if probabilities is None else probabilities[start:end]))
+            start = end
+        return results
+
+    def _predict(self, X):
+        compiled = self._compiled
+        return compiled._estimate(*compiled._from_array(X), include_proba=self._classes is not None)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version, headers, body = await self._read_request(request_line, reader)
+                except ValueError as e:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {'error': str(e)}, keep_alive=False)
+                    break
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                status, content = await self._route(method, path.split('?')[0], body)
+                await self._respond(writer, status, content, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(request_line, reader):
+        """Reads the headers and body of a request. Raises a ValueError if the request is malformed."""
+        try:
+            method, path, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise ValueError("Malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            content_length = int(headers.get('content-length', 0))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            raise ValueError(f"Malformed Content-Length header {headers['content-length']!r}")
+        body = await reader.readexactly(content_length)
+        return method, path, version, headers, body
+
+    async def _route(self, method, path, body):
+        if path == '/predict':
+            if method != 'POST':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'error': f"{method} is not allowed for {path}"}
+            started = time.monotonic()
+            self.metrics.requests += 1
+            try:
+                response = await self.predict(json.loads(body or b'null'))
+            except (ValueError, TypeError) as e:
+                self.metrics.errors += 1
+                return HTTPStatus.BAD_REQUEST, {'error': str(e)}
+            except Exception as e:
+                self.metrics.errors += 1
+                logger.error(f"Prediction failed: {e}")
+                return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+            self.metrics.rows += len(response['predictions'])
+            self.metrics.latencies.append(time.monotonic() - started)
+            return HTTPStatus.OK, response
+        if path in ('/metrics', '/health'):
+            if method != 'GET':
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'error': f"{method} is not allowed for {path}"}
+            return HTTPStatus.OK, self.metrics.to_dict() if path == '/metrics' else {'status': 'ok'}
+        return HTTPStatus.NOT_FOUND, {'error': f"{path} was not found"}
+
+    @staticmethod
+    async def _respond(writer, status, content, keep_alive):
+        body = json.dumps(_replace_nan(content), allow_nan=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+def _replace_nan(content):
+    """Replaces NaN and infinite values, which are not valid JSON, with None, which is serialized as null."""
+    if isinstance(content, float):
+        return content if np.isfinite(content) else None
+    if isinstance(content, dict):
+        return {key: _replace_nan(value) for key, value in content.items()}
+    if isinstance(content, list):
+        return [_replace_nan(value) for value in content]
+    return content
+
+
+def serve_pipeline(pipeline, host='127.0.0.1', port=8000, max_batch_size=64, max_wait=0.002, n_workers=1):
+    """Serves the predictions of a fitted pipeline as JSON over HTTP until interrupted. See PredictionServer for the endpoints.
+
+    Arguments:
+        pipeline (PipelineBase): The fitted pipeline to serve.
+        host (str): The host to listen on. Defaults to '127.0.0.1'.
+        port (int): The port to listen on. Defaults to 8000.
+        max_batch_size (int): A batch is predicted once it has at least this many rows. Defaults to 64.
+        max_wait (float): The longest time, in seconds, to wait for more requests after the first request of a batch arrives.
+            Defaults to 0.002.
+        n_workers (int): The number of batches to predict concurrently. Defaults to 1.
+
+    Returns:
+        None
+    """
+    server = PredictionServer(pipeline, max_batch_size=max_batch_size, max_wait=max_wait, n_workers=n_workers)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    http_server = loop.run_until_complete(server.start(host, port))
+    logger.info(f"Serving predictions of {pipeline.name} on http://{host}:{port}")
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        http_server.close()
+        loop.run_until_complete(http_server.wait_closed())
+        loop.run_until_complete(server.close())
+        loop.close()